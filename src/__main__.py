@@ -1,5 +1,6 @@
 """Entry point for the EVE Means of Profit application."""
 
+import multiprocessing
 import sys
 from pathlib import Path
 
@@ -10,4 +11,6 @@ if str(src_dir) not in sys.path:
 from main import main_window  # noqa: E402
 
 if __name__ == "__main__":
+    # Frozen builds re-enter here in SDE parsing worker processes
+    multiprocessing.freeze_support()
     sys.exit(main_window())
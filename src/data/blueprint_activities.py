@@ -0,0 +1,130 @@
+"""Compact array layout of blueprint activities for vectorized industry math.
+
+Each activity (manufacturing, invention, reaction, ...) is packed into flat
+NumPy arrays in CSR form: blueprints are rows sorted by blueprint type ID and
+their materials/products are contiguous slices delimited by an ``indptr``
+array. Cost and yield calculations then run as a handful of array operations
+over every blueprint at once instead of per-blueprint Python loops.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+
+from data.csr import find_rows, indptr_from_lengths, row_ids
+from models.eve import EveBlueprint
+
+# ESI industry job activity IDs -> SDE blueprint activity names
+INDUSTRY_ACTIVITY_NAMES: dict[int, str] = {
+    1: "manufacturing",
+    3: "research_time",
+    4: "research_material",
+    5: "copying",
+    8: "invention",
+    9: "reaction",
+    11: "reaction",
+}
+
+
+@dataclass(frozen=True, eq=False)
+class BlueprintActivityArrays:
+    """One blueprint activity packed into CSR arrays.
+
+    Attributes:
+        activity: SDE activity name
+        blueprint_type_ids: Sorted blueprint type IDs, one row each (int64)
+        times: Base duration per run in seconds (int64)
+        max_production_limits: Maximum runs per copy, 0 if unknown (int64)
+        material_indptr: Row offsets into the material arrays (n + 1)
+        material_type_ids: Material type IDs (int64)
+        material_quantities: Base material quantities per run (int64)
+        product_indptr: Row offsets into the product arrays (n + 1)
+        product_type_ids: Product type IDs (int64)
+        product_quantities: Product quantities per run (int64)
+        product_probabilities: Success chance per product, 1.0 if certain
+    """
+
+    activity: str
+    blueprint_type_ids: np.ndarray
+    times: np.ndarray
+    max_production_limits: np.ndarray
+    material_indptr: np.ndarray
+    material_type_ids: np.ndarray
+    material_quantities: np.ndarray
+    product_indptr: np.ndarray
+    product_type_ids: np.ndarray
+    product_quantities: np.ndarray
+    product_probabilities: np.ndarray
+
+    @classmethod
+    def from_blueprints(
+        cls, blueprints: Iterable[EveBlueprint], activity: str
+    ) -> BlueprintActivityArrays:
+        """Pack every blueprint that has ``activity`` into arrays.
+
+        Args:
+            blueprints: Blueprint models (any order)
+            activity: SDE activity name (e.g. ``"manufacturing"``)
+        """
+        rows = sorted(
+            (bp for bp in blueprints if activity in bp.activities),
+            key=lambda bp: bp.blueprint_type_id,
+        )
+        materials = [bp.activities[activity].materials for bp in rows]
+        products = [bp.activities[activity].products for bp in rows]
+        return cls(
+            activity=activity,
+            blueprint_type_ids=np.array(
+                [bp.blueprint_type_id for bp in rows], dtype=np.int64
+            ),
+            times=np.array([bp.activities[activity].time for bp in rows], np.int64),
+            max_production_limits=np.array(
+                [bp.max_production_limit or 0 for bp in rows], dtype=np.int64
+            ),
+            material_indptr=indptr_from_lengths(len(row) for row in materials),
+            material_type_ids=np.array(
+                [m.type_id for row in materials for m in row], dtype=np.int64
+            ),
+            material_quantities=np.array(
+                [m.quantity for row in materials for m in row], dtype=np.int64
+            ),
+            product_indptr=indptr_from_lengths(len(row) for row in products),
+            product_type_ids=np.array(
+                [p.type_id for row in products for p in row], dtype=np.int64
+            ),
+            product_quantities=np.array(
+                [p.quantity for row in products for p in row], dtype=np.int64
+            ),
+            product_probabilities=np.array(
+                [
+                    1.0 if p.probability is None else p.probability
+                    for row in products
+                    for p in row
+                ],
+                dtype=np.float64,
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.blueprint_type_ids)
+
+    @cached_property
+    def material_rows(self) -> np.ndarray:
+        """Row index of every material entry (for scatter-adds per blueprint)."""
+        return row_ids(self.material_indptr)
+
+    @cached_property
+    def product_rows(self) -> np.ndarray:
+        """Row index of every product entry."""
+        return row_ids(self.product_indptr)
+
+    def rows_of(self, blueprint_type_ids: Iterable[int] | np.ndarray) -> np.ndarray:
+        """Row positions of the given blueprint type IDs, -1 where absent."""
+        return find_rows(self.blueprint_type_ids, blueprint_type_ids)
+
+
+__all__ = ["INDUSTRY_ACTIVITY_NAMES", "BlueprintActivityArrays"]
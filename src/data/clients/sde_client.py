@@ -6,11 +6,13 @@ Handles:
 from __future__ import annotations
 
 import asyncio
-import io
 import json
 import logging
+import shutil
+import tempfile
 import zipfile
 from datetime import UTC, datetime
+from pathlib import Path, PurePosixPath
 from typing import TYPE_CHECKING, Any
 
 import httpx
@@ -37,13 +39,54 @@ CARED_TABLES = {
     "blueprints",
     "industryActivityMaterials",
     "industryActivityProducts",
+    "typeMaterials",
     "npcStations",
     "stations",
     "regions",
     "constellations",
     "solarSystems",
+    "mapRegions",
+    "mapConstellations",
+    "mapSolarSystems",
+    "mapStargates",
 }
 
+# SDE files (by table name) read by SDEJsonlParser; extracted from the
+# archive together with the members backing CARED_TABLES
+REQUIRED_SDE_TABLES = {
+    "types",
+    "groups",
+    "categories",
+    "marketGroups",
+    "blueprints",
+    "typeMaterials",
+    "npcStations",
+    "mapRegions",
+    "mapConstellations",
+    "mapSolarSystems",
+    "mapStargates",
+}
+
+# Buffer size for spooling the archive and streaming extracted members
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def _select_sde_members(names: list[str], tables: set[str] | None = None) -> list[str]:
+    """Pick the archive members backing tables the app reads.
+
+    Args:
+        names: Archive member names
+        tables: Optional subset of tables to extract
+    """
+    wanted = CARED_TABLES | REQUIRED_SDE_TABLES
+    if tables is not None:
+        wanted &= tables
+    return [
+        name
+        for name in names
+        if name.endswith(".jsonl") and PurePosixPath(name).stem in wanted
+    ]
+
 
 class SDEBuildMetadata:
     """Metadata about an SDE build."""
@@ -242,28 +285,50 @@ class SDEClient:
             self._emit_progress(ProgressPhase.ERROR, 0, 100, f"Download failed: {e}")
             return False
 
-    async def _download_rift_sde(self, build_id: str) -> None:
-        """Download SDE files from RIFT enhanced source."""
+    async def _download_rift_sde(
+        self, build_id: str, tables: set[str] | None = None
+    ) -> None:
+        """Download SDE files from RIFT enhanced source.
+
+        The archive is spooled to a temporary file rather than held in
+        memory, and only the members the app reads are extracted, several
+        at a time in worker threads.
+
+        Args:
+            build_id: Build to download.
+            tables: Optional subset of tables to extract (default: all needed).
+        """
         download_url = self.config.sde.rift_download_url_template.format(
             build_id=build_id
         )
-        async with httpx.AsyncClient(timeout=300.0) as client:
+        with tempfile.TemporaryDirectory(
+            prefix="sde-download-", dir=self.sde_dir.parent
+        ) as tmp_dir:
+            archive_path = Path(tmp_dir) / "sde.zip"
             try:
-                self._emit_progress(
-                    ProgressPhase.FETCHING,
-                    0,
-                    100,
-                    "Downloading SDE archive...",
-                )
+                await self._spool_archive(download_url, archive_path)
+                await self._extract_sde_members(archive_path, tables)
+            except Exception as e:
+                raise SDEDownloadError(f"Failed to download/extract SDE: {e}") from e
 
-                async with client.stream("GET", download_url) as response:
-                    response.raise_for_status()
-                    total_bytes = int(response.headers.get("Content-Length", 0))
-                    downloaded_bytes = 0
-                    archive_bytes = bytearray()
+    async def _spool_archive(self, download_url: str, archive_path: Path) -> None:
+        """Stream the SDE archive at ``download_url`` to ``archive_path``."""
+        async with httpx.AsyncClient(timeout=300.0) as client:
+            self._emit_progress(
+                ProgressPhase.FETCHING,
+                0,
+                100,
+                "Downloading SDE archive...",
+            )
+
+            async with client.stream("GET", download_url) as response:
+                response.raise_for_status()
+                total_bytes = int(response.headers.get("Content-Length", 0))
+                downloaded_bytes = 0
 
+                with open(archive_path, "wb") as archive:
                     async for chunk in response.aiter_bytes(64 * 1024):
-                        archive_bytes.extend(chunk)
+                        archive.write(chunk)
                         downloaded_bytes += len(chunk)
                         progress = (
                             int(downloaded_bytes * 100 / total_bytes)
@@ -283,39 +348,63 @@ class SDEClient:
                             detail=detail,
                         )
 
-                archive_bytes = bytes(archive_bytes)
-                total_size_mb = len(archive_bytes) / (1024 * 1024)
-
+    async def _extract_sde_members(
+        self, archive_path: Path, tables: set[str] | None = None
+    ) -> None:
+        """Extract the needed JSONL members of ``archive_path`` concurrently."""
+        total_size_mb = archive_path.stat().st_size / (1024 * 1024)
+        with zipfile.ZipFile(archive_path) as zf:
+            members = _select_sde_members(zf.namelist(), tables)
+        if not members:
+            raise SDEDownloadError("Archive contains none of the required SDE files")
+
+        self._emit_progress(
+            ProgressPhase.PROCESSING,
+            50,
+            100,
+            f"Extracting {len(members)} SDE files... ({total_size_mb:.1f} MB)",
+        )
+        total = len(members)
+        extracted_size_mb = 0.0
+        tasks = [
+            asyncio.create_task(
+                asyncio.to_thread(self._extract_member, archive_path, member)
+            )
+            for member in members
+        ]
+        try:
+            for idx, task in enumerate(asyncio.as_completed(tasks)):
+                extracted_size_mb += await task / (1024 * 1024)
+                progress = 50 + int((idx + 1) / total * 40)
                 self._emit_progress(
                     ProgressPhase.PROCESSING,
-                    50,
+                    progress,
                     100,
-                    f"Extracting SDE files... ({total_size_mb:.1f} MB)",
-                )
-                with zipfile.ZipFile(io.BytesIO(archive_bytes)) as zf:
-                    members = [m for m in zf.namelist() if m.endswith(".jsonl")]
-                    total = len(members)
-                    extracted_size_mb = 0
-                    for idx, member in enumerate(members):
-                        file_data = zf.read(member)
-                        extracted_size_mb += len(file_data) / (1024 * 1024)
-                        output_path = self.sde_dir / member.split("/")[-1]
-                        temp_path = output_path.with_suffix(".tmp")
-                        temp_path.write_bytes(file_data)
-                        temp_path.replace(output_path)
-                        if (idx + 1) % 5 == 0:
-                            progress = 50 + int((idx + 1) / total * 40)
-                            self._emit_progress(
-                                ProgressPhase.PROCESSING,
-                                progress,
-                                100,
-                                f"Extracted {idx + 1}/{total} files... ({extracted_size_mb:.1f}/{total_size_mb:.1f} MB)",
-                            )
-                logger.info(
-                    f"Extracted {len(members)} SDE files ({extracted_size_mb:.1f} MB)"
+                    f"Extracted {idx + 1}/{total} files... ({extracted_size_mb:.1f} MB)",
                 )
-            except Exception as e:
-                raise SDEDownloadError(f"Failed to download/extract SDE: {e}") from e
+        finally:
+            # Worker threads cannot be interrupted; let them finish before the
+            # temporary archive is removed
+            await asyncio.gather(*tasks, return_exceptions=True)
+        logger.info(f"Extracted {total} SDE files ({extracted_size_mb:.1f} MB)")
+
+    def _extract_member(self, archive_path: Path, member: str) -> int:
+        """Stream one archive member into the SDE directory (worker thread).
+
+        Each call opens its own handle on the archive so members decompress
+        independently. The file is replaced atomically.
+
+        Returns:
+            Number of bytes written.
+        """
+        output_path = self.sde_dir / PurePosixPath(member).name
+        temp_path = output_path.with_suffix(".tmp")
+        with zipfile.ZipFile(archive_path) as zf:
+            with zf.open(member) as src, open(temp_path, "wb") as dst:
+                shutil.copyfileobj(src, dst, _COPY_BUFFER_SIZE)
+        size = temp_path.stat().st_size
+        temp_path.replace(output_path)
+        return size
 
     async def _retry_request(
         self,
@@ -393,12 +482,34 @@ class SDEClient:
         Returns:
             Set of changed table names that we care about.
         """
+        changes = await self.collect_changes(from_build, to_build)
+        if changes is None:
+            # If we can't fetch changes, assume everything changed to be safe
+            return set(CARED_TABLES)
+        return set(changes)
+
+    async def collect_changes(
+        self, from_build: str, to_build: str
+    ) -> dict[str, set[int]] | None:
+        """Collect the record keys changed between two builds per cared table.
+
+        Walks the change feeds backwards from to_build until from_build and
+        merges each table's added, removed and changed keys.
+
+        Args:
+            from_build: Current build ID.
+            to_build: Target build ID.
+
+        Returns:
+            Mapping of table name to touched record keys (only tables with
+            changes), or None if the feeds could not be read completely.
+        """
         logger.info(f"Scanning changes from build {from_build} to {to_build}")
 
         if from_build == to_build:
-            return set()
+            return {}
 
-        changed_tables: set[str] = set()
+        changes: dict[str, set[int]] = {}
         current_build = int(to_build)
         target_build = int(from_build)
 
@@ -433,13 +544,15 @@ class SDEClient:
                                 next_build = last_build
                         elif key in CARED_TABLES:
                             # This table changed and we care about it
-                            has_changes = (
-                                data.get("added")
-                                or data.get("removed")
-                                or data.get("changed")
-                            )
-                            if has_changes:
-                                changed_tables.add(key)
+                            touched = [
+                                *data.get("added", []),
+                                *data.get("removed", []),
+                                *data.get("changed", []),
+                            ]
+                            if touched:
+                                changes.setdefault(key, set()).update(
+                                    int(record_key) for record_key in touched
+                                )
                                 logger.debug(
                                     f"Build {current_build}: {key} changed "
                                     f"(+{len(data.get('added', []))} "
@@ -463,14 +576,65 @@ class SDEClient:
                     logger.error(
                         f"Failed to fetch changes for build {current_build}: {e}"
                     )
-                    # If we can't fetch changes, assume everything changed to be safe
-                    return CARED_TABLES
+                    return None
 
         logger.info(
-            f"Found {len(changed_tables)} changed tables we care about: "
-            f"{', '.join(sorted(changed_tables))}"
+            f"Found {len(changes)} changed tables we care about: "
+            f"{', '.join(sorted(changes))}"
         )
-        return changed_tables
+        return changes
+
+    async def update_sde(
+        self, build_id: str | None = None
+    ) -> tuple[bool, dict[str, set[int]] | None]:
+        """Update the SDE to a build, incrementally where possible.
+
+        Uses the change feeds to find the tables and records that changed
+        since the applied build and extracts only those tables from the
+        build archive. Falls back to a full download when there is no applied
+        build or the feeds cannot be read.
+
+        Args:
+            build_id: Target build ID (latest if omitted).
+
+        Returns:
+            Tuple of (success, changes). ``changes`` maps SDE file names to the
+            touched record keys for patching caches in place; it is None when
+            a full download was performed and caches must be rebuilt.
+        """
+        try:
+            if build_id is None:
+                build_id = await self._fetch_latest_build_id()
+        except Exception as e:
+            logger.error(f"SDE update failed: {e}")
+            return False, None
+
+        current = self.load_metadata()
+        changes = None
+        if current is not None and any(self.sde_dir.glob("*.jsonl")):
+            changes = await self.collect_changes(current.build_id, build_id)
+        if changes is None:
+            return await self.download_sde(build_id), None
+
+        try:
+            tables = set(changes) & (CARED_TABLES | REQUIRED_SDE_TABLES)
+            if tables:
+                logger.info(
+                    f"Applying SDE build {build_id} incrementally: "
+                    f"{', '.join(sorted(tables))}"
+                )
+                await self._download_rift_sde(build_id, tables=tables)
+        except Exception as e:
+            logger.warning(f"Incremental SDE update failed, downloading in full: {e}")
+            return await self.download_sde(build_id), None
+
+        self.save_metadata(
+            SDEBuildMetadata(build_id=build_id, version=build_id, source="rift")
+        )
+        self._emit_progress(ProgressPhase.COMPLETE, 100, 100, f"SDE {build_id} applied")
+        return True, {
+            f"{table}.jsonl": keys for table, keys in changes.items() if table in tables
+        }
 
     def should_apply_build(self, changed_tables: set[str]) -> bool:
         """Determine if a build should be applied based on changed tables.
@@ -0,0 +1,61 @@
+"""Helpers for compressed sparse row (CSR) arrays built on NumPy.
+
+SDE relations such as blueprint materials or reprocessing yields map one ID
+to a short list of entries. They are packed as rows sorted by ID whose
+entries are contiguous slices of flat arrays delimited by an ``indptr``
+array, so lookups and aggregations run as vectorized array operations.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import numpy as np
+
+
+def indptr_from_lengths(lengths: Iterable[int]) -> np.ndarray:
+    """Row offsets (n + 1 entries) for rows with the given entry counts."""
+    counts = np.fromiter(lengths, dtype=np.int64)
+    indptr = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+    return indptr
+
+
+def row_ids(indptr: np.ndarray) -> np.ndarray:
+    """Row index of every entry (for scatter-adds per row)."""
+    return np.repeat(np.arange(len(indptr) - 1, dtype=np.int64), np.diff(indptr))
+
+
+def find_rows(sorted_ids: np.ndarray, wanted: Iterable[int] | np.ndarray) -> np.ndarray:
+    """Row positions of ``wanted`` IDs in ``sorted_ids``, -1 where absent."""
+    wanted_arr = np.asarray(
+        wanted if isinstance(wanted, np.ndarray) else list(wanted), dtype=np.int64
+    )
+    if not len(sorted_ids):
+        return np.full(len(wanted_arr), -1, dtype=np.int64)
+    rows = np.minimum(np.searchsorted(sorted_ids, wanted_arr), len(sorted_ids) - 1)
+    return np.where(sorted_ids[rows] == wanted_arr, rows, -1)
+
+
+def gather_rows(indptr: np.ndarray, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Entries of the selected rows as (position in ``rows``, entry index).
+
+    Args:
+        indptr: Row offsets
+        rows: Row positions to gather (must all be valid)
+
+    Returns:
+        Tuple of aligned arrays: which element of ``rows`` each entry belongs
+        to, and the entry's index into the flat entry arrays
+    """
+    starts = indptr[rows]
+    lengths = indptr[rows + 1] - starts
+    entry_rows = np.repeat(np.arange(len(rows), dtype=np.int64), lengths)
+    offsets = np.cumsum(lengths) - lengths
+    entries = starts[entry_rows] + (
+        np.arange(len(entry_rows), dtype=np.int64) - offsets[entry_rows]
+    )
+    return entry_rows, entries
+
+
+__all__ = ["find_rows", "gather_rows", "indptr_from_lengths", "row_ids"]
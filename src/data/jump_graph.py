@@ -0,0 +1,184 @@
+"""Solar system jump graph built from SDE stargates.
+
+Stargate connections are packed in CSR form: solar systems are rows sorted
+by ID, and the positions of the systems one jump away are contiguous slices
+of a flat ``neighbors`` array delimited by ``indptr``. Hop counts from one
+system to every other system come from a level-synchronous breadth-first
+search, where each level expands the whole frontier with array operations.
+Rows are memoized in a small LRU, and pinned origins such as trade hubs are
+kept for the graph's lifetime.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+
+import numpy as np
+
+from data.csr import find_rows, gather_rows, indptr_from_lengths
+
+# Hop-count rows (one int32 per system) kept besides pinned origins
+DEFAULT_DISTANCE_CACHE_SIZE = 64
+
+
+class JumpGraph:
+    """Stargate topology with memoized hop counts between solar systems."""
+
+    def __init__(
+        self,
+        system_ids: np.ndarray,
+        indptr: np.ndarray,
+        neighbors: np.ndarray,
+        *,
+        cache_size: int = DEFAULT_DISTANCE_CACHE_SIZE,
+    ) -> None:
+        """Wrap packed adjacency arrays.
+
+        Args:
+            system_ids: Sorted solar system IDs, one row each (int64)
+            indptr: Row offsets into ``neighbors`` (n + 1)
+            neighbors: Row positions of adjacent systems (int64)
+            cache_size: Number of unpinned hop-count rows to memoize
+        """
+        self.system_ids = system_ids
+        self.indptr = indptr
+        self.neighbors = neighbors
+        self._cache_size = cache_size
+        self._distances: OrderedDict[int, np.ndarray] = OrderedDict()
+        self._pinned: dict[int, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_stargates(
+        cls,
+        gate_systems: Mapping[int, int],
+        gate_destinations: Mapping[int, int],
+        **kwargs: int,
+    ) -> JumpGraph:
+        """Build the graph from stargate records.
+
+        Args:
+            gate_systems: Stargate ID -> solar system the gate is in
+            gate_destinations: Stargate ID -> solar system it jumps to
+            **kwargs: Passed to the constructor (``cache_size``)
+        """
+        edges = {
+            (source, gate_destinations[gate_id])
+            for gate_id, source in gate_systems.items()
+            if gate_id in gate_destinations
+        }
+        # Gates come in pairs, but count every connection in both directions
+        edges |= {(target, source) for source, target in edges}
+        pairs = sorted(edges)
+        system_ids = np.unique(
+            np.array([system for edge in pairs for system in edge], dtype=np.int64)
+        )
+        sources = np.array([source for source, _ in pairs], dtype=np.int64)
+        targets = np.array([target for _, target in pairs], dtype=np.int64)
+        rows = find_rows(system_ids, sources)
+        return cls(
+            system_ids=system_ids,
+            indptr=indptr_from_lengths(np.bincount(rows, minlength=len(system_ids))),
+            neighbors=find_rows(system_ids, targets),
+            **kwargs,
+        )
+
+    def __len__(self) -> int:
+        return len(self.system_ids)
+
+    def positions_of(self, system_ids: Iterable[int] | np.ndarray) -> np.ndarray:
+        """Row positions of the given solar system IDs, -1 where unknown."""
+        return find_rows(self.system_ids, system_ids)
+
+    def _search(self, origin: int) -> np.ndarray:
+        """Breadth-first hop counts from one row position (-1 unreachable)."""
+        distances = np.full(len(self), -1, dtype=np.int32)
+        distances[origin] = 0
+        frontier = np.array([origin], dtype=np.int64)
+        hops = 0
+        while len(frontier):
+            hops += 1
+            _, entries = gather_rows(self.indptr, frontier)
+            reached = self.neighbors[entries]
+            frontier = np.unique(reached[distances[reached] < 0])
+            distances[frontier] = hops
+        distances.setflags(write=False)
+        return distances
+
+    def distances_from(self, system_id: int) -> np.ndarray:
+        """Hop counts from one solar system to every system in the graph.
+
+        Args:
+            system_id: Origin solar system ID
+
+        Returns:
+            Read-only int32 array aligned with ``system_ids``; -1 marks
+            systems that cannot be reached. All -1 for unknown origins
+            (wormhole space has no stargates).
+        """
+        with self._lock:
+            row = self._pinned.get(system_id)
+            if row is None:
+                row = self._distances.get(system_id)
+                if row is not None:
+                    self._distances.move_to_end(system_id)
+        if row is not None:
+            return row
+
+        origin = int(self.positions_of([system_id])[0])
+        if origin < 0:
+            row = np.full(len(self), -1, dtype=np.int32)
+            row.setflags(write=False)
+        else:
+            row = self._search(origin)
+        with self._lock:
+            self._distances[system_id] = row
+            while len(self._distances) > self._cache_size:
+                self._distances.popitem(last=False)
+        return row
+
+    def pin(self, system_ids: Iterable[int]) -> None:
+        """Precompute hop counts from the given systems and never evict them.
+
+        Args:
+            system_ids: Frequently used origins, such as trade hubs
+        """
+        for system_id in system_ids:
+            row = self.distances_from(system_id)
+            with self._lock:
+                self._pinned[system_id] = row
+                self._distances.pop(system_id, None)
+
+    def jumps(
+        self, origin_id: int, system_ids: Iterable[int] | np.ndarray
+    ) -> np.ndarray:
+        """Hop counts from one system to many systems.
+
+        Args:
+            origin_id: Origin solar system ID
+            system_ids: Destination solar system IDs
+
+        Returns:
+            int32 array aligned with ``system_ids``; -1 where unreachable or
+            unknown
+        """
+        rows = self.positions_of(system_ids)
+        if not len(self):
+            return rows.astype(np.int32)
+        distances = self.distances_from(origin_id)[np.maximum(rows, 0)]
+        return np.where(rows >= 0, distances, -1).astype(np.int32)
+
+    def jumps_between(self, origin_id: int, destination_id: int) -> int | None:
+        """Hop count between two systems, or None if there is no gate route."""
+        hops = int(self.jumps(origin_id, [destination_id])[0])
+        return hops if hops >= 0 else None
+
+    def within(self, origin_id: int, max_jumps: int) -> np.ndarray:
+        """IDs of the systems at most ``max_jumps`` gates from a system."""
+        distances = self.distances_from(origin_id)
+        return self.system_ids[(distances >= 0) & (distances <= max_jumps)]
+
+
+__all__ = ["DEFAULT_DISTANCE_CACHE_SIZE", "JumpGraph"]
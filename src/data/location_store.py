@@ -0,0 +1,233 @@
+"""SQLite sidecar store for resolved locations and structure access state.
+
+Replaces rewriting a whole ``locations.json`` file on every change: each
+location is one row keyed by its ID, so a resolved structure batch or a
+custom name edit upserts only the rows that changed. Writes are synchronous
+and small, and the file runs in WAL mode, so callers on the UI thread or the
+event loop don't block on a full rewrite.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable, Mapping
+from datetime import datetime
+from pathlib import Path
+
+from models.app import LocationInfo
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS locations (
+    location_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    esi_name TEXT,
+    category TEXT NOT NULL,
+    last_checked TEXT NOT NULL,
+    owner_id INTEGER,
+    custom_name TEXT,
+    is_placeholder INTEGER NOT NULL DEFAULT 0,
+    solar_system_id INTEGER,
+    metadata TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_locations_last_checked ON locations(last_checked);
+CREATE TABLE IF NOT EXISTS structure_backoff (
+    structure_id INTEGER PRIMARY KEY,
+    retry_after TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS structure_access (
+    structure_id INTEGER NOT NULL,
+    character_id INTEGER NOT NULL,
+    allowed INTEGER NOT NULL,
+    checked_at TEXT NOT NULL,
+    PRIMARY KEY (structure_id, character_id)
+);
+"""
+
+_LOCATION_COLUMNS = (
+    "location_id",
+    "name",
+    "esi_name",
+    "category",
+    "last_checked",
+    "owner_id",
+    "custom_name",
+    "is_placeholder",
+    "solar_system_id",
+    "metadata",
+)
+
+_UPSERT_LOCATION = (
+    f"INSERT OR REPLACE INTO locations ({', '.join(_LOCATION_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_LOCATION_COLUMNS))})"
+)
+
+
+def _location_row(loc: LocationInfo) -> tuple:
+    return (
+        loc.location_id,
+        loc.name,
+        loc.esi_name or loc.name,
+        loc.category,
+        loc.last_checked.isoformat(),
+        loc.owner_id,
+        loc.custom_name,
+        int(loc.is_placeholder),
+        loc.solar_system_id,
+        json.dumps(loc.metadata) if loc.metadata else None,
+    )
+
+
+def _location_from_row(row: tuple) -> LocationInfo:
+    data = dict(zip(_LOCATION_COLUMNS, row, strict=True))
+    return LocationInfo(
+        location_id=data["location_id"],
+        name=data["esi_name"] or data["name"],
+        esi_name=data["esi_name"] or data["name"],
+        category=data["category"],
+        last_checked=datetime.fromisoformat(data["last_checked"]),
+        owner_id=data["owner_id"],
+        custom_name=data["custom_name"],
+        is_placeholder=bool(data["is_placeholder"]),
+        solar_system_id=data["solar_system_id"],
+        metadata=json.loads(data["metadata"]) if data["metadata"] else None,
+    )
+
+
+class LocationStore:
+    """Row-level persistence for the location cache."""
+
+    def __init__(self, path: str | Path):
+        """Open (or create) the store.
+
+        Args:
+            path: SQLite file path
+
+        Raises:
+            sqlite3.DatabaseError: If the file exists but is not a database
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+    def is_empty(self) -> bool:
+        """Whether no location has been stored yet."""
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM locations LIMIT 1").fetchone()
+        return row is None
+
+    def load_locations(self) -> list[LocationInfo]:
+        """Read every stored location (rows that fail to parse are skipped)."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(_LOCATION_COLUMNS)} FROM locations"
+            ).fetchall()
+        locations = []
+        for row in rows:
+            try:
+                locations.append(_location_from_row(row))
+            except (TypeError, ValueError) as e:
+                logger.debug("Skipping invalid location row %s: %s", row[0], e)
+        return locations
+
+    def upsert_locations(self, locations: Iterable[LocationInfo]) -> int:
+        """Insert or replace locations in one transaction.
+
+        Returns:
+            Number of rows written
+        """
+        rows = [_location_row(loc) for loc in locations]
+        if rows:
+            with self._lock, self._conn:
+                self._conn.executemany(_UPSERT_LOCATION, rows)
+        return len(rows)
+
+    def load_backoff(self) -> dict[int, datetime]:
+        """Read structure retry times (structure ID -> earliest retry)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT structure_id, retry_after FROM structure_backoff"
+            ).fetchall()
+        return {
+            structure_id: datetime.fromisoformat(retry_after)
+            for structure_id, retry_after in rows
+        }
+
+    def set_backoff(self, retry_after: Mapping[int, datetime]) -> None:
+        """Record when failed structures may be retried."""
+        if retry_after:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO structure_backoff VALUES (?, ?)",
+                    [(sid, when.isoformat()) for sid, when in retry_after.items()],
+                )
+
+    def clear_backoff(self, structure_ids: Iterable[int] | None = None) -> None:
+        """Forget retry times for some structures, or all when None."""
+        with self._lock, self._conn:
+            if structure_ids is None:
+                self._conn.execute("DELETE FROM structure_backoff")
+            else:
+                self._conn.executemany(
+                    "DELETE FROM structure_backoff WHERE structure_id = ?",
+                    [(int(sid),) for sid in structure_ids],
+                )
+
+    def load_access(self) -> dict[int, dict[int, tuple[bool, datetime]]]:
+        """Read the structure access matrix.
+
+        Returns:
+            Structure ID -> character ID -> (allowed, checked_at)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT structure_id, character_id, allowed, checked_at "
+                "FROM structure_access"
+            ).fetchall()
+        access: dict[int, dict[int, tuple[bool, datetime]]] = {}
+        for structure_id, character_id, allowed, checked_at in rows:
+            access.setdefault(structure_id, {})[character_id] = (
+                bool(allowed),
+                datetime.fromisoformat(checked_at),
+            )
+        return access
+
+    def set_access(self, entries: Iterable[tuple[int, int, bool, datetime]]) -> None:
+        """Record access checks as (structure, character, allowed, checked_at)."""
+        rows = [
+            (int(sid), int(cid), int(allowed), checked_at.isoformat())
+            for sid, cid, allowed, checked_at in entries
+        ]
+        if rows:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO structure_access VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+
+    def clear_access(self, character_ids: Iterable[int] | None = None) -> None:
+        """Forget access checks made by some characters, or all when None."""
+        with self._lock, self._conn:
+            if character_ids is None:
+                self._conn.execute("DELETE FROM structure_access")
+            else:
+                self._conn.executemany(
+                    "DELETE FROM structure_access WHERE character_id = ?",
+                    [(int(cid),) for cid in character_ids],
+                )
+
+
+__all__ = ["LocationStore"]
@@ -0,0 +1,223 @@
+"""Market group hierarchy flattened into Euler-tour intervals.
+
+Market groups are numbered in depth-first (pre-order) visiting order, so the
+descendants of a group are exactly the groups numbered from its ``enter`` up
+to its ``exit`` position. Types are kept sorted by the position of their
+market group, which makes "every type under Ships > Frigates" one range
+lookup, and subtree tests or roll-ups to a tree level vectorized array
+operations instead of per-group recursion.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+
+from data.csr import find_rows
+
+
+@dataclass(frozen=True, eq=False)
+class MarketGroupTree:
+    """Market group hierarchy with pre-computed descendant intervals.
+
+    Attributes:
+        group_ids: Market group IDs in depth-first order; a group's position
+            is its ``enter`` index (int64)
+        parent_positions: Position of each group's parent, -1 for roots
+        depths: Depth of each group (roots are 0)
+        exits: One past the position of each group's last descendant
+        type_ids: Type IDs sorted by the position of their market group
+        type_positions: Market group position of each entry of ``type_ids``
+    """
+
+    group_ids: np.ndarray
+    parent_positions: np.ndarray
+    depths: np.ndarray
+    exits: np.ndarray
+    type_ids: np.ndarray
+    type_positions: np.ndarray
+
+    @classmethod
+    def from_parents(
+        cls,
+        parent_ids: Mapping[int, int | None],
+        types_by_group: Iterable[tuple[int, Iterable[int]]] = (),
+    ) -> MarketGroupTree:
+        """Flatten a market group hierarchy.
+
+        Args:
+            parent_ids: Every market group ID -> its parent ID (None for
+                roots); groups whose parent is unknown are treated as roots
+            types_by_group: (market group ID, type IDs) pairs; types in
+                unknown groups are skipped
+        """
+        children: dict[int | None, list[int]] = defaultdict(list)
+        for group_id, parent_id in parent_ids.items():
+            is_root = parent_id is None or parent_id not in parent_ids
+            children[None if is_root else parent_id].append(group_id)
+
+        order: list[int] = []
+        parents: list[int] = []
+        depths: list[int] = []
+        exits: list[int] = []
+        # Iterative pre-order walk; a negative entry closes a visited group
+        stack: list[tuple[int, int, int]] = [
+            (group_id, -1, 0) for group_id in sorted(children[None], reverse=True)
+        ]
+        while stack:
+            group_id, parent_pos, depth = stack.pop()
+            if group_id < 0:
+                exits[parent_pos] = len(order)
+                continue
+            pos = len(order)
+            order.append(group_id)
+            parents.append(parent_pos)
+            depths.append(depth)
+            exits.append(pos + 1)
+            stack.append((-1, pos, depth))
+            stack.extend(
+                (child, pos, depth + 1)
+                for child in sorted(children.get(group_id, ()), reverse=True)
+            )
+
+        position_of = {group_id: pos for pos, group_id in enumerate(order)}
+        type_rows: list[int] = []
+        type_list: list[int] = []
+        for group_id, type_ids in types_by_group:
+            pos = position_of.get(group_id)
+            if pos is not None:
+                members = list(type_ids)
+                type_list.extend(members)
+                type_rows.extend([pos] * len(members))
+        positions = np.array(type_rows, dtype=np.int64)
+        type_order = np.lexsort((np.array(type_list, dtype=np.int64), positions))
+        return cls(
+            group_ids=np.array(order, dtype=np.int64),
+            parent_positions=np.array(parents, dtype=np.int64),
+            depths=np.array(depths, dtype=np.int64),
+            exits=np.array(exits, dtype=np.int64),
+            type_ids=np.array(type_list, dtype=np.int64)[type_order],
+            type_positions=positions[type_order],
+        )
+
+    def __len__(self) -> int:
+        return len(self.group_ids)
+
+    @cached_property
+    def _sorted_group_ids(self) -> tuple[np.ndarray, np.ndarray]:
+        order = np.argsort(self.group_ids)
+        return self.group_ids[order], order
+
+    @cached_property
+    def _sorted_type_ids(self) -> tuple[np.ndarray, np.ndarray]:
+        order = np.argsort(self.type_ids)
+        return self.type_ids[order], order
+
+    def positions_of(self, group_ids: Iterable[int] | np.ndarray) -> np.ndarray:
+        """Positions of the given market group IDs, -1 where unknown."""
+        sorted_ids, order = self._sorted_group_ids
+        rows = find_rows(sorted_ids, group_ids)
+        if not len(order):
+            return rows
+        return np.where(rows >= 0, order[np.maximum(rows, 0)], -1)
+
+    def type_group_positions(self, type_ids: Iterable[int] | np.ndarray) -> np.ndarray:
+        """Market group position of each type, -1 where not on the market."""
+        sorted_ids, order = self._sorted_type_ids
+        rows = find_rows(sorted_ids, type_ids)
+        if not len(order):
+            return rows
+        return np.where(rows >= 0, self.type_positions[order[np.maximum(rows, 0)]], -1)
+
+    def descendants(self, group_id: int) -> np.ndarray:
+        """IDs of a market group and all groups below it (empty if unknown)."""
+        pos = int(self.positions_of([group_id])[0])
+        if pos < 0:
+            return self.group_ids[:0]
+        return self.group_ids[pos : self.exits[pos]]
+
+    def types_under(self, group_id: int) -> np.ndarray:
+        """IDs of every type in a market group or any group below it."""
+        pos = int(self.positions_of([group_id])[0])
+        if pos < 0:
+            return self.type_ids[:0]
+        start, end = np.searchsorted(self.type_positions, [pos, self.exits[pos]])
+        return self.type_ids[start:end]
+
+    def ancestors(self, group_id: int) -> list[int]:
+        """IDs of a market group's ancestors, root first (excluding itself)."""
+        pos = int(self.positions_of([group_id])[0])
+        chain: list[int] = []
+        while pos >= 0:
+            pos = int(self.parent_positions[pos])
+            if pos >= 0:
+                chain.append(int(self.group_ids[pos]))
+        return chain[::-1]
+
+    def is_under(
+        self, group_ids: Iterable[int] | np.ndarray, ancestor_id: int
+    ) -> np.ndarray:
+        """Whether each market group is ``ancestor_id`` or below it."""
+        positions = self.positions_of(group_ids)
+        anc = int(self.positions_of([ancestor_id])[0])
+        if anc < 0:
+            return np.zeros(len(positions), dtype=bool)
+        return (positions >= anc) & (positions < self.exits[anc])
+
+    def ancestor_positions(self, positions: np.ndarray, depth: int) -> np.ndarray:
+        """Position of each group's ancestor at ``depth``.
+
+        Groups shallower than ``depth`` map to themselves; -1 stays -1.
+        """
+        result = np.asarray(positions, dtype=np.int64).copy()
+        valid = np.flatnonzero(result >= 0)
+        # Climb one level per pass; trees are only a handful of levels deep
+        while len(valid):
+            valid = valid[self.depths[result[valid]] > depth]
+            result[valid] = self.parent_positions[result[valid]]
+        return result
+
+    def rollup(
+        self,
+        type_ids: Iterable[int] | np.ndarray,
+        values: Iterable[float] | np.ndarray,
+        depth: int = 0,
+    ) -> dict[int, float]:
+        """Sum values per market group at one tree level in a single pass.
+
+        Args:
+            type_ids: Type ID per value
+            values: Values to aggregate (e.g. ISK per asset stack)
+            depth: Tree level to aggregate at (0 = root groups); types in
+                shallower groups are summed under their own group
+
+        Returns:
+            Dict mapping market group ID -> summed value; types without a
+            market group are left out
+        """
+        positions = self.ancestor_positions(self.type_group_positions(type_ids), depth)
+        weights = np.asarray(
+            values if isinstance(values, np.ndarray) else list(values),
+            dtype=np.float64,
+        )
+        if weights.shape != positions.shape:
+            raise ValueError(f"Expected {len(positions)} values, got {weights.shape}")
+        known = positions >= 0
+        totals = np.bincount(
+            positions[known], weights=weights[known], minlength=len(self)
+        )
+        touched = np.unique(positions[known])
+        return dict(
+            zip(
+                self.group_ids[touched].tolist(),
+                totals[touched].tolist(),
+                strict=True,
+            )
+        )
+
+
+__all__ = ["MarketGroupTree"]
@@ -1,15 +1,24 @@
 """SDE JSONL data parser for EVE Online static data."""
 
+import json
 import logging
-from collections.abc import Iterator
+import multiprocessing
+import os
+import re
+from collections.abc import Callable, Collection, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
+from pydantic import BaseModel
+
 from models.eve import (
+    EveBlueprint,
     EveCategory,
     EveGroup,
     EveMarketGroup,
     EveType,
+    EveTypeMaterials,
 )
 from utils.jsonl_parser import JSONLParser
 
@@ -85,16 +94,172 @@ FIELD_NAME_MAP = {
 }
 
 
+def _map_keys(data: dict[str, Any]) -> dict[str, Any]:
+    """Map SDE keys to model field names recursively.
+
+    Handles:
+    - Converting SDE keys to our domain keys using FIELD_NAME_MAP
+    - Recursively processing nested dicts and lists
+
+    Args:
+        data: Raw dictionary from JSONL
+
+    Returns:
+        Dictionary with snake_case keys (recursively applied)
+
+    """
+    out: dict[str, Any] = {}
+
+    for k, v in data.items():
+        # Map key using the field name mapping, fall back to original if not found
+        mapped_key: str = FIELD_NAME_MAP.get(k, k)
+
+        # If this field is a translated object (e.g. name: {"en": "...", "de": "..."})
+        # prefer the English ('en') value when available. This fixes Pydantic errors where
+        # models expect a string but the SDE provides a dict of translations.
+        if isinstance(v, dict) and mapped_key in (
+            "name",
+            "description",
+            "display_name",
+        ):
+            # Prefer English
+            en_val = v.get("en")
+            if isinstance(en_val, str):
+                out[mapped_key] = en_val
+            else:
+                # Fallback to the first string value found
+                picked: Any = None
+                for val in v.values():
+                    if isinstance(val, str):
+                        picked = val
+                        break
+                out[mapped_key] = picked
+
+        # Recursively process nested structures
+        elif isinstance(v, dict):
+            out[mapped_key] = _map_keys(v)  # type: ignore[list-item]
+        elif isinstance(v, list):
+            out[mapped_key] = [
+                _map_keys(item) if isinstance(item, dict) else item  # type: ignore[list-item]
+                for item in v  # type: ignore[list-item]
+            ]
+        else:
+            out[mapped_key] = v
+
+    return out
+
+
+# Model loaders that can be parsed in byte-range chunks by worker processes:
+# loader name -> (file name, model class, id field)
+_CHUNKED_MODEL_LOADERS: dict[str, tuple[str, type[BaseModel], str]] = {
+    "types": ("types.jsonl", EveType, "type_id"),
+    "categories": ("categories.jsonl", EveCategory, "category_id"),
+    "groups": ("groups.jsonl", EveGroup, "group_id"),
+    "market_groups": ("marketGroups.jsonl", EveMarketGroup, "marketgroup_id"),
+    "blueprints": ("blueprints.jsonl", EveBlueprint, "blueprint_type_id"),
+    "type_materials": ("typeMaterials.jsonl", EveTypeMaterials, "type_id"),
+}
+
+# Leading ``_key`` of an SDE JSONL line, read without decoding the record
+_LEADING_KEY = re.compile(rb'^\s*\{\s*"_key"\s*:\s*(-?\d+)\s*[,}]')
+
+# Split model files into roughly this many bytes per worker task
+_CHUNK_BYTES = 4 * 1024 * 1024
+
+
+def _iter_chunk_lines(path: Path, start: int, end: int) -> Iterator[bytes]:
+    """Yield the non-empty lines that start within ``[start, end)``.
+
+    A line straddling ``start`` belongs to the previous chunk, so chunks can
+    be cut at arbitrary byte offsets without splitting or repeating records.
+    """
+    with open(path, "rb") as f:
+        if start:
+            f.seek(start - 1)
+            f.readline()
+        pos = f.tell()
+        while pos < end:
+            line = f.readline()
+            if not line:
+                break
+            pos += len(line)
+            line = line.strip()
+            if line:
+                yield line
+
+
+def _parse_model_chunk(
+    loader: str, path: str, start: int, end: int
+) -> list[tuple[Any, ...]]:
+    """Worker: parse one byte range of a model file into compact records.
+
+    Records are validated here and returned as tuples of field values in
+    model field order, which pickle far smaller than model instances.
+    """
+    _, model, _ = _CHUNKED_MODEL_LOADERS[loader]
+    records: list[tuple[Any, ...]] = []
+    for line in _iter_chunk_lines(Path(path), start, end):
+        try:
+            data = _map_keys(json.loads(line))
+        except json.JSONDecodeError as e:
+            logger.warning(f"Invalid JSON in {path}: {e}")
+            continue
+        try:
+            obj = model(**data)
+        except Exception as e:
+            logger.error(f"Failed to parse {loader} {data.get('id', 'unknown')}: {e}")
+            continue
+        records.append(tuple(getattr(obj, field) for field in model.model_fields))
+    return records
+
+
+def _load_jsonl_records(path: Path, keys: frozenset[int]) -> Iterator[dict[str, Any]]:
+    """Yield only the records of ``path`` whose ``_key`` is in ``keys``.
+
+    Lines are matched on their leading ``_key`` before decoding, so
+    records that are not wanted are never passed to ``json.loads``.
+    """
+    with open(path, "rb") as f:
+        for line in f:
+            match = _LEADING_KEY.match(line)
+            if match is not None and int(match[1]) not in keys:
+                continue
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.warning(f"Invalid JSON in {path}: {e}")
+                continue
+            if match is not None or data.get("_key") in keys:
+                yield data
+
+
+def _run_loader(data_path: str, loader: str) -> Any:
+    """Worker: run one SDEJsonlParser loader that returns plain ids/names."""
+    return getattr(SDEJsonlParser(data_path), f"load_{loader}")()
+
+
 class SDEJsonlParser:
     """Parser for SDE JSONL files with lazy loading capabilities."""
 
-    def __init__(self, data_path: Path | str):
+    def __init__(
+        self,
+        data_path: Path | str,
+        record_filter: Mapping[str, Collection[int]] | None = None,
+    ):
         """Initialize the parser with the SDE data path.
 
         Args:
             data_path: Path to the SDE data directory
+            record_filter: Optional mapping of file name to the only record
+                keys to load from that file (see restricted_to)
         """
         self.file_path: Path = Path(data_path)
+        self._record_filter: dict[str, frozenset[int]] = {
+            name: frozenset(ids) for name, ids in (record_filter or {}).items()
+        }
 
         if not self.file_path.exists():
             logger.info(
@@ -182,6 +347,67 @@ class SDEJsonlParser:
             logger.error(f"Market groups file not found: {e}")
             raise
 
+    def load_market_group_parent_ids(self) -> dict[int, int]:
+        """Load market group to parent market group mapping from marketGroups.jsonl.
+
+        Returns:
+            Dictionary mapping market group ID to parent market group ID
+            (root groups are left out)
+
+        """
+        group_parents = {}
+        try:
+            for data in self._load_jsonl("marketGroups.jsonl"):
+                group_id = data.get("_key")
+                parent_id = data.get("parentGroupID")
+
+                if group_id is not None and parent_id is not None:
+                    group_parents[int(group_id)] = int(parent_id)
+        except FileNotFoundError as e:
+            logger.warning(f"Market groups file not found: {e}")
+        except Exception as e:
+            logger.error(f"Failed to load market group parents: {e}")
+
+        return group_parents
+
+    def load_blueprints(self) -> Iterator[EveBlueprint]:
+        """Load all blueprints with their activities from blueprints.jsonl.
+
+        Yields:
+            EveBlueprint objects
+
+        """
+        try:
+            for data in self._load_jsonl("blueprints.jsonl"):
+                data = self._map_keys(data)
+                try:
+                    yield EveBlueprint(**data)
+                except Exception as e:
+                    item_id = data.get("id", "unknown")
+                    logger.error(f"Failed to parse blueprint {item_id}: {e}")
+                    continue
+        except FileNotFoundError:
+            logger.warning("blueprints.jsonl not found")
+
+    def load_type_materials(self) -> Iterator[EveTypeMaterials]:
+        """Load reprocessing yields from typeMaterials.jsonl.
+
+        Yields:
+            EveTypeMaterials objects
+
+        """
+        try:
+            for data in self._load_jsonl("typeMaterials.jsonl"):
+                data = self._map_keys(data)
+                try:
+                    yield EveTypeMaterials(**data)
+                except Exception as e:
+                    item_id = data.get("id", "unknown")
+                    logger.error(f"Failed to parse type materials {item_id}: {e}")
+                    continue
+        except FileNotFoundError:
+            logger.warning("typeMaterials.jsonl not found")
+
     def load_blueprint_type_ids(self) -> set[int]:
         """Load all blueprint type IDs from blueprints.jsonl.
 
@@ -223,6 +449,35 @@ class SDEJsonlParser:
 
         return station_ids
 
+    def load_type_names(self) -> dict[int, str]:
+        """Load type IDs and English names from types.jsonl.
+
+        Returns:
+            Dictionary mapping type ID to type name
+
+        """
+        names = {}
+        try:
+            for data in self._load_jsonl("types.jsonl"):
+                type_id = data.get("_key")
+                name_data = data.get("name")
+
+                if type_id is not None and name_data:
+                    # name is a dict with translations, prefer English
+                    name = (
+                        name_data.get("en")
+                        if isinstance(name_data, dict)
+                        else str(name_data)
+                    )
+                    if name:
+                        names[int(type_id)] = name
+        except FileNotFoundError as e:
+            logger.warning(f"Types file not found: {e}")
+        except Exception as e:
+            logger.error(f"Failed to load type names: {e}")
+
+        return names
+
     def load_npc_station_names(self) -> dict[int, str]:
         """Load NPC station IDs and names from npcStations.jsonl.
 
@@ -405,6 +660,138 @@ class SDEJsonlParser:
 
         return constellation_regions
 
+    def load_stargate_system_ids(self) -> dict[int, int]:
+        """Load stargate to solar system ID mapping from mapStargates.jsonl.
+
+        Returns:
+            Dictionary mapping stargate ID to the solar system it is in
+
+        """
+        gate_systems = {}
+        try:
+            for data in self._load_jsonl("mapStargates.jsonl"):
+                gate_id = data.get("_key")
+                system_id = data.get("solarSystemID")
+
+                if gate_id is not None and system_id is not None:
+                    gate_systems[int(gate_id)] = int(system_id)
+        except FileNotFoundError as e:
+            logger.warning(f"Stargate map file not found: {e}")
+        except Exception as e:
+            logger.error(f"Failed to load stargate system IDs: {e}")
+
+        return gate_systems
+
+    def load_stargate_destination_ids(self) -> dict[int, int]:
+        """Load stargate to destination solar system mapping from mapStargates.jsonl.
+
+        Returns:
+            Dictionary mapping stargate ID to the solar system it jumps to
+
+        """
+        gate_destinations = {}
+        try:
+            for data in self._load_jsonl("mapStargates.jsonl"):
+                gate_id = data.get("_key")
+                destination = data.get("destination")
+                system_id = (
+                    destination.get("solarSystemID")
+                    if isinstance(destination, dict)
+                    else None
+                )
+
+                if gate_id is not None and system_id is not None:
+                    gate_destinations[int(gate_id)] = int(system_id)
+        except FileNotFoundError as e:
+            logger.warning(f"Stargate map file not found: {e}")
+        except Exception as e:
+            logger.error(f"Failed to load stargate destinations: {e}")
+
+        return gate_destinations
+
+    def load_parallel(
+        self, loaders: Iterable[str], max_workers: int | None = None
+    ) -> dict[str, Any]:
+        """Run several loaders concurrently in a process pool.
+
+        Model files are split into byte-range chunks so that large files such
+        as types.jsonl are parsed by several workers at once. Workers return
+        compact records which are rebuilt into models here without being
+        validated a second time.
+
+        Args:
+            loaders: Loader names without the ``load_`` prefix
+                (e.g. ``"types"``, ``"npc_station_names"``)
+            max_workers: Number of worker processes; defaults to the CPU count
+
+        Returns:
+            Mapping of loader name to result. Model loaders produce
+            ``{id: model}`` dicts; others return what their ``load_`` method
+            returns.
+        """
+        workers = max_workers or os.cpu_count() or 1
+        results: dict[str, Any] = {}
+        tasks: list[tuple[str, Callable[..., Any], tuple[Any, ...]]] = []
+        for loader in dict.fromkeys(loaders):
+            spec = _CHUNKED_MODEL_LOADERS.get(loader)
+            if spec is None:
+                tasks.append((loader, _run_loader, (str(self.file_path), loader)))
+                continue
+            results[loader] = {}
+            path = self.file_path / spec[0]
+            if not path.exists():
+                logger.debug("Skipping missing SDE file: %s", path)
+                continue
+            size = path.stat().st_size
+            step = -(-size // max(1, min(workers, -(-size // _CHUNK_BYTES))))
+            for start in range(0, size, step):
+                end = min(start + step, size)
+                tasks.append(
+                    (loader, _parse_model_chunk, (loader, str(path), start, end))
+                )
+
+        if workers <= 1 or len(tasks) <= 1:
+            outputs = [fn(*args) for _, fn, args in tasks]
+        else:
+            # Spawn rather than fork: builds run on a background thread
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(tasks)),
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as pool:
+                futures: list[Future[Any]] = [
+                    pool.submit(fn, *args) for _, fn, args in tasks
+                ]
+                outputs = [future.result() for future in futures]
+
+        for (loader, _, _), output in zip(tasks, outputs, strict=True):
+            spec = _CHUNKED_MODEL_LOADERS.get(loader)
+            if spec is None:
+                results[loader] = output
+                continue
+            _, model, id_field = spec
+            fields = tuple(model.model_fields)
+            merged = results[loader]
+            for record in output:
+                obj = model.model_construct(**dict(zip(fields, record, strict=True)))
+                merged[getattr(obj, id_field)] = obj
+        return results
+
+    def restricted_to(self, keys: Mapping[str, Collection[int]]) -> "SDEJsonlParser":
+        """Return a view of this parser that only loads the given records.
+
+        Loaders on the view behave as usual, but for each listed file only
+        records whose ``_key`` is in the given keys are decoded; other files
+        load in full. Used to re-read the handful of records named in an SDE
+        change feed without parsing whole files.
+
+        Args:
+            keys: Mapping of file name to record keys to load
+
+        Returns:
+            A parser sharing this parser's data path.
+        """
+        return SDEJsonlParser(self.file_path, {**self._record_filter, **keys})
+
     def _load_jsonl(self, filename: str) -> Iterator[dict[str, Any]]:
         """Load a JSONL file and return an iterator of dictionaries.
 
@@ -422,59 +809,13 @@ class SDEJsonlParser:
         if not file_path.exists():
             logger.debug("Skipping missing SDE file: %s", file_path)
             return
+        keys = self._record_filter.get(filename)
+        if keys is not None:
+            yield from _load_jsonl_records(file_path, keys)
+            return
         parser = JSONLParser(file_path)
         yield from parser.parse()
 
     def _map_keys(self, data: dict[str, Any]) -> dict[str, Any]:
-        """Map SDE keys to model field names recursively.
-
-        Handles:
-        - Converting SDE keys to our domain keys using FIELD_NAME_MAP
-        - Recursively processing nested dicts and lists
-
-        Args:
-            data: Raw dictionary from JSONL
-
-        Returns:
-            Dictionary with snake_case keys (recursively applied)
-
-        """
-        out: dict[str, Any] = {}
-
-        for k, v in data.items():
-            # Map key using the field name mapping, fall back to original if not found
-            mapped_key: str = FIELD_NAME_MAP.get(k, k)
-
-            # If this field is a translated object (e.g. name: {"en": "...", "de": "..."})
-            # prefer the English ('en') value when available. This fixes Pydantic errors where
-            # models expect a string but the SDE provides a dict of translations.
-            if isinstance(v, dict) and mapped_key in (
-                "name",
-                "description",
-                "display_name",
-            ):
-                # Prefer English
-                en_val = v.get("en")
-                if isinstance(en_val, str):
-                    out[mapped_key] = en_val
-                else:
-                    # Fallback to the first string value found
-                    picked: Any = None
-                    for val in v.values():
-                        if isinstance(val, str):
-                            picked = val
-                            break
-                    out[mapped_key] = picked
-
-            # Recursively process nested structures
-            elif isinstance(v, dict):
-                out[mapped_key] = self._map_keys(v)  # type: ignore[list-item]
-            elif isinstance(v, list):
-                out[mapped_key] = [
-                    self._map_keys(item) if isinstance(item, dict) else item  # type: ignore[list-item]
-                    for item in v  # type: ignore[list-item]
-                ]
-            else:
-                out[mapped_key] = v
-
-        return out
+        """Map SDE keys to model field names recursively (see module _map_keys)."""
+        return _map_keys(data)
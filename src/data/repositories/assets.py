@@ -7,6 +7,17 @@ as their first parameter.
 Functions:
     - save_snapshot: Save a new asset snapshot and track changes
     - get_current_assets: Get current assets for a character
+    - get_blueprint_copy_counts: Count current blueprint copies per character/type
+    - get_root_locations: Get the persisted root location of each current asset
+    - get_assets_at_roots: Get current assets under specific root locations
+    - get_root_location_summary: Count current assets per root location
+    - backfill_root_locations: Compute root columns for rows stored without them
+    - rebuild_valuation_ledger: Rebuild a character's valuation ledger
+    - get_ledger_type_ids: Get type IDs held in a character's valuation ledger
+    - get_ledger_prices: Get the unit prices recorded in a valuation ledger
+    - set_ledger_prices: Record resolved unit prices in a valuation ledger
+    - sum_ledger_values: Sum valuation ledgers per character
+    - clear_valuation_ledger: Drop a character's valuation ledger
     - get_history: Get asset change history
     - get_snapshots: Get snapshot metadata history
 """
@@ -98,6 +109,9 @@ async def save_snapshot(
     # Save changes
     if changes:
         await _save_changes(repo, snapshot_id, character_id, changes)
+        await _apply_ledger_deltas(
+            repo, character_id, _ledger_deltas(current_assets, assets, changes)
+        )
 
     # Update current assets
     await _update_current_assets(repo, character_id, assets, snapshot_time)
@@ -134,25 +148,213 @@ async def get_current_assets(repo: Repository, character_id: int) -> list[EveAss
         (character_id,),
     )
 
-    return [
-        EveAsset(
-            item_id=row["item_id"],
-            type_id=row["type_id"],
-            quantity=row["quantity"],
-            location_id=row["location_id"],
-            location_type=row["location_type"],
-            location_flag=row["location_flag"],
-            is_singleton=bool(row["is_singleton"]),
-            is_blueprint_copy=(
-                bool(row["is_blueprint_copy"])
-                if row["is_blueprint_copy"] is not None
-                else None
-            ),
+    return [_row_to_asset(row) for row in rows]
+
+
+def _row_to_asset(row: Any) -> EveAsset:
+    """Convert a current_assets row to an EveAsset."""
+    return EveAsset(
+        item_id=row["item_id"],
+        type_id=row["type_id"],
+        quantity=row["quantity"],
+        location_id=row["location_id"],
+        location_type=row["location_type"],
+        location_flag=row["location_flag"],
+        is_singleton=bool(row["is_singleton"]),
+        is_blueprint_copy=(
+            bool(row["is_blueprint_copy"])
+            if row["is_blueprint_copy"] is not None
+            else None
+        ),
+    )
+
+
+# Rows counted towards asset value: live stacks that are not blueprint copies
+_VALUED_ASSET_FILTER = """
+    (removed_at IS NULL OR removed_at = '')
+    AND quantity > 0
+    AND (is_blueprint_copy IS NULL OR is_blueprint_copy = 0)
+"""
+
+
+async def get_blueprint_copy_counts(
+    repo: Repository, character_ids: list[int]
+) -> dict[int, dict[int, int]]:
+    """Count current blueprint copies per character and type in one query.
+
+    Copies are valued separately from the valuation ledger (see
+    BlueprintValuator), so they are grouped here rather than priced per row.
+
+    Args:
+        repo: Repository instance
+        character_ids: Character IDs
+
+    Returns:
+        Dict mapping character_id -> {type_id: number of copies}
+    """
+    if not character_ids:
+        return {}
+    placeholders = ",".join("?" for _ in character_ids)
+    rows = await repo.fetchall(
+        f"""
+        SELECT character_id, type_id, COUNT(*) AS copies
+        FROM current_assets
+        WHERE character_id IN ({placeholders})
+          AND (removed_at IS NULL OR removed_at = '')
+          AND is_blueprint_copy = 1
+        GROUP BY character_id, type_id
+        """,
+        tuple(character_ids),
+    )
+    counts: dict[int, dict[int, int]] = {}
+    for row in rows:
+        counts.setdefault(int(row["character_id"]), {})[int(row["type_id"])] = int(
+            row["copies"]
+        )
+    return counts
+
+
+async def get_root_locations(
+    repo: Repository, character_id: int
+) -> dict[int, tuple[int, str]]:
+    """Get the persisted root location of each current asset.
+
+    Args:
+        repo: Repository instance
+        character_id: Character ID
+
+    Returns:
+        Dict mapping item_id -> (root_location_id, root_location_type) for
+        assets whose root could be resolved
+    """
+    rows = await repo.fetchall(
+        """
+        SELECT item_id, root_location_id, root_location_type
+        FROM current_assets
+        WHERE character_id = ? AND (removed_at IS NULL OR removed_at = '')
+          AND root_location_id IS NOT NULL
+        """,
+        (character_id,),
+    )
+    return {
+        int(row["item_id"]): (
+            int(row["root_location_id"]),
+            row["root_location_type"] or "",
         )
         for row in rows
+    }
+
+
+async def get_assets_at_roots(
+    repo: Repository, character_id: int, root_location_ids: list[int]
+) -> list[EveAsset]:
+    """Get current assets whose root location is one of the given locations.
+
+    Args:
+        repo: Repository instance
+        character_id: Character ID
+        root_location_ids: Root location IDs (stations, structures, systems)
+
+    Returns:
+        List of current assets, including those nested in containers
+    """
+    if not root_location_ids:
+        return []
+    placeholders = ",".join("?" for _ in root_location_ids)
+    rows = await repo.fetchall(
+        f"""
+        SELECT item_id, type_id, quantity, location_id, location_type,
+               location_flag, is_singleton, is_blueprint_copy
+        FROM current_assets
+        WHERE root_location_id IN ({placeholders}) AND character_id = ?
+          AND (removed_at IS NULL OR removed_at = '')
+        """,
+        (*root_location_ids, character_id),
+    )
+    return [_row_to_asset(row) for row in rows]
+
+
+async def get_root_location_summary(
+    repo: Repository, character_ids: list[int] | None = None
+) -> list[dict[str, Any]]:
+    """Count current assets per root location in one grouped query.
+
+    Args:
+        repo: Repository instance
+        character_ids: Optional character IDs to restrict to (default: all)
+
+    Returns:
+        List of dicts with location_id, location_type, asset_count and
+        character_count
+    """
+    params: tuple[Any, ...] = ()
+    character_filter = ""
+    if character_ids:
+        character_filter = (
+            f"AND character_id IN ({','.join('?' for _ in character_ids)})"
+        )
+        params = tuple(character_ids)
+    rows = await repo.fetchall(
+        f"""
+        SELECT root_location_id,
+               MAX(root_location_type) AS root_location_type,
+               COUNT(*) AS asset_count,
+               COUNT(DISTINCT character_id) AS character_count
+        FROM current_assets
+        WHERE root_location_id IS NOT NULL
+          AND (removed_at IS NULL OR removed_at = '')
+          {character_filter}
+        GROUP BY root_location_id
+        """,
+        params,
+    )
+    return [
+        {
+            "location_id": int(row["root_location_id"]),
+            "location_type": row["root_location_type"] or "",
+            "asset_count": int(row["asset_count"]),
+            "character_count": int(row["character_count"]),
+        }
+        for row in rows
     ]
 
 
+async def backfill_root_locations(repo: Repository) -> None:
+    """Compute root location columns for rows stored before they existed.
+
+    Args:
+        repo: Repository instance
+    """
+    rows = await repo.fetchall(
+        "SELECT DISTINCT character_id FROM current_assets WHERE container_depth IS NULL"
+    )
+    for row in rows:
+        character_id = int(row["character_id"])
+        asset_rows = await repo.fetchall(
+            """
+            SELECT item_id, type_id, quantity, location_id, location_type,
+                   location_flag, is_singleton, is_blueprint_copy
+            FROM current_assets
+            WHERE character_id = ?
+            """,
+            (character_id,),
+        )
+        roots = _compute_root_locations([_row_to_asset(r) for r in asset_rows])
+        await repo.executemany(
+            """
+            UPDATE current_assets
+            SET root_location_id = ?, root_location_type = ?, container_depth = ?
+            WHERE character_id = ? AND item_id = ?
+            """,
+            [(*root, character_id, item_id) for item_id, root in roots.items()],
+        )
+        logger.info(
+            "Backfilled root locations for %d assets of character %d",
+            len(roots),
+            character_id,
+        )
+
+
 async def get_history(
     repo: Repository,
     character_id: int,
@@ -242,8 +444,8 @@ async def update_current_assets(
 
     This function updates the current_assets table with fresh data
     from ESI during refresh operations. Unlike save_snapshot(), this
-    does NOT create a snapshot or track changes - it just updates
-    the current state.
+    does NOT create a snapshot or record asset_changes - it just updates
+    the current state and applies the delta to the valuation ledger.
 
     Args:
         repo: Repository instance
@@ -251,6 +453,12 @@ async def update_current_assets(
         assets: List of current assets
     """
     timestamp = datetime.now(UTC)
+    current = await _get_current_assets_dict(repo, character_id)
+    changes = _compute_changes(current, assets)
+    if changes:
+        await _apply_ledger_deltas(
+            repo, character_id, _ledger_deltas(current, assets, changes)
+        )
     await _update_current_assets(repo, character_id, assets, timestamp)
     logger.info(
         "Updated current_assets for character %d with %d assets",
@@ -453,7 +661,8 @@ async def _update_current_assets(
         "DELETE FROM current_assets WHERE character_id = ?", (character_id,)
     )
 
-    # Insert new assets
+    # Insert new assets with their container root computed once here
+    roots = _compute_root_locations(assets)
     asset_data = [
         (
             character_id,
@@ -470,6 +679,7 @@ async def _update_current_assets(
                 else None
             ),
             timestamp.isoformat(),
+            *roots[asset.item_id],
         )
         for asset in assets
     ]
@@ -479,17 +689,315 @@ async def _update_current_assets(
         INSERT INTO current_assets (
             character_id, item_id, type_id, quantity, location_id,
             location_type, location_flag, is_singleton, is_blueprint_copy,
-            last_updated
+            last_updated, root_location_id, root_location_type, container_depth
         )
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """,
         asset_data,
     )
 
 
+# Maximum container nesting followed when resolving root locations
+_MAX_CONTAINER_DEPTH = 64
+
+
+def _infer_location_type(location_id: int) -> str | None:
+    """Infer a location type from an ID range when its container is unknown."""
+    if location_id >= 1_000_000_000_000:  # Structure ID
+        return "other"
+    if 60000000 <= location_id < 70000000:  # Station ID
+        return "station"
+    if 30000000 <= location_id < 40000000:  # System ID
+        return "solar_system"
+    return None
+
+
+def _compute_root_locations(
+    assets: list[EveAsset],
+) -> dict[int, tuple[int | None, str | None, int]]:
+    """Resolve the first non-item location above every asset.
+
+    Parent chains are walked once and memoized, so the whole inventory is
+    resolved in linear time.
+
+    Args:
+        assets: All assets of one character
+
+    Returns:
+        Dict mapping item_id -> (root_location_id, root_location_type,
+        container_depth); the root is (None, None) when it cannot be resolved
+    """
+    by_item_id = {asset.item_id: asset for asset in assets}
+    resolved: dict[int, tuple[int | None, str | None, int]] = {}
+
+    for asset in assets:
+        # Climb until a resolved ancestor or a non-item location
+        chain: list[EveAsset] = []
+        current = asset
+        while current.item_id not in resolved:
+            if current.location_type != "item":
+                resolved[current.item_id] = (
+                    current.location_id,
+                    current.location_type,
+                    0,
+                )
+                break
+            parent = by_item_id.get(current.location_id)
+            if parent is None or len(chain) >= _MAX_CONTAINER_DEPTH:
+                # Container not in this inventory (or a cycle): infer from ID
+                inferred = (
+                    _infer_location_type(current.location_id)
+                    if parent is None
+                    else None
+                )
+                if inferred:
+                    resolved[current.item_id] = (current.location_id, inferred, 0)
+                else:
+                    resolved[current.item_id] = (None, None, 1)
+                break
+            chain.append(current)
+            current = parent
+
+        # Unwind so each link sits one container deeper than its parent
+        root_id, root_type, depth = resolved[current.item_id]
+        for link in reversed(chain):
+            depth += 1
+            resolved[link.item_id] = (root_id, root_type, depth)
+
+    return resolved
+
+
+def _ledger_deltas(
+    current: dict[int, dict[str, Any]],
+    new_assets: list[EveAsset],
+    changes: list[_AssetChangeDelta],
+) -> dict[tuple[int, int], int]:
+    """Translate item-level changes into valued quantity deltas.
+
+    Blueprint copies carry no value and are left out of the ledger.
+
+    Args:
+        current: Current assets dict (item_id -> asset data) before the update
+        new_assets: New asset list
+        changes: Changes computed by _compute_changes
+
+    Returns:
+        Dict mapping (type_id, location_id) -> quantity delta
+    """
+    new_by_item = {asset.item_id: asset for asset in new_assets}
+    deltas: dict[tuple[int, int], int] = {}
+
+    def _add(type_id: int, location_id: int, quantity: int) -> None:
+        key = (int(type_id), int(location_id))
+        deltas[key] = deltas.get(key, 0) + int(quantity)
+
+    for change in changes:
+        if change.change_type in ("removed", "modified"):
+            old = current.get(change.item_id)
+            if old and not old["is_blueprint_copy"]:
+                _add(old["type_id"], old["location_id"], -old["quantity"])
+        if change.change_type in ("added", "modified"):
+            new = new_by_item.get(change.item_id)
+            if new and not new.is_blueprint_copy:
+                _add(new.type_id, new.location_id, new.quantity)
+
+    return {key: delta for key, delta in deltas.items() if delta}
+
+
+async def _apply_ledger_deltas(
+    repo: Repository, character_id: int, deltas: dict[tuple[int, int], int]
+) -> None:
+    """Apply quantity deltas to a character's valuation ledger.
+
+    Existing rows keep their resolved unit price; new rows are inserted
+    unpriced so the next valuation prices them.
+    """
+    if not deltas:
+        return
+    await repo.executemany(
+        """
+        INSERT INTO asset_valuation_ledger (
+            character_id, type_id, location_id, quantity
+        )
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(character_id, type_id, location_id)
+        DO UPDATE SET quantity = quantity + excluded.quantity
+        """,
+        [
+            (character_id, type_id, location_id, delta)
+            for (type_id, location_id), delta in deltas.items()
+        ],
+    )
+    await repo.execute(
+        "DELETE FROM asset_valuation_ledger WHERE character_id = ? AND quantity <= 0",
+        (character_id,),
+    )
+
+
+async def rebuild_valuation_ledger(repo: Repository, character_id: int) -> None:
+    """Rebuild a character's valuation ledger from current_assets.
+
+    All rows are left unpriced; callers reprice every held type afterwards.
+
+    Args:
+        repo: Repository instance
+        character_id: Character ID
+    """
+    await repo.execute(
+        "DELETE FROM asset_valuation_ledger WHERE character_id = ?", (character_id,)
+    )
+    await repo.execute(
+        f"""
+        INSERT INTO asset_valuation_ledger (
+            character_id, type_id, location_id, quantity
+        )
+        SELECT character_id, type_id, location_id, SUM(quantity)
+        FROM current_assets
+        WHERE character_id = ? AND {_VALUED_ASSET_FILTER}
+        GROUP BY character_id, type_id, location_id
+        """,
+        (character_id,),
+    )
+    await repo.commit()
+
+
+async def get_ledger_type_ids(
+    repo: Repository,
+    character_id: int,
+    unpriced_only: bool = False,
+    source_prefix: str | None = None,
+) -> set[int]:
+    """Get type IDs held in a character's valuation ledger.
+
+    Args:
+        repo: Repository instance
+        character_id: Character ID
+        unpriced_only: Only return types with rows that still need a price
+        source_prefix: Only return types whose recorded price source starts
+            with this prefix (e.g. "blueprint-")
+
+    Returns:
+        Set of type IDs
+    """
+    sql = "SELECT DISTINCT type_id FROM asset_valuation_ledger WHERE character_id = ?"
+    params: tuple = (character_id,)
+    if unpriced_only:
+        sql += " AND unit_price IS NULL"
+    if source_prefix is not None:
+        sql += " AND substr(price_source, 1, ?) = ?"
+        params += (len(source_prefix), source_prefix)
+    rows = await repo.fetchall(sql, params)
+    return {int(row["type_id"]) for row in rows}
+
+
+async def get_ledger_prices(
+    repo: Repository, character_id: int
+) -> dict[int, tuple[float, str]]:
+    """Get the positive unit prices recorded in a character's valuation ledger.
+
+    Args:
+        repo: Repository instance
+        character_id: Character ID
+
+    Returns:
+        Dict mapping type_id -> (unit_price, price_source)
+    """
+    rows = await repo.fetchall(
+        """
+        SELECT DISTINCT type_id, unit_price, price_source
+        FROM asset_valuation_ledger
+        WHERE character_id = ? AND unit_price > 0
+        """,
+        (character_id,),
+    )
+    return {
+        int(row["type_id"]): (float(row["unit_price"]), row["price_source"] or "")
+        for row in rows
+    }
+
+
+async def set_ledger_prices(
+    repo: Repository,
+    character_id: int,
+    unit_prices: dict[int, tuple[float, str | None]],
+) -> None:
+    """Record resolved unit prices for types in a character's valuation ledger.
+
+    Args:
+        repo: Repository instance
+        character_id: Character ID
+        unit_prices: Dict mapping type_id -> (unit_price, price_source); use a
+            0.0 price for types that could not be priced
+    """
+    if not unit_prices:
+        return
+    await repo.executemany(
+        """
+        UPDATE asset_valuation_ledger
+        SET unit_price = ?, price_source = ?
+        WHERE character_id = ? AND type_id = ?
+        """,
+        [
+            (float(price), source, character_id, int(type_id))
+            for type_id, (price, source) in unit_prices.items()
+        ],
+    )
+
+
+async def sum_ledger_values(
+    repo: Repository, character_ids: list[int]
+) -> dict[int, float]:
+    """Sum quantity * unit price over characters' valuation ledgers in one query.
+
+    Args:
+        repo: Repository instance
+        character_ids: Character IDs
+
+    Returns:
+        Dict mapping character_id -> total asset value (unpriced rows
+        contribute nothing; characters without priced rows are omitted)
+    """
+    if not character_ids:
+        return {}
+    placeholders = ",".join("?" for _ in character_ids)
+    rows = await repo.fetchall(
+        f"""
+        SELECT character_id, SUM(quantity * unit_price) AS total_value
+        FROM asset_valuation_ledger
+        WHERE character_id IN ({placeholders}) AND quantity > 0 AND unit_price > 0
+        GROUP BY character_id
+        """,
+        tuple(character_ids),
+    )
+    return {int(row["character_id"]): float(row["total_value"] or 0.0) for row in rows}
+
+
+async def clear_valuation_ledger(repo: Repository, character_id: int) -> None:
+    """Drop a character's valuation ledger (e.g. when the character is removed).
+
+    Args:
+        repo: Repository instance
+        character_id: Character ID
+    """
+    await repo.execute(
+        "DELETE FROM asset_valuation_ledger WHERE character_id = ?", (character_id,)
+    )
+
+
 __all__ = [
+    "backfill_root_locations",
+    "clear_valuation_ledger",
+    "get_assets_at_roots",
+    "get_blueprint_copy_counts",
     "get_current_assets",
     "get_history",
+    "get_ledger_prices",
+    "get_ledger_type_ids",
+    "get_root_location_summary",
+    "get_root_locations",
     "get_snapshots",
+    "rebuild_valuation_ledger",
     "save_snapshot",
+    "set_ledger_prices",
+    "sum_ledger_values",
 ]
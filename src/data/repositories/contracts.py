@@ -280,7 +280,52 @@ async def get_active_contracts(
     ]
 
 
+async def get_active_contract_totals(
+    repo: Repository, character_ids: list[int]
+) -> dict[int, dict[str, float]]:
+    """Sum collateral and value of active contracts for many characters.
+
+    Contract value is the price, or the reward when no price is set.
+
+    Args:
+        repo: Repository instance
+        character_ids: Character IDs
+
+    Returns:
+        Dict mapping character_id -> {"collateral": float, "value": float};
+        characters without active contracts are omitted
+    """
+    if not character_ids:
+        return {}
+    placeholders = ",".join("?" for _ in character_ids)
+    sql = f"""
+    SELECT
+        character_id,
+        SUM(COALESCE(collateral, 0)) AS collateral,
+        SUM(
+            CASE
+                WHEN price IS NOT NULL AND price != 0 THEN price
+                ELSE COALESCE(reward, 0)
+            END
+        ) AS value
+    FROM contracts
+    WHERE character_id IN ({placeholders})
+      AND status IN ('outstanding', 'in_progress')
+    GROUP BY character_id
+    """
+
+    rows = await repo.fetchall(sql, tuple(character_ids))
+    return {
+        int(row["character_id"]): {
+            "collateral": float(row["collateral"] or 0.0),
+            "value": float(row["value"] or 0.0),
+        }
+        for row in rows
+    }
+
+
 __all__ = [
+    "get_active_contract_totals",
     "get_active_contracts",
     "get_contract_items",
     "get_contracts",
@@ -12,11 +12,16 @@ from typing import TYPE_CHECKING
 
 from models.eve import EveIndustryJob
 
+from .schemas import CREATE_JOB_OUTPUT_VALUES_TEMP_TABLE
+
 if TYPE_CHECKING:
     from .repository import Repository
 
 logger = logging.getLogger(__name__)
 
+# Jobs whose output has not been delivered into the hangar yet
+_IN_PROGRESS_STATUSES = "('active', 'paused', 'ready')"
+
 
 async def save_jobs(
     repo: Repository, character_id: int, jobs: list[EveIndustryJob]
@@ -333,11 +338,106 @@ async def count_active_jobs_by_activity(
     return {row["activity_id"]: row["count"] for row in rows}
 
 
+async def get_in_progress_outputs(
+    repo: Repository, character_ids: list[int]
+) -> set[tuple[int, int, int]]:
+    """Get the distinct outputs of undelivered jobs across characters.
+
+    Args:
+        repo: Repository instance
+        character_ids: Character IDs
+
+    Returns:
+        Set of (activity_id, blueprint_type_id, product_type_id); jobs without
+        a product type are skipped
+    """
+    if not character_ids:
+        return set()
+    placeholders = ",".join("?" for _ in character_ids)
+    rows = await repo.fetchall(
+        f"""
+        SELECT DISTINCT activity_id, blueprint_type_id, product_type_id
+        FROM industry_jobs
+        WHERE character_id IN ({placeholders})
+          AND status IN {_IN_PROGRESS_STATUSES}
+          AND product_type_id IS NOT NULL
+        """,
+        tuple(character_ids),
+    )
+    return {
+        (
+            int(row["activity_id"]),
+            int(row["blueprint_type_id"]),
+            int(row["product_type_id"]),
+        )
+        for row in rows
+    }
+
+
+async def sum_job_values(
+    repo: Repository,
+    character_ids: list[int],
+    run_values: dict[tuple[int, int, int], tuple[float, float]],
+) -> dict[int, float]:
+    """Sum the expected output value of undelivered jobs per character.
+
+    The per-run values are loaded into a connection-scoped temporary table
+    and joined against industry_jobs, so all characters are valued by one
+    query. A job is worth ``runs * run_value * probability``, where the
+    job's own (skill-adjusted) probability overrides the base probability.
+
+    Args:
+        repo: Repository instance
+        character_ids: Character IDs
+        run_values: Dict mapping (activity_id, blueprint_type_id,
+            product_type_id) -> (value of one successful run, base probability)
+
+    Returns:
+        Dict mapping character_id -> in-progress job value (characters
+        without valued jobs are omitted)
+    """
+    if not character_ids or not run_values:
+        return {}
+
+    await repo.execute(CREATE_JOB_OUTPUT_VALUES_TEMP_TABLE)
+    await repo.execute("DELETE FROM temp.job_output_values")
+    await repo.executemany(
+        "INSERT INTO temp.job_output_values (activity_id, blueprint_type_id, "
+        "product_type_id, run_value, probability) VALUES (?, ?, ?, ?, ?)",
+        [
+            (*key, float(value), float(probability))
+            for key, (value, probability) in run_values.items()
+            if value > 0
+        ],
+    )
+
+    placeholders = ",".join("?" for _ in character_ids)
+    rows = await repo.fetchall(
+        f"""
+        SELECT ij.character_id,
+               SUM(ij.runs * jv.run_value
+                   * COALESCE(ij.probability, jv.probability)) AS total_value
+        FROM industry_jobs ij
+        JOIN temp.job_output_values jv
+          ON jv.activity_id = ij.activity_id
+         AND jv.blueprint_type_id = ij.blueprint_type_id
+         AND jv.product_type_id = ij.product_type_id
+        WHERE ij.character_id IN ({placeholders})
+          AND ij.status IN {_IN_PROGRESS_STATUSES}
+        GROUP BY ij.character_id
+        """,
+        tuple(character_ids),
+    )
+    return {int(row["character_id"]): float(row["total_value"] or 0.0) for row in rows}
+
+
 __all__ = [
     "count_active_jobs_by_activity",
     "get_active_jobs",
+    "get_in_progress_outputs",
     "get_job_history",
     "get_jobs_by_activity",
     "get_jobs_by_status",
     "save_jobs",
+    "sum_job_values",
 ]
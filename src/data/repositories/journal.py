@@ -316,9 +316,47 @@ async def get_entries_by_types(
     ]
 
 
+async def get_current_balances(
+    repo: Repository, character_ids: list[int]
+) -> dict[int, float]:
+    """Get the current wallet balance for many characters in one query.
+
+    Args:
+        repo: Repository instance
+        character_ids: Character IDs
+
+    Returns:
+        Dict mapping character_id -> most recent balance (characters without
+        journal entries are omitted)
+    """
+    if not character_ids:
+        return {}
+    placeholders = ",".join("?" for _ in character_ids)
+    sql = f"""
+    SELECT character_id, balance
+    FROM (
+        SELECT character_id, balance,
+               ROW_NUMBER() OVER (
+                   PARTITION BY character_id ORDER BY date DESC
+               ) AS rn
+        FROM wallet_journal
+        WHERE character_id IN ({placeholders})
+    ) t
+    WHERE rn = 1
+    """
+
+    rows = await repo.fetchall(sql, tuple(character_ids))
+    return {
+        int(row["character_id"]): float(row["balance"])
+        for row in rows
+        if row["balance"] is not None
+    }
+
+
 __all__ = [
     "get_balance_history",
     "get_current_balance",
+    "get_current_balances",
     "get_entries_by_date_range",
     "get_entries_by_type",
     "get_entries_by_types",
@@ -251,8 +251,49 @@ async def calculate_market_exposure(repo: Repository, character_id: int) -> dict
     }
 
 
+async def calculate_market_exposures(
+    repo: Repository, character_ids: list[int]
+) -> dict[int, dict]:
+    """Calculate market exposure for many characters in one aggregated query.
+
+    Args:
+        repo: Repository instance
+        character_ids: Character IDs
+
+    Returns:
+        Dict mapping character_id -> exposure statistics (same keys as
+        calculate_market_exposure); characters without active orders are omitted
+    """
+    if not character_ids:
+        return {}
+    placeholders = ",".join("?" for _ in character_ids)
+    sql = f"""
+    SELECT
+        character_id,
+        SUM(CASE WHEN is_buy_order = 1 THEN volume_remain * price ELSE 0 END) as buy_exposure,
+        SUM(CASE WHEN is_buy_order = 0 THEN volume_remain * price ELSE 0 END) as sell_exposure,
+        SUM(CASE WHEN escrow IS NOT NULL THEN escrow ELSE 0 END) as total_escrow,
+        COUNT(*) as total_orders
+    FROM market_orders
+    WHERE character_id IN ({placeholders}) AND state = 'active'
+    GROUP BY character_id
+    """
+
+    rows = await repo.fetchall(sql, tuple(character_ids))
+    return {
+        int(row["character_id"]): {
+            "buy_exposure": row["buy_exposure"] or 0.0,
+            "sell_exposure": row["sell_exposure"] or 0.0,
+            "total_escrow": row["total_escrow"] or 0.0,
+            "total_orders": row["total_orders"] or 0,
+        }
+        for row in rows
+    }
+
+
 __all__ = [
     "calculate_market_exposure",
+    "calculate_market_exposures",
     "get_active_orders",
     "get_order_history",
     "get_orders_by_type",
@@ -7,16 +7,21 @@ as their first parameter.
 Functions:
     - save_snapshot: Save a new price snapshot from market data
     - get_latest_jita_price: Get the most recent Jita price for an item
+    - get_latest_jita_prices: Get the most recent Jita price for many items at once
     - get_jita_prices: Get historical Jita prices for an item
     - get_price_history: Get price history for any region
     - get_snapshots: Get price snapshot metadata
     - get_items_with_history: Get all items that have price data
+    - get_latest_snapshot_prices: Load preference-resolved prices from the latest snapshot
+    - select_preferred_price: Apply hub/price-type preferences to buy/sell candidates
     - delete_old_prices: Clean up old price records
 """
 
 from __future__ import annotations
 
+import json
 import logging
+from collections.abc import Iterable
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
@@ -42,6 +47,81 @@ SUPPORTED_REGION_IDS = frozenset(
     ]
 )
 
+# Trade hub name -> region ID used for market preference lookups
+TRADE_HUB_REGION_IDS: dict[str, int] = {
+    "jita": 10000002,  # The Forge
+    "amarr": 10000043,  # Domain
+    "dodixie": 10000032,  # Sinq Laison
+    "rens": 10000030,  # Heimatar
+    "hek": 10000042,  # Metropolis
+}
+
+
+# Trade hub name -> solar system ID used for jump distances
+TRADE_HUB_SYSTEM_IDS: dict[str, int] = {
+    "jita": 30000142,
+    "amarr": 30002187,
+    "dodixie": 30002659,
+    "rens": 30002510,
+    "hek": 30002053,
+}
+
+
+def region_for_trade_hub(trade_hub: str | None) -> int:
+    """Map a trade hub name to its region ID, defaulting to Jita."""
+    if not trade_hub:
+        return JITA_REGION_ID
+    return TRADE_HUB_REGION_IDS.get(trade_hub.lower(), JITA_REGION_ID)
+
+
+def _first_positive(values: Iterable[object]) -> float | None:
+    """Return the first candidate that converts to a positive float."""
+    for value in values:
+        if value is None:
+            continue
+        try:
+            price = float(value)  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            continue
+        if price > 0:
+            return price
+    return None
+
+
+def select_preferred_price(
+    buy_candidates: Iterable[object],
+    sell_candidates: Iterable[object],
+    price_type: str = "sell",
+    weighted_buy_ratio: float = 0.3,
+) -> float | None:
+    """Pick a unit price from buy/sell statistics according to user preferences.
+
+    Candidates are ordered by preference (median first) and the first positive
+    value on each side is used. This is the single precedence rule shared by
+    stored snapshots and live Fuzzwork data.
+
+    Args:
+        buy_candidates: Buy-side statistics in preference order
+        sell_candidates: Sell-side statistics in preference order
+        price_type: "buy", "sell", or "weighted"
+        weighted_buy_ratio: Buy share for weighted prices (0.3 = 30% buy, 70% sell)
+
+    Returns:
+        Price per unit or None if neither side has a usable value
+    """
+    buy_price = _first_positive(buy_candidates)
+    sell_price = _first_positive(sell_candidates)
+
+    if price_type == "buy":
+        return buy_price if buy_price is not None else sell_price
+    if price_type == "weighted":
+        if buy_price is not None and sell_price is not None:
+            return (buy_price * weighted_buy_ratio) + (
+                sell_price * (1 - weighted_buy_ratio)
+            )
+        return sell_price if sell_price is not None else buy_price
+    return sell_price
+
 
 async def save_snapshot(
     repo: Repository,
@@ -284,6 +364,57 @@ async def get_latest_jita_price(repo: Repository, type_id: int) -> PriceHistory
     return PriceHistory(**dict(row)) if row else None
 
 
+async def get_latest_jita_prices(
+    repo: Repository, type_ids: Iterable[int]
+) -> dict[int, PriceHistory]:
+    """Get the most recent Jita price for many items in one query.
+
+    Resolves the latest snapshot per type set-based instead of issuing one
+    lookup per item. Type IDs are passed as a single JSON array so the query
+    is not bound by SQLite's host parameter limit.
+
+    Args:
+        repo: Repository instance
+        type_ids: Item type IDs to look up
+
+    Returns:
+        Dict mapping type_id -> latest PriceHistory (types without data omitted)
+    """
+    wanted = sorted({int(t) for t in type_ids})
+    if not wanted:
+        return {}
+
+    rows = await repo.fetchall(
+        """
+        WITH wanted(type_id) AS (
+            SELECT DISTINCT CAST(value AS INTEGER) FROM json_each(?)
+        ),
+        latest AS (
+            SELECT ph.type_id, MAX(ph.snapshot_id) AS snapshot_id
+            FROM price_history ph
+            JOIN wanted w ON w.type_id = ph.type_id
+            WHERE ph.region_id = ?
+            GROUP BY ph.type_id
+        )
+        SELECT
+            ph.price_id, ph.type_id, ph.region_id, ph.snapshot_id,
+            ph.buy_weighted_average, ph.buy_max_price, ph.buy_min_price,
+            ph.buy_stddev, ph.buy_median, ph.buy_volume, ph.buy_num_orders,
+            ph.buy_five_percent,
+            ph.sell_weighted_average, ph.sell_max_price, ph.sell_min_price,
+            ph.sell_stddev, ph.sell_median, ph.sell_volume, ph.sell_num_orders,
+            ph.sell_five_percent
+        FROM price_history ph
+        JOIN latest l
+            ON l.type_id = ph.type_id AND l.snapshot_id = ph.snapshot_id
+        WHERE ph.region_id = ?
+        """,
+        (json.dumps(wanted), JITA_REGION_ID, JITA_REGION_ID),
+    )
+
+    return {int(row["type_id"]): PriceHistory(**dict(row)) for row in rows}
+
+
 async def get_price_history(
     repo: Repository, type_id: int, region_id: int, limit: int = 100
 ) -> list[PriceHistory]:
@@ -423,41 +554,21 @@ async def get_latest_snapshot_prices(
             price = float(row["custom_sell_price"])
         elif row["custom_buy_price"] is not None:
             price = float(row["custom_buy_price"])
-        # Then apply price_type preference
-        elif price_type == "buy":
-            candidates = [
-                row["buy_median"],
-                row["buy_weighted_average"],
-                row["buy_max_price"],
-            ]
-            price = next(
-                (float(v) for v in candidates if v is not None and v > 0), None
-            )
-        elif price_type == "sell":
-            candidates = [
-                row["sell_median"],
-                row["sell_weighted_average"],
-                row["sell_max_price"],
-            ]
-            price = next(
-                (float(v) for v in candidates if v is not None and v > 0), None
+        else:
+            price = select_preferred_price(
+                (
+                    row["buy_median"],
+                    row["buy_weighted_average"],
+                    row["buy_max_price"],
+                ),
+                (
+                    row["sell_median"],
+                    row["sell_weighted_average"],
+                    row["sell_max_price"],
+                ),
+                price_type,
+                weighted_buy_ratio,
             )
-        elif price_type == "weighted":
-            buy_price = None
-            sell_price = None
-            if row["buy_median"] is not None and row["buy_median"] > 0:
-                buy_price = float(row["buy_median"])
-            if row["sell_median"] is not None and row["sell_median"] > 0:
-                sell_price = float(row["sell_median"])
-
-            if buy_price and sell_price:
-                price = (buy_price * weighted_buy_ratio) + (
-                    sell_price * (1 - weighted_buy_ratio)
-                )
-            elif sell_price:
-                price = sell_price
-            elif buy_price:
-                price = buy_price
 
         if price and price > 0:
             prices[type_id] = price
@@ -517,12 +628,17 @@ async def delete_old_prices(repo: Repository, days: int = 90) -> int:
 
 __all__ = [
     "JITA_REGION_ID",
+    "SUPPORTED_REGION_IDS",
+    "TRADE_HUB_REGION_IDS",
     "delete_old_prices",
     "get_items_with_history",
     "get_jita_prices",
     "get_latest_jita_price",
+    "get_latest_jita_prices",
     "get_latest_snapshot_prices",
     "get_price_history",
     "get_snapshots",
+    "region_for_trade_hub",
     "save_snapshot",
+    "select_preferred_price",
 ]
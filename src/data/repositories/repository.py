@@ -193,6 +193,8 @@ class Repository:
         """Initialize database schema with all required tables."""
         logger.info("Initializing database schema at %s", self.db_path)
 
+        added_columns = await self._apply_column_migrations()
+
         for sql_statement in schemas.ALL_TABLES:
             # Split by semicolons to handle multiple statements
             statements = [s.strip() for s in sql_statement.split(";") if s.strip()]
@@ -205,8 +207,32 @@ class Repository:
                     raise
 
         await self.commit()
+
+        if ("current_assets", "root_location_id") in added_columns:
+            from . import assets  # noqa: PLC0415
+
+            await assets.backfill_root_locations(self)
+
         logger.info("Database schema initialized successfully")
 
+    async def _apply_column_migrations(self) -> set[tuple[str, str]]:
+        """Add columns from schemas.COLUMN_MIGRATIONS missing in existing tables.
+
+        Returns:
+            Set of (table, column) pairs that were added
+        """
+        added: set[tuple[str, str]] = set()
+        for table, column, column_type in schemas.COLUMN_MIGRATIONS:
+            if not await self.table_exists(table):
+                continue  # Created with the column by ALL_TABLES
+            existing = {row["name"] for row in await self.get_table_info(table)}
+            if column in existing:
+                continue
+            logger.info("Adding column %s.%s", table, column)
+            await self.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+            added.add((table, column))
+        return added
+
     async def vacuum(self) -> None:
         """Vacuum the database to reclaim space and optimize."""
         logger.info("Vacuuming database...")
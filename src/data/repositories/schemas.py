@@ -37,6 +37,9 @@ CREATE TABLE IF NOT EXISTS current_assets (
     is_blueprint_copy INTEGER,
     last_updated TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     removed_at TIMESTAMP,
+    root_location_id INTEGER,
+    root_location_type TEXT,
+    container_depth INTEGER,
     PRIMARY KEY (character_id, item_id)
 );
 """
@@ -45,6 +48,9 @@ CREATE_CURRENT_ASSETS_INDEXES = """
 CREATE INDEX IF NOT EXISTS idx_current_assets_character
 ON current_assets(character_id);
 
+CREATE INDEX IF NOT EXISTS idx_current_assets_root
+ON current_assets(root_location_id, character_id);
+
 CREATE INDEX IF NOT EXISTS idx_current_assets_type
 ON current_assets(type_id);
 
@@ -52,6 +58,21 @@ CREATE INDEX IF NOT EXISTS idx_current_assets_location
 ON current_assets(location_id);
 """
 
+# Per-character valuation ledger: valued (non-BPC) quantity per type/location
+# with the last resolved unit price. Maintained from asset sync deltas so net
+# worth only reprices churned rows and types whose effective price moved.
+CREATE_ASSET_VALUATION_LEDGER_TABLE = """
+CREATE TABLE IF NOT EXISTS asset_valuation_ledger (
+    character_id INTEGER NOT NULL,
+    type_id INTEGER NOT NULL,
+    location_id INTEGER NOT NULL,
+    quantity INTEGER NOT NULL,
+    unit_price REAL,
+    price_source TEXT,
+    PRIMARY KEY (character_id, type_id, location_id)
+);
+"""
+
 CREATE_ASSET_CHANGES_TABLE = """
 CREATE TABLE IF NOT EXISTS asset_changes (
     change_id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -439,12 +460,36 @@ CREATE INDEX IF NOT EXISTS idx_character_lifecycle_char
 ON character_lifecycle(character_id, event_time);
 """
 
+# Connection-scoped expected value of one run per job output, joined against
+# industry_jobs for bulk in-progress job valuation. Created on demand by
+# industry_jobs.sum_job_values; not part of ALL_TABLES.
+CREATE_JOB_OUTPUT_VALUES_TEMP_TABLE = """
+CREATE TEMP TABLE IF NOT EXISTS job_output_values (
+    activity_id INTEGER NOT NULL,
+    blueprint_type_id INTEGER NOT NULL,
+    product_type_id INTEGER NOT NULL,
+    run_value REAL NOT NULL,
+    probability REAL NOT NULL,
+    PRIMARY KEY (activity_id, blueprint_type_id, product_type_id)
+);
+"""
+
+# Columns added after their table first shipped, as (table, column, type).
+# Repository.initialize_schema adds any that are missing from older databases
+# before applying ALL_TABLES (whose indexes may reference them).
+COLUMN_MIGRATIONS = [
+    ("current_assets", "root_location_id", "INTEGER"),
+    ("current_assets", "root_location_type", "TEXT"),
+    ("current_assets", "container_depth", "INTEGER"),
+]
+
 # All table creation statements in order
 ALL_TABLES = [
     CREATE_ASSET_SNAPSHOTS_TABLE,
     CREATE_ASSET_SNAPSHOTS_INDEX,
     CREATE_CURRENT_ASSETS_TABLE,
     CREATE_CURRENT_ASSETS_INDEXES,
+    CREATE_ASSET_VALUATION_LEDGER_TABLE,
     CREATE_ASSET_CHANGES_TABLE,
     CREATE_ASSET_CHANGES_INDEXES,
     CREATE_PRICE_HISTORY_TABLE,
@@ -474,12 +519,14 @@ ALL_TABLES = [
 
 __all__ = [
     "ALL_TABLES",
+    "COLUMN_MIGRATIONS",
     "CREATE_ACCOUNT_PLEX_SNAPSHOTS_INDEXES",
     "CREATE_ACCOUNT_PLEX_SNAPSHOTS_TABLE",
     "CREATE_ASSET_CHANGES_INDEXES",
     "CREATE_ASSET_CHANGES_TABLE",
     "CREATE_ASSET_SNAPSHOTS_INDEX",
     "CREATE_ASSET_SNAPSHOTS_TABLE",
+    "CREATE_ASSET_VALUATION_LEDGER_TABLE",
     "CREATE_CHARACTER_LIFECYCLE_INDEXES",
     "CREATE_CHARACTER_LIFECYCLE_TABLE",
     "CREATE_CONTRACTS_INDEXES",
@@ -492,6 +539,7 @@ __all__ = [
     "CREATE_CUSTOM_PRICES_TABLE",
     "CREATE_INDUSTRY_JOBS_INDEXES",
     "CREATE_INDUSTRY_JOBS_TABLE",
+    "CREATE_JOB_OUTPUT_VALUES_TEMP_TABLE",
     "CREATE_MARKET_ORDERS_INDEXES",
     "CREATE_MARKET_ORDERS_TABLE",
     "CREATE_NETWORTH_SNAPSHOTS_INDEXES",
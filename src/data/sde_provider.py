@@ -1,21 +1,30 @@
 """SDE Provider for high-level data access and caching."""
 
 import asyncio
+import hashlib
+import itertools
 import logging
-import os
-import pickle
 import threading
 from collections import defaultdict
+from collections.abc import Collection, Mapping
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import TypedDict
+from typing import Any, NamedTuple, TypedDict
 
+from data.blueprint_activities import BlueprintActivityArrays
+from data.jump_graph import JumpGraph
+from data.market_group_tree import MarketGroupTree
 from data.parsers import SDEJsonlParser
+from data.sde_store import SDEStore
+from data.type_materials import ReprocessingMatrix
+from data.type_name_index import TypeNameIndex
 from models.eve import (
+    EveBlueprint,
     EveCategory,
     EveGroup,
     EveMarketGroup,
     EveType,
+    EveTypeMaterials,
 )
 from utils.config import get_config
 from utils.progress_callback import ProgressCallback, ProgressPhase, ProgressUpdate
@@ -23,6 +32,14 @@ from utils.progress_callback import ProgressCallback, ProgressPhase, ProgressUpd
 logger = logging.getLogger(__name__)
 
 
+class SDEFileSignature(TypedDict):
+    """Signature of one SDE source file at the time caches were built."""
+
+    mtime: float
+    size: int
+    sha256: str
+
+
 class SDEMetadata(TypedDict):
     """Metadata about when and how caches were built."""
 
@@ -33,6 +50,66 @@ class SDEMetadata(TypedDict):
     total_market_groups: int
     total_npc_stations: int
     total_blueprint_types: int
+    file_signatures: dict[str, SDEFileSignature]
+
+
+class SDEStorePatch(NamedTuple):
+    """A committed store patch waiting to be adopted by its provider."""
+
+    store: SDEStore
+    file_signatures: dict[str, SDEFileSignature]
+
+
+# Caches derived from each SDE source file. A cache named ``x`` lives in
+# ``SDEProvider._x_cache`` and is (re)built by ``SDEProvider._load_x``.
+SDE_SOURCE_CACHES: dict[str, tuple[str, ...]] = {
+    "types.jsonl": ("types", "type_names"),
+    "groups.jsonl": ("groups",),
+    "categories.jsonl": ("categories",),
+    "marketGroups.jsonl": ("market_groups", "market_group_parent_ids"),
+    "blueprints.jsonl": ("blueprints", "blueprint_type_ids"),
+    "typeMaterials.jsonl": ("type_materials",),
+    "npcStations.jsonl": (
+        "npc_stations",
+        "npc_station_names",
+        "npc_station_system_ids",
+    ),
+    "mapRegions.jsonl": ("region_names",),
+    "mapConstellations.jsonl": ("constellation_names", "constellation_region_ids"),
+    "mapSolarSystems.jsonl": (
+        "solar_system_names",
+        "solar_system_constellation_ids",
+    ),
+    "mapStargates.jsonl": ("stargate_system_ids", "stargate_destination_ids"),
+}
+
+# Store section (and kind, for keyed sections) persisting each cache
+_STORE_SECTIONS: dict[str, tuple[str, str | None]] = {
+    "types": ("types", None),
+    "groups": ("groups", None),
+    "categories": ("categories", None),
+    "market_groups": ("market_groups", None),
+    "blueprints": ("blueprints", None),
+    "type_materials": ("type_materials", None),
+    "npc_stations": ("id_sets", "npc_stations"),
+    "blueprint_type_ids": ("id_sets", "blueprint_types"),
+    "type_names": ("names", "types"),
+    "npc_station_names": ("names", "npc_stations"),
+    "region_names": ("names", "regions"),
+    "constellation_names": ("names", "constellations"),
+    "solar_system_names": ("names", "solar_systems"),
+    "market_group_parent_ids": ("links", "market_group_parent"),
+    "npc_station_system_ids": ("links", "station_system"),
+    "solar_system_constellation_ids": ("links", "system_constellation"),
+    "constellation_region_ids": ("links", "constellation_region"),
+    "stargate_system_ids": ("links", "stargate_system"),
+    "stargate_destination_ids": ("links", "stargate_destination"),
+}
+
+# Parser loaders (``load_<name>``) for caches whose names differ from them
+_CACHE_LOADER_NAMES: dict[str, str] = {"npc_stations": "npc_station_ids"}
+
+_HASH_CHUNK_SIZE = 1024 * 1024
 
 
 # Minimum expected sizes for integrity validation
@@ -52,6 +129,9 @@ class SDEProvider:
     - Primary caches: Direct ID lookups (O(1))
     - Index hashmaps: Fast filtered queries (O(1) for common filters)
     - Memory management: Clear caches when needed
+
+    Built caches are persisted to a compact SDEStore file; when loaded from it,
+    caches and indices are lazy read-only mappings decoded on access.
     """
 
     def __init__(
@@ -73,40 +153,64 @@ class SDEProvider:
         self._parser = parser
         self._progress_callback = progress_callback
 
-        # Primary caches - ID-based lookups (dict[id, object])
-        self._types_cache: dict[int, EveType] | None = None
-        self._categories_cache: dict[int, EveCategory] | None = None
-        self._groups_cache: dict[int, EveGroup] | None = None
-        self._market_groups_cache: dict[int, EveMarketGroup] | None = None
+        # Primary caches - ID-based lookups (mapping[id, object]); plain dicts
+        # when built from the parser, lazy SDEStore views when loaded from disk
+        self._types_cache: Mapping[int, EveType] | None = None
+        self._categories_cache: Mapping[int, EveCategory] | None = None
+        self._groups_cache: Mapping[int, EveGroup] | None = None
+        self._market_groups_cache: Mapping[int, EveMarketGroup] | None = None
         self._npc_stations_cache: set[int] | None = None
 
+        # Market group hierarchy and its flattened tree (built on first use)
+        self._market_group_parent_ids_cache: Mapping[int, int] | None = None
+        self._market_group_tree: MarketGroupTree | None = None
+
+        # Type names and their search index (built on first search)
+        self._type_names_cache: Mapping[int, str] | None = None
+        self._type_name_index: TypeNameIndex | None = None
+
         # Location name caches
-        self._npc_station_names_cache: dict[int, str] | None = None
-        self._npc_station_system_ids_cache: dict[int, int] | None = None
-        self._region_names_cache: dict[int, str] | None = None
-        self._constellation_names_cache: dict[int, str] | None = None
-        self._solar_system_names_cache: dict[int, str] | None = None
-        self._solar_system_constellation_ids_cache: dict[int, int] | None = None
-        self._constellation_region_ids_cache: dict[int, int] | None = None
+        self._npc_station_names_cache: Mapping[int, str] | None = None
+        self._npc_station_system_ids_cache: Mapping[int, int] | None = None
+        self._region_names_cache: Mapping[int, str] | None = None
+        self._constellation_names_cache: Mapping[int, str] | None = None
+        self._solar_system_names_cache: Mapping[int, str] | None = None
+        self._solar_system_constellation_ids_cache: Mapping[int, int] | None = None
+        self._constellation_region_ids_cache: Mapping[int, int] | None = None
+
+        # Stargates and the jump graph packed from them (built on first use)
+        self._stargate_system_ids_cache: Mapping[int, int] | None = None
+        self._stargate_destination_ids_cache: Mapping[int, int] | None = None
+        self._jump_graph: JumpGraph | None = None
 
         # Index hashmaps - for fast filtered queries
-        # Format: dict[filter_value, list[object_id]]
+        # Format: mapping[filter_value, list[object_id]]
         # These are always built when their corresponding cache is loaded
-        self._types_by_group_index: dict[int, list[int]] | None = None
-        self._types_by_category_index: dict[int, list[int]] | None = None
-        self._types_by_market_group_index: dict[int, list[int]] | None = None
+        self._types_by_group_index: Mapping[int, list[int]] | None = None
+        self._types_by_category_index: Mapping[int, list[int]] | None = None
+        self._types_by_market_group_index: Mapping[int, list[int]] | None = None
         self._published_types_ids: set[int] | None = None
-        self._groups_by_category_index: dict[int, list[int]] | None = None
+        self._groups_by_category_index: Mapping[int, list[int]] | None = None
+
+        # Open persisted store backing the lazy caches (if loaded from disk)
+        self._store: SDEStore | None = None
 
-        # Blueprint type IDs cache
+        # Blueprint caches: type IDs, full activity records and their packed
+        # per-activity arrays (built on first use)
         self._blueprint_type_ids_cache: set[int] | None = None
+        self._blueprints_cache: Mapping[int, EveBlueprint] | None = None
+        self._blueprint_activity_arrays: dict[str, BlueprintActivityArrays] = {}
+
+        # Reprocessing yields and their packed matrix (built on first use)
+        self._type_materials_cache: Mapping[int, EveTypeMaterials] | None = None
+        self._reprocessing_matrix: ReprocessingMatrix | None = None
 
         # SDE metadata
         self._sde_metadata: SDEMetadata | None = None
 
         # Persistence / background build
         self._persist_path: Path = Path(
-            persist_path or (get_config().app.user_data_dir / "sde_indices.pkl")
+            persist_path or (get_config().app.user_data_dir / "sde_store.db")
         )
         try:
             self._persist_path.parent.mkdir(parents=True, exist_ok=True)
@@ -234,6 +338,46 @@ class SDEProvider:
         type_ids = index.get(market_group_id, [])
         return [types_cache[tid] for tid in type_ids]
 
+    def get_market_group_tree(self) -> MarketGroupTree:
+        """Get the market group hierarchy flattened for subtree queries.
+
+        Built on first use and kept until the caches are cleared or reloaded.
+
+        Returns:
+            MarketGroupTree of every market group and the types in them
+        """
+        tree = self._market_group_tree
+        if tree is None:
+            parents = dict(self._load_market_group_parent_ids().items())
+            self._load_types()
+            # _load_types ensures indices are built
+            index = self._types_by_market_group_index or {}
+            tree = MarketGroupTree.from_parents(
+                {
+                    group_id: parents.get(group_id)
+                    for group_id in self._load_market_groups()
+                },
+                index.items(),
+            )
+            self._market_group_tree = tree
+            logger.debug(
+                "Flattened %d market groups (%d types)", len(tree), len(tree.type_ids)
+            )
+        return tree
+
+    def get_types_under_market_group(self, market_group_id: int) -> list[EveType]:
+        """Get all types in a market group or any of its descendant groups.
+
+        Args:
+            market_group_id: The market group ID at the top of the subtree
+
+        Returns:
+            List of EveType objects under the market group
+        """
+        types_cache = self._load_types()
+        type_ids = self.get_market_group_tree().types_under(market_group_id)
+        return [types_cache[tid] for tid in type_ids.tolist()]
+
     def get_published_types(self) -> list[EveType]:
         """Get all published types.
 
@@ -331,6 +475,128 @@ class SDEProvider:
         """
         return self._load_blueprint_type_ids().copy()
 
+    def get_blueprint(self, blueprint_type_id: int) -> EveBlueprint | None:
+        """Get a blueprint with its activities by blueprint type ID.
+
+        Args:
+            blueprint_type_id: Type ID of the blueprint item
+
+        Returns:
+            EveBlueprint or None if not found
+        """
+        return self._load_blueprints().get(blueprint_type_id)
+
+    def get_blueprint_activity_arrays(
+        self, activity: str = "manufacturing"
+    ) -> BlueprintActivityArrays:
+        """Get one blueprint activity packed into compact arrays.
+
+        Built from all blueprints on first use and kept until the caches are
+        cleared or reloaded.
+
+        Args:
+            activity: SDE activity name (e.g. "manufacturing", "invention")
+
+        Returns:
+            BlueprintActivityArrays covering every blueprint with the activity
+        """
+        arrays = self._blueprint_activity_arrays.get(activity)
+        if arrays is None:
+            arrays = BlueprintActivityArrays.from_blueprints(
+                self._load_blueprints().values(), activity
+            )
+            self._blueprint_activity_arrays[activity] = arrays
+            logger.debug(
+                "Packed %d blueprints for %s (%d materials)",
+                len(arrays),
+                activity,
+                len(arrays.material_type_ids),
+            )
+        return arrays
+
+    def get_type_materials(self, type_id: int) -> EveTypeMaterials | None:
+        """Get the reprocessing yield of a type.
+
+        Args:
+            type_id: Type ID of the reprocessed item
+
+        Returns:
+            EveTypeMaterials or None if the type cannot be reprocessed
+        """
+        return self._load_type_materials().get(type_id)
+
+    def get_reprocessing_matrix(self) -> ReprocessingMatrix:
+        """Get all reprocessing yields packed into a sparse matrix.
+
+        Built on first use and kept until the caches are cleared or reloaded.
+
+        Returns:
+            ReprocessingMatrix of every reprocessable type
+        """
+        matrix = self._reprocessing_matrix
+        if matrix is None:
+            types = self._load_types()
+
+            def portion_size(type_id: int) -> int | None:
+                eve_type = types.get(type_id)
+                return eve_type.portion_size if eve_type else None
+
+            matrix = ReprocessingMatrix.from_type_materials(
+                self._load_type_materials().values(), portion_size
+            )
+            self._reprocessing_matrix = matrix
+            logger.debug(
+                "Packed %d reprocessable types (%d materials)",
+                len(matrix),
+                len(matrix.material_type_ids),
+            )
+        return matrix
+
+    def get_type_name_index(self) -> TypeNameIndex:
+        """Get the type name search index.
+
+        Built from the type name cache on first use and kept until the caches
+        are cleared or reloaded; call early to keep the first search fast.
+
+        Returns:
+            TypeNameIndex over every named type
+        """
+        index = self._type_name_index
+        if index is None:
+            names = self._load_type_names()
+            self._load_types()
+            # _load_types ensures indices are built
+            index = TypeNameIndex(names, self._published_types_ids or ())
+            self._type_name_index = index
+            logger.debug("Indexed %d type names", len(index))
+        return index
+
+    def search_types(
+        self, query: str, limit: int = 20, published_only: bool = True
+    ) -> list[EveType]:
+        """Search types by name for autocomplete.
+
+        Matches are case-insensitive: exact names first, then names starting
+        with the query, then names containing a word starting with it, then
+        close (fuzzy) matches.
+
+        Args:
+            query: Name or part of a name
+            limit: Maximum number of results
+            published_only: Only return published types
+
+        Returns:
+            List of matching EveType objects, best match first
+        """
+        types_cache = self._load_types()
+        return [
+            types_cache[type_id]
+            for type_id in self.get_type_name_index().search(
+                query, limit, published_only
+            )
+            if type_id in types_cache
+        ]
+
     def get_npc_station_name(self, station_id: int) -> str | None:
         """Get NPC station name by ID.
 
@@ -416,7 +682,29 @@ class SDEProvider:
         Returns:
             Dictionary mapping solar system ID to name
         """
-        return self._load_solar_system_names()
+        return dict(self._load_solar_system_names())
+
+    def get_jump_graph(self) -> JumpGraph:
+        """Get the stargate graph between solar systems.
+
+        Built on first use and kept until the caches are cleared or reloaded.
+
+        Returns:
+            JumpGraph of every system connected by stargates
+        """
+        graph = self._jump_graph
+        if graph is None:
+            graph = JumpGraph.from_stargates(
+                dict(self._load_stargate_system_ids().items()),
+                dict(self._load_stargate_destination_ids().items()),
+            )
+            self._jump_graph = graph
+            logger.debug(
+                "Packed jump graph of %d systems (%d connections)",
+                len(graph),
+                len(graph.neighbors) // 2,
+            )
+        return graph
 
     def clear_cache(self) -> None:
         """Clear all cached data to free memory.
@@ -424,6 +712,7 @@ class SDEProvider:
         All caches are set to None for consistency with fresh state.
         """
         logger.info("Clearing SDE cache...")
+        self._close_store()
 
         # Clear primary caches
         self._types_cache = None
@@ -432,6 +721,14 @@ class SDEProvider:
         self._market_groups_cache = None
         self._npc_stations_cache = None
         self._blueprint_type_ids_cache = None
+        self._blueprints_cache = None
+        self._blueprint_activity_arrays = {}
+        self._type_materials_cache = None
+        self._reprocessing_matrix = None
+        self._type_names_cache = None
+        self._type_name_index = None
+        self._market_group_parent_ids_cache = None
+        self._market_group_tree = None
 
         # Clear location name caches
         self._npc_station_names_cache = None
@@ -441,6 +738,9 @@ class SDEProvider:
         self._solar_system_names_cache = None
         self._solar_system_constellation_ids_cache = None
         self._constellation_region_ids_cache = None
+        self._stargate_system_ids_cache = None
+        self._stargate_destination_ids_cache = None
+        self._jump_graph = None
 
         # Clear index hashmaps (set to None for consistency)
         self._types_by_group_index = None
@@ -495,6 +795,23 @@ class SDEProvider:
                 if self._blueprint_type_ids_cache
                 else 0
             ),
+            "blueprints": (
+                len(self._blueprints_cache) if self._blueprints_cache else 0
+            ),
+            "type_materials": (
+                len(self._type_materials_cache) if self._type_materials_cache else 0
+            ),
+            "type_names": len(self._type_names_cache) if self._type_names_cache else 0,
+            "market_group_parents": (
+                len(self._market_group_parent_ids_cache)
+                if self._market_group_parent_ids_cache
+                else 0
+            ),
+            "stargates": (
+                len(self._stargate_system_ids_cache)
+                if self._stargate_system_ids_cache
+                else 0
+            ),
             "indices_built": (
                 self._types_by_group_index is not None
                 and len(self._types_by_group_index) > 0
@@ -535,60 +852,90 @@ class SDEProvider:
         finally:
             self._background_ready.set()
 
-    def _check_sde_changed(self, old_metadata: SDEMetadata | None) -> bool:
-        """Check if SDE source files have changed since cache was built.
+    def _compute_file_signatures(
+        self, previous: Mapping[str, SDEFileSignature] | None = None
+    ) -> dict[str, SDEFileSignature]:
+        """Compute mtime, size and content hash of every SDE source file.
 
-        Uses a simple heuristic: if max mtime of any .jsonl file is newer than
-        the cache computed_at timestamp, rebuild everything. This is simpler and
-        more robust than per-file tracking for a data set that changes rarely.
+        Files whose mtime and size match ``previous`` reuse the recorded hash,
+        so only files that were actually touched are read.
 
         Args:
-            old_metadata: Previously stored SDE metadata with computed_at timestamp
+            previous: Signatures recorded when the caches were last built
 
         Returns:
-            True if SDE files appear to have changed, False otherwise.
+            Mapping of file name to its signature.
         """
-        if old_metadata is None:
-            # No previous metadata - rebuild
-            return True
-
         base = getattr(self._parser, "file_path", None)
-        if not base:
-            return False
+        if not base or not Path(base).exists():
+            return {}
+
+        signatures: dict[str, SDEFileSignature] = {}
+        for path in sorted(Path(base).glob("*.jsonl")):
+            try:
+                stat = path.stat()
+                known = (previous or {}).get(path.name)
+                if (
+                    known is not None
+                    and known["mtime"] == stat.st_mtime
+                    and known["size"] == stat.st_size
+                ):
+                    digest = known["sha256"]
+                else:
+                    hasher = hashlib.sha256()
+                    with path.open("rb") as f:
+                        while chunk := f.read(_HASH_CHUNK_SIZE):
+                            hasher.update(chunk)
+                    digest = hasher.hexdigest()
+            except OSError:
+                logger.debug("Could not fingerprint %s", path, exc_info=True)
+                continue
+            signatures[path.name] = SDEFileSignature(
+                mtime=stat.st_mtime, size=stat.st_size, sha256=digest
+            )
+        return signatures
 
-        base_path = Path(base)
-        if not base_path.exists():
-            return False
+    def _changed_source_files(
+        self, old_metadata: SDEMetadata | None
+    ) -> tuple[set[str] | None, dict[str, SDEFileSignature]]:
+        """Compare SDE source files against the signatures caches were built from.
 
-        try:
-            # Parse the cached timestamp
-            cached_time = datetime.fromisoformat(old_metadata["computed_at"])
-
-            # Check if any .jsonl file is newer than cache
-            for path in base_path.glob("*.jsonl"):
-                try:
-                    file_mtime = path.stat().st_mtime
-                    file_time = datetime.fromtimestamp(file_mtime, tz=UTC)
-                    if file_time > cached_time:
-                        logger.debug(
-                            f"SDE file changed: {path.name} mtime {file_time} > cache time {cached_time}"
-                        )
-                        return True
-                except OSError:
-                    continue
-        except Exception:
-            logger.debug(
-                "Error checking SDE changes; assuming no change", exc_info=True
-            )
-            return False
+        Args:
+            old_metadata: Previously stored SDE metadata
 
-        return False
+        Returns:
+            Tuple of (names of files whose content changed, current signatures).
+            The set is None when no usable signatures were recorded and all
+            caches must be rebuilt.
+        """
+        previous = (old_metadata or {}).get("file_signatures")
+        if previous is None:
+            return None, {}
+
+        current = self._compute_file_signatures(previous)
+        if not current:
+            # Source files unavailable (e.g. store shipped without the SDE)
+            return set(), dict(previous)
+
+        changed = {
+            name
+            for name in previous.keys() | current.keys()
+            if (previous.get(name) or {}).get("sha256")
+            != (current.get(name) or {}).get("sha256")
+        }
+        return changed, current
 
-    def _compute_sde_metadata(self) -> SDEMetadata:
+    def _compute_sde_metadata(
+        self, file_signatures: dict[str, SDEFileSignature] | None = None
+    ) -> SDEMetadata:
         """Compute metadata about the current SDE cache state.
 
+        Args:
+            file_signatures: Source file signatures the caches were built from;
+                computed from disk when omitted.
+
         Returns:
-            SDEMetadata with counts and timestamp.
+            SDEMetadata with counts, timestamp and file signatures.
         """
         return SDEMetadata(
             computed_at=datetime.now(UTC).isoformat(),
@@ -608,53 +955,75 @@ class SDEProvider:
                 if self._blueprint_type_ids_cache
                 else 0
             ),
+            file_signatures=(
+                file_signatures
+                if file_signatures is not None
+                else self._compute_file_signatures()
+            ),
         )
 
-    def _persist_indices(self) -> None:
+    def _close_store(self) -> None:
+        if self._store is not None:
+            try:
+                self._store.close()
+            except Exception:
+                logger.debug("Failed to close SDE store", exc_info=True)
+            self._store = None
+
+    def _persist_indices(
+        self,
+        rebuilt: Collection[str] | None = None,
+        file_signatures: dict[str, SDEFileSignature] | None = None,
+    ) -> bool:
+        """Persist caches to the SDE store.
+
+        Args:
+            rebuilt: Names of caches rebuilt on top of the open store; all
+                other sections are copied from it. None writes every cache.
+            file_signatures: Source file signatures the caches were built from
+
+        Returns:
+            True if the store was written, False otherwise.
+        """
         if not self._types_cache:
-            return
+            return False
 
+        base = self._store.path if rebuilt is not None and self._store else None
         # Compute metadata (includes computed_at timestamp)
-        self._sde_metadata = self._compute_sde_metadata()
-
-        payload = {
-            # SDE metadata - includes computed_at for change detection
-            "sde_metadata": self._sde_metadata,
-            # Caches
-            "types_cache": self._types_cache,
-            "categories_cache": self._categories_cache,
-            "groups_cache": self._groups_cache,
-            "market_groups_cache": self._market_groups_cache,
-            "npc_stations_cache": self._npc_stations_cache,
-            "npc_station_names_cache": self._npc_station_names_cache,
-            "npc_station_system_ids_cache": self._npc_station_system_ids_cache,
-            "region_names_cache": self._region_names_cache,
-            "constellation_names_cache": self._constellation_names_cache,
-            "solar_system_names_cache": self._solar_system_names_cache,
-            "solar_system_constellation_ids_cache": self._solar_system_constellation_ids_cache,
-            "constellation_region_ids_cache": self._constellation_region_ids_cache,
-            "types_by_group_index": self._types_by_group_index,
-            "types_by_category_index": self._types_by_category_index,
-            "types_by_market_group_index": self._types_by_market_group_index,
-            "published_types_ids": self._published_types_ids,
-            "groups_by_category_index": self._groups_by_category_index,
-            "blueprint_type_ids_cache": self._blueprint_type_ids_cache,
-        }
+        self._sde_metadata = self._compute_sde_metadata(file_signatures)
 
         try:
-            tmp_path = self._persist_path.with_suffix(".tmp")
-            with open(tmp_path, "wb") as f:
-                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
-            os.replace(tmp_path, self._persist_path)
+            # Materialize everything before the backing file is replaced
+            payload: dict[str, Any] = {"id_sets": {}, "names": {}, "links": {}}
+            for name, (section, kind) in _STORE_SECTIONS.items():
+                if base is not None and name not in rebuilt:  # type: ignore[operator]
+                    continue
+                cache = getattr(self, f"_{name}_cache")
+                if kind is None:
+                    payload[section] = list((cache or {}).values())
+                elif section == "id_sets":
+                    payload[section][kind] = set(cache or ())
+                else:
+                    payload[section][kind] = dict(cache or {})
+            if base is None:
+                self._close_store()
+            SDEStore.write(
+                self._persist_path,
+                meta={"sde_metadata": self._sde_metadata},
+                base=base,
+                **payload,
+            )
             logger.debug("Persisted SDE caches to %s", self._persist_path)
+            return True
         except Exception:
             logger.debug("Failed to persist SDE caches", exc_info=True)
+            return False
 
-    def _validate_cache_integrity(self, payload: dict) -> bool:
+    def _validate_cache_integrity(self, payload: dict[str, Any]) -> bool:
         """Validate that loaded cache data meets integrity requirements.
 
         Args:
-            payload: The loaded pickle payload
+            payload: Loaded caches and indices keyed by cache name
 
         Returns:
             True if all integrity checks pass, False otherwise.
@@ -689,8 +1058,8 @@ class SDEProvider:
         types_by_group = payload.get("types_by_group_index", {})
         if types_cache and types_by_group:
             # Sample check: ensure indexed type IDs exist in types cache
-            for type_ids in list(types_by_group.values())[:10]:
-                for tid in type_ids[:5]:
+            for group_id in itertools.islice(types_by_group, 10):
+                for tid in types_by_group[group_id][:5]:
                     if tid not in types_cache:
                         logger.debug(
                             f"Cache integrity check: type_id {tid} in index but not in cache"
@@ -702,66 +1071,254 @@ class SDEProvider:
     def _load_persisted_indices(self) -> bool:
         if not self._persist_path.exists():
             return False
+        store: SDEStore | None = None
         try:
-            with open(self._persist_path, "rb") as f:
-                payload = pickle.load(f)
-
-            # Check if SDE source files have changed since cache was built
-            sde_metadata = payload.get("sde_metadata")
-            if self._check_sde_changed(sde_metadata):
-                logger.info("SDE source files have changed; rebuilding all caches")
+            store = SDEStore(self._persist_path)
+
+            # Check which SDE source files changed since the store was built
+            sde_metadata = store.get_meta("sde_metadata")
+            changed, signatures = self._changed_source_files(sde_metadata)
+            if changed is None:
+                logger.info("No SDE file signatures recorded; rebuilding all caches")
+                store.close()
                 return False
 
+            payload: dict[str, Any] = {
+                "types_cache": store.models("types"),
+                "categories_cache": store.models("categories"),
+                "groups_cache": store.models("groups"),
+                "market_groups_cache": store.models("market_groups"),
+                "npc_stations_cache": store.id_set("npc_stations"),
+                "types_by_group_index": store.index("types", "group_id"),
+            }
+
             # Validate integrity before loading
             if not self._validate_cache_integrity(payload):
                 logger.warning("Cache integrity validation failed; rebuilding")
+                store.close()
                 return False
 
-            # Load all caches from payload
-            self._types_cache = payload.get("types_cache")
-            self._categories_cache = payload.get("categories_cache")
-            self._groups_cache = payload.get("groups_cache")
-            self._market_groups_cache = payload.get("market_groups_cache")
-            self._npc_stations_cache = payload.get("npc_stations_cache")
-            self._npc_station_names_cache = payload.get("npc_station_names_cache")
-            self._npc_station_system_ids_cache = payload.get(
-                "npc_station_system_ids_cache"
-            )
-            self._region_names_cache = payload.get("region_names_cache")
-            self._solar_system_constellation_ids_cache = payload.get(
-                "solar_system_constellation_ids_cache"
-            )
-            self._constellation_region_ids_cache = payload.get(
-                "constellation_region_ids_cache"
-            )
-            self._constellation_names_cache = payload.get("constellation_names_cache")
-            self._solar_system_names_cache = payload.get("solar_system_names_cache")
-            self._types_by_group_index = payload.get("types_by_group_index")
-            self._types_by_category_index = payload.get("types_by_category_index")
-            self._types_by_market_group_index = payload.get(
-                "types_by_market_group_index"
-            )
-            self._published_types_ids = payload.get("published_types_ids")
-            self._groups_by_category_index = payload.get("groups_by_category_index")
-            self._blueprint_type_ids_cache = payload.get("blueprint_type_ids_cache")
-            self._sde_metadata = sde_metadata
-
-            logger.info(
-                "Loaded SDE caches from persisted file (%s)", self._persist_path
-            )
-            return True
+            self._wire_store(store, sde_metadata)
+            logger.info("Opened SDE store (%s)", self._persist_path)
         except Exception:
+            if store is not None and store is not self._store:
+                store.close()
             logger.debug(
                 "Failed to load persisted SDE caches; will rebuild", exc_info=True
             )
             return False
 
+        if changed:
+            try:
+                self._rebuild_changed_caches(changed, signatures)
+            except Exception:
+                logger.warning(
+                    "Partial SDE rebuild failed; rebuilding all caches", exc_info=True
+                )
+                self.clear_cache()
+                return False
+        return True
+
+    def apply_sde_changes(self, changes: Mapping[str, Collection[int]]) -> bool:
+        """Patch the persisted caches and reopen them on the patched store.
+
+        Convenience for callers on the thread that owns the provider; see
+        ``patch_sde_store`` and ``adopt_patched_store`` for the two halves.
+
+        Args:
+            changes: SDE file name -> keys of records added, changed or removed
+
+        Returns:
+            True if the changes were applied; False if the caller should fall
+            back to a rebuild.
+        """
+        patch = self.patch_sde_store(changes)
+        if patch is None:
+            return False
+        self.adopt_patched_store(patch)
+        return True
+
+    def patch_sde_store(
+        self, changes: Mapping[str, Collection[int]]
+    ) -> SDEStorePatch | None:
+        """Write the records named in an SDE change feed into the store file.
+
+        The SDE files on disk must already hold the new build. Only records
+        whose keys are listed are re-read (through a restricted parser view)
+        and written in one transaction on a separate connection, so this may
+        run in a worker thread: the open store and every lazy cache keep
+        serving reads until ``adopt_patched_store`` swaps them on the owning
+        thread.
+
+        Blueprint records are assumed to be keyed by their blueprint type ID,
+        as they are in the SDE.
+
+        Args:
+            changes: SDE file name -> keys of records added, changed or removed
+
+        Returns:
+            The committed patch, or None if the caller should fall back to a
+            rebuild (no open store, or the patch failed).
+        """
+        restricted_to = getattr(self._parser, "restricted_to", None)
+        store = self._store
+        if restricted_to is None or store is None:
+            return None
+
+        relevant = {
+            name: set(keys)
+            for name, keys in changes.items()
+            if name in SDE_SOURCE_CACHES and keys
+        }
+        previous = (self._sde_metadata or {}).get("file_signatures")
+        try:
+            view = restricted_to(relevant)
+            removed: dict[tuple[str, str | None], set[int]] = {}
+            upserts: dict[str, Any] = {"id_sets": {}, "names": {}, "links": {}}
+            for source, keys in relevant.items():
+                for name in SDE_SOURCE_CACHES[source]:
+                    section, kind = _STORE_SECTIONS[name]
+                    loader = getattr(
+                        view, f"load_{_CACHE_LOADER_NAMES.get(name, name)}"
+                    )
+                    removed[(section, kind)] = keys
+                    if kind is None:
+                        upserts[section] = list(loader())
+                    else:
+                        upserts[section][kind] = loader()
+            store.apply_patch(removed=removed, **upserts)
+            patched = SDEStore(self._persist_path)
+        except Exception:
+            logger.warning("Failed to apply SDE changes to the store", exc_info=True)
+            return None
+
+        logger.info(
+            "Applied SDE changes to %d records in %s",
+            sum(len(keys) for keys in relevant.values()),
+            ", ".join(sorted(relevant)) or "no cached files",
+        )
+        return SDEStorePatch(
+            store=patched,
+            file_signatures=self._compute_file_signatures(previous),
+        )
+
+    def adopt_patched_store(self, patch: SDEStorePatch) -> None:
+        """Reopen every cache on a store written by ``patch_sde_store``.
+
+        Closes the previous store, so it must run on the thread that reads
+        the provider.
+
+        Args:
+            patch: Result of ``patch_sde_store``
+        """
+        self._wire_store(patch.store, self._sde_metadata)  # type: ignore[arg-type]
+        self._sde_metadata = self._compute_sde_metadata(patch.file_signatures)
+        try:
+            patch.store.set_meta({"sde_metadata": self._sde_metadata})
+        except Exception:
+            # Stale signatures only cause a partial rebuild on next start
+            logger.debug("Failed to update SDE store metadata", exc_info=True)
+
+    def _wire_store(self, store: SDEStore, sde_metadata: SDEMetadata) -> None:
+        """Point every cache and index at lazy views over ``store``."""
+        self._close_store()
+        self._store = store
+        self._types_cache = store.models("types")
+        self._categories_cache = store.models("categories")
+        self._groups_cache = store.models("groups")
+        self._market_groups_cache = store.models("market_groups")
+        self._npc_stations_cache = store.id_set("npc_stations")
+        self._type_names_cache = store.names("types")
+        self._type_name_index = None
+        self._market_group_parent_ids_cache = store.links("market_group_parent")
+        self._market_group_tree = None
+        self._npc_station_names_cache = store.names("npc_stations")
+        self._npc_station_system_ids_cache = store.links("station_system")
+        self._region_names_cache = store.names("regions")
+        self._solar_system_constellation_ids_cache = store.links("system_constellation")
+        self._constellation_region_ids_cache = store.links("constellation_region")
+        self._constellation_names_cache = store.names("constellations")
+        self._solar_system_names_cache = store.names("solar_systems")
+        self._stargate_system_ids_cache = store.links("stargate_system")
+        self._stargate_destination_ids_cache = store.links("stargate_destination")
+        self._jump_graph = None
+        self._types_by_group_index = store.index("types", "group_id")
+        self._types_by_category_index = store.index("types", "category_id")
+        self._types_by_market_group_index = store.index("types", "market_group_id")
+        self._published_types_ids = store.published_type_ids()
+        self._groups_by_category_index = store.index("groups", "category_id")
+        self._blueprint_type_ids_cache = store.id_set("blueprint_types")
+        self._blueprints_cache = store.models("blueprints")
+        self._blueprint_activity_arrays = {}
+        self._type_materials_cache = store.models("type_materials")
+        self._reprocessing_matrix = None
+        self._sde_metadata = sde_metadata
+
+    def _rebuild_changed_caches(
+        self, changed: set[str], signatures: dict[str, SDEFileSignature]
+    ) -> None:
+        """Re-parse only the caches derived from changed source files.
+
+        Unchanged caches keep reading from the open store; the store is then
+        rewritten with the rebuilt sections and reopened.
+
+        Args:
+            changed: Names of source files whose content changed
+            signatures: Current signatures of all source files
+        """
+        rebuilt = [
+            name
+            for source in sorted(changed)
+            for name in SDE_SOURCE_CACHES.get(source, ())
+        ]
+        logger.info(
+            "SDE source files changed (%s); rebuilding %s",
+            ", ".join(sorted(changed)),
+            ", ".join(rebuilt) or "no caches",
+        )
+
+        # Groups first: type indices read the group cache
+        rebuilt.sort(key=lambda name: name != "groups")
+        for name in rebuilt:
+            setattr(self, f"_{name}_cache", None)
+        if "blueprints" in rebuilt:
+            self._blueprint_activity_arrays = {}
+        if "type_materials" in rebuilt or "types" in rebuilt:
+            # Portion sizes come from types
+            self._reprocessing_matrix = None
+        if "types" in rebuilt:
+            # Names and published flags both come from types
+            self._type_name_index = None
+        if "types" in rebuilt or "market_group_parent_ids" in rebuilt:
+            self._market_group_tree = None
+        if "stargate_system_ids" in rebuilt:
+            self._jump_graph = None
+        self._ingest_parallel(rebuilt)
+        for name in rebuilt:
+            getattr(self, f"_load_{name}")()
+        if "groups" in rebuilt and "types" not in rebuilt:
+            self._build_type_category_index()
+
+        if not self._persist_indices(rebuilt=rebuilt, file_signatures=signatures):
+            # Keep serving the rebuilt in-memory caches over the old store
+            return
+        try:
+            self._wire_store(SDEStore(self._persist_path), self._sde_metadata)  # type: ignore[arg-type]
+        except Exception:
+            logger.debug("Failed to reopen SDE store after rebuild", exc_info=True)
+
     def _build_all_indices_sync(self) -> None:
+        # Parse files in parallel where possible; loaders below fill the rest
+        self._ingest_parallel(
+            [name for names in SDE_SOURCE_CACHES.values() for name in names]
+        )
         # Force load everything to build indices once
         self._load_types()
+        self._load_type_names()
         self._load_categories()
         self._load_groups()
         self._load_market_groups()
+        self._load_market_group_parent_ids()
         self._load_npc_stations()
         self._load_npc_station_names()
         self._load_npc_station_system_ids()
@@ -770,7 +1327,47 @@ class SDEProvider:
         self._load_constellation_region_ids()
         self._load_constellation_names()
         self._load_solar_system_names()
+        self._load_stargate_system_ids()
+        self._load_stargate_destination_ids()
         self._load_blueprint_type_ids()
+        self._load_blueprints()
+        self._load_type_materials()
+
+    def _ingest_parallel(self, names: Collection[str]) -> None:
+        """Parse unset caches in the parser's process pool and merge them.
+
+        Caches stay unset (and are filled by their sequential loaders) when
+        the parser has no ``load_parallel`` or the pool fails.
+
+        Args:
+            names: Cache names as used in SDE_SOURCE_CACHES
+        """
+        load_parallel = getattr(self._parser, "load_parallel", None)
+        pending = {
+            _CACHE_LOADER_NAMES.get(name, name): name
+            for name in names
+            if getattr(self, f"_{name}_cache") is None
+        }
+        if load_parallel is None or not pending:
+            return
+
+        try:
+            results = load_parallel(pending)
+        except Exception:
+            logger.warning(
+                "Parallel SDE parsing failed; falling back to sequential loading",
+                exc_info=True,
+            )
+            return
+
+        for loader, value in results.items():
+            setattr(self, f"_{pending[loader]}_cache", value)
+        logger.info("Parsed %d SDE caches in parallel", len(results))
+
+        if "groups" in results:
+            self._build_group_indices()
+        if "types" in results:
+            self._build_type_indices()
 
     def _load_blueprint_type_ids(self) -> set[int]:
         """Load and cache blueprint type IDs.
@@ -784,7 +1381,44 @@ class SDEProvider:
             logger.info(f"Loaded {len(self._blueprint_type_ids_cache)} blueprint types")
         return self._blueprint_type_ids_cache
 
-    def _load_npc_station_names(self) -> dict[int, str]:
+    def _load_blueprints(self) -> Mapping[int, EveBlueprint]:
+        """Load and cache blueprints with their activities."""
+        if self._blueprints_cache is None:
+            logger.info("Loading blueprints from SDE...")
+            self._blueprints_cache = {
+                bp.blueprint_type_id: bp for bp in self._parser.load_blueprints()
+            }
+            self._blueprint_activity_arrays = {}
+            logger.info(f"Loaded {len(self._blueprints_cache)} blueprints")
+        return self._blueprints_cache
+
+    def _load_type_materials(self) -> Mapping[int, EveTypeMaterials]:
+        """Load and cache reprocessing yields."""
+        if self._type_materials_cache is None:
+            logger.info("Loading type materials from SDE...")
+            self._type_materials_cache = {
+                tm.type_id: tm for tm in self._parser.load_type_materials()
+            }
+            self._reprocessing_matrix = None
+            logger.info(
+                f"Loaded reprocessing yields for {len(self._type_materials_cache)} types"
+            )
+        return self._type_materials_cache
+
+    def _load_type_names(self) -> Mapping[int, str]:
+        """Load and cache type names.
+
+        Returns:
+            Dictionary mapping type ID to type name
+        """
+        if self._type_names_cache is None:
+            logger.info("Loading type names from SDE...")
+            self._type_names_cache = self._parser.load_type_names()
+            self._type_name_index = None
+            logger.info(f"Loaded {len(self._type_names_cache)} type names")
+        return self._type_names_cache
+
+    def _load_npc_station_names(self) -> Mapping[int, str]:
         """Load and cache NPC station names.
 
         Returns:
@@ -798,7 +1432,7 @@ class SDEProvider:
             )
         return self._npc_station_names_cache
 
-    def _load_npc_station_system_ids(self) -> dict[int, int]:
+    def _load_npc_station_system_ids(self) -> Mapping[int, int]:
         """Load and cache NPC station to system ID mapping.
 
         Returns:
@@ -814,7 +1448,7 @@ class SDEProvider:
             )
         return self._npc_station_system_ids_cache
 
-    def _load_region_names(self) -> dict[int, str]:
+    def _load_region_names(self) -> Mapping[int, str]:
         """Load and cache region names.
 
         Returns:
@@ -826,7 +1460,7 @@ class SDEProvider:
             logger.info(f"Loaded {len(self._region_names_cache)} region names")
         return self._region_names_cache
 
-    def _load_constellation_names(self) -> dict[int, str]:
+    def _load_constellation_names(self) -> Mapping[int, str]:
         """Load and cache constellation names.
 
         Returns:
@@ -840,7 +1474,7 @@ class SDEProvider:
             )
         return self._constellation_names_cache
 
-    def _load_solar_system_names(self) -> dict[int, str]:
+    def _load_solar_system_names(self) -> Mapping[int, str]:
         """Load and cache solar system names.
 
         Returns:
@@ -854,7 +1488,7 @@ class SDEProvider:
             )
         return self._solar_system_names_cache
 
-    def _load_solar_system_constellation_ids(self) -> dict[int, int]:
+    def _load_solar_system_constellation_ids(self) -> Mapping[int, int]:
         """Load and cache solar system to constellation ID mapping.
 
         Returns:
@@ -870,7 +1504,7 @@ class SDEProvider:
             )
         return self._solar_system_constellation_ids_cache
 
-    def _load_constellation_region_ids(self) -> dict[int, int]:
+    def _load_constellation_region_ids(self) -> Mapping[int, int]:
         """Load and cache constellation to region ID mapping.
 
         Returns:
@@ -886,7 +1520,37 @@ class SDEProvider:
             )
         return self._constellation_region_ids_cache
 
-    def _load_types(self) -> dict[int, EveType]:
+    def _load_stargate_system_ids(self) -> Mapping[int, int]:
+        """Load and cache stargate to solar system mappings.
+
+        Returns:
+            Dictionary mapping stargate ID to the solar system it is in
+        """
+        if self._stargate_system_ids_cache is None:
+            logger.info("Loading stargates from SDE...")
+            self._stargate_system_ids_cache = self._parser.load_stargate_system_ids()
+            self._jump_graph = None
+            logger.info(f"Loaded {len(self._stargate_system_ids_cache)} stargates")
+        return self._stargate_system_ids_cache
+
+    def _load_stargate_destination_ids(self) -> Mapping[int, int]:
+        """Load and cache stargate to destination solar system mappings.
+
+        Returns:
+            Dictionary mapping stargate ID to the solar system it jumps to
+        """
+        if self._stargate_destination_ids_cache is None:
+            logger.info("Loading stargate destinations from SDE...")
+            self._stargate_destination_ids_cache = (
+                self._parser.load_stargate_destination_ids()
+            )
+            self._jump_graph = None
+            logger.info(
+                f"Loaded {len(self._stargate_destination_ids_cache)} stargate destinations"
+            )
+        return self._stargate_destination_ids_cache
+
+    def _load_types(self) -> Mapping[int, EveType]:
         """Load and cache all types."""
         if self._types_cache is None:
             logger.info("Loading types from SDE...")
@@ -945,7 +1609,23 @@ class SDEProvider:
 
         logger.debug("Type indices built successfully")
 
-    def _load_categories(self) -> dict[int, EveCategory]:
+    def _build_type_category_index(self) -> None:
+        """Rebuild the type category index from the group index.
+
+        Used when groups changed but types did not, so the types cache does
+        not need to be decoded or re-parsed.
+        """
+        assert self._types_by_group_index is not None
+        assert self._groups_cache is not None
+
+        categories_index: dict[int, list[int]] = defaultdict(list)
+        for group_id, type_ids in self._types_by_group_index.items():
+            group = self._groups_cache.get(group_id)
+            if group:
+                categories_index[group.category_id].extend(type_ids)
+        self._types_by_category_index = dict(categories_index)
+
+    def _load_categories(self) -> Mapping[int, EveCategory]:
         """Load and cache all categories."""
         if self._categories_cache is None:
             logger.info("Loading categories from SDE...")
@@ -955,7 +1635,7 @@ class SDEProvider:
             logger.info(f"Loaded {len(self._categories_cache)} categories")
         return self._categories_cache
 
-    def _load_groups(self) -> dict[int, EveGroup]:
+    def _load_groups(self) -> Mapping[int, EveGroup]:
         """Load and cache all groups."""
         if self._groups_cache is None:
             logger.info("Loading groups from SDE...")
@@ -986,7 +1666,7 @@ class SDEProvider:
 
         logger.debug("Group indices built successfully")
 
-    def _load_market_groups(self) -> dict[int, EveMarketGroup]:
+    def _load_market_groups(self) -> Mapping[int, EveMarketGroup]:
         """Load and cache all market groups."""
         if self._market_groups_cache is None:
             logger.info("Loading market groups from SDE...")
@@ -996,6 +1676,23 @@ class SDEProvider:
             logger.info(f"Loaded {len(self._market_groups_cache)} market groups")
         return self._market_groups_cache
 
+    def _load_market_group_parent_ids(self) -> Mapping[int, int]:
+        """Load and cache market group to parent market group mappings.
+
+        Returns:
+            Dictionary mapping market group ID to parent market group ID
+        """
+        if self._market_group_parent_ids_cache is None:
+            logger.info("Loading market group hierarchy from SDE...")
+            self._market_group_parent_ids_cache = (
+                self._parser.load_market_group_parent_ids()
+            )
+            self._market_group_tree = None
+            logger.info(
+                f"Loaded {len(self._market_group_parent_ids_cache)} market group parents"
+            )
+        return self._market_group_parent_ids_cache
+
     def _load_npc_stations(self) -> set[int]:
         """Load and cache all NPC station IDs.
 
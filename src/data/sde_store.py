@@ -0,0 +1,598 @@
+"""Compact read-only SQLite store for prebuilt SDE caches and indices.
+
+The store replaces a monolithic pickle of fully materialized models. Each
+record is kept as a compact JSON row next to the indexed columns the provider
+filters on, and the file is memory-mapped by SQLite. Models and names are
+decoded lazily on first access and memoized, so cold start only opens the
+file and resident memory grows with what is actually used.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from models.eve import (
+    EveBlueprint,
+    EveCategory,
+    EveGroup,
+    EveMarketGroup,
+    EveType,
+    EveTypeMaterials,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk layout changes; older files are rebuilt
+SDE_STORE_FORMAT_VERSION = 6
+
+# Let SQLite memory-map up to this many bytes of the store
+_MMAP_SIZE = 256 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE types (
+    type_id INTEGER PRIMARY KEY,
+    group_id INTEGER,
+    category_id INTEGER,
+    market_group_id INTEGER,
+    published INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX idx_types_group ON types(group_id);
+CREATE INDEX idx_types_category ON types(category_id);
+CREATE INDEX idx_types_market_group ON types(market_group_id);
+CREATE TABLE groups (
+    group_id INTEGER PRIMARY KEY,
+    category_id INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX idx_groups_category ON groups(category_id);
+CREATE TABLE categories (category_id INTEGER PRIMARY KEY, data TEXT NOT NULL);
+CREATE TABLE market_groups (marketgroup_id INTEGER PRIMARY KEY, data TEXT NOT NULL);
+CREATE TABLE blueprints (blueprint_type_id INTEGER PRIMARY KEY, data TEXT NOT NULL);
+CREATE TABLE type_materials (type_id INTEGER PRIMARY KEY, data TEXT NOT NULL);
+CREATE TABLE id_sets (
+    kind TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    PRIMARY KEY (kind, id)
+) WITHOUT ROWID;
+CREATE TABLE names (
+    kind TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (kind, id)
+) WITHOUT ROWID;
+CREATE TABLE links (
+    kind TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    target INTEGER NOT NULL,
+    PRIMARY KEY (kind, id)
+) WITHOUT ROWID;
+"""
+
+# Record tables: table -> (primary key column, model class)
+_MODEL_TABLES: dict[str, tuple[str, type[BaseModel]]] = {
+    "types": ("type_id", EveType),
+    "groups": ("group_id", EveGroup),
+    "categories": ("category_id", EveCategory),
+    "market_groups": ("marketgroup_id", EveMarketGroup),
+    "blueprints": ("blueprint_type_id", EveBlueprint),
+    "type_materials": ("type_id", EveTypeMaterials),
+}
+
+# Filterable columns per record table
+_INDEX_COLUMNS: dict[str, set[str]] = {
+    "types": {"group_id", "category_id", "market_group_id"},
+    "groups": {"category_id"},
+}
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def _encode(model: BaseModel) -> str:
+    return model.model_dump_json(by_alias=True, exclude_none=True)
+
+
+# Row builders per record table; type category_id is filled in by SQL
+_ROW_BUILDERS: dict[str, Callable[[Any], tuple[Any, ...]]] = {
+    "types": lambda t: (
+        t.type_id,
+        t.group_id,
+        None,
+        t.market_group_id,
+        1 if t.published else 0,
+        _encode(t),
+    ),
+    "groups": lambda g: (g.group_id, g.category_id, _encode(g)),
+    "categories": lambda c: (c.category_id, _encode(c)),
+    "market_groups": lambda mg: (mg.marketgroup_id, _encode(mg)),
+    "blueprints": lambda bp: (bp.blueprint_type_id, _encode(bp)),
+    "type_materials": lambda tm: (tm.type_id, _encode(tm)),
+}
+
+_UPDATE_TYPE_CATEGORIES = (
+    "UPDATE types SET category_id = ("
+    "SELECT g.category_id FROM groups g WHERE g.group_id = types.group_id)"
+)
+
+
+def _insert_records(
+    conn: sqlite3.Connection, table: str, models: Iterable[BaseModel]
+) -> None:
+    build = _ROW_BUILDERS[table]
+    rows = (build(model) for model in models)
+    first = next(rows, None)
+    if first is None:
+        return
+    placeholders = ", ".join("?" * len(first))
+    conn.executemany(
+        f"INSERT OR REPLACE INTO {table} VALUES ({placeholders})",
+        itertools.chain((first,), rows),
+    )
+
+
+def _insert_keyed(
+    conn: sqlite3.Connection,
+    id_sets: Mapping[str, Iterable[int]] | None,
+    names: Mapping[str, Mapping[int, str]] | None,
+    links: Mapping[str, Mapping[int, int]] | None,
+) -> dict[str, list[str]]:
+    """Insert or replace keyed entries; returns the kinds supplied per table."""
+    for kind, ids in (id_sets or {}).items():
+        conn.executemany(
+            "INSERT OR IGNORE INTO id_sets VALUES (?, ?)",
+            ((kind, int(i)) for i in ids),
+        )
+    for table, sections in (("names", names), ("links", links)):
+        for kind, mapping in (sections or {}).items():
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {table} VALUES (?, ?, ?)",
+                (
+                    (kind, int(i), value if table == "names" else int(value))
+                    for i, value in mapping.items()
+                ),
+            )
+    return {
+        "id_sets": list(id_sets or ()),
+        "names": list(names or ()),
+        "links": list(links or ()),
+    }
+
+
+class _LazyModelMap(Mapping[int, M]):
+    """Read-only ``id -> model`` mapping decoding rows on first access."""
+
+    def __init__(self, store: SDEStore, table: str):
+        self._store = store
+        self._table = table
+        self._key, self._model = _MODEL_TABLES[table]
+        self._decoded: dict[int, M] = {}
+        self._len: int | None = None
+
+    def __getitem__(self, key: int) -> M:
+        decoded = self._decoded.get(key)
+        if decoded is not None:
+            return decoded
+        row = self._store.fetchone(
+            f"SELECT data FROM {self._table} WHERE {self._key} = ?", (key,)
+        )
+        if row is None:
+            raise KeyError(key)
+        decoded = self._model.model_validate_json(row[0])  # type: ignore[assignment]
+        self._decoded[key] = decoded  # type: ignore[assignment]
+        return decoded  # type: ignore[return-value]
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._decoded:
+            return True
+        return (
+            self._store.fetchone(
+                f"SELECT 1 FROM {self._table} WHERE {self._key} = ?", (key,)
+            )
+            is not None
+        )
+
+    def __iter__(self) -> Iterator[int]:
+        rows = self._store.fetchall(
+            f"SELECT {self._key} FROM {self._table} ORDER BY {self._key}"
+        )
+        return (row[0] for row in rows)
+
+    def __len__(self) -> int:
+        if self._len is None:
+            row = self._store.fetchone(f"SELECT COUNT(*) FROM {self._table}")
+            self._len = int(row[0]) if row else 0
+        return self._len
+
+    def _decode_all(self) -> dict[int, M]:
+        """Decode every row at once (bulk accessors such as get_all_types)."""
+        if len(self._decoded) < len(self):
+            for key, data in self._store.fetchall(
+                f"SELECT {self._key}, data FROM {self._table} ORDER BY {self._key}"
+            ):
+                if key not in self._decoded:
+                    self._decoded[key] = self._model.model_validate_json(data)  # type: ignore[assignment]
+        return self._decoded
+
+    def values(self):  # type: ignore[override]
+        return self._decode_all().values()
+
+    def items(self):  # type: ignore[override]
+        return self._decode_all().items()
+
+
+class _LazyIndexMap(Mapping[int, list[int]]):
+    """Read-only ``filter value -> [ids]`` index answered by an indexed column."""
+
+    def __init__(self, store: SDEStore, table: str, column: str):
+        if column not in _INDEX_COLUMNS.get(table, set()):
+            raise ValueError(f"{table}.{column} is not an indexed column")
+        self._store = store
+        self._table = table
+        self._column = column
+        self._key = _MODEL_TABLES[table][0]
+        self._memo: dict[int, list[int]] = {}
+
+    def __getitem__(self, value: int) -> list[int]:
+        ids = self._memo.get(value)
+        if ids is None:
+            ids = [
+                row[0]
+                for row in self._store.fetchall(
+                    f"SELECT {self._key} FROM {self._table} "
+                    f"WHERE {self._column} = ? ORDER BY {self._key}",
+                    (value,),
+                )
+            ]
+            if not ids:
+                raise KeyError(value)
+            self._memo[value] = ids
+        return ids
+
+    def __iter__(self) -> Iterator[int]:
+        rows = self._store.fetchall(
+            f"SELECT DISTINCT {self._column} FROM {self._table} "
+            f"WHERE {self._column} IS NOT NULL ORDER BY {self._column}"
+        )
+        return (row[0] for row in rows)
+
+    def __len__(self) -> int:
+        row = self._store.fetchone(
+            f"SELECT COUNT(DISTINCT {self._column}) FROM {self._table}"
+        )
+        return int(row[0]) if row else 0
+
+    def items(self):  # type: ignore[override]
+        """All ``(value, ids)`` pairs from one query (bulk readers)."""
+        grouped: dict[int, list[int]] = {}
+        for value, key in self._store.fetchall(
+            f"SELECT {self._column}, {self._key} FROM {self._table} "
+            f"WHERE {self._column} IS NOT NULL ORDER BY {self._column}, {self._key}"
+        ):
+            grouped.setdefault(value, []).append(key)
+        self._memo.update(grouped)
+        return grouped.items()
+
+
+class _LazyValueMap(Mapping[int, Any]):
+    """Read-only ``id -> name`` or ``id -> id`` mapping of one kind."""
+
+    def __init__(self, store: SDEStore, table: str, kind: str):
+        self._store = store
+        self._table = table
+        self._column = "name" if table == "names" else "target"
+        self._kind = kind
+        self._memo: dict[int, Any] = {}
+        self._len: int | None = None
+        self._complete = False
+
+    def __getitem__(self, key: int) -> Any:
+        if key in self._memo:
+            return self._memo[key]
+        if self._complete:
+            raise KeyError(key)
+        row = self._store.fetchone(
+            f"SELECT {self._column} FROM {self._table} WHERE kind = ? AND id = ?",
+            (self._kind, key),
+        )
+        if row is None:
+            raise KeyError(key)
+        self._memo[key] = row[0]
+        return row[0]
+
+    def _load_all(self) -> dict[int, Any]:
+        if not self._complete:
+            self._memo = {
+                row[0]: row[1]
+                for row in self._store.fetchall(
+                    f"SELECT id, {self._column} FROM {self._table} "
+                    "WHERE kind = ? ORDER BY id",
+                    (self._kind,),
+                )
+            }
+            self._complete = True
+        return self._memo
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._load_all())
+
+    def __len__(self) -> int:
+        if self._complete:
+            return len(self._memo)
+        if self._len is None:
+            row = self._store.fetchone(
+                f"SELECT COUNT(*) FROM {self._table} WHERE kind = ?", (self._kind,)
+            )
+            self._len = int(row[0]) if row else 0
+        return self._len
+
+    def values(self):  # type: ignore[override]
+        return self._load_all().values()
+
+    def items(self):  # type: ignore[override]
+        return self._load_all().items()
+
+
+class SDEStore:
+    """Read-only, memory-mapped SQLite file holding prebuilt SDE caches."""
+
+    def __init__(self, path: str | Path):
+        """Open an existing store.
+
+        Args:
+            path: Path to a store written by SDEStore.write
+
+        Raises:
+            sqlite3.DatabaseError: If the file is not a valid store
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            f"{self.path.resolve().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+        )
+        try:
+            self._conn.execute(f"PRAGMA mmap_size = {_MMAP_SIZE}")
+            version = self.get_meta("format_version")
+            if version != SDE_STORE_FORMAT_VERSION:
+                raise sqlite3.DatabaseError(f"Unsupported SDE store format {version!r}")
+        except Exception:
+            self._conn.close()
+            raise
+
+    # ------------------------------------------------------------------
+    # Low-level access
+    # ------------------------------------------------------------------
+
+    def fetchone(self, sql: str, params: tuple = ()) -> tuple | None:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()
+
+    def fetchall(self, sql: str, params: tuple = ()) -> list[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def get_meta(self, key: str) -> Any:
+        """Return a JSON-decoded metadata value, or None if absent."""
+        row = self.fetchone("SELECT value FROM meta WHERE key = ?", (key,))
+        return json.loads(row[0]) if row else None
+
+    # ------------------------------------------------------------------
+    # Lazy views
+    # ------------------------------------------------------------------
+
+    def models(self, table: str) -> Mapping[int, Any]:
+        """Lazy ``id -> model`` view over a record table."""
+        return _LazyModelMap(self, table)
+
+    def index(self, table: str, column: str) -> Mapping[int, list[int]]:
+        """Lazy ``value -> [ids]`` view over an indexed column."""
+        return _LazyIndexMap(self, table, column)
+
+    def names(self, kind: str) -> Mapping[int, str]:
+        """Lazy ``id -> name`` view for one name kind."""
+        return _LazyValueMap(self, "names", kind)
+
+    def links(self, kind: str) -> Mapping[int, int]:
+        """Lazy ``id -> id`` view for one relation kind."""
+        return _LazyValueMap(self, "links", kind)
+
+    def id_set(self, kind: str) -> set[int]:
+        """Load one ID set (small; materialized eagerly)."""
+        return {
+            row[0]
+            for row in self.fetchall("SELECT id FROM id_sets WHERE kind = ?", (kind,))
+        }
+
+    def published_type_ids(self) -> set[int]:
+        return {
+            row[0] for row in self.fetchall("SELECT type_id FROM types WHERE published")
+        }
+
+    # ------------------------------------------------------------------
+    # In-place patching
+    # ------------------------------------------------------------------
+
+    def set_meta(self, entries: Mapping[str, Any]) -> None:
+        """Replace metadata entries in place (JSON-encoded)."""
+        with self._writer() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [(key, json.dumps(value)) for key, value in entries.items()],
+            )
+
+    def apply_patch(
+        self,
+        *,
+        removed: Mapping[tuple[str, str | None], Iterable[int]],
+        types: Iterable[EveType] = (),
+        groups: Iterable[EveGroup] = (),
+        categories: Iterable[EveCategory] = (),
+        market_groups: Iterable[EveMarketGroup] = (),
+        blueprints: Iterable[EveBlueprint] = (),
+        type_materials: Iterable[EveTypeMaterials] = (),
+        id_sets: Mapping[str, Iterable[int]] | None = None,
+        names: Mapping[str, Mapping[int, str]] | None = None,
+        links: Mapping[str, Mapping[int, int]] | None = None,
+    ) -> None:
+        """Apply record-level changes to the store file in one transaction.
+
+        Rows listed in ``removed`` are deleted first, then the given records
+        are upserted. Lazy views created before the patch keep memoized
+        values, so callers should open fresh views afterwards.
+
+        Args:
+            removed: ``(table, kind)`` -> ids to delete; ``kind`` is None for
+                record tables (e.g. ``("types", None)``, ``("names", "regions")``)
+            types: Types to insert or replace
+            groups: Groups to insert or replace
+            categories: Categories to insert or replace
+            market_groups: Market groups to insert or replace
+            blueprints: Blueprints to insert or replace
+            type_materials: Reprocessing yields to insert or replace
+            id_sets: Named ID sets to add to
+            names: Named ``id -> name`` entries to insert or replace
+            links: Named ``id -> id`` entries to insert or replace
+        """
+        with self._writer() as conn:
+            for (table, kind), ids in removed.items():
+                if kind is None:
+                    key = _MODEL_TABLES[table][0]
+                    conn.executemany(
+                        f"DELETE FROM {table} WHERE {key} = ?", ((i,) for i in ids)
+                    )
+                else:
+                    conn.executemany(
+                        f"DELETE FROM {table} WHERE kind = ? AND id = ?",
+                        ((kind, i) for i in ids),
+                    )
+            records = {
+                "types": types,
+                "groups": groups,
+                "categories": categories,
+                "market_groups": market_groups,
+                "blueprints": blueprints,
+                "type_materials": type_materials,
+            }
+            for table, models in records.items():
+                _insert_records(conn, table, models)
+            _insert_keyed(conn, id_sets, names, links)
+            conn.execute(_UPDATE_TYPE_CATEGORIES)
+
+    @contextmanager
+    def _writer(self) -> Iterator[sqlite3.Connection]:
+        """Read-write connection committing on success (readers stay open)."""
+        conn = sqlite3.connect(self.path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def write(
+        path: str | Path,
+        *,
+        meta: Mapping[str, Any],
+        types: Iterable[EveType] | None = None,
+        groups: Iterable[EveGroup] | None = None,
+        categories: Iterable[EveCategory] | None = None,
+        market_groups: Iterable[EveMarketGroup] | None = None,
+        blueprints: Iterable[EveBlueprint] | None = None,
+        type_materials: Iterable[EveTypeMaterials] | None = None,
+        id_sets: Mapping[str, Iterable[int]] | None = None,
+        names: Mapping[str, Mapping[int, str]] | None = None,
+        links: Mapping[str, Mapping[int, int]] | None = None,
+        base: str | Path | None = None,
+    ) -> None:
+        """Write a complete store atomically (temp file + replace).
+
+        Sections that are not supplied are copied unchanged from ``base``,
+        so a partial rebuild only re-encodes the caches that changed.
+
+        Args:
+            path: Destination path
+            meta: JSON-serializable metadata entries
+            types: Types to store
+            groups: Groups to store (also used to derive type categories)
+            categories: Categories to store
+            market_groups: Market groups to store
+            blueprints: Blueprints with their activities
+            type_materials: Reprocessing yields per type
+            id_sets: Named ID sets (e.g. NPC stations, blueprint types)
+            names: Named ``id -> name`` maps
+            links: Named ``id -> id`` maps
+            base: Optional existing store to copy omitted sections and kinds from
+        """
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.unlink(missing_ok=True)
+
+        conn = sqlite3.connect(tmp_path)
+        try:
+            conn.executescript("PRAGMA journal_mode = OFF;" + _SCHEMA)
+            if base is not None:
+                conn.execute("ATTACH DATABASE ? AS base", (f"{Path(base)}",))
+            conn.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                [
+                    ("format_version", json.dumps(SDE_STORE_FORMAT_VERSION)),
+                    *((key, json.dumps(value)) for key, value in meta.items()),
+                ],
+            )
+            records = {
+                "types": types,
+                "groups": groups,
+                "categories": categories,
+                "market_groups": market_groups,
+                "blueprints": blueprints,
+                "type_materials": type_materials,
+            }
+            for table, models in records.items():
+                if models is not None:
+                    _insert_records(conn, table, models)
+                elif base is not None:
+                    conn.execute(f"INSERT INTO {table} SELECT * FROM base.{table}")
+
+            kinds = _insert_keyed(conn, id_sets, names, links)
+            if base is not None:
+                for table, supplied in kinds.items():
+                    placeholders = ", ".join("?" * len(supplied))
+                    conn.execute(
+                        f"INSERT INTO {table} SELECT * FROM base.{table} "
+                        f"WHERE kind NOT IN ({placeholders})",
+                        tuple(supplied),
+                    )
+
+            # Type categories follow whichever groups ended up in the store
+            conn.execute(_UPDATE_TYPE_CATEGORIES)
+            conn.commit()
+            if base is not None:
+                conn.execute("DETACH DATABASE base")
+            conn.execute("VACUUM")
+        finally:
+            conn.close()
+        os.replace(tmp_path, path)
+
+
+__all__ = ["SDE_STORE_FORMAT_VERSION", "SDEStore"]
@@ -0,0 +1,81 @@
+"""Sparse type x material matrix of SDE reprocessing yields.
+
+Reprocessing yields are packed in CSR form: reprocessable types are rows
+sorted by type ID, and the materials one portion yields at 100% are
+contiguous slices of flat arrays delimited by ``indptr``. Valuing any set of
+items then gathers their rows and scatter-adds material value per item, a
+sparse matrix-vector product against the price vector.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+
+from data.csr import find_rows, indptr_from_lengths, row_ids
+from models.eve import EveTypeMaterials
+
+
+@dataclass(frozen=True, eq=False)
+class ReprocessingMatrix:
+    """Reprocessing yields of every type packed into CSR arrays.
+
+    Attributes:
+        type_ids: Sorted reprocessable type IDs, one row each (int64)
+        portion_sizes: Units consumed per reprocessing batch (int64, >= 1)
+        indptr: Row offsets into the material arrays (n + 1)
+        material_type_ids: Material type IDs (int64)
+        quantities: Material quantities per portion at 100% yield (int64)
+    """
+
+    type_ids: np.ndarray
+    portion_sizes: np.ndarray
+    indptr: np.ndarray
+    material_type_ids: np.ndarray
+    quantities: np.ndarray
+
+    @classmethod
+    def from_type_materials(
+        cls,
+        records: Iterable[EveTypeMaterials],
+        portion_size: Callable[[int], int | None],
+    ) -> ReprocessingMatrix:
+        """Pack reprocessing records into a matrix.
+
+        Args:
+            records: Type material records (any order); empty ones are skipped
+            portion_size: Returns a type's portion size (None or 0 means 1)
+        """
+        rows = sorted((r for r in records if r.materials), key=lambda r: r.type_id)
+        return cls(
+            type_ids=np.array([r.type_id for r in rows], dtype=np.int64),
+            portion_sizes=np.array(
+                [max(portion_size(r.type_id) or 1, 1) for r in rows], dtype=np.int64
+            ),
+            indptr=indptr_from_lengths(len(r.materials) for r in rows),
+            material_type_ids=np.array(
+                [m.material_type_id for r in rows for m in r.materials],
+                dtype=np.int64,
+            ),
+            quantities=np.array(
+                [m.quantity for r in rows for m in r.materials], dtype=np.int64
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.type_ids)
+
+    @cached_property
+    def entry_rows(self) -> np.ndarray:
+        """Row index of every material entry."""
+        return row_ids(self.indptr)
+
+    def rows_of(self, type_ids: Iterable[int] | np.ndarray) -> np.ndarray:
+        """Row positions of the given type IDs, -1 where not reprocessable."""
+        return find_rows(self.type_ids, type_ids)
+
+
+__all__ = ["ReprocessingMatrix"]
@@ -0,0 +1,146 @@
+"""Type name search index with prefix and fuzzy (trigram) matching.
+
+Names are lower-cased, interned and kept in one sorted list, so a prefix
+query is two binary searches. Every name is also split into trigrams with an
+inverted index of posting arrays; a fuzzy query counts shared trigrams per
+name with one ``bincount`` over the postings of its own trigrams and ranks
+candidates by trigram similarity.
+"""
+
+from __future__ import annotations
+
+import bisect
+import sys
+from collections import defaultdict
+from collections.abc import Collection, Iterable, Mapping
+
+import numpy as np
+
+# Fuzzy matches must share at least this fraction of trigrams
+_MIN_SIMILARITY = 0.3
+
+
+def _normalize(name: str) -> str:
+    return " ".join(name.lower().split())
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class TypeNameIndex:
+    """Search type IDs by name.
+
+    Results rank exact matches first, then name prefixes, then names with a
+    word starting with the query, then fuzzy matches by similarity; ties go
+    to shorter names.
+    """
+
+    def __init__(
+        self, names: Mapping[int, str], published_ids: Collection[int] = ()
+    ) -> None:
+        """Build the index.
+
+        Args:
+            names: Type ID -> display name
+            published_ids: Type IDs of published types
+        """
+        entries = sorted(
+            (sys.intern(_normalize(name)), type_id)
+            for type_id, name in names.items()
+            if name
+        )
+        self._keys: list[str] = [key for key, _ in entries]
+        self._ids = np.array([type_id for _, type_id in entries], dtype=np.int64)
+        published = set(published_ids)
+        self._published = np.array(
+            [type_id in published for _, type_id in entries], dtype=bool
+        )
+        self._lengths = np.array([len(key) for key in self._keys], dtype=np.int64)
+
+        postings: dict[str, list[int]] = defaultdict(list)
+        trigram_counts = np.zeros(len(entries), dtype=np.int64)
+        for pos, key in enumerate(self._keys):
+            grams = _trigrams(key)
+            trigram_counts[pos] = len(grams)
+            for gram in grams:
+                postings[gram].append(pos)
+        self._trigram_counts = trigram_counts
+        self._postings = {
+            gram: np.array(positions, dtype=np.int64)
+            for gram, positions in postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def search(
+        self, query: str, limit: int = 20, published_only: bool = True
+    ) -> list[int]:
+        """Find type IDs whose names match ``query``.
+
+        Args:
+            query: Name or part of a name (case-insensitive)
+            limit: Maximum number of results
+            published_only: Skip unpublished types
+
+        Returns:
+            Matching type IDs, best match first
+        """
+        text = _normalize(query)
+        if not text or limit <= 0:
+            return []
+
+        results: list[int] = []
+        seen: set[int] = set()
+
+        def take(positions: Iterable[int]) -> bool:
+            for pos in positions:
+                if pos in seen or (published_only and not self._published[pos]):
+                    continue
+                seen.add(pos)
+                results.append(int(self._ids[pos]))
+                if len(results) >= limit:
+                    return True
+            return False
+
+        # Prefix matches: one contiguous slice of the sorted names
+        start = bisect.bisect_left(self._keys, text)
+        end = bisect.bisect_left(self._keys, text + "￿", lo=start)
+        prefix = np.arange(start, end, dtype=np.int64)
+        exact = prefix[self._lengths[prefix] == len(text)]
+        if take(exact.tolist()):
+            return results
+        order = np.argsort(self._lengths[prefix], kind="stable")
+        if take(prefix[order].tolist()):
+            return results
+
+        # Fuzzy matches: shared trigrams counted in one pass over the postings
+        grams = _trigrams(text)
+        hit_lists = [self._postings[g] for g in grams if g in self._postings]
+        if not hit_lists:
+            return results
+        hits = np.bincount(np.concatenate(hit_lists), minlength=len(self._keys))
+        candidates = np.flatnonzero(hits)
+        shared = hits[candidates]
+        similarity = shared / (len(grams) + self._trigram_counts[candidates] - shared)
+
+        # Names with a word starting with the query rank above other matches
+        word_start = np.fromiter(
+            (f" {text}" in self._keys[pos] for pos in candidates.tolist()),
+            dtype=bool,
+            count=len(candidates),
+        )
+        keep = word_start | (similarity >= _MIN_SIMILARITY)
+        candidates, similarity, word_start = (
+            candidates[keep],
+            similarity[keep],
+            word_start[keep],
+        )
+        order = np.lexsort((self._lengths[candidates], -similarity, ~word_start))
+        take(candidates[order].tolist())
+        return results
+
+
+__all__ = ["TypeNameIndex"]
@@ -1,6 +1,13 @@
 """EVE Online data models (domain layer)."""
 
 from .asset import EveAsset
+from .blueprint import (
+    EveBlueprint,
+    EveBlueprintActivity,
+    EveBlueprintMaterial,
+    EveBlueprintProduct,
+    EveBlueprintSkill,
+)
 from .category import EveCategory
 from .contract import EveContract, EveContractItem
 from .group import EveGroup
@@ -15,9 +22,15 @@ from .station import EveStation
 from .structure import EveStructure
 from .transaction import EveTransaction
 from .type import EveType
+from .type_materials import EveTypeMaterial, EveTypeMaterials
 
 __all__ = [
     "EveAsset",
+    "EveBlueprint",
+    "EveBlueprintActivity",
+    "EveBlueprintMaterial",
+    "EveBlueprintProduct",
+    "EveBlueprintSkill",
     "EveCategory",
     "EveContract",
     "EveContractItem",
@@ -33,4 +46,6 @@ __all__ = [
     "EveStructure",
     "EveTransaction",
     "EveType",
+    "EveTypeMaterial",
+    "EveTypeMaterials",
 ]
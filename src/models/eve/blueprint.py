@@ -0,0 +1,66 @@
+"""EVE Online blueprint data models."""
+
+from pydantic import BaseModel, Field
+
+
+class EveBlueprintMaterial(BaseModel):
+    """A material consumed by one run of a blueprint activity."""
+
+    type_id: int = Field(..., ge=0, description="The type ID of the material.")
+    quantity: int = Field(..., ge=0, description="The base quantity per run.")
+
+
+class EveBlueprintProduct(BaseModel):
+    """A product made by one run of a blueprint activity."""
+
+    type_id: int = Field(..., ge=0, description="The type ID of the product.")
+    quantity: int = Field(..., ge=0, description="The quantity produced per run.")
+    probability: float | None = Field(
+        None,
+        ge=0,
+        le=1,
+        description="The base success chance (invention and similar activities).",
+    )
+
+
+class EveBlueprintSkill(BaseModel):
+    """A skill required to run a blueprint activity."""
+
+    type_id: int = Field(..., ge=0, description="The type ID of the skill.")
+    level: int = Field(..., ge=0, le=5, description="The required skill level.")
+
+
+class EveBlueprintActivity(BaseModel):
+    """Inputs, outputs and duration of one blueprint activity."""
+
+    time: int = Field(0, ge=0, description="The base duration per run in seconds.")
+    materials: list[EveBlueprintMaterial] = Field(
+        default_factory=list, description="Materials consumed per run."
+    )
+    products: list[EveBlueprintProduct] = Field(
+        default_factory=list, description="Products made per run."
+    )
+    skills: list[EveBlueprintSkill] = Field(
+        default_factory=list, description="Skills required for the activity."
+    )
+
+
+class EveBlueprint(BaseModel):
+    """Represents an EVE Online blueprint and its industry activities."""
+
+    blueprint_type_id: int = Field(
+        ...,
+        ge=0,
+        description="The type ID of the blueprint item.",
+        alias="id",
+    )
+    max_production_limit: int | None = Field(
+        None, ge=0, description="The maximum number of runs per copy."
+    )
+    activities: dict[str, EveBlueprintActivity] = Field(
+        default_factory=dict,
+        description=(
+            "Activities by SDE name (manufacturing, invention, copying, "
+            "reaction, research_material, research_time)."
+        ),
+    )
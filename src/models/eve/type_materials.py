@@ -0,0 +1,26 @@
+"""EVE Online reprocessing yield models."""
+
+from pydantic import BaseModel, Field
+
+
+class EveTypeMaterial(BaseModel):
+    """A material recovered by reprocessing one portion of a type."""
+
+    material_type_id: int = Field(
+        ..., ge=0, description="The type ID of the recovered material."
+    )
+    quantity: int = Field(..., ge=0, description="The quantity at 100% yield.")
+
+
+class EveTypeMaterials(BaseModel):
+    """Represents the reprocessing yield of an EVE Online type."""
+
+    type_id: int = Field(
+        ...,
+        ge=0,
+        description="The type ID of the reprocessed item.",
+        alias="id",
+    )
+    materials: list[EveTypeMaterial] = Field(
+        default_factory=list, description="Materials recovered per portion."
+    )
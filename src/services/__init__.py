@@ -2,31 +2,46 @@
 
 Domain-oriented submodules:
     asset_service : asset enrichment & location mapping
+    blueprint_valuation: blueprint & BPC valuation strategies
     contract_service: contract & contract item operations
     industry_service: industry jobs & aggregation
+    location_refresher: budgeted background refresh of stale structures
     location_service: location resolution & custom naming
+    manufacturing_cost: vectorized blueprint material costs
     market_service: market order & exposure logic
     networth_service: net worth calculation
+    price_resolver: effective price table from market preferences
+    reprocessing: vectorized reprocessing yields and values
     wallet_service: wallet transactions & journal
 
 """
 
 from .asset_service import AssetService
+from .blueprint_valuation import BlueprintValuator
 from .character_service import CharacterService
 from .contract_service import ContractService
 from .industry_service import IndustryService
+from .location_refresher import LocationRefresher
 from .location_service import LocationService
+from .manufacturing_cost import ManufacturingCostEngine
 from .market_service import MarketService
 from .networth_service import NetWorthService
+from .price_resolver import PriceResolver
+from .reprocessing import ReprocessingEngine
 from .wallet_service import WalletService
 
 __all__ = [
     "AssetService",
+    "BlueprintValuator",
     "CharacterService",
     "ContractService",
     "IndustryService",
+    "LocationRefresher",
     "LocationService",
+    "ManufacturingCostEngine",
     "MarketService",
     "NetWorthService",
+    "PriceResolver",
+    "ReprocessingEngine",
     "WalletService",
 ]
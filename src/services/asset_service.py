@@ -68,19 +68,16 @@ class AssetService:
         Returns:
             List of enriched assets with SDE data and location info
         """
-        # Fetch current assets from repository
+        # Fetch current assets and their root locations (computed at sync)
         assets = await asset_repo.get_current_assets(self._repo, character_id)
-        # Index assets by item_id for parent traversal
-        by_item_id: dict[int, EveAsset] = {a.item_id: a for a in assets}
-
-        # Build set of root location IDs to resolve
-        root_ids: set[int] = set()
-        root_for_asset: dict[int, int] = {}
-        for a in assets:
-            rid, rtype = self._find_root_location(a, by_item_id)
-            if rid is not None and rtype is not None and rtype != "item":
-                root_ids.add(rid)
-                root_for_asset[a.item_id] = rid
+        root_for_asset: dict[int, int] = {
+            item_id: rid
+            for item_id, (rid, rtype) in (
+                await asset_repo.get_root_locations(self._repo, character_id)
+            ).items()
+            if rtype and rtype != "item"
+        }
+        root_ids: set[int] = set(root_for_asset.values())
 
         # Resolve locations
         locations = {}
@@ -271,46 +268,6 @@ class AssetService:
             asset.constellation_id = loc_info.location_id
             asset.constellation_name = loc_info.name
 
-    def _find_root_location(
-        self, asset: EveAsset, by_item_id: dict[int, EveAsset]
-    ) -> tuple[int | None, str | None]:
-        """Follow parent chain to a non-item location.
-
-        Args:
-            asset: Asset to find root location for
-            by_item_id: Index of assets by item_id for parent traversal
-
-        Returns:
-            Tuple of (location_id, location_type) or (None, None) if not found
-        """
-        loc_id = asset.location_id
-        loc_type = asset.location_type
-
-        if loc_type != "item":
-            return loc_id, loc_type
-
-        # Traverse container chain
-        max_hops = 64
-        hops = 0
-        while loc_type == "item" and hops < max_hops:
-            parent = by_item_id.get(loc_id)
-            if parent is None:
-                # Try to infer location type from ID
-                if loc_id >= 1000000000000:  # Structure ID
-                    return loc_id, "other"
-                if 60000000 <= loc_id < 70000000:  # Station ID
-                    return loc_id, "station"
-                if 30000000 <= loc_id < 40000000:  # System ID
-                    return loc_id, "solar_system"
-                return None, None
-            loc_id = parent.location_id
-            loc_type = parent.location_type
-            hops += 1
-
-        if loc_type == "item":
-            return None, None
-        return loc_id, loc_type
-
     async def get_asset_tree(
         self, character_id: int, character_name: str
     ) -> dict[str, Any]:
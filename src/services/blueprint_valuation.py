@@ -0,0 +1,124 @@
+"""Blueprint valuation strategies with memoized bulk results.
+
+Blueprints rarely have a usable market price, so their value is derived from
+the manufacturing data instead. The strategy is a market preference:
+
+- ``material_cost``: cost of the materials the blueprint's runs consume
+- ``product_margin``: expected product value minus material cost (>= 0)
+- ``custom``: only user custom prices count; copies are otherwise worth 0
+
+Values are memoized per (blueprint type, ME, TE, runs) and dropped whenever
+the price table revision, the strategy or the SDE blueprint data change, so
+valuing thousands of copies is a dictionary lookup after the first pass.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from services.manufacturing_cost import ManufacturingCostEngine
+    from services.price_resolver import PriceResolver
+
+logger = logging.getLogger(__name__)
+
+BLUEPRINT_VALUATION_STRATEGIES = ("material_cost", "product_margin", "custom")
+
+
+class BlueprintKey(NamedTuple):
+    """Blueprint attributes a valuation depends on."""
+
+    type_id: int
+    me: int = 0
+    te: int = 0
+    runs: int = 1
+
+
+class BlueprintValuator:
+    """Value blueprints in bulk under the configured strategy."""
+
+    def __init__(
+        self, cost_engine: ManufacturingCostEngine, price_resolver: PriceResolver
+    ) -> None:
+        self._engine = cost_engine
+        self._prices = price_resolver
+        self._memo: dict[BlueprintKey, float] = {}
+        self._stamp: tuple[int, str, object] | None = None
+
+    @property
+    def strategy(self) -> str:
+        """Active valuation strategy (``custom`` if the setting is unknown)."""
+        strategy = self._prices.preferences.blueprint_valuation
+        return strategy if strategy in BLUEPRINT_VALUATION_STRATEGIES else "custom"
+
+    @property
+    def blueprint_data(self) -> object:
+        """SDE blueprint data values are computed against.
+
+        Compares by identity: the provider rebuilds it whenever the SDE is
+        reloaded.
+        """
+        return self._engine.blueprint_arrays()
+
+    def _check_stamp(self, strategy: str) -> None:
+        """Drop memoized values computed against other prices or SDE data."""
+        stamp = (
+            self._prices.revision,
+            strategy,
+            self.blueprint_data,
+        )
+        if stamp != self._stamp:
+            self._memo = {}
+            self._stamp = stamp
+
+    def value_blueprints(
+        self, keys: Iterable[BlueprintKey]
+    ) -> dict[BlueprintKey, float]:
+        """Value many blueprints at once, computing only unmemoized keys.
+
+        Args:
+            keys: Blueprints to value; ``runs`` below 1 (originals) count as 1
+
+        Returns:
+            Dict mapping each key to its value in ISK (0.0 under ``custom`` or
+            for types without manufacturing data)
+        """
+        wanted = list(dict.fromkeys(keys))
+        strategy = self.strategy
+        if strategy == "custom" or not wanted:
+            return dict.fromkeys(wanted, 0.0)
+
+        self._check_stamp(strategy)
+        missing = [key for key in wanted if key not in self._memo]
+        if missing:
+            self._compute(missing, strategy)
+        return {key: self._memo[key] for key in wanted}
+
+    def _compute(self, keys: list[BlueprintKey], strategy: str) -> None:
+        type_ids = np.fromiter((k.type_id for k in keys), np.int64, len(keys))
+        me = np.fromiter((k.me for k in keys), np.int64, len(keys))
+        te = np.fromiter((k.te for k in keys), np.int64, len(keys))
+        runs = np.maximum(np.fromiter((k.runs for k in keys), np.int64, len(keys)), 1)
+
+        values = np.zeros(len(keys), dtype=np.float64)
+        costs = self._engine.material_costs(type_ids, me=me, te=te, runs=runs)
+        # Blueprints without manufacturing data are left out of ``costs``
+        values[np.isin(type_ids, costs.blueprint_type_ids)] = costs.material_cost
+        if strategy == "product_margin":
+            products, _ = self._engine.product_values(type_ids, runs=runs)
+            values = np.maximum(products - values, 0.0)
+
+        self._memo.update(zip(keys, values.tolist(), strict=True))
+        logger.debug(
+            "Valued %d blueprints (%s, price revision %s)",
+            len(keys),
+            strategy,
+            self._stamp[0] if self._stamp else None,
+        )
+
+
+__all__ = ["BLUEPRINT_VALUATION_STRATEGIES", "BlueprintKey", "BlueprintValuator"]
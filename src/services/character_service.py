@@ -2,12 +2,15 @@
 
 import logging
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from data.clients import ESIClient
-from data.repositories import Repository, networth
+from data.repositories import Repository, assets, networth
 from models.app.character_info import CharacterInfo
 
+if TYPE_CHECKING:
+    from services.location_service import LocationService
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,15 +20,23 @@ class CharacterService:
     # Cache TTL: 1 hour - only refresh on explicit request or stale
     CACHE_TTL = timedelta(hours=1)
 
-    def __init__(self, esi_client: ESIClient, repository: Repository | None = None):
+    def __init__(
+        self,
+        esi_client: ESIClient,
+        repository: Repository | None = None,
+        location_service: "LocationService | None" = None,
+    ):
         """Initialize character service.
 
         Args:
             esi_client: ESI client instance (required via DI)
             repository: Repository instance for lifecycle tracking
+            location_service: Location service whose structure access checks
+                are dropped for removed characters
         """
         self._client = esi_client
         self._repo = repository
+        self._location_service = location_service
         self._image_cache: dict[str, bytes] = {}
         # Character info cache: character_id -> (CharacterInfo, last_updated)
         self._character_cache: dict[int, tuple[CharacterInfo, datetime]] = {}
@@ -194,6 +205,10 @@ class CharacterService:
             return False
         success = self._client.auth.remove_token(character_id)
 
+        # Structures it could or could not dock at no longer matter
+        if success and self._location_service is not None:
+            self._location_service.forget_character_access(character_id)
+
         # Track lifecycle event and mark assets as removed
         if success and self._repo:
             try:
@@ -216,6 +231,9 @@ class CharacterService:
                     self._repo.cursor.rowcount if self._repo.cursor else 0,
                     character_id,
                 )
+                # Removed assets no longer count towards net worth
+                await assets.clear_valuation_ledger(self._repo, character_id)
+                await self._repo.commit()
 
             except Exception:
                 logger.debug(
@@ -0,0 +1,182 @@
+"""Background refresher for stale player structure names.
+
+Drains :meth:`LocationService.get_refresh_queue` one structure at a time on a
+per-minute request budget, so stale names are refreshed off the critical path
+of asset loads. The budget is also capped to a share of the universe rate
+group, and the refresher waits whenever an interactive resolution is running
+or the rate limiter asks to back off.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable, Iterable
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from models.app import LocationInfo
+from utils.config import get_config
+
+if TYPE_CHECKING:
+    from data.clients import ESIClient
+    from services.location_service import LocationService
+
+logger = logging.getLogger(__name__)
+
+# Largest share of the universe group's request rate spent in the background
+MAX_GROUP_SHARE = 0.25
+
+
+class LocationRefresher:
+    """Refreshes stale structure names in the background on an ESI budget."""
+
+    def __init__(
+        self,
+        location_service: LocationService,
+        esi_client: ESIClient,
+        *,
+        budget_per_minute: int | None = None,
+        max_age: timedelta | None = None,
+        idle_interval: float = 60.0,
+        on_resolved: Callable[[dict[int, LocationInfo]], None] | None = None,
+    ):
+        """Initialize the refresher.
+
+        Args:
+            location_service: Location service owning the cache and queue
+            esi_client: ESI client whose rate limiter sets the budget cap
+            budget_per_minute: Structure lookups per minute (defaults to
+                ``esi.structure_refresh_per_minute``; 0 disables refreshing)
+            max_age: Age after which a name is refreshed (defaults to
+                ``esi.structure_refresh_max_age_hours``)
+            idle_interval: Seconds to wait before re-checking an empty queue
+            on_resolved: Called with {structure_id: LocationInfo} whenever a
+                structure name resolves
+        """
+        esi_config = get_config().esi
+        self._service = location_service
+        self._client = esi_client
+        self.budget_per_minute = (
+            esi_config.structure_refresh_per_minute
+            if budget_per_minute is None
+            else budget_per_minute
+        )
+        self.max_age = max_age or timedelta(
+            hours=esi_config.structure_refresh_max_age_hours
+        )
+        self.idle_interval = idle_interval
+        self.on_resolved = on_resolved
+        self._character_ids: list[int] = []
+        self._next_slot = 0.0
+        self._task: asyncio.Task | None = None
+
+    def set_characters(self, character_ids: Iterable[int]) -> None:
+        """Set the characters whose tokens may be used for lookups."""
+        self._character_ids = list(character_ids)
+
+    def _universe_group(self) -> str | None:
+        """Rate limit bucket key of the universe endpoints, if known yet."""
+        for group_key in self._client.rate_limiter.rate_limit_groups:
+            if "universe" in group_key.lower():
+                return group_key
+        return None
+
+    def effective_budget(self) -> float:
+        """Lookups per minute allowed right now.
+
+        The configured budget, capped to ``MAX_GROUP_SHARE`` of the universe
+        group's request rate once ESI has reported it.
+        """
+        budget = float(self.budget_per_minute)
+        group_key = self._universe_group()
+        if group_key:
+            group = self._client.rate_limiter.rate_limit_groups.get(group_key, {})
+            requests_per_second = group.get("requests_per_second") or 0
+            if requests_per_second > 0:
+                budget = min(budget, requests_per_second * 60 * MAX_GROUP_SHARE)
+        return budget
+
+    async def _wait_for_slot(self) -> None:
+        """Wait until the budget, the rate limiter and interactive work allow a lookup."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._service.wait_until_idle()
+            group_key = self._universe_group()
+            if group_key and self._client.rate_limiter.should_backoff(group_key):
+                await asyncio.sleep(self.idle_interval)
+                continue
+            delay = self._next_slot - loop.time()
+            if delay <= 0:
+                break
+            await asyncio.sleep(delay)
+        # An interactive request may have started during the last sleep
+        await self._service.wait_until_idle()
+        self._next_slot = loop.time() + 60.0 / self.effective_budget()
+
+    async def run_once(self) -> int:
+        """Drain the current refresh queue.
+
+        Returns:
+            Number of structures whose names resolved
+        """
+        if self.budget_per_minute <= 0 or not self._character_ids:
+            return 0
+
+        queue = self._service.get_refresh_queue(self.max_age)
+        if queue:
+            logger.info("Refreshing %d stale structures in background", len(queue))
+
+        resolved = 0
+        for structure_id in queue:
+            await self._wait_for_slot()
+            # An interactive resolution may have refreshed it while waiting
+            if not self._service.needs_refresh(structure_id, self.max_age):
+                continue
+            try:
+                results = await self._service.refresh_structures(
+                    {structure_id}, self._character_ids
+                )
+            except Exception:
+                logger.debug(
+                    "Background refresh of structure %d failed",
+                    structure_id,
+                    exc_info=True,
+                )
+                continue
+            fresh = {sid: loc for sid, loc in results.items() if not loc.is_placeholder}
+            if fresh:
+                resolved += len(fresh)
+                if self.on_resolved is not None:
+                    self.on_resolved(fresh)
+        return resolved
+
+    async def run(self) -> None:
+        """Refresh stale structures until cancelled."""
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Background location refresh failed", exc_info=True)
+            await asyncio.sleep(self.idle_interval)
+
+    def start(self) -> asyncio.Task:
+        """Start the background loop (no-op if already running)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        """Cancel the background loop and wait for it to finish."""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
+__all__ = ["MAX_GROUP_SHARE", "LocationRefresher"]
@@ -8,15 +8,20 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
+from data.location_store import LocationStore
+from data.repositories.prices import TRADE_HUB_SYSTEM_IDS
 from models.app import LocationInfo
 from utils.config import get_config
 
 if TYPE_CHECKING:
     from data import SDEProvider
     from data.clients import ESIClient
+    from data.jump_graph import JumpGraph
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +43,13 @@ class LocationService:
     - Staleness tracking for player structures
     """
 
+    # Legacy JSON cache, imported once into the location store
     CACHE_FILE = "locations.json"
+    STORE_FILE = "locations.db"
+
+    # How long a structure access check is trusted (overridable in app config)
+    ACCESS_ALLOWED_TTL = timedelta(days=7)
+    ACCESS_DENIED_TTL = timedelta(hours=6)
 
     def __init__(
         self,
@@ -53,7 +64,10 @@ class LocationService:
         """
         self._client = esi_client
         self._sde = sde_provider
-        self._cache_file = get_config().app.user_data_dir / self.CACHE_FILE
+        user_data_dir = get_config().app.user_data_dir
+        self._cache_file = user_data_dir / self.CACHE_FILE
+        self._store_file = user_data_dir / self.STORE_FILE
+        self._store: LocationStore | None = None
 
         # Ensure cache directory exists
         try:
@@ -64,13 +78,15 @@ class LocationService:
         # In-memory cache: location_id -> LocationInfo
         self._cache: dict[int, LocationInfo] = {}
 
-        # Load location cache and apply custom names from settings
-        self._load_cache()
-
         # Track which structures we've attempted to fetch (to avoid repeated failures)
         self._failed_structures: set[int] = set()
         # Backoff tracking for recent failures (struct_id -> next_allowed_datetime)
         self._failed_structures_backoff: dict[int, datetime] = {}
+        # Docking access checks: struct_id -> character_id -> (allowed, checked_at)
+        self._structure_access: dict[int, dict[int, tuple[bool, datetime]]] = {}
+
+        # Load location cache (custom overrides included) and backoff state
+        self._load_cache()
 
         # Pending in-flight structure resolutions to coalesce concurrent requests
         self._pending_structures: dict[int, asyncio.Future[LocationInfo | None]] = {}
@@ -78,87 +94,198 @@ class LocationService:
         # Lock for cache modifications
         self._cache_lock = asyncio.Lock()
 
+        # Structures requested by callers, so background refreshes know about
+        # IDs that never resolved
+        self._requested_structures: set[int] = set()
+        # Interactive resolutions in flight; background refreshes wait for idle
+        self._interactive_requests = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+        # Jump graph whose trade hub rows have been precomputed
+        self._pinned_graph: JumpGraph | None = None
+
     def _load_cache(self) -> None:
-        """Load location cache from disk and apply custom names from settings."""
-        if not self._cache_file.exists():
-            logger.debug("No location cache file found")
-            try:
-                # Create an empty cache file so future loads don't warn
-                self._save_cache()
-            except Exception:
-                logger.debug(
-                    "Unable to create initial location cache file", exc_info=True
-                )
-        else:
-            try:
-                with open(self._cache_file, encoding="utf-8") as f:
-                    data = json.load(f)
-
-                for entry in data.get("locations", []):
-                    try:
-                        canonical_name = entry.get("esi_name") or entry.get("name")
-                        loc = LocationInfo(
-                            location_id=entry["location_id"],
-                            name=canonical_name,
-                            esi_name=canonical_name,
-                            category=entry["category"],
-                            last_checked=datetime.fromisoformat(entry["last_checked"]),
-                            owner_id=entry.get("owner_id"),
-                            custom_name=entry.get("custom_name"),
-                            is_placeholder=entry.get("is_placeholder", False),
-                            solar_system_id=entry.get("solar_system_id"),
-                            metadata=entry.get("metadata"),
-                        )
-                        # Don't load placeholders from cache - they'll be re-resolved
-                        if not loc.is_placeholder:
-                            self._cache[loc.location_id] = loc
-                    except (KeyError, ValueError) as e:
-                        logger.debug("Skipping invalid cache entry: %s", e)
-
-                logger.info("Loaded %d locations from cache", len(self._cache))
-            except Exception as e:
-                logger.warning("Failed to load location cache: %s", e)
-
-    def _save_cache(self) -> None:
-        """Save location cache to disk."""
+        """Load locations and structure backoff state from the location store.
+
+        A legacy ``locations.json`` cache is imported once into an empty store.
+        """
         try:
-            data = {
-                "locations": [
-                    {
-                        "location_id": loc.location_id,
-                        "name": loc.name,
-                        "category": loc.category,
-                        "last_checked": loc.last_checked.isoformat(),
-                        "owner_id": loc.owner_id,
-                        "esi_name": loc.esi_name or loc.name,
-                        "custom_name": loc.custom_name,
-                        "is_placeholder": loc.is_placeholder,
-                        "solar_system_id": loc.solar_system_id,
-                        "metadata": loc.metadata or {},
-                    }
-                    for loc in self._cache.values()
-                    # Persist entries that have custom data even if they were
-                    # previously placeholders.
-                    if not loc.is_placeholder
-                    or loc.custom_name
-                    or (
-                        isinstance(loc.metadata, dict)
-                        and loc.metadata.get("custom_overrides")
-                    )
-                ],
-                "saved_at": datetime.now(UTC).isoformat(),
+            self._store = LocationStore(self._store_file)
+        except Exception:
+            logger.warning("Failed to open location store", exc_info=True)
+            self._store = None
+            return
+
+        if self._store.is_empty() and self._cache_file.exists():
+            self._import_legacy_cache()
+
+        try:
+            for loc in self._store.load_locations():
+                # Don't load placeholders - they'll be re-resolved
+                if not loc.is_placeholder:
+                    self._cache[loc.location_id] = loc
+            now = datetime.now(UTC)
+            self._failed_structures_backoff = {
+                sid: retry_after
+                for sid, retry_after in self._store.load_backoff().items()
+                if retry_after > now
             }
+            self._structure_access = self._store.load_access()
+            logger.info("Loaded %d locations from cache", len(self._cache))
+        except Exception as e:
+            logger.warning("Failed to load location cache: %s", e)
 
-            # Atomic write
-            tmp_file = self._cache_file.with_suffix(".tmp")
-            with open(tmp_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-            tmp_file.replace(self._cache_file)
+    def _import_legacy_cache(self) -> None:
+        """Copy entries of a legacy ``locations.json`` file into the store."""
+        try:
+            with open(self._cache_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.warning("Failed to read legacy location cache: %s", e)
+            return
 
-            logger.debug("Saved %d locations to cache", len(self._cache))
+        imported: list[LocationInfo] = []
+        for entry in data.get("locations", []):
+            try:
+                canonical_name = entry.get("esi_name") or entry.get("name")
+                imported.append(
+                    LocationInfo(
+                        location_id=entry["location_id"],
+                        name=canonical_name,
+                        esi_name=canonical_name,
+                        category=entry["category"],
+                        last_checked=datetime.fromisoformat(entry["last_checked"]),
+                        owner_id=entry.get("owner_id"),
+                        custom_name=entry.get("custom_name"),
+                        is_placeholder=entry.get("is_placeholder", False),
+                        solar_system_id=entry.get("solar_system_id"),
+                        metadata=entry.get("metadata"),
+                    )
+                )
+            except (KeyError, ValueError) as e:
+                logger.debug("Skipping invalid cache entry: %s", e)
+
+        try:
+            count = self._store.upsert_locations(imported) if self._store else 0
+            logger.info("Imported %d locations from %s", count, self._cache_file)
+        except Exception:
+            logger.warning("Failed to import legacy location cache", exc_info=True)
+
+    @staticmethod
+    def _is_persistable(loc: LocationInfo) -> bool:
+        """Whether a cache entry is worth keeping across runs."""
+        # Persist entries that have custom data even if they were
+        # previously placeholders.
+        return bool(
+            not loc.is_placeholder
+            or loc.custom_name
+            or (isinstance(loc.metadata, dict) and loc.metadata.get("custom_overrides"))
+        )
+
+    def _persist_locations(self, location_ids: Iterable[int]) -> None:
+        """Write the given cache entries to the location store (one row each)."""
+        if self._store is None:
+            return
+        locations = [
+            loc
+            for location_id in dict.fromkeys(location_ids)
+            if (loc := self._cache.get(location_id)) is not None
+            and self._is_persistable(loc)
+        ]
+        try:
+            count = self._store.upsert_locations(locations)
+            logger.debug("Saved %d locations to cache", count)
         except Exception:
             logger.exception("Failed to save location cache")
 
+    def _persist_backoff(self, structure_id: int, retry_after: datetime | None) -> None:
+        """Record (or clear, when None) a structure's retry time."""
+        if self._store is None:
+            return
+        try:
+            if retry_after is None:
+                self._store.clear_backoff([structure_id])
+            else:
+                self._store.set_backoff({structure_id: retry_after})
+        except Exception:
+            logger.debug("Failed to persist structure backoff", exc_info=True)
+
+    def _access_ttl(self, allowed: bool) -> timedelta:
+        """How long an allowed or denied access check stays valid."""
+        name = (
+            "structure_access_allowed_ttl" if allowed else "structure_access_denied_ttl"
+        )
+        default = self.ACCESS_ALLOWED_TTL if allowed else self.ACCESS_DENIED_TTL
+        ttl = getattr(get_config().app, name, default)
+        if isinstance(ttl, (int, float)):
+            ttl = timedelta(seconds=ttl)
+        return ttl
+
+    def _record_access(
+        self, structure_id: int, character_id: int, allowed: bool
+    ) -> None:
+        """Remember whether a character could read a structure, in memory and on disk."""
+        checked_at = datetime.now(UTC)
+        self._structure_access.setdefault(structure_id, {})[character_id] = (
+            allowed,
+            checked_at,
+        )
+        if self._store is None:
+            return
+        try:
+            self._store.set_access([(structure_id, character_id, allowed, checked_at)])
+        except Exception:
+            logger.debug("Failed to persist structure access", exc_info=True)
+
+    def forget_character_access(self, character_id: int) -> None:
+        """Drop every structure access check made by a removed character.
+
+        Args:
+            character_id: Character ID that is no longer tracked
+        """
+        for access in self._structure_access.values():
+            access.pop(character_id, None)
+        if self._store is None:
+            return
+        try:
+            self._store.clear_access([character_id])
+        except Exception:
+            logger.debug("Failed to clear structure access", exc_info=True)
+
+    def get_structure_access(self, structure_id: int) -> dict[int, bool]:
+        """Characters with a still valid access check for a structure.
+
+        Args:
+            structure_id: Player structure ID
+
+        Returns:
+            Dict mapping character_id -> whether the character can dock
+        """
+        now = datetime.now(UTC)
+        return {
+            character_id: allowed
+            for character_id, (allowed, checked_at) in self._structure_access.get(
+                structure_id, {}
+            ).items()
+            if checked_at + self._access_ttl(allowed) > now
+        }
+
+    def _access_candidates(
+        self, structure_id: int, character_ids: list[int]
+    ) -> list[int]:
+        """Order characters for resolving a structure by what is known about access.
+
+        Characters known to have docking access come first (most recently
+        confirmed first), then characters never checked, in the given order.
+        Characters denied within the negative-cache TTL are left out.
+        """
+        access = self.get_structure_access(structure_id)
+        allowed = [cid for cid in character_ids if access.get(cid) is True]
+        checked = self._structure_access.get(structure_id, {})
+        allowed.sort(key=lambda cid: checked[cid][1], reverse=True)
+        return allowed + [cid for cid in character_ids if cid not in access]
+
     def get_cached_location(self, location_id: int) -> LocationInfo | None:
         """Get cached location info if available.
 
@@ -194,6 +321,87 @@ class LocationService:
 
         return data or None
 
+    def get_system_id(self, location_id: int) -> int | None:
+        """Get the solar system a location is in.
+
+        Custom system overrides win over resolved data.
+
+        Args:
+            location_id: Location ID (system, NPC station or structure)
+
+        Returns:
+            Solar system ID, or None if unknown
+        """
+        if 30000000 <= location_id < 40000000:
+            return location_id
+        custom = self.get_custom_location_data(location_id)
+        if custom and custom.get("system_id") is not None:
+            return int(custom["system_id"])
+        loc = self._cache.get(location_id)
+        if loc and loc.solar_system_id:
+            return loc.solar_system_id
+        if 60000000 <= location_id <= 69999999:
+            return self._sde.get_npc_station_system_id(location_id)
+        return None
+
+    def _jump_graph(self) -> JumpGraph:
+        """Stargate graph with hop counts from the trade hubs precomputed."""
+        graph = self._sde.get_jump_graph()
+        if self._pinned_graph is not graph:
+            graph.pin(TRADE_HUB_SYSTEM_IDS.values())
+            self._pinned_graph = graph
+        return graph
+
+    def jump_distances(
+        self, origin_system_id: int, system_ids: Iterable[int | None]
+    ) -> list[int | None]:
+        """Get stargate jumps from one solar system to many others.
+
+        Args:
+            origin_system_id: Solar system to count jumps from
+            system_ids: Destination solar system IDs (None entries allowed)
+
+        Returns:
+            Jump count per destination; None where unknown or unreachable
+        """
+        ids = list(system_ids)
+        jumps = self._jump_graph().jumps(
+            origin_system_id, [-1 if sid is None else sid for sid in ids]
+        )
+        return [hops if hops >= 0 else None for hops in jumps.tolist()]
+
+    def systems_within_jumps(self, origin_system_id: int, max_jumps: int) -> set[int]:
+        """Get solar systems at most ``max_jumps`` stargate jumps away.
+
+        Args:
+            origin_system_id: Solar system to count jumps from
+            max_jumps: Maximum number of jumps (0 is the origin only)
+
+        Returns:
+            Set of solar system IDs, including the origin if it has gates
+        """
+        return set(self._jump_graph().within(origin_system_id, max_jumps).tolist())
+
+    def locations_within_jumps(
+        self, location_ids: Iterable[int], origin_system_id: int, max_jumps: int
+    ) -> set[int]:
+        """Filter locations to those within ``max_jumps`` of a solar system.
+
+        Args:
+            location_ids: Locations to test (systems, stations, structures)
+            origin_system_id: Solar system to count jumps from
+            max_jumps: Maximum number of jumps
+
+        Returns:
+            Subset of ``location_ids`` in systems within range
+        """
+        nearby = self.systems_within_jumps(origin_system_id, max_jumps)
+        return {
+            location_id
+            for location_id in location_ids
+            if self.get_system_id(location_id) in nearby
+        }
+
     def get_all_custom_locations(self) -> dict[int, dict[str, Any]]:
         """Return all locations that have custom overrides stored in cache."""
 
@@ -236,8 +444,9 @@ class LocationService:
     ) -> None:
         """Persist custom location overrides into the locations cache.
 
-        Both custom names and system overrides are stored in the locations.json
-        cache file. Any provided override will be persisted immediately.
+        Both custom names and system overrides are stored in the location's
+        row of the location store. Any provided override will be persisted
+        immediately.
         Passing ``None`` for both parameters clears existing overrides.
         """
 
@@ -290,9 +499,9 @@ class LocationService:
         # Custom overrides should not be treated as placeholders so they get saved
         loc.is_placeholder = False
 
-        # Save cache to disk
+        # Save the edited entry to disk
         if persist:
-            self._save_cache()
+            self._persist_locations([location_id])
 
     def get_stale_locations(self, location_ids: set[int]) -> list[int]:
         """Get list of location IDs that are stale or not cached.
@@ -336,6 +545,63 @@ class LocationService:
             + [loc_id for loc_id, _ in stale]
         )
 
+    @contextmanager
+    def _interactive(self) -> Iterator[None]:
+        """Mark a user-facing resolution as in flight."""
+        self._interactive_requests += 1
+        self._idle.clear()
+        try:
+            yield
+        finally:
+            self._interactive_requests -= 1
+            if not self._interactive_requests:
+                self._idle.set()
+
+    @property
+    def is_idle(self) -> bool:
+        """Whether no interactive structure resolution is running."""
+        return not self._interactive_requests
+
+    async def wait_until_idle(self) -> None:
+        """Wait until no interactive structure resolution is running."""
+        while self._interactive_requests:
+            await self._idle.wait()
+
+    def get_refresh_queue(self, max_age: timedelta) -> list[int]:
+        """Structures due for a background refresh, in priority order.
+
+        Covers cached and previously requested player structures that are
+        unknown, placeholders, or older than ``max_age``, ordered as by
+        :meth:`get_stale_locations`. Structures in their retry backoff are
+        left out.
+
+        Args:
+            max_age: Age after which a resolved structure name is refreshed
+
+        Returns:
+            List of structure IDs
+        """
+        structure_ids = {
+            loc_id for loc_id in self._cache if loc_id >= 1000000000000
+        } | self._requested_structures
+        return [
+            loc_id
+            for loc_id in self.get_stale_locations(structure_ids)
+            if self.needs_refresh(loc_id, max_age)
+        ]
+
+    def needs_refresh(self, structure_id: int, max_age: timedelta) -> bool:
+        """Whether a structure is unknown, a placeholder or older than ``max_age``.
+
+        Structures still in their retry backoff never need a refresh.
+        """
+        now = datetime.now(UTC)
+        retry_after = self._failed_structures_backoff.get(structure_id)
+        if retry_after is not None and retry_after > now:
+            return False
+        loc = self._cache.get(structure_id)
+        return loc is None or loc.is_placeholder or now - loc.last_checked >= max_age
+
     async def resolve_locations_bulk(
         self,
         location_ids: list[int],
@@ -373,6 +639,7 @@ class LocationService:
 
             # Check if this is a player structure (13+ digit IDs)
             if loc_id >= 1000000000000:
+                self._requested_structures.add(loc_id)
                 # Player structure - check cache first
                 cached = self._cache.get(loc_id)
 
@@ -441,7 +708,8 @@ class LocationService:
                     if len(structure_ids) <= 5
                     else f"{structure_ids[:3]}... and {len(structure_ids) - 3} more",
                 )
-                await self._resolve_structures(structure_ids, character_id, results)
+                with self._interactive():
+                    await self._resolve_structures(structure_ids, character_id, results)
             else:
                 logger.debug(
                     "Cannot resolve %d player structures without character_id",
@@ -500,6 +768,7 @@ class LocationService:
         structure_ids: list[int],
         character_id: int | None,
         results: dict[int, LocationInfo],
+        ignore_backoff: bool = False,
     ) -> None:
         """Resolve structures using batched /universe/structures/ calls.
 
@@ -510,6 +779,8 @@ class LocationService:
             structure_ids: List of structure IDs
             character_id: Character ID for authentication
             results: Dict to update with resolved structures
+            ignore_backoff: Retry structures even if they are in their backoff
+                window (used when switching to another character)
         """
         if not character_id:
             logger.debug(
@@ -542,6 +813,8 @@ class LocationService:
 
         total = len(structure_ids)
         resolved = 0
+        # Structures cached by this call, saved to disk at the end
+        cached_ids: list[int] = []
 
         # Process structures in batches
         for i in range(0, len(structure_ids), batch_size):
@@ -551,7 +824,8 @@ class LocationService:
             batch = [
                 sid
                 for sid in batch
-                if self._failed_structures_backoff.get(
+                if ignore_backoff
+                or self._failed_structures_backoff.get(
                     sid, datetime.min.replace(tzinfo=UTC)
                 )
                 <= now
@@ -582,6 +856,8 @@ class LocationService:
                     continue
                 if loc is not None:
                     results[struct_id] = loc
+                    if self._cache.get(struct_id) is loc:
+                        cached_ids.append(struct_id)
             resolved += len(batch)
 
             # Small delay between batches to allow rate limit tokens to regenerate
@@ -597,7 +873,7 @@ class LocationService:
         # Persist any newly resolved structures to disk so subsequent runs
         # don't re-fetch them and custom names remain merged with ESI data.
         try:
-            self._save_cache()
+            self._persist_locations(cached_ids)
         except Exception:
             logger.debug(
                 "Failed to persist location cache after resolution", exc_info=True
@@ -610,13 +886,14 @@ class LocationService:
     ) -> dict[int, LocationInfo]:
         """Resolve structures efficiently across multiple characters.
 
-        Instead of trying each structure with each character, this method:
-        1. Collects unique structures needed across all characters
-        2. Tries each structure with the first character that has assets there
-        3. Falls back to trying other characters if first one fails
-        4. Caches which characters have access to which structures
-
-        This dramatically reduces API calls when multiple characters share structures.
+        Uses the persisted structure access map instead of trying each
+        structure with each character:
+        1. Each structure is routed straight to a character known to have
+           docking access, or else to one that has not been checked yet
+        2. Characters denied within ``ACCESS_DENIED_TTL`` are skipped
+        3. On an access error the structure moves on to its next candidate
+        4. Structures every character is denied on are not retried until the
+           earliest denial expires
 
         Args:
             structure_ids: Set of structure IDs to resolve
@@ -625,48 +902,81 @@ class LocationService:
         Returns:
             Dict mapping structure_id to LocationInfo
         """
+        with self._interactive():
+            return await self._resolve_with_access_map(structure_ids, character_ids)
+
+    async def refresh_structures(
+        self,
+        structure_ids: set[int],
+        character_ids: list[int],
+    ) -> dict[int, LocationInfo]:
+        """Re-resolve structures in the background.
+
+        Same routing as :meth:`resolve_structures_multi_character`, but not
+        counted as an interactive request, so it never holds up
+        :meth:`wait_until_idle`.
+
+        Args:
+            structure_ids: Structure IDs to refresh
+            character_ids: Character IDs that might have access
+
+        Returns:
+            Dict mapping structure_id to LocationInfo
+        """
+        return await self._resolve_with_access_map(structure_ids, character_ids)
+
+    async def _resolve_with_access_map(
+        self,
+        structure_ids: set[int],
+        character_ids: list[int],
+    ) -> dict[int, LocationInfo]:
+        """Route structures to characters using the access map."""
         if not structure_ids or not character_ids:
             return {}
 
         results: dict[int, LocationInfo] = {}
-        remaining_structures = list(structure_ids)
+        candidates: dict[int, list[int]] = {}
+        for sid in structure_ids:
+            ordered = self._access_candidates(sid, character_ids)
+            if ordered:
+                candidates[sid] = ordered
+            else:
+                self._schedule_denied_retry(sid, character_ids)
 
-        # Try with first character for all structures
-        if character_ids:
-            primary_char = character_ids[0]
+        if len(candidates) < len(structure_ids):
             logger.info(
-                "Attempting to resolve %d structures with primary character %d",
-                len(remaining_structures),
-                primary_char,
+                "Skipping %d structures no character can currently access",
+                len(structure_ids) - len(candidates),
             )
-            await self._resolve_structures(remaining_structures, primary_char, results)
 
-            # Check which structures still need resolution (failed with primary)
-            remaining_structures = [
-                sid for sid in remaining_structures if sid not in results
-            ]
-
-        # For any structures that failed, try with remaining characters
-        if remaining_structures and len(character_ids) > 1:
-            logger.info(
-                "%d structures need retry with alternate characters",
-                len(remaining_structures),
-            )
-            for char_id in character_ids[1:]:
-                if not remaining_structures:
-                    break
+        first_round = True
+        while candidates:
+            routes: dict[int, list[int]] = {}
+            for sid, ordered in candidates.items():
+                routes.setdefault(ordered[0], []).append(sid)
 
-                logger.debug(
-                    "Retrying %d structures with character %d",
-                    len(remaining_structures),
-                    char_id,
+            for char_id, sids in routes.items():
+                logger.info(
+                    "Resolving %d structures with character %d", len(sids), char_id
                 )
-                await self._resolve_structures(remaining_structures, char_id, results)
+                # After a denial the structure is in backoff, but another
+                # character may still have access
+                await self._resolve_structures(
+                    sids, char_id, results, ignore_backoff=not first_round
+                )
+            first_round = False
 
-                # Update remaining structures
-                remaining_structures = [
-                    sid for sid in remaining_structures if sid not in results
-                ]
+            # Only structures that were denied move on to their next character
+            retry: dict[int, list[int]] = {}
+            for sid, (char_id, *rest) in candidates.items():
+                allowed = self.get_structure_access(sid).get(char_id)
+                if allowed is not False:
+                    continue
+                if rest:
+                    retry[sid] = rest
+                else:
+                    self._schedule_denied_retry(sid, character_ids)
+            candidates = retry
 
         logger.info(
             "Multi-character structure resolution complete: %d/%d resolved",
@@ -676,6 +986,25 @@ class LocationService:
 
         return results
 
+    def _schedule_denied_retry(
+        self, structure_id: int, character_ids: list[int]
+    ) -> None:
+        """Back off a structure until the first character's denial expires."""
+        expiries = [
+            checked_at + self._access_ttl(False)
+            for cid, (allowed, checked_at) in self._structure_access.get(
+                structure_id, {}
+            ).items()
+            if cid in character_ids and not allowed
+        ]
+        if not expiries:
+            return
+        retry_after = min(expiries)
+        current = self._failed_structures_backoff.get(structure_id)
+        if current is None or current < retry_after:
+            self._failed_structures_backoff[structure_id] = retry_after
+            self._persist_backoff(structure_id, retry_after)
+
     async def _resolve_single_structure(
         self,
         struct_id: int,
@@ -762,7 +1091,9 @@ class LocationService:
             self._cache[structure.structure_id] = loc
             # Maintain minimal internal state unrelated to cache
             self._failed_structures.discard(structure.structure_id)
-            self._failed_structures_backoff.pop(structure.structure_id, None)
+            if self._failed_structures_backoff.pop(structure.structure_id, None):
+                self._persist_backoff(structure.structure_id, None)
+            self._record_access(structure.structure_id, character_id, True)
 
             logger.debug(
                 "Successfully resolved structure %d: %s (custom: %s)",
@@ -781,11 +1112,14 @@ class LocationService:
             )
             if isinstance(backoff, (int, float)):
                 backoff = timedelta(seconds=backoff)
-            self._failed_structures_backoff[struct_id] = datetime.now(UTC) + backoff
+            retry_after = datetime.now(UTC) + backoff
+            self._failed_structures_backoff[struct_id] = retry_after
+            self._persist_backoff(struct_id, retry_after)
 
             # Log at DEBUG for auth errors (common when access is revoked), WARNING for others
             error_str = str(e)
             if "401" in error_str or "403" in error_str or "Unauthorized" in error_str:
+                self._record_access(struct_id, character_id, False)
                 logger.debug(
                     "Structure %d: Access denied (character may have lost docking rights or not in ACL)",
                     struct_id,
@@ -0,0 +1,223 @@
+"""Vectorized material cost engine for blueprint activities.
+
+Prices the material bill of every blueprint at once against the effective
+price table: material entries of the selected blueprints are gathered from
+the packed activity arrays, adjusted for material efficiency and runs, priced
+with one sorted lookup and summed per blueprint with a scatter-add.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from data.csr import gather_rows
+from services.price_vector import PriceVector
+
+if TYPE_CHECKING:
+    from data import SDEProvider
+    from data.blueprint_activities import BlueprintActivityArrays
+    from services.price_resolver import PriceResolver
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, eq=False)
+class MaterialCosts:
+    """Material costs for a batch of blueprints, aligned by position.
+
+    Attributes:
+        blueprint_type_ids: Blueprints that were costed (int64)
+        runs: Runs costed per blueprint (int64)
+        material_cost: ISK cost of all materials for ``runs`` runs (float64)
+        production_time: Duration of ``runs`` runs in seconds (float64)
+        fully_priced: False where some material had no price (counted as 0)
+    """
+
+    blueprint_type_ids: np.ndarray
+    runs: np.ndarray
+    material_cost: np.ndarray
+    production_time: np.ndarray
+    fully_priced: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.blueprint_type_ids)
+
+    @property
+    def cost_per_run(self) -> np.ndarray:
+        """Material cost of a single run (ME rounding applied to the batch)."""
+        return self.material_cost / np.maximum(self.runs, 1)
+
+    def as_dict(self) -> dict[int, float]:
+        """Return ``blueprint_type_id -> material cost`` for all runs."""
+        return dict(
+            zip(
+                self.blueprint_type_ids.tolist(),
+                self.material_cost.tolist(),
+                strict=True,
+            )
+        )
+
+
+class ManufacturingCostEngine:
+    """Compute blueprint material costs in bulk against the price table.
+
+    The price table is converted to sorted NumPy arrays once per price
+    resolver revision; blueprint arrays come from the SDE provider, which
+    rebuilds them when the SDE is reloaded.
+    """
+
+    def __init__(self, sde_provider: SDEProvider, price_resolver: PriceResolver):
+        self._sde = sde_provider
+        self._price_vector = PriceVector(price_resolver)
+
+    @property
+    def price_revision(self) -> int:
+        """Price resolver revision the next computation will price against."""
+        return self._price_vector.revision
+
+    def blueprint_arrays(
+        self, activity: str = "manufacturing"
+    ) -> BlueprintActivityArrays:
+        """Packed blueprint arrays the engine currently computes against."""
+        return self._sde.get_blueprint_activity_arrays(activity)
+
+    def unit_prices(self, type_ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Look up effective unit prices for an array of type IDs.
+
+        Returns:
+            Tuple of (prices, found); unpriced types get a price of 0.0
+        """
+        return self._price_vector.lookup(type_ids)
+
+    def material_costs(
+        self,
+        blueprint_type_ids: Iterable[int] | np.ndarray | None = None,
+        *,
+        me: int | Iterable[int] | np.ndarray = 0,
+        te: int | Iterable[int] | np.ndarray = 0,
+        runs: int | Iterable[int] | np.ndarray = 1,
+        activity: str = "manufacturing",
+        material_modifier: float = 1.0,
+    ) -> MaterialCosts:
+        """Cost the materials of many blueprints in one vectorized pass.
+
+        Per material the job quantity follows the game's rounding:
+        ``max(runs, ceil(round(base * runs * (1 - ME/100) * modifier, 2)))``.
+
+        Args:
+            blueprint_type_ids: Blueprints to cost; all blueprints with the
+                activity if omitted. Unknown IDs are left out of the result.
+            me: Material efficiency (0-10), scalar or one per blueprint
+            te: Time efficiency (0-20), scalar or one per blueprint
+            runs: Runs per job, scalar or one per blueprint
+            activity: SDE activity name
+            material_modifier: Extra material multiplier (structure/rig bonus)
+
+        Returns:
+            MaterialCosts aligned with the costed blueprints
+        """
+        arrays = self.blueprint_arrays(activity)
+        if blueprint_type_ids is None:
+            rows = np.arange(len(arrays), dtype=np.int64)
+        else:
+            rows = arrays.rows_of(blueprint_type_ids)
+        me_arr = _per_row(me, len(rows), np.float64)
+        te_arr = _per_row(te, len(rows), np.float64)
+        runs_arr = np.maximum(_per_row(runs, len(rows), np.int64), 1)
+
+        known = rows >= 0
+        if not known.all():
+            rows, me_arr, te_arr, runs_arr = (
+                rows[known],
+                me_arr[known],
+                te_arr[known],
+                runs_arr[known],
+            )
+
+        entry_rows, entries = gather_rows(arrays.material_indptr, rows)
+        base = arrays.material_quantities[entries]
+        job_runs = runs_arr[entry_rows]
+        adjusted = np.ceil(
+            np.round(
+                base
+                * job_runs
+                * (1.0 - me_arr[entry_rows] / 100.0)
+                * material_modifier,
+                2,
+            )
+        )
+        quantities = np.where(base > 0, np.maximum(job_runs, adjusted), 0.0)
+
+        prices, found = self.unit_prices(arrays.material_type_ids[entries])
+        cost = np.bincount(entry_rows, weights=quantities * prices, minlength=len(rows))
+        unpriced = np.bincount(entry_rows, weights=~found, minlength=len(rows))
+
+        return MaterialCosts(
+            blueprint_type_ids=arrays.blueprint_type_ids[rows],
+            runs=runs_arr,
+            material_cost=cost,
+            production_time=arrays.times[rows] * (1.0 - te_arr / 100.0) * runs_arr,
+            fully_priced=unpriced == 0,
+        )
+
+    def product_values(
+        self,
+        blueprint_type_ids: Iterable[int] | np.ndarray,
+        *,
+        runs: int | Iterable[int] | np.ndarray = 1,
+        activity: str = "manufacturing",
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Expected market value of the products of many blueprints.
+
+        Product quantities are weighted by their success probability, so
+        invention outputs count at their expected yield.
+
+        Args:
+            blueprint_type_ids: Blueprints to value
+            runs: Runs per job, scalar or one per blueprint
+            activity: SDE activity name
+
+        Returns:
+            Tuple of (values, fully_priced) aligned with ``blueprint_type_ids``;
+            unknown blueprints are worth 0.0
+        """
+        arrays = self.blueprint_arrays(activity)
+        rows = arrays.rows_of(blueprint_type_ids)
+        runs_arr = np.maximum(_per_row(runs, len(rows), np.int64), 1)
+        known = np.flatnonzero(rows >= 0)
+
+        entry_rows, entries = gather_rows(arrays.product_indptr, rows[known])
+        prices, found = self.unit_prices(arrays.product_type_ids[entries])
+        weights = (
+            arrays.product_quantities[entries]
+            * arrays.product_probabilities[entries]
+            * runs_arr[known][entry_rows]
+            * prices
+        )
+        values = np.zeros(len(rows), dtype=np.float64)
+        values[known] = np.bincount(entry_rows, weights=weights, minlength=len(known))
+        unpriced = np.bincount(entry_rows, weights=~found, minlength=len(known))
+        fully_priced = np.zeros(len(rows), dtype=bool)
+        fully_priced[known] = unpriced == 0
+        return values, fully_priced
+
+
+def _per_row(value: object, count: int, dtype: type) -> np.ndarray:
+    """Broadcast a scalar or per-blueprint sequence to ``count`` entries."""
+    if isinstance(value, int | float):
+        return np.full(count, value, dtype=dtype)
+    arr = np.asarray(
+        value if isinstance(value, np.ndarray) else list(value),  # type: ignore[call-overload]
+        dtype=dtype,
+    )
+    if arr.shape != (count,):
+        raise ValueError(f"Expected {count} per-blueprint values, got {arr.shape}")
+    return arr
+
+
+__all__ = ["ManufacturingCostEngine", "MaterialCosts"]
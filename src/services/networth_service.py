@@ -6,15 +6,19 @@ and industry jobs.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 from data import FuzzworkProvider
+from data.blueprint_activities import INDUSTRY_ACTIVITY_NAMES
 from data.repositories import (
     Repository,
     assets,
     contracts,
+    industry_jobs,
     journal,
     market_orders,
     networth,
@@ -30,6 +34,9 @@ from models.app import (
     NetWorthSnapshot,
 )
 from models.eve.asset import EveAsset
+from services.blueprint_valuation import BlueprintKey, BlueprintValuator
+from services.manufacturing_cost import ManufacturingCostEngine
+from services.price_resolver import PriceResolver
 
 if TYPE_CHECKING:
     from data.clients import ESIClient
@@ -37,6 +44,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Activities whose output is a blueprint copy rather than a market item
+_COPY_OUTPUT_ACTIVITIES = frozenset({"copying", "invention"})
+
 
 class NetWorthService:
     """Calculate and track character net worth.
@@ -47,6 +57,10 @@ class NetWorthService:
     - Market orders (escrow + sell exposure)
     - Contracts (collateral + price/reward)
     - Industry jobs
+
+    Blueprints are valued through a BlueprintValuator: copies always, and
+    originals when they have no custom or market price (ahead of their SDE
+    base price).
     """
 
     def __init__(
@@ -57,15 +71,33 @@ class NetWorthService:
         settings_manager: Any | None = None,
         sde_provider: Any | None = None,
         location_service: LocationService | None = None,
+        price_resolver: PriceResolver | None = None,
+        blueprint_valuator: BlueprintValuator | None = None,
     ) -> None:
         self._esi_client = esi_client
         self._repo = repository
         self._fuzzwork = fuzzwork_provider
         self._settings = settings_manager
+        self._prices = price_resolver or PriceResolver(
+            repository, fuzzwork_provider, settings_manager
+        )
         self._last_used_prices: dict[int, tuple[float, str]] = {}
+        # Price-history fallback memo for the current valuation run
+        self._history_price_cache: dict[int, float | None] = {}
         self._schema_ready: bool = False
+        # Serializes valuations sharing the ledgers and per-run price memos
+        self._bulk_lock = asyncio.Lock()
+        # Price table revision each character's valuation ledger was priced at
+        self._ledger_revisions: dict[int, int] = {}
+        # SDE blueprint data each ledger's blueprint values were computed with
+        self._ledger_blueprint_data: dict[int, object] = {}
         self._sde = sde_provider
         self._location_service = location_service
+        if blueprint_valuator is None and sde_provider is not None:
+            blueprint_valuator = BlueprintValuator(
+                ManufacturingCostEngine(sde_provider, self._prices), self._prices
+            )
+        self._blueprints = blueprint_valuator
 
     async def _ensure_schema(self) -> None:
         """Ensure networth snapshot groups table exists."""
@@ -79,129 +111,96 @@ class NetWorthService:
         except Exception:
             logger.debug("Networth schema initialization failed", exc_info=True)
 
+    def set_fuzzwork_provider(self, provider: FuzzworkProvider | None) -> None:
+        """Replace the live market data source after a Fuzzwork refresh."""
+        self._fuzzwork = provider
+        self._prices.set_fuzzwork_provider(provider)
+
     def _get_market_price(self, type_id: int) -> float | None:
         """Get market price for a type from Fuzzwork data respecting user preferences.
 
-        Respects:
-        - Trade hub selection (Jita, Amarr, Dodixie, Rens, Hek)
-        - Price type (buy, sell, weighted)
+        Respects trade hub selection and price type (buy, sell, weighted) via the
+        shared PriceResolver table.
         """
-        if not self._fuzzwork or not self._fuzzwork.is_loaded:
-            return None
-        market_data = self._fuzzwork.get_market_data(type_id)
-        if not market_data or not market_data.region_data:
-            return None
+        return self._prices.get_market_price(type_id)
 
-        # Get user preferences for market valuation
-        trade_hub = (
-            self._settings.get_market_source_station() if self._settings else "jita"
-        )
-        price_type = (
-            self._settings.get_market_price_type() if self._settings else "sell"
-        )
-
-        # Map trade hub names to region IDs
-        hub_to_region = {
-            "jita": 10000002,  # The Forge
-            "amarr": 10000043,  # Domain
-            "dodixie": 10000032,  # Sinq Laison
-            "rens": 10000030,  # Heimatar
-            "hek": 10000042,  # Metropolis
-        }
-
-        preferred_region_id = hub_to_region.get(
-            trade_hub.lower(), 10000002
-        )  # Default to Jita
+    @staticmethod
+    def _history_record_price(record: Any) -> float | None:
+        """Pick the sell-side unit price from a stored price history record."""
+        candidates = [
+            record.sell_weighted_average,
+            record.sell_median,
+            record.sell_max_price,
+            record.sell_min_price,
+        ]
+        price_val = next((float(v) for v in candidates if v is not None), None)
+        if price_val is not None and price_val > 0:
+            return price_val
+        return None
 
-        # Try to get data from preferred region first
-        region_data = market_data.region_data.get(preferred_region_id)
+    async def _get_price_history_prices(
+        self, type_ids: Iterable[int]
+    ) -> dict[int, float]:
+        """Resolve the stored-snapshot fallback for many types with one query.
 
-        # Fallback to any available region if preferred not found
-        if not region_data:
-            for region_data in market_data.region_data.values():
-                if region_data:
-                    break
-            else:
-                return None
-
-        # Extract price based on user preference
-        if price_type == "buy" and region_data.buy_stats:
-            return region_data.buy_stats.median
-        if price_type == "sell" and region_data.sell_stats:
-            return region_data.sell_stats.median
-        if price_type == "weighted":
-            # Weighted average: default 30% buy, 70% sell
-            weighted_ratio = (
-                self._settings.get_market_weighted_buy_ratio()
-                if self._settings
-                else 0.3
-            )
-            buy_price = region_data.buy_stats.median if region_data.buy_stats else 0
-            sell_price = region_data.sell_stats.median if region_data.sell_stats else 0
-            if buy_price > 0 and sell_price > 0:
-                return (buy_price * weighted_ratio) + (
-                    sell_price * (1 - weighted_ratio)
+        Results (including misses) are memoized for the current valuation run.
+        """
+        wanted = [int(t) for t in type_ids]
+        missing = set(wanted) - self._history_price_cache.keys()
+        if missing:
+            try:
+                records = await prices.get_latest_jita_prices(self._repo, missing)
+            except Exception:
+                logger.debug("Batched price history lookup failed", exc_info=True)
+                records = {}
+            for type_id in missing:
+                record = records.get(type_id)
+                self._history_price_cache[type_id] = (
+                    self._history_record_price(record) if record else None
                 )
-            if sell_price > 0:
-                return sell_price
-            if buy_price > 0:
-                return buy_price
-
-        # Final fallback to sell price
-        if region_data.sell_stats:
-            return region_data.sell_stats.median
 
-        return None
+        resolved: dict[int, float] = {}
+        for type_id in wanted:
+            price_val = self._history_price_cache.get(type_id)
+            if price_val is not None:
+                self._last_used_prices[type_id] = (price_val, "history")
+                resolved[type_id] = price_val
+        return resolved
 
     async def _get_price_history_price(self, type_id: int) -> float | None:
         """Fallback to latest stored price snapshot when live market data is missing."""
-        try:
-            record = await prices.get_latest_jita_price(self._repo, type_id)
-            if record is None:
-                return None
-            candidates = [
-                record.sell_weighted_average,
-                record.sell_median,
-                record.sell_max_price,
-                record.sell_min_price,
-            ]
-            price_val = next((float(v) for v in candidates if v is not None), None)
-            if price_val is not None and price_val > 0:
-                self._last_used_prices[type_id] = (price_val, "history")
-                return price_val
-        except Exception:
-            logger.debug("Price history lookup failed for %s", type_id, exc_info=True)
-        return None
+        resolved = await self._get_price_history_prices([type_id])
+        return resolved.get(type_id)
 
-    def _get_asset_price(self, asset: Any, type_id: int) -> float | None:
+    def _get_asset_price(
+        self, asset: Any, type_id: int, use_base_price: bool = True
+    ) -> float | None:
         """Get price for an asset using custom, market, or base price.
 
         Priority:
         1. Custom price (from settings)
-        2. Blueprint copy pricing (0.0 unless custom price set)
+        2. Blueprint copies: 0.0 here (copies are valued through the
+           BlueprintValuator, see _blueprint_copy_values)
         3. Asset's market_value (if enriched)
         4. Market price (from Fuzzwork)
-        5. Base price (from SDE)
+        5. Base price (from SDE), unless use_base_price is False
 
         Args:
             asset: Enriched asset object
             type_id: EVE type ID
+            use_base_price: Fall back to the SDE base price
 
         Returns:
             Price per unit or None
         """
-        custom_price = None
-        if self._settings:
-            custom_prices = self._settings.get_custom_price(type_id)
-            if custom_prices:
-                custom_price = custom_prices.get("sell")
+        custom_price = self._prices.get_custom_price(type_id)
 
         # Custom price takes highest priority and is honored even if 0.0 (explicit override)
         if custom_price is not None:
             self._last_used_prices[type_id] = (custom_price, "custom")
             return custom_price
 
-        # Blueprint copies always have 0 value (unless custom price set above)
+        # Copies are never priced per unit; callers value them in bulk
         # is_blueprint_copy: True (copy), False (original), None (unknown - check SDE)
         is_blueprint_copy = getattr(asset, "is_blueprint_copy", None)
         if is_blueprint_copy is True:  # Explicit copy from ESI
@@ -218,6 +217,12 @@ class NetWorthService:
             self._last_used_prices[type_id] = (market_price, "market")
             return market_price
 
+        if use_base_price:
+            return self._get_base_price(asset, type_id)
+        return None
+
+    def _get_base_price(self, asset: Any, type_id: int) -> float | None:
+        """Base price of an asset or type from the asset or the SDE."""
         base_price = getattr(asset, "base_price", None)
         if base_price is not None and base_price > 0:
             self._last_used_prices[type_id] = (base_price, "base")
@@ -237,6 +242,313 @@ class NetWorthService:
 
         return None
 
+    async def _value_assets(self, raw_assets: list[EveAsset]) -> float:
+        """Sum stack values for assets.
+
+        Assets without a live price are collected and resolved against the
+        stored price history in one batched lookup.
+        """
+        total = 0.0
+        unpriced: dict[int, int] = {}
+        copies: dict[int, int] = {}
+        for asset in raw_assets:
+            try:
+                if asset.quantity <= 0:
+                    continue
+                if asset.is_blueprint_copy:
+                    copies[asset.type_id] = copies.get(asset.type_id, 0) + 1
+                    continue
+                per_unit = self._get_asset_price(asset, asset.type_id)
+                if per_unit is None:
+                    unpriced[asset.type_id] = (
+                        unpriced.get(asset.type_id, 0) + asset.quantity
+                    )
+                elif per_unit > 0:
+                    total += per_unit * asset.quantity
+            except Exception:
+                logger.debug(
+                    "Failed to value asset %s",
+                    getattr(asset, "item_id", None),
+                    exc_info=True,
+                )
+
+        if unpriced:
+            history_prices = await self._get_price_history_prices(unpriced.keys())
+            for type_id, quantity in unpriced.items():
+                per_unit = history_prices.get(type_id)
+                if per_unit:
+                    total += per_unit * quantity
+        if copies:
+            copy_values = self._blueprint_copy_values(copies.keys())
+            total += sum(copy_values[t] * count for t, count in copies.items())
+        return total
+
+    def _blueprint_copy_values(self, type_ids: Iterable[int]) -> dict[int, float]:
+        """Value one copy of each blueprint type in bulk.
+
+        A custom price overrides the valuation strategy. Asset rows carry no
+        ME/TE/runs, so copies are valued as a single run at ME 0 / TE 0.
+
+        Returns:
+            Dict mapping type_id -> value per copy
+        """
+        values: dict[int, float] = {}
+        strategy_types: list[int] = []
+        for type_id in type_ids:
+            custom = self._prices.get_custom_price(type_id)
+            if custom is not None:
+                values[type_id] = custom
+            else:
+                strategy_types.append(type_id)
+        if strategy_types and self._blueprints is not None:
+            try:
+                valued = self._blueprints.value_blueprints(
+                    BlueprintKey(type_id) for type_id in strategy_types
+                )
+                for key, value in valued.items():
+                    values[key.type_id] = value
+            except Exception:
+                logger.debug("Blueprint copy valuation failed", exc_info=True)
+        for type_id in strategy_types:
+            values.setdefault(type_id, 0.0)
+        return values
+
+    async def _value_industry_jobs(self, character_ids: list[int]) -> dict[int, float]:
+        """Expected output value of undelivered industry jobs per character.
+
+        Each distinct job output is valued once: product price times the
+        per-run output quantity from the SDE. Invention and copying outputs
+        are blueprint copies valued like copies held as assets, and invention
+        counts at its success probability. Research jobs produce no items.
+
+        Returns:
+            Dict mapping character_id -> in-progress job value
+        """
+        outputs = await industry_jobs.get_in_progress_outputs(self._repo, character_ids)
+        per_run: dict[tuple[int, int, int], tuple[float, float]] = {}
+        copy_outputs: set[int] = set()
+        item_outputs: set[int] = set()
+        for key in outputs:
+            activity_id, blueprint_type_id, product_type_id = key
+            activity = INDUSTRY_ACTIVITY_NAMES.get(activity_id)
+            if activity is None or activity.startswith("research"):
+                continue
+            quantity, probability = self._job_output_yield(
+                blueprint_type_id, activity, product_type_id
+            )
+            if activity in _COPY_OUTPUT_ACTIVITIES:
+                # One copy per successful run, whatever runs the copy carries
+                quantity = 1
+                copy_outputs.add(product_type_id)
+            else:
+                item_outputs.add(product_type_id)
+            per_run[key] = (float(quantity), probability)
+        if not per_run:
+            return {}
+
+        unit_values = self._blueprint_copy_values(copy_outputs) if copy_outputs else {}
+        if item_outputs:
+            for type_id, (price, _source) in (
+                await self._price_types(list(item_outputs))
+            ).items():
+                unit_values[type_id] = price
+        run_values = {
+            key: (quantity * unit_values.get(key[2], 0.0), probability)
+            for key, (quantity, probability) in per_run.items()
+        }
+        return await industry_jobs.sum_job_values(self._repo, character_ids, run_values)
+
+    def _job_output_yield(
+        self, blueprint_type_id: int, activity: str, product_type_id: int
+    ) -> tuple[int, float]:
+        """Per-run output quantity and base success chance of a job output."""
+        if self._sde is None:
+            return 1, 1.0
+        try:
+            blueprint = self._sde.get_blueprint(blueprint_type_id)
+        except Exception:
+            logger.debug("Blueprint lookup failed", exc_info=True)
+            return 1, 1.0
+        job_activity = blueprint.activities.get(activity) if blueprint else None
+        for product in job_activity.products if job_activity else ():
+            if product.type_id == product_type_id:
+                probability = (
+                    1.0 if product.probability is None else product.probability
+                )
+                return product.quantity, probability
+        return 1, 1.0
+
+    async def _value_blueprint_copies(
+        self, character_ids: list[int]
+    ) -> dict[int, float]:
+        """Total blueprint copy value per character (one query, one valuation)."""
+        counts = await assets.get_blueprint_copy_counts(self._repo, character_ids)
+        if not counts:
+            return {}
+        values = self._blueprint_copy_values(
+            {type_id for per_type in counts.values() for type_id in per_type}
+        )
+        return {
+            character_id: sum(
+                values[type_id] * count for type_id, count in per_type.items()
+            )
+            for character_id, per_type in counts.items()
+        }
+
+    async def _price_types(
+        self, type_ids: Iterable[int]
+    ) -> dict[int, tuple[float, str | None]]:
+        """Resolve unit prices for types that are not tied to a specific asset.
+
+        Uses the same priority as _get_asset_price, except that blueprint
+        originals without a custom or market price are valued with the
+        blueprint valuation strategy before falling back to their SDE base
+        price. Types still unpriced are resolved against the stored price
+        history in one batched lookup.
+
+        Returns:
+            Dict mapping type_id -> (unit_price, source); unpriceable types map
+            to (0.0, None)
+        """
+        type_ids = list(type_ids)
+        resolved: dict[int, tuple[float, str | None]] = {}
+        unpriced: list[int] = []
+        blueprint_ids = self._strategy_blueprint_ids(type_ids)
+        for type_id in type_ids:
+            per_unit = self._get_asset_price(
+                None, type_id, use_base_price=type_id not in blueprint_ids
+            )
+            if per_unit is None:
+                unpriced.append(type_id)
+            else:
+                source = self._last_used_prices.get(type_id, (per_unit, None))[1]
+                resolved[type_id] = (per_unit, source)
+        originals = [t for t in unpriced if t in blueprint_ids]
+        if originals:
+            self._value_blueprint_originals(originals, resolved)
+            for type_id in originals:
+                per_unit = (
+                    None if type_id in resolved else self._get_base_price(None, type_id)
+                )
+                if per_unit is not None:
+                    resolved[type_id] = (per_unit, "base")
+            unpriced = [t for t in unpriced if t not in resolved]
+        if unpriced:
+            history_prices = await self._get_price_history_prices(unpriced)
+            for type_id in unpriced:
+                per_unit = history_prices.get(type_id)
+                resolved[type_id] = (per_unit, "history") if per_unit else (0.0, None)
+        return resolved
+
+    def _strategy_blueprint_ids(self, type_ids: Iterable[int]) -> set[int]:
+        """Blueprint types among type_ids that the valuation strategy can value."""
+        if self._blueprints is None or self._sde is None:
+            return set()
+        try:
+            return {t for t in type_ids if self._sde.is_blueprint(t)}
+        except Exception:
+            logger.debug("Blueprint type lookup failed", exc_info=True)
+            return set()
+
+    def _value_blueprint_originals(
+        self, type_ids: list[int], resolved: dict[int, tuple[float, str | None]]
+    ) -> None:
+        """Value blueprint originals with the valuation strategy.
+
+        Originals are valued as one run at ME 0 / TE 0. Positive values are
+        written to ``resolved``.
+        """
+        if self._blueprints is None:
+            return
+        try:
+            valued = self._blueprints.value_blueprints(
+                BlueprintKey(type_id) for type_id in type_ids
+            )
+        except Exception:
+            logger.debug("Blueprint original valuation failed", exc_info=True)
+            return
+        source = f"blueprint-{self._blueprints.strategy}"
+        for key, value in valued.items():
+            if value > 0:
+                resolved[key.type_id] = (value, source)
+                self._last_used_prices[key.type_id] = (value, source)
+
+    async def _value_ledgers(self, character_ids: list[int]) -> dict[int, float]:
+        """Value characters' assets from their incremental valuation ledgers.
+
+        The ledgers hold valued quantities per type/location, kept current by
+        asset syncs. Only rows added since the last valuation and types whose
+        effective price moved are repriced; the first valuation in a session
+        and market preference changes reprice everything. Blueprints valued
+        from their materials and products are repriced whenever any price or
+        the SDE changed, since their own type never shows up as changed.
+        Types to reprice are collected across all characters and priced once.
+
+        Returns:
+            Dict mapping character_id -> ledger asset value
+        """
+        revision = self._prices.revision
+        blueprint_data = self._current_blueprint_data()
+        reprice: dict[int, set[int]] = {}
+        for character_id in character_ids:
+            reprice[character_id] = await self._ledger_reprice_types(
+                character_id, blueprint_data
+            )
+
+        wanted = set().union(*reprice.values())
+        unit_prices = await self._price_types(wanted) if wanted else {}
+        for character_id, type_ids in reprice.items():
+            await assets.set_ledger_prices(
+                self._repo, character_id, {t: unit_prices[t] for t in type_ids}
+            )
+            self._ledger_revisions[character_id] = revision
+            self._ledger_blueprint_data[character_id] = blueprint_data
+            # Expose every price in use so snapshot persistence sees the full set
+            self._last_used_prices.update(
+                await assets.get_ledger_prices(self._repo, character_id)
+            )
+        logger.debug(
+            "Valuation ledgers for %d characters repriced %d types (revision %d)",
+            len(reprice),
+            len(wanted),
+            revision,
+        )
+        return await assets.sum_ledger_values(self._repo, character_ids)
+
+    async def _ledger_reprice_types(
+        self, character_id: int, blueprint_data: object
+    ) -> set[int]:
+        """Types in a character's valuation ledger that need a new price."""
+        since = self._ledger_revisions.get(character_id)
+        if since is None:
+            await assets.rebuild_valuation_ledger(self._repo, character_id)
+            return await assets.get_ledger_type_ids(self._repo, character_id)
+
+        changed = self._prices.changed_types(since)
+        reprice = await assets.get_ledger_type_ids(
+            self._repo, character_id, unpriced_only=changed is not None
+        )
+        if changed:
+            held = await assets.get_ledger_type_ids(self._repo, character_id)
+            reprice |= changed & held
+        if changed or (
+            blueprint_data is not self._ledger_blueprint_data.get(character_id)
+        ):
+            reprice |= await assets.get_ledger_type_ids(
+                self._repo, character_id, source_prefix="blueprint-"
+            )
+        return reprice
+
+    def _current_blueprint_data(self) -> object:
+        """SDE blueprint data blueprint originals are valued against, if any."""
+        if self._blueprints is None:
+            return None
+        try:
+            return self._blueprints.blueprint_data
+        except Exception:
+            logger.debug("Blueprint data lookup failed", exc_info=True)
+            return None
+
     async def calculate_assets_for_locations(
         self, character_id: int, include_locations: list[int]
     ) -> float:
@@ -245,32 +557,14 @@ class NetWorthService:
         if not include_locations:
             return 0.0
         total = 0.0
-        include_set = {int(loc) for loc in include_locations if loc is not None}
+        root_ids = sorted({int(loc) for loc in include_locations if loc is not None})
+        self._history_price_cache = {}
+        await self._prices.ensure_ready()
         try:
-            raw_assets = await assets.get_current_assets(self._repo, character_id)
-            by_item_id = {asset.item_id: asset for asset in raw_assets}
-            for asset in raw_assets:
-                try:
-                    if asset.is_blueprint_copy or asset.quantity <= 0:
-                        continue
-                    if include_set:
-                        root_id, _root_type = self._find_root_location(
-                            asset, by_item_id
-                        )
-                        if root_id is None or int(root_id) not in include_set:
-                            continue
-                    per_unit = self._get_asset_price(asset, asset.type_id)
-                    if per_unit is None:
-                        per_unit = await self._get_price_history_price(asset.type_id)
-                    if per_unit and per_unit > 0:
-                        total += per_unit * asset.quantity
-                except Exception:
-                    logger.debug(
-                        "Failed to value asset %s for %s",
-                        getattr(asset, "item_id", None),
-                        character_id,
-                        exc_info=True,
-                    )
+            raw_assets = await assets.get_assets_at_roots(
+                self._repo, character_id, root_ids
+            )
+            total = await self._value_assets(raw_assets)
         except Exception:
             logger.debug(
                 "Failed to compute filtered assets for character %s",
@@ -289,129 +583,121 @@ class NetWorthService:
         Returns:
             NetWorthSnapshot with calculated values
         """
-        self._last_used_prices = {}
-        snapshot_time = datetime.now(UTC)
-
-        wallet_balance = await journal.get_current_balance(self._repo, character_id)
-        if wallet_balance is None:
-            wallet_balance = 0.0
-            logger.warning(
-                "No wallet balance available for character %d, using 0",
-                character_id,
-            )
+        snapshots = await self.calculate_networth_many([character_id])
+        return snapshots[int(character_id)]
+
+    async def calculate_networth_many(
+        self, character_ids: list[int]
+    ) -> dict[int, NetWorthSnapshot]:
+        """Calculate net worth snapshots for many characters in one pass.
 
-        # PLEX is account-level data stored separately in account_plex_snapshots table.
-        # PLEX snapshots are created separately during refresh operations.
-        plex_vault = 0.0
-        account_id = None
-        if self._settings and hasattr(self._settings, "get_account_for_character"):
-            account_id = self._settings.get_account_for_character(character_id)
+        Assets are valued from the per-character valuation ledgers, repricing
+        each distinct type at most once across all characters. Wallet
+        balances, market exposure and contract totals are each computed with a
+        single aggregated query grouped by character.
 
-        market_escrow = 0.0
-        market_sell_value = 0.0
+        Args:
+            character_ids: Character IDs to calculate net worth for
+        Returns:
+            Dict mapping character_id -> NetWorthSnapshot
+        """
+        ids = list(dict.fromkeys(int(c) for c in character_ids))
+        if not ids:
+            return {}
+
+        async with self._bulk_lock:
+            self._last_used_prices = {}
+            self._history_price_cache = {}
+            snapshot_time = datetime.now(UTC)
+            await self._prices.ensure_ready()
+
+            asset_values: dict[int, float] = {}
+            try:
+                asset_values = await self._value_ledgers(ids)
+            except Exception:
+                logger.debug(
+                    "Ledger valuation failed, revaluing all assets", exc_info=True
+                )
+                for character_id in ids:
+                    self._ledger_revisions.pop(character_id, None)
+                    try:
+                        raw_assets = await assets.get_current_assets(
+                            self._repo, character_id
+                        )
+                        asset_values[character_id] = await self._value_assets(
+                            raw_assets
+                        )
+                    except Exception:
+                        logger.debug("Asset valuation failed", exc_info=True)
+            else:
+                try:
+                    for character_id, value in (
+                        await self._value_blueprint_copies(ids)
+                    ).items():
+                        asset_values[character_id] = (
+                            asset_values.get(character_id, 0.0) + value
+                        )
+                except Exception:
+                    logger.debug("Blueprint copy valuation failed", exc_info=True)
+
+            job_values: dict[int, float] = {}
+            try:
+                job_values = await self._value_industry_jobs(ids)
+            except Exception:
+                logger.debug("Bulk industry job value calc failed", exc_info=True)
+
+        balances: dict[int, float] = {}
         try:
-            exposure = await market_orders.calculate_market_exposure(
-                self._repo, character_id
-            )
-            market_escrow = float(exposure.get("total_escrow", 0.0))
-            market_sell_value = float(exposure.get("sell_exposure", 0.0))
+            balances = await journal.get_current_balances(self._repo, ids)
         except Exception:
-            logger.debug("Market exposure calc failed", exc_info=True)
+            logger.debug("Bulk wallet balance lookup failed", exc_info=True)
 
-        contract_collateral = 0.0
-        contract_value = 0.0
+        exposures: dict[int, dict] = {}
         try:
-            active_contracts = await contracts.get_active_contracts(
-                self._repo, character_id
-            )
-            for c in active_contracts:
-                if c.collateral:
-                    contract_collateral += float(c.collateral)
-                if c.price:
-                    contract_value += float(c.price)
-                elif c.reward:
-                    contract_value += float(c.reward)
+            exposures = await market_orders.calculate_market_exposures(self._repo, ids)
         except Exception:
-            logger.debug("Contract value calc failed", exc_info=True)
+            logger.debug("Bulk market exposure calc failed", exc_info=True)
 
-        total_asset_value = 0.0
+        contract_totals: dict[int, dict[str, float]] = {}
         try:
-            raw_assets = await assets.get_current_assets(self._repo, character_id)
-            for asset in raw_assets:
-                type_id = asset.type_id
-                quantity = asset.quantity
-                is_blueprint_copy = asset.is_blueprint_copy
-
-                # TODO: Include blueprints in networth calculation
-                # Currently blueprints are skipped entirely. In the future, implement:
-                # - Use price priority: custom -> market_value -> market_price -> base_price
-                # - market_value for blueprints can be derived in different ways:
-                #   * Manufacturing cost (sum of component materials)
-                #   * Blueprint value (based on copy worth, time remaining, etc)
-                #   * Custom override price (user-defined valuation)
-                # - Remove the is_blueprint_copy skip to include them in totals
-                if is_blueprint_copy or quantity <= 0:
-                    continue
-
-                per_unit = self._get_asset_price(asset, type_id)
-                if per_unit is None:
-                    per_unit = await self._get_price_history_price(type_id)
-                if per_unit and per_unit > 0:
-                    stack_value = per_unit * quantity
-                    total_asset_value += stack_value
+            contract_totals = await contracts.get_active_contract_totals(
+                self._repo, ids
+            )
         except Exception:
-            logger.debug("Asset valuation failed", exc_info=True)
-
-        industry_job_value = 0.0
-
-        return NetWorthSnapshot(
-            snapshot_id=0,
-            character_id=character_id,
-            account_id=account_id,
-            snapshot_group_id=None,
-            snapshot_time=snapshot_time,
-            total_asset_value=total_asset_value,
-            wallet_balance=wallet_balance,
-            market_escrow=market_escrow,
-            market_sell_value=market_sell_value,
-            contract_collateral=contract_collateral,
-            contract_value=contract_value,
-            industry_job_value=industry_job_value,
-            plex_vault=plex_vault,
-        )
+            logger.debug("Bulk contract value calc failed", exc_info=True)
+
+        snapshots: dict[int, NetWorthSnapshot] = {}
+        for character_id in ids:
+            wallet_balance = balances.get(character_id)
+            if wallet_balance is None:
+                wallet_balance = 0.0
+                logger.warning(
+                    "No wallet balance available for character %d, using 0",
+                    character_id,
+                )
 
-    @staticmethod
-    def _find_root_location(
-        asset: EveAsset, by_item_id: dict[int, EveAsset]
-    ) -> tuple[int | None, str | None]:
-        """Walk parent chain to find the first non-item location."""
-
-        loc_id = asset.location_id
-        loc_type = asset.location_type
-
-        if loc_type != "item":
-            return loc_id, loc_type
-
-        max_hops = 64
-        hops = 0
-        while loc_type == "item" and hops < max_hops:
-            parent = by_item_id.get(loc_id)
-            if parent is None:
-                # Infer based on numeric range if parent row missing
-                if loc_id >= 1_000_000_000_000:
-                    return loc_id, "structure"
-                if 60000000 <= loc_id < 70000000:
-                    return loc_id, "station"
-                if 30000000 <= loc_id < 40000000:
-                    return loc_id, "solar_system"
-                return None, None
-            loc_id = parent.location_id
-            loc_type = parent.location_type
-            hops += 1
-
-        if loc_type == "item":
-            return None, None
-        return loc_id, loc_type
+            account_id = None
+            if self._settings and hasattr(self._settings, "get_account_for_character"):
+                account_id = self._settings.get_account_for_character(character_id)
+
+            exposure = exposures.get(character_id, {})
+            contract = contract_totals.get(character_id, {})
+            snapshots[character_id] = NetWorthSnapshot(
+                snapshot_id=0,
+                character_id=character_id,
+                account_id=account_id,
+                snapshot_group_id=None,
+                snapshot_time=snapshot_time,
+                total_asset_value=asset_values.get(character_id, 0.0),
+                wallet_balance=wallet_balance,
+                market_escrow=float(exposure.get("total_escrow", 0.0)),
+                market_sell_value=float(exposure.get("sell_exposure", 0.0)),
+                contract_collateral=float(contract.get("collateral", 0.0)),
+                contract_value=float(contract.get("value", 0.0)),
+                industry_job_value=job_values.get(character_id, 0.0),
+                plex_vault=0.0,
+            )
+        return snapshots
 
     async def list_asset_locations(
         self, character_ids: list[int] | None = None
@@ -431,29 +717,12 @@ class NetWorthService:
         if not character_ids:
             return []
 
-        stats: dict[int, dict[str, Any]] = {}
-        for cid in character_ids:
-            raw_assets = await assets.get_current_assets(self._repo, cid)
-            if not raw_assets:
-                continue
-            by_item = {asset.item_id: asset for asset in raw_assets}
-            for asset in raw_assets:
-                root_id, root_type = self._find_root_location(asset, by_item)
-                if root_id is None:
-                    continue
-                entry = stats.setdefault(
-                    int(root_id),
-                    {
-                        "asset_count": 0,
-                        "characters": set(),
-                        "location_type": root_type or "",
-                    },
-                )
-                entry["asset_count"] += 1
-                entry["characters"].add(int(cid))
-                if root_type and not entry.get("location_type"):
-                    entry["location_type"] = root_type
-
+        stats = {
+            entry["location_id"]: entry
+            for entry in await assets.get_root_location_summary(
+                self._repo, character_ids
+            )
+        }
         if not stats:
             return []
 
@@ -496,7 +765,7 @@ class NetWorthService:
                     display_name=display_name,
                     location_type=str(category or ""),
                     asset_count=int(entry["asset_count"]),
-                    character_count=len(entry["characters"]),
+                    character_count=int(entry["character_count"]),
                     system_name=system_name,
                 )
             )
@@ -546,21 +815,8 @@ class NetWorthService:
         await self._ensure_schema()
         await networth.delete_snapshot(self._repo, snapshot_id)
 
-    async def save_networth_snapshot(
-        self, character_id: int, snapshot_group_id: int | None = None
-    ) -> int:
-        """Calculate and save a net worth snapshot.
-
-        Snapshots data already in the repository.
-
-        Args:
-            character_id: Character ID
-
-        Returns:
-            Snapshot ID
-        """
-        await self._ensure_schema()
-
+    async def _ensure_snapshot_group(self, snapshot_group_id: int | None) -> int | None:
+        """Return the group to save into, creating a manual one if needed."""
         # Ensure snapshots always belong to a group so graph aggregation picks them up
         if snapshot_group_id is None:
             try:
@@ -577,10 +833,164 @@ class NetWorthService:
                 logger.debug(
                     "Failed to create snapshot group for manual save", exc_info=True
                 )
+        return snapshot_group_id
+
+    async def save_networth_snapshots(
+        self, character_ids: list[int], snapshot_group_id: int | None = None
+    ) -> dict[int, int]:
+        """Calculate and save net worth snapshots for many characters at once.
+
+        Valuation goes through calculate_networth_many, so every distinct type
+        is priced once and each component is one grouped query, instead of a
+        full calculation per character. One price snapshot covers the batch.
+
+        Args:
+            character_ids: Character IDs
+            snapshot_group_id: Snapshot group to save into (a manual group is
+                created when None)
+
+        Returns:
+            Dict mapping character_id -> snapshot ID for the snapshots saved
+        """
+        await self._ensure_schema()
+        snapshots = await self.calculate_networth_many(character_ids)
+        if not snapshots:
+            return {}
+        snapshot_group_id = await self._ensure_snapshot_group(snapshot_group_id)
+
+        snapshot_time = next(iter(snapshots.values())).snapshot_time
+        price_snapshot_id = await self._save_price_snapshot(
+            snapshot_time, snapshot_group_id, f"{len(snapshots)} characters"
+        )
+        saved: dict[int, int] = {}
+        for character_id, snapshot in snapshots.items():
+            snapshot.snapshot_group_id = snapshot_group_id
+            try:
+                saved[character_id] = await self._persist_snapshot(
+                    character_id, snapshot, snapshot_group_id, price_snapshot_id
+                )
+            except Exception:
+                logger.debug(
+                    "Skipping net worth snapshot for character %d",
+                    character_id,
+                    exc_info=True,
+                )
+        return saved
+
+    async def _save_price_snapshot(
+        self,
+        snapshot_time: datetime,
+        snapshot_group_id: int | None,
+        subject: str,
+    ) -> int | None:
+        """Save the prices used by the last valuation, when they are new.
+
+        Args:
+            snapshot_time: Time of the net worth snapshot(s) being saved
+            snapshot_group_id: Snapshot group to associate with
+            subject: What was valued, for the snapshot notes
+
+        Returns:
+            Price snapshot ID, or None when no snapshot was needed
+        """
+        if not (self._last_used_prices and self._fuzzwork):
+            return None
+        price_snapshot_id = None
+        try:
+            # Check if we should save a price snapshot
+            custom_count = sum(
+                1 for _, (_, src) in self._last_used_prices.items() if src == "custom"
+            )
+
+            should_save = False
+
+            # Always save if there are custom prices
+            if custom_count > 0:
+                should_save = True
+                logger.debug(
+                    "Price snapshot needed: %d custom prices used", custom_count
+                )
+            else:
+                # Check if Fuzzwork data is newer than last snapshot
+                fuzz_time = self._fuzzwork.get_snapshot_time()
+                if fuzz_time:
+                    recent_snapshots = await prices.get_snapshots(self._repo, limit=1)
+                    if not recent_snapshots:
+                        should_save = True
+                        logger.debug("Price snapshot needed: no previous snapshots")
+                    else:
+                        last_snapshot_time = recent_snapshots[0].snapshot_time
+                        if fuzz_time > last_snapshot_time:
+                            should_save = True
+                            logger.debug(
+                                "Price snapshot needed: Fuzzwork data updated (fuzz=%s > last=%s)",
+                                fuzz_time.isoformat(),
+                                last_snapshot_time.isoformat(),
+                            )
+                        else:
+                            logger.debug(
+                                "Skipping price snapshot: Fuzzwork data unchanged (fuzz=%s <= last=%s)",
+                                fuzz_time.isoformat(),
+                                last_snapshot_time.isoformat(),
+                            )
 
-        snapshot = await self.calculate_networth(character_id)
-        snapshot.snapshot_group_id = snapshot_group_id
+            if should_save:
+                market_data: list[FuzzworkMarketDataPoint] = []
+                for type_id, (
+                    price_value,
+                    source,
+                ) in self._last_used_prices.items():
+                    region_data = {}
+
+                    fuzz_data = self._fuzzwork.get_market_data(type_id)
+                    if fuzz_data and fuzz_data.region_data:
+                        region_data = fuzz_data.region_data
+
+                    if source == "custom" or not region_data:
+                        region_data[0] = FuzzworkRegionMarketData(
+                            region_id=0,
+                            sell_stats=FuzzworkMarketStats(
+                                weighted_average=price_value,
+                                max_price=price_value,
+                                min_price=price_value,
+                                stddev=0.0,
+                                median=price_value,
+                                volume=0,
+                                num_orders=0,
+                                five_percent=price_value,
+                            ),
+                            buy_stats=None,
+                        )
+
+                    market_data.append(
+                        FuzzworkMarketDataPoint(
+                            type_id=type_id,
+                            snapshot_time=snapshot_time,
+                            region_data=region_data,
+                        )
+                    )
+
+                if market_data:
+                    price_snapshot_id = await prices.save_snapshot(
+                        self._repo,
+                        market_data,
+                        notes=f"Networth snapshot for {subject} "
+                        f"(includes {custom_count} custom prices)",
+                        snapshot_group_id=snapshot_group_id,
+                    )
+                    self._prices.on_price_snapshot_saved()
+        except Exception:
+            logger.exception("Failed to save price snapshot", exc_info=True)
+        return price_snapshot_id
 
+    async def _persist_snapshot(
+        self,
+        character_id: int,
+        snapshot: NetWorthSnapshot,
+        snapshot_group_id: int | None,
+        price_snapshot_id: int | None,
+    ) -> int:
+        """Save a calculated snapshot with the character's asset snapshot."""
         asset_snapshot_id = None
         try:
             raw_assets = await assets.get_current_assets(self._repo, character_id)
@@ -619,97 +1029,6 @@ class NetWorthService:
         except Exception:
             logger.debug("Failed to verify contract items", exc_info=True)
 
-        price_snapshot_id = None
-        if self._last_used_prices and self._fuzzwork:
-            try:
-                # Check if we should save a price snapshot
-                custom_count = sum(
-                    1
-                    for _, (_, src) in self._last_used_prices.items()
-                    if src == "custom"
-                )
-
-                should_save = False
-
-                # Always save if there are custom prices
-                if custom_count > 0:
-                    should_save = True
-                    logger.debug(
-                        "Price snapshot needed: %d custom prices used", custom_count
-                    )
-                else:
-                    # Check if Fuzzwork data is newer than last snapshot
-                    fuzz_time = self._fuzzwork.get_snapshot_time()
-                    if fuzz_time:
-                        recent_snapshots = await prices.get_snapshots(
-                            self._repo, limit=1
-                        )
-                        if not recent_snapshots:
-                            should_save = True
-                            logger.debug("Price snapshot needed: no previous snapshots")
-                        else:
-                            last_snapshot_time = recent_snapshots[0].snapshot_time
-                            if fuzz_time > last_snapshot_time:
-                                should_save = True
-                                logger.debug(
-                                    "Price snapshot needed: Fuzzwork data updated (fuzz=%s > last=%s)",
-                                    fuzz_time.isoformat(),
-                                    last_snapshot_time.isoformat(),
-                                )
-                            else:
-                                logger.debug(
-                                    "Skipping price snapshot: Fuzzwork data unchanged (fuzz=%s <= last=%s)",
-                                    fuzz_time.isoformat(),
-                                    last_snapshot_time.isoformat(),
-                                )
-
-                if should_save:
-                    market_data: list[FuzzworkMarketDataPoint] = []
-                    for type_id, (
-                        price_value,
-                        source,
-                    ) in self._last_used_prices.items():
-                        region_data = {}
-
-                        fuzz_data = self._fuzzwork.get_market_data(type_id)
-                        if fuzz_data and fuzz_data.region_data:
-                            region_data = fuzz_data.region_data
-
-                        if source == "custom" or not region_data:
-                            region_data[0] = FuzzworkRegionMarketData(
-                                region_id=0,
-                                sell_stats=FuzzworkMarketStats(
-                                    weighted_average=price_value,
-                                    max_price=price_value,
-                                    min_price=price_value,
-                                    stddev=0.0,
-                                    median=price_value,
-                                    volume=0,
-                                    num_orders=0,
-                                    five_percent=price_value,
-                                ),
-                                buy_stats=None,
-                            )
-
-                        market_data.append(
-                            FuzzworkMarketDataPoint(
-                                type_id=type_id,
-                                snapshot_time=snapshot.snapshot_time,
-                                region_data=region_data,
-                            )
-                        )
-
-                    if market_data:
-                        price_snapshot_id = await prices.save_snapshot(
-                            self._repo,
-                            market_data,
-                            notes=f"Networth snapshot for character {character_id} "
-                            f"(includes {custom_count} custom prices)",
-                            snapshot_group_id=snapshot_group_id,
-                        )
-            except Exception:
-                logger.exception("Failed to save price snapshot", exc_info=True)
-
         try:
             # Pass account and group to persistence
             snapshot_id = await networth.save_snapshot(
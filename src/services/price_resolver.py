@@ -0,0 +1,383 @@
+"""Effective price table shared by valuation consumers.
+
+Compiles the user's market preferences (trade hub, price type, weighted ratio),
+custom overrides, live Fuzzwork data and the latest stored price snapshot into
+one ``type_id -> price`` table so every consumer reads the same numbers with
+O(1) lookups instead of re-deriving them per item.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from data.repositories import prices
+
+if TYPE_CHECKING:
+    from data import FuzzworkProvider
+    from data.repositories import Repository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class MarketPreferences:
+    """Snapshot of the market valuation settings a price table was built from."""
+
+    trade_hub: str = "jita"
+    region_id: int = prices.JITA_REGION_ID
+    price_type: str = "sell"
+    weighted_buy_ratio: float = 0.3
+    blueprint_valuation: str = "custom"
+
+
+class PriceResolver:
+    """Compile market preferences into a single effective price table.
+
+    Precedence per type: custom override > live market (Fuzzwork) > latest
+    stored snapshot. The table is rebuilt only when invalidated (market
+    preference change, new market data); custom price edits patch a single
+    entry.
+
+    Every rebuild or patch bumps ``revision``; ``changed_types`` reports which
+    entries moved since a revision so incremental consumers only reprice those.
+    The stored-snapshot layer is reloaded by ``ensure_ready`` after a new
+    snapshot is saved or the market data source is swapped.
+    """
+
+    def __init__(
+        self,
+        repository: Repository | None = None,
+        fuzzwork_provider: FuzzworkProvider | None = None,
+        settings_manager: Any | None = None,
+    ) -> None:
+        self._repo = repository
+        self._fuzzwork = fuzzwork_provider
+        self._settings = settings_manager
+
+        self._preferences = MarketPreferences()
+        self._custom_prices: dict[int, float] = {}
+        self._market_prices: dict[int, float | None] = {}
+        self._history_prices: dict[int, float] = {}
+        self._table: dict[int, tuple[float, str]] = {}
+
+        # Live market table is complete once compiled from a loaded provider;
+        # until then individual types are resolved on demand and memoized.
+        self._market_complete = False
+        self._custom_complete = False
+        self._dirty = True
+        self._history_dirty = True
+
+        # Change tracking for incremental consumers
+        self._revision = 0
+        self._full_revision = 0
+        self._changed_at: dict[int, int] = {}
+        # Custom price edits received while stale, reported by the next rebuild
+        self._pending_changes: set[int] = set()
+        self._compiled_preferences: MarketPreferences | None = None
+
+    # ------------------------------------------------------------------
+    # Invalidation (connected to signal bus by the UI layer)
+    # ------------------------------------------------------------------
+
+    def invalidate(self) -> None:
+        """Mark the table stale; the next lookup recompiles it.
+
+        Connected to ``market_preferences_changed``.
+        """
+        self._dirty = True
+        self._history_dirty = True
+
+    def on_custom_price_changed(self, type_id: int) -> None:
+        """Patch a single entry after a custom price edit.
+
+        Connected to ``custom_price_changed``.
+        """
+        type_id = int(type_id)
+        if self._dirty:
+            # The rebuild reads the new value; make sure it reports it as well
+            self._pending_changes.add(type_id)
+            return
+        custom = self._read_custom_price(type_id)
+        if custom is None:
+            self._custom_prices.pop(type_id, None)
+        else:
+            self._custom_prices[type_id] = custom
+        self._table.pop(type_id, None)
+        self._merge_entry(type_id)
+        self._revision += 1
+        self._changed_at[type_id] = self._revision
+
+    def on_price_snapshot_saved(self) -> None:
+        """Reload the stored-snapshot layer on the next ``ensure_ready``."""
+        self._history_dirty = True
+
+    def set_fuzzwork_provider(self, provider: FuzzworkProvider | None) -> None:
+        """Swap the live market data source and invalidate the live layer.
+
+        New market data usually comes with a new stored snapshot, so the
+        snapshot layer is reloaded as well.
+        """
+        self._fuzzwork = provider
+        self._dirty = True
+        self._history_dirty = True
+
+    # ------------------------------------------------------------------
+    # Compilation
+    # ------------------------------------------------------------------
+
+    def _read_preferences(self) -> MarketPreferences:
+        settings = self._settings
+        if not settings or not hasattr(settings, "get_market_source_station"):
+            return MarketPreferences()
+        trade_hub = (settings.get_market_source_station() or "jita").lower()
+        return MarketPreferences(
+            trade_hub=trade_hub,
+            region_id=prices.region_for_trade_hub(trade_hub),
+            price_type=settings.get_market_price_type() or "sell",
+            weighted_buy_ratio=float(settings.get_market_weighted_buy_ratio()),
+            blueprint_valuation=(
+                settings.get_blueprint_valuation()
+                if hasattr(settings, "get_blueprint_valuation")
+                else "custom"
+            ),
+        )
+
+    def _read_custom_price(self, type_id: int) -> float | None:
+        if not self._settings:
+            return None
+        custom = self._settings.get_custom_price(type_id)
+        if custom and custom.get("sell") is not None:
+            return float(custom["sell"])
+        return None
+
+    def _compile_custom_table(self) -> None:
+        self._custom_prices = {}
+        self._custom_complete = False
+        if not self._settings:
+            self._custom_complete = True
+            return
+        try:
+            all_custom = dict(self._settings.get_all_custom_prices())
+            self._custom_prices = {
+                int(type_id): float(entry["sell"])
+                for type_id, entry in all_custom.items()
+                if entry and entry.get("sell") is not None
+            }
+            self._custom_complete = True
+        except Exception:
+            # Settings without bulk access: read overrides per type instead
+            logger.debug("Bulk custom price read unavailable", exc_info=True)
+            self._custom_prices = {}
+
+    def _lookup_custom(self, type_id: int) -> float | None:
+        if self._custom_complete:
+            return self._custom_prices.get(type_id)
+        return self._read_custom_price(type_id)
+
+    def _lookup_market(self, type_id: int) -> float | None:
+        if type_id in self._market_prices:
+            return self._market_prices[type_id]
+        if self._market_complete:
+            return None
+        price = self._live_price(type_id)
+        if self._fuzzwork is not None and self._fuzzwork.is_loaded:
+            self._market_prices[type_id] = price
+        return price
+
+    def _live_price(self, type_id: int) -> float | None:
+        """Resolve one type from live Fuzzwork data using the compiled preferences."""
+        if not self._fuzzwork or not self._fuzzwork.is_loaded:
+            return None
+        market_data = self._fuzzwork.get_market_data(type_id)
+        if not market_data or not market_data.region_data:
+            return None
+        return self._price_from_region_data(market_data.region_data)
+
+    def _price_from_region_data(self, region_data_map: dict) -> float | None:
+        prefs = self._preferences
+        region_data = region_data_map.get(prefs.region_id)
+        # Fallback to any available region if preferred not found
+        if not region_data:
+            region_data = next((rd for rd in region_data_map.values() if rd), None)
+            if region_data is None:
+                return None
+
+        buy = region_data.buy_stats
+        sell = region_data.sell_stats
+        return prices.select_preferred_price(
+            (buy.median, buy.weighted_average, buy.max_price) if buy else (),
+            (sell.median, sell.weighted_average, sell.max_price) if sell else (),
+            prefs.price_type,
+            prefs.weighted_buy_ratio,
+        )
+
+    def _compile_market_table(self) -> None:
+        self._market_prices = {}
+        self._market_complete = False
+        if not self._fuzzwork:
+            # No provider: the (empty) live layer is complete until one is set
+            self._market_complete = True
+            return
+        if not self._fuzzwork.is_loaded:
+            return
+        try:
+            for point in self._fuzzwork.get_all_market_data():
+                self._market_prices[point.type_id] = (
+                    self._price_from_region_data(point.region_data)
+                    if point.region_data
+                    else None
+                )
+            self._market_complete = True
+        except Exception:
+            # Provider without bulk access: fall back to per-type memoization
+            logger.debug("Bulk market compile unavailable", exc_info=True)
+            self._market_prices = {}
+
+    def _merge_entry(self, type_id: int) -> tuple[float, str] | None:
+        custom = self._lookup_custom(type_id)
+        if custom is not None:
+            entry = (custom, "custom")
+        else:
+            market = self._lookup_market(type_id)
+            if market is not None:
+                entry = (market, "market")
+            else:
+                history = self._history_prices.get(type_id)
+                if history is None:
+                    return None
+                entry = (history, "history")
+        self._table[type_id] = entry
+        return entry
+
+    def _rebuild(self) -> None:
+        previous = self._table
+        self._preferences = self._read_preferences()
+        self._compile_custom_table()
+        self._compile_market_table()
+        self._table = {}
+        for type_id in (
+            self._custom_prices.keys()
+            | self._history_prices.keys()
+            | self._market_prices.keys()
+        ):
+            self._merge_entry(type_id)
+        self._dirty = False
+        self._record_changes(previous)
+        logger.debug(
+            "Price table compiled: %d entries (hub=%s, type=%s, custom=%d, "
+            "market=%d, history=%d)",
+            len(self._table),
+            self._preferences.trade_hub,
+            self._preferences.price_type,
+            len(self._custom_prices),
+            len(self._market_prices),
+            len(self._history_prices),
+        )
+
+    def _record_changes(self, previous: dict[int, tuple[float, str]]) -> None:
+        """Bump the revision and note which entries differ from ``previous``.
+
+        A preference change or a partially compiled table (entries resolved on
+        demand) cannot be diffed, so it marks a full revision instead.
+        """
+        self._revision += 1
+        complete = self._market_complete and self._custom_complete
+        if self._preferences != self._compiled_preferences or not complete:
+            self._full_revision = self._revision
+            self._changed_at = {}
+        else:
+            for type_id in previous.keys() | self._table.keys():
+                if previous.get(type_id) != self._table.get(type_id):
+                    self._changed_at[type_id] = self._revision
+            for type_id in self._pending_changes:
+                self._changed_at[type_id] = self._revision
+        self._pending_changes = set()
+        self._compiled_preferences = self._preferences
+
+    def _ensure_compiled(self) -> None:
+        if self._dirty:
+            self._rebuild()
+
+    async def ensure_ready(self) -> None:
+        """Compile the table, loading the stored-snapshot layer if it is stale."""
+        if self._history_dirty:
+            self._preferences = self._read_preferences()
+            self._history_prices = {}
+            if self._repo is not None:
+                try:
+                    self._history_prices = await prices.get_latest_snapshot_prices(
+                        self._repo,
+                        region_id=self._preferences.region_id,
+                        price_type=self._preferences.price_type,
+                        weighted_buy_ratio=self._preferences.weighted_buy_ratio,
+                    )
+                except Exception:
+                    logger.warning("Failed to load snapshot prices", exc_info=True)
+            self._history_dirty = False
+            self._dirty = True
+        self._ensure_compiled()
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    @property
+    def revision(self) -> int:
+        """Monotonic revision of the compiled table."""
+        self._ensure_compiled()
+        return self._revision
+
+    def changed_types(self, since_revision: int) -> set[int] | None:
+        """Types whose effective price changed after ``since_revision``.
+
+        Returns:
+            Set of type IDs, or None when everything must be repriced (market
+            preferences changed or the table could not be diffed)
+        """
+        self._ensure_compiled()
+        if since_revision < self._full_revision:
+            return None
+        return {t for t, rev in self._changed_at.items() if rev > since_revision}
+
+    @property
+    def preferences(self) -> MarketPreferences:
+        """Market preferences the current table was compiled from."""
+        self._ensure_compiled()
+        return self._preferences
+
+    def get_price(self, type_id: int) -> float | None:
+        """Effective unit price (custom > market > stored snapshot)."""
+        entry = self.get_price_with_source(type_id)
+        return entry[0] if entry else None
+
+    def get_price_with_source(self, type_id: int) -> tuple[float, str] | None:
+        """Effective unit price and its source ("custom", "market", "history")."""
+        self._ensure_compiled()
+        entry = self._table.get(type_id)
+        if entry is None and not (self._market_complete and self._custom_complete):
+            entry = self._merge_entry(type_id)
+        return entry
+
+    def get_custom_price(self, type_id: int) -> float | None:
+        """Custom sell override for a type, if any."""
+        self._ensure_compiled()
+        return self._lookup_custom(type_id)
+
+    def get_market_price(self, type_id: int) -> float | None:
+        """Live market price for a type under the current preferences."""
+        self._ensure_compiled()
+        return self._lookup_market(type_id)
+
+    def get_history_price(self, type_id: int) -> float | None:
+        """Price from the latest stored snapshot under the current preferences."""
+        return self._history_prices.get(type_id)
+
+    def price_table(self) -> dict[int, float]:
+        """Return the compiled effective price table as ``type_id -> price``."""
+        self._ensure_compiled()
+        return {type_id: entry[0] for type_id, entry in self._table.items()}
+
+
+__all__ = ["MarketPreferences", "PriceResolver"]
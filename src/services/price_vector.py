@@ -0,0 +1,63 @@
+"""Effective price table as sorted NumPy arrays for vectorized lookups."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from services.price_resolver import PriceResolver
+
+logger = logging.getLogger(__name__)
+
+
+class PriceVector:
+    """Sorted ``type_id -> price`` arrays rebuilt once per resolver revision."""
+
+    def __init__(self, price_resolver: PriceResolver):
+        self._prices = price_resolver
+        self._revision: int | None = None
+        self._ids = np.empty(0, dtype=np.int64)
+        self._values = np.empty(0, dtype=np.float64)
+
+    @property
+    def revision(self) -> int:
+        """Price resolver revision the next lookup will price against."""
+        return self._prices.revision
+
+    def arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """Sorted type IDs and their effective prices."""
+        revision = self._prices.revision
+        if revision != self._revision:
+            table = self._prices.price_table()
+            ids = np.fromiter(table.keys(), dtype=np.int64, count=len(table))
+            values = np.fromiter(table.values(), dtype=np.float64, count=len(table))
+            order = np.argsort(ids)
+            self._ids = ids[order]
+            self._values = values[order]
+            self._revision = revision
+            logger.debug(
+                "Price vector rebuilt: %d types (revision %d)", len(table), revision
+            )
+        return self._ids, self._values
+
+    def lookup(self, type_ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Look up effective unit prices for an array of type IDs.
+
+        Returns:
+            Tuple of (prices, found); unpriced types get a price of 0.0
+        """
+        ids, values = self.arrays()
+        if not len(ids):
+            return (
+                np.zeros(len(type_ids), dtype=np.float64),
+                np.zeros(len(type_ids), dtype=bool),
+            )
+        pos = np.minimum(np.searchsorted(ids, type_ids), len(ids) - 1)
+        found = ids[pos] == type_ids
+        return np.where(found, values[pos], 0.0), found
+
+
+__all__ = ["PriceVector"]
@@ -0,0 +1,128 @@
+"""Vectorized reprocessing value engine.
+
+Values what a set of items would reprocess into against the effective price
+table. Items are matched to rows of the SDE reprocessing matrix, their
+material entries are gathered, scaled by whole portions and the yield,
+floored per material as in game, priced with one sorted lookup and summed
+per item with a scatter-add.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from data.csr import gather_rows
+from services.price_vector import PriceVector
+
+if TYPE_CHECKING:
+    from data import SDEProvider
+    from data.type_materials import ReprocessingMatrix
+    from services.price_resolver import PriceResolver
+
+logger = logging.getLogger(__name__)
+
+# Base yield of an NPC station without skills or implants
+DEFAULT_REPROCESSING_YIELD = 0.5
+
+
+class ReprocessingEngine:
+    """Compute reprocessing yields and values of many items at once."""
+
+    def __init__(self, sde_provider: SDEProvider, price_resolver: PriceResolver):
+        self._sde = sde_provider
+        self._price_vector = PriceVector(price_resolver)
+
+    def matrix(self) -> ReprocessingMatrix:
+        """Reprocessing matrix the engine currently computes against."""
+        return self._sde.get_reprocessing_matrix()
+
+    def _recovered(
+        self,
+        type_ids: Iterable[int] | np.ndarray,
+        quantities: Iterable[int] | np.ndarray,
+        yield_rate: float | np.ndarray,
+    ) -> tuple[int, np.ndarray, np.ndarray, np.ndarray]:
+        """Recovered material entries for the given items.
+
+        Returns:
+            Tuple of (item count, item position per entry, material type ID
+            per entry, recovered units per entry)
+        """
+        matrix = self.matrix()
+        rows = matrix.rows_of(type_ids)
+        qty = np.asarray(
+            quantities if isinstance(quantities, np.ndarray) else list(quantities),
+            dtype=np.int64,
+        )
+        if qty.shape != rows.shape:
+            raise ValueError(f"Expected {len(rows)} quantities, got {qty.shape}")
+        rates = np.broadcast_to(np.asarray(yield_rate, dtype=np.float64), rows.shape)
+
+        known = np.flatnonzero(rows >= 0)
+        entry_pos, entries = gather_rows(matrix.indptr, rows[known])
+        items = known[entry_pos]
+        portions = qty[items] // matrix.portion_sizes[rows[items]]
+        units = np.floor(portions * matrix.quantities[entries] * rates[items])
+        return len(rows), items, matrix.material_type_ids[entries], units
+
+    def reprocess_values(
+        self,
+        type_ids: Iterable[int] | np.ndarray,
+        quantities: Iterable[int] | np.ndarray,
+        *,
+        yield_rate: float | np.ndarray = DEFAULT_REPROCESSING_YIELD,
+    ) -> np.ndarray:
+        """Value of reprocessing each item stack.
+
+        Only whole portions are reprocessed, and each material is rounded
+        down per stack.
+
+        Args:
+            type_ids: Type ID per item stack
+            quantities: Units per item stack
+            yield_rate: Reprocessing yield (0-1), scalar or one per stack
+
+        Returns:
+            Reprocess value per stack in ISK (0.0 where not reprocessable),
+            aligned with ``type_ids``
+        """
+        count, items, materials, units = self._recovered(
+            type_ids, quantities, yield_rate
+        )
+        prices, _found = self._price_vector.lookup(materials)
+        return np.bincount(items, weights=units * prices, minlength=count)
+
+    def material_yields(
+        self,
+        type_ids: Iterable[int] | np.ndarray,
+        quantities: Iterable[int] | np.ndarray,
+        *,
+        yield_rate: float | np.ndarray = DEFAULT_REPROCESSING_YIELD,
+    ) -> dict[int, int]:
+        """Total materials recovered from reprocessing a set of item stacks.
+
+        Args:
+            type_ids: Type ID per item stack
+            quantities: Units per item stack
+            yield_rate: Reprocessing yield (0-1), scalar or one per stack
+
+        Returns:
+            Dict mapping material type_id -> recovered units
+        """
+        _count, _items, materials, units = self._recovered(
+            type_ids, quantities, yield_rate
+        )
+        ids, inverse = np.unique(materials, return_inverse=True)
+        totals = np.bincount(inverse, weights=units, minlength=len(ids))
+        return {
+            type_id: int(total)
+            for type_id, total in zip(ids.tolist(), totals.tolist(), strict=True)
+            if total > 0
+        }
+
+
+__all__ = ["DEFAULT_REPROCESSING_YIELD", "ReprocessingEngine"]
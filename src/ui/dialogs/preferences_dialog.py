@@ -157,6 +157,29 @@ class PreferencesDialog(QDialog):
 
         layout.addWidget(price_group)
 
+        # Blueprint valuation group
+        blueprint_group = QGroupBox("Blueprint Valuation")
+        blueprint_group.setStyleSheet(AppStyles.GROUP_BOX)
+        blueprint_layout = QFormLayout(blueprint_group)
+
+        self.blueprint_value_combo = QComboBox()
+        self.blueprint_value_combo.addItems(
+            ["Custom Prices Only", "Material Cost", "Product Margin"]
+        )
+        self.blueprint_value_combo.setStyleSheet(AppStyles.COMBOBOX)
+        blueprint_layout.addRow("Blueprint Value:", self.blueprint_value_combo)
+
+        blueprint_help = QLabel(
+            "• Custom Prices Only: Copies count only with a custom price\n"
+            "• Material Cost: Cost of the materials one run consumes\n"
+            "• Product Margin: Product value minus material cost"
+        )
+        blueprint_help.setWordWrap(True)
+        blueprint_help.setStyleSheet(AppStyles.LABEL_INFO)
+        blueprint_layout.addRow("", blueprint_help)
+
+        layout.addWidget(blueprint_group)
+
         layout.addStretch()
         return widget
 
@@ -229,6 +252,11 @@ class PreferencesDialog(QDialog):
         self.weighted_spin.setValue(self._settings.get_market_weighted_buy_ratio())
         self._on_price_type_changed(self.price_type_combo.currentText())
 
+        blueprint_index = {"custom": 0, "material_cost": 1, "product_margin": 2}.get(
+            self._settings.get_blueprint_valuation(), 0
+        )
+        self.blueprint_value_combo.setCurrentIndex(blueprint_index)
+
         # Logging
         self.log_file_checkbox.setChecked(self._settings.get_logging_save_to_file())
         self.retention_spin.setValue(self._settings.get_logging_retention_count())
@@ -258,6 +286,7 @@ class PreferencesDialog(QDialog):
             # Track old values to detect changes
             old_station = self._settings.get_market_source_station()
             old_type = self._settings.get_market_price_type()
+            old_blueprint = self._settings.get_blueprint_valuation()
 
             # Market values
             station_map = ["jita", "amarr", "dodixie", "rens", "hek"]
@@ -270,6 +299,10 @@ class PreferencesDialog(QDialog):
 
             self._settings.set_market_weighted_buy_ratio(self.weighted_spin.value())
 
+            blueprint_map = ["custom", "material_cost", "product_margin"]
+            new_blueprint = blueprint_map[self.blueprint_value_combo.currentIndex()]
+            self._settings.set_blueprint_valuation(new_blueprint)
+
             # Logging
             self._settings.set_logging_save_to_file(self.log_file_checkbox.isChecked())
             self._settings.set_logging_retention_count(self.retention_spin.value())
@@ -281,7 +314,11 @@ class PreferencesDialog(QDialog):
             logger.info("User preferences saved successfully")
 
             # Emit signal if market preferences changed
-            if old_station != new_station or old_type != new_type:
+            if (
+                old_station != new_station
+                or old_type != new_type
+                or old_blueprint != new_blueprint
+            ):
                 from ui.signal_bus import get_signal_bus
 
                 signal_bus = get_signal_bus()
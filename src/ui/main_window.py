@@ -22,6 +22,7 @@ from qasync import QEventLoop, asyncSlot
 from data import FuzzworkProvider
 from data.clients import FuzzworkClient
 from data.parsers.fuzzwork_csv import FuzzworkCSVParser
+from services.location_refresher import LocationRefresher
 from services.networth_service import NetWorthService
 from ui.dialogs import PreferencesDialog
 from ui.dialogs.auth_dialog import AuthDialog
@@ -71,9 +72,26 @@ class MainWindow(QMainWindow):
         self._market_service = container.resolve("market_service")
         self._contract_service = container.resolve("contract_service")
         self._industry_service = container.resolve("industry_service")
+        self._price_resolver = container.resolve("price_resolver")
+        self._reprocessing = container.resolve("reprocessing")
+        # Keep the shared price table in step with preference/custom price edits.
+        # Connected before any tab is created so tab slots read the updated table.
+        self._signal_bus.market_preferences_changed.connect(
+            self._price_resolver.invalidate
+        )
+        self._signal_bus.custom_price_changed.connect(
+            self._price_resolver.on_custom_price_changed
+        )
 
         self._background_tasks: set[asyncio.Task] = set()
 
+        # Refreshes stale structure names off the asset-load path
+        self._location_refresher = LocationRefresher(
+            self._location_service,
+            self._esi_client,
+            on_resolved=self._on_locations_refreshed,
+        )
+
         # Fuzzwork client and provider - will be initialized async
         self._fuzzwork_client = FuzzworkClient()
         self._fuzzwork_provider: FuzzworkProvider | None = None
@@ -208,6 +226,11 @@ class MainWindow(QMainWindow):
         self._background_tasks.add(refresh_task)
         refresh_task.add_done_callback(lambda t: self._background_tasks.discard(t))
 
+        # 4. Refresh stale structure names within the background ESI budget
+        location_task = self._location_refresher.start()
+        self._background_tasks.add(location_task)
+        location_task.add_done_callback(lambda t: self._background_tasks.discard(t))
+
     async def _refresh_characters_from_esi(self):
         """Fetch fresh character data from ESI in background.
 
@@ -238,17 +261,25 @@ class MainWindow(QMainWindow):
                         "Downloading SDE update...", total=100
                     )
 
-                # Download the update
-                success = await self._sde_client.download_sde(latest_build)
+                # Download the update, only the changed tables if possible
+                success, changes = await self._sde_client.update_sde(latest_build)
 
                 if success:
                     logger.info("SDE updated successfully")
                     if hasattr(self, "_progress_widget"):
                         self._progress_widget.complete("SDE updated")
 
-                    # Clear and rebuild SDE provider caches
-                    self._sde_provider.clear_cache()
-                    await self._sde_provider.initialize_async()
+                    # Patch the changed records in place, else rebuild caches.
+                    # The store file is patched off-thread; the provider only
+                    # swaps to it here, on the thread that reads its caches.
+                    patch = changes is not None and await asyncio.to_thread(
+                        self._sde_provider.patch_sde_store, changes
+                    )
+                    if patch:
+                        self._sde_provider.adopt_patched_store(patch)
+                    else:
+                        self._sde_provider.clear_cache()
+                        await self._sde_provider.initialize_async()
                 else:
                     logger.warning("SDE update failed")
                     if hasattr(self, "_progress_widget"):
@@ -296,6 +327,7 @@ class MainWindow(QMainWindow):
                     )
                 parser = FuzzworkCSVParser(csv_text)
                 self._fuzzwork_provider = FuzzworkProvider(parser)
+                self._price_resolver.set_fuzzwork_provider(self._fuzzwork_provider)
 
                 # Now create NetWorthService with the provider
                 self._networth_service = NetWorthService(
@@ -305,6 +337,7 @@ class MainWindow(QMainWindow):
                     settings_manager=self._settings,
                     sde_provider=self._sde_provider,
                     location_service=self._location_service,
+                    price_resolver=self._price_resolver,
                 )
 
                 # Update the CharactersTab with the networth_service and fuzzwork_provider
@@ -405,6 +438,8 @@ class MainWindow(QMainWindow):
             asset_service=self._asset_service,
             location_service=self._location_service,
             fuzzwork_provider=self._fuzzwork_provider,
+            price_resolver=self._price_resolver,
+            reprocessing_engine=self._reprocessing,
         )
         self.tab_widget.addTab(self.assets_tab, "Assets")
 
@@ -527,6 +562,7 @@ class MainWindow(QMainWindow):
         self._signal_bus.error_occurred.connect(self._on_error)
         self._signal_bus.info_message.connect(self._on_info)
         self._signal_bus.character_selected.connect(self._on_character_selected)
+        self._signal_bus.characters_loaded.connect(self._on_characters_loaded)
 
         # Connect global progress signals
         self._signal_bus.progress_start.connect(self._on_progress_start)
@@ -535,6 +571,21 @@ class MainWindow(QMainWindow):
         self._signal_bus.progress_error.connect(self._on_progress_error)
         self._signal_bus.progress_cancel_requested.connect(self._on_progress_cancel)
 
+    def _on_characters_loaded(self, characters: list) -> None:
+        """Let the location refresher use every authenticated character."""
+        self._location_refresher.set_characters(
+            character.character_id for character in characters
+        )
+
+    def _on_locations_refreshed(self, locations: dict) -> None:
+        """Broadcast structure names resolved by the background refresher."""
+        names = {
+            location_id: loc.custom_name or loc.name
+            for location_id, loc in locations.items()
+        }
+        self._signal_bus.locations_refreshed.emit(names)
+        self._signal_bus.structures_resolved.emit(len(names))
+
     def _on_progress_cancel(self) -> None:
         """Handle progress widget cancel button click."""
         # Cancel background tasks
@@ -21,6 +21,7 @@ class SignalBus(QObject):
     # Structure/location signals
     structures_resolving = pyqtSignal(int, int)  # Emits (current, total) for progress
     structures_resolved = pyqtSignal(int)  # Emits count of structures resolved
+    locations_refreshed = pyqtSignal(dict)  # Emits {location_id: display name}
 
     # Authentication signals
     auth_started = pyqtSignal()
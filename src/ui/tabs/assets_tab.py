@@ -13,10 +13,12 @@ from PyQt6.QtWidgets import QLabel, QMenu, QVBoxLayout, QWidget
 
 from data import FuzzworkProvider
 from data.clients import ESIClient
-from data.repositories import prices
+from data.repositories.prices import TRADE_HUB_SYSTEM_IDS
 from services.asset_service import AssetService
 from services.character_service import CharacterService
 from services.location_service import LocationService
+from services.price_resolver import PriceResolver
+from services.reprocessing import ReprocessingEngine
 from ui.dialogs.custom_location_dialog import CustomLocationDialog
 from ui.dialogs.custom_overrides_dialog import CustomOverridesDialog
 from ui.dialogs.custom_price_dialog import CustomPriceDialog
@@ -43,6 +45,8 @@ class AssetsTab(QWidget):
         asset_service: AssetService,
         location_service: LocationService,
         fuzzwork_provider: FuzzworkProvider | None = None,
+        price_resolver: PriceResolver | None = None,
+        reprocessing_engine: ReprocessingEngine | None = None,
         parent=None,
     ):
         super().__init__(parent)
@@ -56,6 +60,18 @@ class AssetsTab(QWidget):
         self._repo = getattr(
             asset_service, "_repo", None
         )  # Access repository from asset service
+        # Shared effective price table; a private one is created when running
+        # standalone and kept in sync through the same signals below.
+        self._owns_price_resolver = price_resolver is None
+        self._prices = price_resolver or PriceResolver(
+            self._repo, fuzzwork_provider, self._settings
+        )
+        # Reprocess values shown next to market values (needs the SDE)
+        if reprocessing_engine is None:
+            sde = getattr(asset_service, "_sde", None)
+            if sde is not None:
+                reprocessing_engine = ReprocessingEngine(sde, self._prices)
+        self._reprocessing = reprocessing_engine
         self._background_tasks: set[asyncio.Task] = set()
         # Track pending repricing when market data is not yet available
         self._pending_price_refresh = False
@@ -66,9 +82,11 @@ class AssetsTab(QWidget):
             ("owner_character_name", "Owner"),
             ("system_name", "System"),
             ("location_display", "Location"),
+            ("hub_jumps", "Jumps (Hub)"),
             ("type_name", "Name"),
             ("market_value", "Value (Unit)"),
             ("total_value", "Value (Total)"),
+            ("reprocess_value", "Reprocess (Total)"),
             ("quantity", "Count"),
             ("base_price", "Price (Base)"),
             ("volume", "Volume (Unit)"),
@@ -82,9 +100,11 @@ class AssetsTab(QWidget):
             ColumnSpec("owner_character_name", "Owner", "text"),
             ColumnSpec("system_name", "System", "text"),
             ColumnSpec("location_display", "Location", "text"),
+            ColumnSpec("hub_jumps", "Jumps (Hub)", "int"),
             ColumnSpec("type_name", "Name", "text"),
             ColumnSpec("market_value", "Value (Unit)", "float"),
             ColumnSpec("total_value", "Value (Total)", "float"),
+            ColumnSpec("reprocess_value", "Reprocess (Total)", "float"),
             ColumnSpec("quantity", "Count", "int"),
             ColumnSpec("base_price", "Price (Base)", "float"),
             ColumnSpec("volume", "Volume (Unit)", "float"),
@@ -141,7 +161,7 @@ class AssetsTab(QWidget):
         # target to attach to. This prevents AttributeError on self.table when
         # the filter_changed signal fires early.
         self.table = AdvancedTableView()
-        self.table.setup(self._columns)
+        self.table.setup(self._columns, columnar=True)
         self.table.set_context_menu_builder(self._build_context_menu)
 
         # Initialize filter spec storage (will be populated by _on_filter_changed)
@@ -203,6 +223,12 @@ class AssetsTab(QWidget):
 
     def _connect_signals(self) -> None:
         """Connect signal bus signals for realtime updates."""
+        if self._owns_price_resolver:
+            # Connect before the tab's own slots so the table is current when read
+            self._signal_bus.market_preferences_changed.connect(self._prices.invalidate)
+            self._signal_bus.custom_price_changed.connect(
+                self._prices.on_custom_price_changed
+            )
         self._signal_bus.custom_price_changed.connect(self._on_custom_price_changed)
 
         # Use wrapper with DIRECT connection to bypass Qt's signal queue corruption
@@ -212,6 +238,7 @@ class AssetsTab(QWidget):
 
         # Force direct (blocking) connection to avoid signal queue corruption
         self._signal_bus.custom_location_changed.connect(location_changed_wrapper)
+        self._signal_bus.locations_refreshed.connect(self._on_locations_refreshed)
         self._signal_bus.character_added.connect(self._on_character_added)
         self._signal_bus.character_removed.connect(self._on_character_removed)
 
@@ -239,16 +266,12 @@ class AssetsTab(QWidget):
 
         # Build advanced filter predicate
         spec = getattr(self, "_current_filter_spec", None)
+        # Passed through as is: a compiled filter lets the columnar table
+        # evaluate it on column arrays instead of row by row
         advanced_pred = FilterWidget.build_predicate(spec) if spec else None
 
-        def predicate(row: dict) -> bool:
-            # Apply advanced filter
-            if advanced_pred:
-                return advanced_pred(row)
-            return True
-
         try:
-            self.table.set_predicate(predicate)
+            self.table.set_predicate(advanced_pred)
         except Exception:
             logger.exception("Failed to apply assets filter predicate")
 
@@ -314,54 +337,26 @@ class AssetsTab(QWidget):
                 )
                 character_assets.append((char, enriched))
 
-            # Load prices from latest database snapshot with user preferences
-            snapshot_prices: dict[int, float] = {}
-            if self._repo:
-                trade_hub = (
-                    self._settings.get_market_source_station()
-                    if self._settings
-                    else "jita"
-                )
-                price_type = (
-                    self._settings.get_market_price_type() if self._settings else "sell"
-                )
-                weighted_ratio = (
-                    self._settings.get_market_weighted_buy_ratio()
-                    if self._settings
-                    else 0.3
-                )
-                # Map hub to region ID
-                hub_to_region = {
-                    "jita": 10000002,
-                    "amarr": 10000043,
-                    "dodixie": 10000032,
-                    "rens": 10000030,
-                    "hek": 10000042,
-                }
-                region_id = hub_to_region.get(trade_hub.lower(), 10000002)
-
-                try:
-                    snapshot_prices = await prices.get_latest_snapshot_prices(
-                        self._repo,
-                        region_id=region_id,
-                        price_type=price_type,
-                        weighted_buy_ratio=weighted_ratio,
-                    )
-                except Exception as e:
-                    logger.warning("Failed to load snapshot prices: %s", e)
+            # Compile effective prices (custom > market > latest snapshot)
+            try:
+                await self._prices.ensure_ready()
+            except Exception as e:
+                logger.warning("Failed to load snapshot prices: %s", e)
 
             # Now build rows with enriched assets (locations already resolved)
             for _char, enriched in character_assets:
                 for ea in enriched:
-                    # Apply prices in priority order: custom > blueprint-copy > snapshot > base
-                    custom_price = self._settings.get_custom_price(ea.type_id)
-                    if custom_price and custom_price.get("sell") is not None:
-                        ea.market_value = custom_price["sell"]
+                    # Apply prices in priority order: custom > blueprint-copy > effective > base
+                    custom_price = self._prices.get_custom_price(ea.type_id)
+                    if custom_price is not None:
+                        ea.market_value = custom_price
                     # Apply blueprint copy 0-pricing if no custom price
                     elif ea.is_blueprint_copy is True:
                         ea.market_value = 0.0
-                    elif ea.type_id in snapshot_prices:
-                        ea.market_value = snapshot_prices[ea.type_id]
+                    else:
+                        price = self._prices.get_price(ea.type_id)
+                        if price is not None:
+                            ea.market_value = price
                     # Otherwise market_value remains as set from repository (or None)
 
                     # Apply custom location overrides (name/system) for cached startup
@@ -422,6 +417,8 @@ class AssetsTab(QWidget):
                         pass
                     rows.append(row)
 
+            self._apply_reprocess_values(rows)
+            self._apply_hub_jumps(rows)
             self._rows_cache = rows
             self.table.set_rows(rows)
 
@@ -466,12 +463,13 @@ class AssetsTab(QWidget):
                     getattr(char, "character_name", str(char.character_id)),
                     refresh_locations=True,  # Refresh locations on explicit update
                 )
+                await self._prices.ensure_ready()
                 for enriched_asset in enriched:
-                    # Apply fuzzwork price if no market_value set
-                    if enriched_asset.market_value is None and self._fuzzwork:
-                        fuzz_price = self._get_fuzzwork_price(enriched_asset.type_id)
-                        if fuzz_price:
-                            enriched_asset.market_value = fuzz_price
+                    # Apply effective price if no market_value set
+                    if enriched_asset.market_value is None:
+                        price = self._prices.get_price(enriched_asset.type_id)
+                        if price:
+                            enriched_asset.market_value = price
 
                     # Apply blueprint copy 0-pricing (before custom price check)
                     # This ensures custom prices can override the 0.0 default if set
@@ -479,12 +477,10 @@ class AssetsTab(QWidget):
                     if enriched_asset.is_blueprint_copy is True:
                         enriched_asset.market_value = 0.0
 
-                    # Apply custom price from settings (overrides all, including blueprint 0.0)
-                    custom_price = self._settings.get_custom_price(
-                        enriched_asset.type_id
-                    )
-                    if custom_price and custom_price.get("sell") is not None:
-                        enriched_asset.market_value = custom_price["sell"]
+                    # Apply custom price (overrides all, including blueprint 0.0)
+                    custom_price = self._prices.get_custom_price(enriched_asset.type_id)
+                    if custom_price is not None:
+                        enriched_asset.market_value = custom_price
 
                     # Apply custom location data (name and optional system override)
                     if enriched_asset.structure_id:
@@ -550,6 +546,8 @@ class AssetsTab(QWidget):
                     except Exception:
                         pass
                     rows.append(row)
+            self._apply_reprocess_values(rows)
+            self._apply_hub_jumps(rows)
             self._rows_cache = rows
             self.table.set_rows(rows)
             self._signal_bus.status_message.emit(
@@ -716,19 +714,19 @@ class AssetsTab(QWidget):
 
     def _on_custom_price_changed(self, type_id: int) -> None:
         """Update displayed prices when custom price changes or is removed."""
-        custom = self._settings.get_custom_price(type_id)
+        custom = self._prices.get_custom_price(type_id)
         # Update cached rows for all matching type_ids
         for row in self._rows_cache:
             if row.get("type_id") == type_id:
-                if custom and custom.get("sell") is not None:
+                if custom is not None:
                     # Apply custom unit price
-                    row["market_value"] = custom["sell"]
+                    row["market_value"] = custom
                 # Apply blueprint copy 0-pricing if no custom price
                 elif row.get("is_blueprint_copy") is True:
                     row["market_value"] = 0.0
                 else:
-                    # Custom removed: revert to fuzzwork or base price
-                    fallback = self._get_fuzzwork_price(type_id)
+                    # Custom removed: revert to effective market/snapshot or base price
+                    fallback = self._prices.get_price(type_id)
                     if fallback is not None:
                         row["market_value"] = fallback
                     else:
@@ -754,6 +752,8 @@ class AssetsTab(QWidget):
                         unit_f = 0.0
                 # Calculate total; preserve 0.0 for blueprint copies (don't treat as missing)
                 row["total_value"] = unit_f * qty if unit_f is not None else None
+        # A material price change moves the reprocess value of other types too
+        self._apply_reprocess_values(self._rows_cache)
         # Refresh table
         self.table.set_rows(self._rows_cache)
 
@@ -765,42 +765,10 @@ class AssetsTab(QWidget):
         task.add_done_callback(self._background_tasks.discard)
 
     async def _refresh_all_prices_async(self) -> None:
-        """Asynchronously load snapshot prices and update all cached rows."""
+        """Asynchronously recompile the price table and update all cached rows."""
         try:
-            # Load prices from latest snapshot with current preferences
-            snapshot_prices: dict[int, float] = {}
-            if self._repo:
-                trade_hub = (
-                    self._settings.get_market_source_station()
-                    if self._settings
-                    else "jita"
-                )
-                price_type = (
-                    self._settings.get_market_price_type() if self._settings else "sell"
-                )
-                weighted_ratio = (
-                    self._settings.get_market_weighted_buy_ratio()
-                    if self._settings
-                    else 0.3
-                )
-                # Map hub to region ID
-                hub_to_region = {
-                    "jita": 10000002,
-                    "amarr": 10000043,
-                    "dodixie": 10000032,
-                    "rens": 10000030,
-                    "hek": 10000042,
-                }
-                region_id = hub_to_region.get(trade_hub.lower(), 10000002)
-
-                snapshot_prices = await prices.get_latest_snapshot_prices(
-                    self._repo,
-                    region_id=region_id,
-                    price_type=price_type,
-                    weighted_buy_ratio=weighted_ratio,
-                )
-
-            self._refresh_all_prices_with_data(snapshot_prices)
+            await self._prices.ensure_ready()
+            self._refresh_all_prices_with_data(self._prices.price_table())
         except Exception as e:
             logger.exception("Failed to refresh prices from snapshot: %s", e)
 
@@ -811,10 +779,11 @@ class AssetsTab(QWidget):
         logger.debug("Fuzzwork provider ready (informational only for assets tab)")
 
     def _refresh_all_prices_with_data(self, snapshot_prices: dict[int, float]) -> None:
-        """Update market and total values using provided snapshot prices.
+        """Update market and total values using provided effective prices.
 
         Args:
-            snapshot_prices: Dict of type_id -> price from database snapshot
+            snapshot_prices: Dict of type_id -> effective price (custom overrides
+                included) from the shared price table
         """
         # Update all rows with new prices
         for row in self._rows_cache:
@@ -823,9 +792,9 @@ class AssetsTab(QWidget):
                 continue
 
             # Check if custom price exists (takes priority)
-            custom = self._settings.get_custom_price(type_id)
-            if custom and custom.get("sell") is not None:
-                row["market_value"] = custom["sell"]
+            custom = self._prices.get_custom_price(type_id)
+            if custom is not None:
+                row["market_value"] = custom
             # Apply blueprint copy 0-pricing
             elif row.get("is_blueprint_copy") is True:
                 row["market_value"] = 0.0
@@ -856,12 +825,61 @@ class AssetsTab(QWidget):
             # Calculate total; preserve 0.0 for blueprint copies (don't treat as missing)
             row["total_value"] = unit_f * qty if unit_f is not None else None
 
+        self._apply_reprocess_values(self._rows_cache)
+        # The market hub may have changed with the preferences
+        self._apply_hub_jumps(self._rows_cache)
+
         # Refresh table display
         self.table.set_rows(self._rows_cache)
         logger.info(
             "Refreshed %d asset rows with snapshot prices", len(self._rows_cache)
         )
 
+    def _apply_reprocess_values(self, rows: list[dict[str, Any]]) -> None:
+        """Set each row's reprocess value from one vectorized computation."""
+        if self._reprocessing is None or not rows:
+            return
+        try:
+            values = self._reprocessing.reprocess_values(
+                [int(row.get("type_id") or 0) for row in rows],
+                [int(row.get("quantity") or 0) for row in rows],
+            )
+        except Exception:
+            logger.debug("Reprocess valuation failed", exc_info=True)
+            return
+        for row, value in zip(rows, values.tolist(), strict=True):
+            row["reprocess_value"] = value
+
+    def _apply_hub_jumps(self, rows: list[dict[str, Any]]) -> None:
+        """Set each row's stargate jumps from the market hub in one lookup."""
+        if self._location_service is None or not rows:
+            return
+        hub = (self._settings.get_market_source_station() or "jita").lower()
+        try:
+            jumps = self._location_service.jump_distances(
+                TRADE_HUB_SYSTEM_IDS.get(hub, TRADE_HUB_SYSTEM_IDS["jita"]),
+                [row.get("system_id") for row in rows],
+            )
+        except Exception:
+            logger.debug("Jump distance lookup failed", exc_info=True)
+            return
+        for row, hops in zip(rows, jumps, strict=True):
+            row["hub_jumps"] = hops
+
+    def _on_locations_refreshed(self, names: dict) -> None:
+        """Show structure names resolved by the background refresher.
+
+        Rows are updated in place so the table keeps its scroll position,
+        selection, sort and filter while the refresher runs.
+        """
+        updates = {
+            structure_id: {"structure_name": name, "location_display": name}
+            for structure_id, name in names.items()
+            if name
+        }
+        if updates:
+            self.table.update_rows_by_key("structure_id", updates)
+
     def _on_custom_location_changed(self, location_id: int) -> None:
         """Update displayed location info when custom location data changes."""
         logger.debug(
@@ -1088,76 +1106,6 @@ class AssetsTab(QWidget):
         # Non-critical; continue silently
         pass
 
-    def _get_fuzzwork_price(self, type_id: int) -> float | None:
-        """Get price from fuzzwork data respecting user preferences.
-
-        Respects trade hub and price type (buy/sell/weighted) preferences.
-        """
-        if not self._fuzzwork or not self._fuzzwork.is_loaded:
-            return None
-        market_data = self._fuzzwork.get_market_data(type_id)
-        if not market_data or not market_data.region_data:
-            return None
-
-        # Get user preferences for market valuation
-        trade_hub = (
-            self._settings.get_market_source_station() if self._settings else "jita"
-        )
-        price_type = (
-            self._settings.get_market_price_type() if self._settings else "sell"
-        )
-
-        # Map trade hub names to region IDs
-        hub_to_region = {
-            "jita": 10000002,  # The Forge
-            "amarr": 10000043,  # Domain
-            "dodixie": 10000032,  # Sinq Laison
-            "rens": 10000030,  # Heimatar
-            "hek": 10000042,  # Metropolis
-        }
-
-        preferred_region_id = hub_to_region.get(trade_hub.lower(), 10000002)
-
-        # Try to get data from preferred region first
-        region_data = market_data.region_data.get(preferred_region_id)
-
-        # Fallback to any available region if preferred not found
-        if not region_data:
-            for region_data in market_data.region_data.values():
-                if region_data:
-                    break
-            else:
-                return None
-
-        # Extract price based on user preference
-        if price_type == "buy" and region_data.buy_stats:
-            return region_data.buy_stats.median
-        if price_type == "sell" and region_data.sell_stats:
-            return region_data.sell_stats.median
-        if price_type == "weighted":
-            # Weighted average: default 30% buy, 70% sell
-            weighted_ratio = (
-                self._settings.get_market_weighted_buy_ratio()
-                if self._settings
-                else 0.3
-            )
-            buy_price = region_data.buy_stats.median if region_data.buy_stats else 0
-            sell_price = region_data.sell_stats.median if region_data.sell_stats else 0
-            if buy_price > 0 and sell_price > 0:
-                return (buy_price * weighted_ratio) + (
-                    sell_price * (1 - weighted_ratio)
-                )
-            if sell_price > 0:
-                return sell_price
-            if buy_price > 0:
-                return buy_price
-
-        # Final fallback to sell price
-        if region_data.sell_stats:
-            return region_data.sell_stats.median
-
-        return None
-
     def _restore_column_state(self) -> None:
         """Restore column visibility, order, and widths from settings."""
         ui_settings = self._settings.get_ui_settings("assets")
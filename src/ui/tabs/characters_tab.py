@@ -334,16 +334,7 @@ class CharactersTab(QWidget):
 
             # Persist networth snapshot without group ID
             if self._networth_service is not None:
-                try:
-                    await self._networth_service.save_networth_snapshot(
-                        character_id, snapshot_group_id
-                    )
-                except Exception:
-                    logger.debug(
-                        "Failed to snapshot networth after refresh for %s",
-                        character_id,
-                        exc_info=True,
-                    )
+                await self._save_networth_snapshots([character_id], snapshot_group_id)
 
                 char_widget = self._find_character_widget(character_id)
                 if char_widget:
@@ -447,7 +438,9 @@ class CharactersTab(QWidget):
 
                 # Also update networth service's provider reference if available
                 if self._networth_service:
-                    self._networth_service._fuzzwork = self._fuzzwork_provider  # noqa: SLF001
+                    self._networth_service.set_fuzzwork_provider(
+                        self._fuzzwork_provider
+                    )
 
                 logger.info("Fuzzwork market data refreshed successfully")
                 self._signal_bus.status_message.emit("Market data updated")
@@ -648,34 +641,13 @@ class CharactersTab(QWidget):
                 total_failures += char_failures
                 completed_endpoints += len(results)
 
-                # Save networth snapshot
-                if self._networth_service is not None:
-                    try:
-                        await self._networth_service.save_networth_snapshot(
-                            character_id, snapshot_group_id
-                        )
-                    except Exception:
-                        logger.debug(
-                            "Failed to snapshot networth after refresh for %s",
-                            character_id,
-                            exc_info=True,
-                        )
+                # Publish endpoint timers now that endpoints have been fetched
+                self._publish_endpoint_timers(character_id)
 
-                # Update character widget
-                char_widget = self._find_character_widget(character_id)
-                if char_widget:
-                    character = next(
-                        (
-                            c
-                            for c in self._last_loaded_characters
-                            if getattr(c, "character_id", 0) == character_id
-                        ),
-                        None,
-                    )
-                    if character:
-                        await self._load_networth(character, char_widget)
-                        # Publish endpoint timers now that endpoints have been fetched
-                        self._publish_endpoint_timers(character_id)
+            # Snapshot net worth for the whole account at once
+            if self._networth_service is not None:
+                await self._save_networth_snapshots(character_ids, snapshot_group_id)
+                await self._reload_networth_widgets(character_ids)
 
             # Complete progress via signal bus
             if total_failures > 0:
@@ -814,67 +786,8 @@ class CharactersTab(QWidget):
                     # Update completed endpoints count
                     completed_characters[0] += len(results)
 
-                    # Save networth snapshot
-                    if self._networth_service is not None:
-                        try:
-                            await self._networth_service.save_networth_snapshot(
-                                character_id, snapshot_group_id
-                            )
-                        except Exception:
-                            logger.debug(
-                                "Failed to snapshot networth after refresh for %s",
-                                character_id,
-                                exc_info=True,
-                            )
-
-                    # Update character widget (schedule networth update as separate task)
-                    char_widget = self._find_character_widget(character_id)
-                    if char_widget:
-                        character = next(
-                            (
-                                c
-                                for c in self._last_loaded_characters
-                                if getattr(c, "character_id", 0) == character_id
-                            ),
-                            None,
-                        )
-                        if character and self._networth_service:
-                            # Schedule networth load as independent task to avoid nesting issues
-                            async def update_widget_networth():
-                                try:
-                                    latest = await self._networth_service.get_latest_networth(
-                                        character_id
-                                    )
-                                    if char_widget and not char_widget.isHidden():
-                                        existing_timers = (
-                                            char_widget._endpoint_timers.copy()  # noqa: SLF001
-                                            if hasattr(char_widget, "_endpoint_timers")
-                                            else {}
-                                        )
-                                        char_widget.set_networth(latest)
-                                        if (
-                                            existing_timers
-                                            and char_widget._endpoint_timers  # noqa: SLF001
-                                            != existing_timers
-                                        ):
-                                            char_widget.set_endpoint_timers(
-                                                existing_timers
-                                            )
-                                        char_widget._networth_snapshot = latest  # noqa: SLF001
-                                        char_widget.set_networth_visible(True)
-                                except Exception:
-                                    logger.debug(
-                                        "Failed to update networth for character %s",
-                                        character_id,
-                                        exc_info=True,
-                                    )
-
-                            task = asyncio.create_task(update_widget_networth())
-                            self._background_tasks.add(task)
-                            task.add_done_callback(self._background_tasks.discard)
-
-                            # Publish endpoint timers now that endpoints have been fetched
-                            self._publish_endpoint_timers(character_id)
+                    # Publish endpoint timers now that endpoints have been fetched
+                    self._publish_endpoint_timers(character_id)
 
                     return character_id, results
 
@@ -885,6 +798,13 @@ class CharactersTab(QWidget):
             ]
             all_results = await asyncio.gather(*tasks, return_exceptions=True)
 
+            # Snapshot net worth for all characters at once
+            if self._networth_service is not None and not (
+                self._cancel_token and self._cancel_token.is_cancelled
+            ):
+                await self._save_networth_snapshots(character_ids, snapshot_group_id)
+                await self._reload_networth_widgets(character_ids)
+
             # Count successes and failures from all results
             for result in all_results:
                 if isinstance(result, Exception):
@@ -935,6 +855,40 @@ class CharactersTab(QWidget):
             self._cancel_token = None
             self._request_account_relayout()
 
+    async def _save_networth_snapshots(
+        self, character_ids: list[int], snapshot_group_id: int | None
+    ) -> None:
+        """Save net worth snapshots for refreshed characters in one batch."""
+        if self._networth_service is None:
+            return
+        try:
+            await self._networth_service.save_networth_snapshots(
+                character_ids, snapshot_group_id
+            )
+        except Exception:
+            logger.debug(
+                "Failed to snapshot networth after refresh for %s",
+                character_ids,
+                exc_info=True,
+            )
+
+    async def _reload_networth_widgets(self, character_ids: list[int]) -> None:
+        """Show the latest saved net worth on the refreshed characters' cards."""
+        for character_id in character_ids:
+            char_widget = self._find_character_widget(character_id)
+            if not char_widget:
+                continue
+            character = next(
+                (
+                    c
+                    for c in self._last_loaded_characters
+                    if getattr(c, "character_id", 0) == character_id
+                ),
+                None,
+            )
+            if character:
+                await self._load_networth(character, char_widget)
+
     async def _refresh_character_endpoints_parallel_batch(
         self,
         character_id: int,
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import deque
+from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
@@ -43,6 +45,12 @@ ACTIVITY_NAMES = {
     9: "Reaction",
 }
 
+# Countdown tick: every second while a visible job ends within a minute,
+# otherwise coarser (and never later than the next job completion)
+COUNTDOWN_FINE_MS = 1000
+COUNTDOWN_COARSE_MS = 10_000
+COUNTDOWN_FINE_WINDOW_SECONDS = 60
+
 
 class IndustryJobsTab(QWidget):
     """Industry jobs view with activity and status filtering."""
@@ -91,14 +99,17 @@ class IndustryJobsTab(QWidget):
             ColumnSpec("cost", "Cost", "float"),
         ]
 
-        self._setup_ui()
-        self._connect_signals()
         self._rows_cache: list[dict[str, Any]] = []
         self._jobs_cache: list[EveIndustryJob] = []  # Cache for countdown updates
+        self._jobs_by_id: dict[str, EveIndustryJob] = {}
+        # Active/paused jobs by end date, consumed as they complete
+        self._ending: deque[EveIndustryJob] = deque()
+        self._setup_ui()
+        self._connect_signals()
 
-        # Setup countdown timer (1 second interval for accurate updates)
+        # Setup countdown timer (interval adapts to the visible jobs)
         self._countdown_timer = QTimer(self)
-        self._countdown_timer.setInterval(1000)  # 1 second
+        self._countdown_timer.setInterval(COUNTDOWN_FINE_MS)
         self._countdown_timer.timeout.connect(self._update_countdowns)
         # Timer will be started/stopped based on active jobs presence
 
@@ -143,6 +154,13 @@ class IndustryJobsTab(QWidget):
         self._table = AdvancedTableView()
         self._table.setup(self._columns)
         self._table.set_context_menu_builder(self._build_context_menu)
+        # Countdown cells are computed when painted, so off-screen rows are
+        # only brought up to date once they scroll into view
+        for key in ("status", "remaining_time"):
+            self._table.set_computed_column(key, self._countdown_cell(key))
+        scroll_bar = self._table.verticalScrollBar()
+        if scroll_bar is not None:
+            scroll_bar.valueChanged.connect(self._on_table_scrolled)
         main_layout.addWidget(self._table)
 
         # Summary label
@@ -256,6 +274,13 @@ class IndustryJobsTab(QWidget):
 
             # Convert jobs to row data with enriched names
             self._jobs_cache = all_jobs  # Store for countdown updates
+            self._jobs_by_id = {str(job.job_id): job for job in all_jobs}
+            self._ending = deque(
+                sorted(
+                    (job for job in all_jobs if job.status in ("active", "paused")),
+                    key=lambda job: job.end_date,
+                )
+            )
             self._rows_cache = [
                 self._job_to_row(job, facility_names) for job in all_jobs
             ]
@@ -279,13 +304,7 @@ class IndustryJobsTab(QWidget):
         activity_name = ACTIVITY_NAMES.get(
             job.activity_id, f"Activity {job.activity_id}"
         )
-        now = datetime.now(UTC)
-        remaining = job.end_date - now
-        remaining_str = (
-            str(remaining).split(".")[0]
-            if remaining.total_seconds() > 0
-            else "Complete"
-        )
+        countdown = self._countdown(job, datetime.now(UTC))
 
         # Resolve installer name from character cache
         installer_name = self._character_names.get(
@@ -319,13 +338,50 @@ class IndustryJobsTab(QWidget):
             "activity_name": activity_name,
             "product_name": product_name,
             "facility_name": facility_name,
-            "status": job.status.title(),
+            "status": countdown["status"],
             "runs": str(job.runs),
             "cost": f"{job.cost:,.2f}",
             "end_date": job.end_date.isoformat(),
-            "remaining_time": remaining_str,
+            "remaining_time": countdown["remaining_time"],
         }
 
+    @staticmethod
+    def _countdown(job: EveIndustryJob, now: datetime) -> dict[str, Any]:
+        """Status and Time Left cells of a job at ``now``."""
+        remaining_seconds = (job.end_date - now).total_seconds()
+        status = job.status
+        if status in ("active", "paused") and remaining_seconds <= 0:
+            # Finished but not delivered yet
+            status = "ready"
+
+        # Format remaining time (clamp negative to 0)
+        if remaining_seconds > 0:
+            # Format as HH:MM:SS
+            hours = int(remaining_seconds // 3600)
+            minutes = int((remaining_seconds % 3600) // 60)
+            seconds = int(remaining_seconds % 60)
+
+            if hours > 0:
+                remaining_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+            else:
+                remaining_str = f"{minutes:02d}:{seconds:02d}"
+        elif status == "paused":
+            remaining_str = "Paused"
+        else:
+            remaining_str = "Complete"
+        return {"status": status.title(), "remaining_time": remaining_str}
+
+    def _countdown_cell(self, key: str) -> Callable[[dict[str, Any]], Any]:
+        """Compute a countdown column of a row from its job, for painting."""
+
+        def compute(row: dict[str, Any]) -> Any:
+            job = self._jobs_by_id.get(row.get("job_id"))
+            if job is None:
+                return row.get(key)
+            return self._countdown(job, datetime.now(UTC))[key]
+
+        return compute
+
     def _on_activity_changed(self, index: int) -> None:
         """Handle activity filter change."""
         self._on_refresh_clicked()
@@ -389,7 +445,7 @@ class IndustryJobsTab(QWidget):
     def _manage_countdown_timer(self) -> None:
         """Start or stop countdown timer based on active/paused jobs presence."""
         # Check if we have any jobs that need countdown updates
-        has_active = any(job.status in ("active", "paused") for job in self._jobs_cache)
+        has_active = bool(self._ending)
 
         if has_active and not self._countdown_timer.isActive():
             self._countdown_timer.start()
@@ -398,92 +454,80 @@ class IndustryJobsTab(QWidget):
             self._countdown_timer.stop()
             logger.debug("Stopped countdown timer (no active jobs)")
 
-    def _update_countdowns(self) -> None:
-        """Update Time Left column for all jobs without resetting view (called every 1 second).
+    def _on_table_scrolled(self, value: int) -> None:
+        """Re-tick so the interval follows the jobs that scrolled into view."""
+        if self._countdown_timer.isActive():
+            self._update_countdowns()
 
-        Uses update_rows_by_key to mutate only the changed columns (remaining_time, status)
-        while preserving selection, sort order, and filter state.
+    def _update_countdowns(self) -> None:
+        """Update Status and Time Left of visible and just completed jobs.
+
+        Only rows inside the viewport are recomputed; other rows get their
+        values computed when painted. Jobs that complete anywhere are taken
+        off the end-date queue and their rows updated, so filters and the
+        timer see the new status. Uses update_rows_by_key to mutate only the
+        changed columns while preserving selection, sort order, and filter
+        state.
         """
-        if not self._jobs_cache or not self._rows_cache:
+        if not self._jobs_by_id or not self._rows_cache:
             return
 
         try:
             now = datetime.now(UTC)
             updates: dict[str, dict[str, Any]] = {}  # {job_id: {field: value, ...}}
-            status_changes = []
+            completed: list[EveIndustryJob] = []
 
-            for job in self._jobs_cache:
-                old_status = job.status
-                job_id_str = str(job.job_id)
-
-                # Compute remaining time
-                remaining = job.end_date - now
-                remaining_seconds = remaining.total_seconds()
-
-                # Update status if job just completed
-                if old_status in ("active", "paused") and remaining_seconds <= 0:
-                    # Mark as ready (job finished but not delivered)
+            while self._ending and self._ending[0].end_date <= now:
+                job = self._ending.popleft()
+                if job.status in ("active", "paused"):
                     job.status = "ready"
-                    status_changes.append((job.job_id, "ready"))
-
-                # Format remaining time (clamp negative to 0)
-                if remaining_seconds > 0:
-                    # Format as HH:MM:SS
-                    hours = int(remaining_seconds // 3600)
-                    minutes = int((remaining_seconds % 3600) // 60)
-                    seconds = int(remaining_seconds % 60)
-
-                    if hours > 0:
-                        remaining_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-                    else:
-                        remaining_str = f"{minutes:02d}:{seconds:02d}"
-                elif job.status == "paused":
-                    remaining_str = "Paused"
-                else:
-                    remaining_str = "Complete"
-
-                # Prepare update if changed
-                row_updates: dict[str, Any] = {}
-                for row in self._rows_cache:
-                    if row.get("job_id") == job_id_str:
-                        if row.get("remaining_time") != remaining_str:
-                            row_updates["remaining_time"] = remaining_str
-                        if row.get("status") != job.status.title():
-                            row_updates["status"] = job.status.title()
-                        if row_updates:
-                            updates[job_id_str] = row_updates
-                        break
+                    completed.append(job)
+                    updates[str(job.job_id)] = self._countdown(job, now)
+
+            ends_soon = False
+            for row in self._table.visible_rows():
+                job = self._jobs_by_id.get(row.get("job_id"))
+                if job is None:
+                    continue
+                changed = {
+                    field: value
+                    for field, value in self._countdown(job, now).items()
+                    if row.get(field) != value
+                }
+                if changed:
+                    updates.setdefault(row["job_id"], {}).update(changed)
+                if job.status in ("active", "paused") and (
+                    (job.end_date - now).total_seconds()
+                    <= COUNTDOWN_FINE_WINDOW_SECONDS
+                ):
+                    ends_soon = True
 
             # Update table rows using new API (preserves selection)
             if updates:
                 self._table.update_rows_by_key("job_id", updates)
 
-            # Preserve selection by job IDs
-            selected_job_ids = set()
-            sel_model = self._table.selectionModel()
-            if sel_model is not None:
-                for idx in sel_model.selectedIndexes():
-                    row_idx = idx.row()
-                    if row_idx < len(self._rows_cache):
-                        job_id = self._rows_cache[row_idx].get("job_id")
-                        if job_id:
-                            selected_job_ids.add(job_id)
-
-            # Reapply selection after updates
-            if selected_job_ids:
-                self._table.select_rows_by_key("job_id", selected_job_ids)
-
             # Log status changes
-            if status_changes:
+            if completed:
                 logger.info(
                     "Industry jobs completed: %s",
-                    ", ".join(f"#{job_id}" for job_id, _ in status_changes),
+                    ", ".join(f"#{job.job_id}" for job in completed),
                 )
 
             # Stop timer if no more active jobs
-            if not any(job.status in ("active", "paused") for job in self._jobs_cache):
+            if not self._ending:
                 self._countdown_timer.stop()
                 logger.debug("All jobs completed, stopped countdown timer")
+                return
+
+            interval = COUNTDOWN_FINE_MS
+            if not ends_soon:
+                # Wake up for the next completion even if it is off-screen
+                until_next = (self._ending[0].end_date - now).total_seconds()
+                interval = int(
+                    min(COUNTDOWN_COARSE_MS, max(COUNTDOWN_FINE_MS, until_next * 1000))
+                )
+            if self._countdown_timer.interval() != interval:
+                self._countdown_timer.setInterval(interval)
 
         except Exception as e:
             logger.error("Error updating countdowns: %s", e, exc_info=True)
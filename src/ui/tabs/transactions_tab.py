@@ -112,7 +112,7 @@ class TransactionsTab(QWidget):
 
         # Table view
         self._table = AdvancedTableView()
-        self._table.setup(self._columns)
+        self._table.setup(self._columns, columnar=True)
         self._table.set_context_menu_builder(self._build_context_menu)
         main_layout.addWidget(self._table)
 
@@ -263,18 +263,11 @@ class TransactionsTab(QWidget):
 
     def _on_filter_changed(self, filter_spec: dict) -> None:
         """Handle filter changes."""
-        # Apply filter to cached rows
-        filtered_rows = self._apply_filters(self._rows_cache, filter_spec)
-        self._table.set_rows(filtered_rows)
+        # The table filters its own rows, off the UI thread when there are many
+        predicate = FilterWidget.build_predicate(filter_spec) if filter_spec else None
+        self._table.set_predicate(predicate)
         self._update_summary()
 
-    def _apply_filters(
-        self, rows: list[dict[str, Any]], filter_spec: dict
-    ) -> list[dict[str, Any]]:
-        """Apply filters to rows."""
-        # Simple implementation - filter widget handles complex logic
-        return rows
-
     def _update_summary(self) -> None:
         """Update summary label."""
         if not self._rows_cache:
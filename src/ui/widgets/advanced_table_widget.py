@@ -2,18 +2,30 @@
 
 Wraps QTableView with a model built from list[dict] rows and integrates with
 FilterWidget by accepting a predicate function. Provides context menu hooks.
+Large tables can use the columnar model, which sorts and filters through
+index permutations instead of rebuilding row lists, off the UI thread once
+they are big enough.
 """
 
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import Any
 
+import numpy as np
 from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
 from PyQt6.QtWidgets import QHeaderView, QMenu, QTableView, QWidget
 
 from ui.styles import COLORS, AppStyles
+from ui.widgets.columnar_table_model import (
+    ColumnarTableModel,
+    ColumnCache,
+    Mask,
+    build_mask,
+    emit_rows_changed,
+)
+from ui.widgets.filter_compiler import CompiledFilter
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +35,10 @@ class DictTableModel(QAbstractTableModel):
         super().__init__()
         self._columns = columns  # list of (key, title)
         self._rows = rows
+        # key -> {value: row positions}, rebuilt lazily after sort/set_rows
+        self._key_rows: dict[str, dict[Any, list[int]]] = {}
+        # column -> function computing its value from a row when painted
+        self._computed: dict[int, Callable[[dict[str, Any]], Any]] = {}
 
     def rowCount(self, parent: QModelIndex | None = None) -> int:  # noqa: N802
         return len(self._rows)
@@ -35,7 +51,8 @@ class DictTableModel(QAbstractTableModel):
             return None
         key = self._columns[index.column()][0]
         row = self._rows[index.row()]
-        val = row.get(key)
+        compute = self._computed.get(index.column())
+        val = compute(row) if compute else row.get(key)
         if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
             # Format numeric values with thousand separators
             if val is not None and isinstance(val, (int, float)):
@@ -62,11 +79,11 @@ class DictTableModel(QAbstractTableModel):
     def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
         key = self._columns[column][0]
         reverse = order == Qt.SortOrder.DescendingOrder
+        value = self._computed.get(column) or (lambda r: r.get(key))
         try:
             self.layoutAboutToBeChanged.emit()
-            self._rows.sort(
-                key=lambda r: (r.get(key) is None, r.get(key)), reverse=reverse
-            )
+            self._rows.sort(key=lambda r: ((v := value(r)) is None, v), reverse=reverse)
+            self._key_rows.clear()
             self.layoutChanged.emit()
         except Exception:
             pass
@@ -74,11 +91,60 @@ class DictTableModel(QAbstractTableModel):
     def set_rows(self, rows: list[dict[str, Any]]):
         self.beginResetModel()
         self._rows = rows
+        self._key_rows.clear()
         self.endResetModel()
 
     def row_at(self, i: int) -> dict[str, Any]:
         return self._rows[i]
 
+    def set_computed_column(
+        self, key: str, compute: Callable[[dict[str, Any]], Any] | None
+    ) -> None:
+        """Compute a column's values from their row when painted or sorted.
+
+        Used for values that change with time: rows nobody looks at need no
+        updates, since their value is computed fresh once they are painted.
+        Pass None to show the stored row value again.
+        """
+        for column, (col_key, _) in enumerate(self._columns):
+            if col_key == key:
+                if compute is None:
+                    self._computed.pop(column, None)
+                else:
+                    self._computed[column] = compute
+
+    def rows_by_key(self, key: str, values: Iterable[Any]) -> dict[Any, list[int]]:
+        """Row positions of the rows whose ``key`` is one of ``values``."""
+        index = self._key_rows.get(key)
+        if index is None:
+            index = self._key_rows[key] = {}
+            for position, row in enumerate(self._rows):
+                try:
+                    index.setdefault(row.get(key), []).append(position)
+                except TypeError:
+                    continue  # unhashable values cannot be looked up
+        return {value: index[value] for value in values if value in index}
+
+    def update_rows_by_key(self, key: str, updates: dict[Any, dict[str, Any]]) -> None:
+        """Update rows matched by a key value (see ``AdvancedTableView``).
+
+        Emits one ``dataChanged`` per run of consecutive updated rows.
+        """
+        column_of = {col_key: i for i, (col_key, _) in enumerate(self._columns)}
+        changed_rows: list[int] = []
+        changed_columns: set[int] = set()
+        for value, rows in self.rows_by_key(key, updates).items():
+            fields = updates[value]
+            for position in rows:
+                row = self._rows[position]
+                for field, new in fields.items():
+                    if field in self._key_rows and row.get(field) != new:
+                        del self._key_rows[field]
+                row.update(fields)
+            changed_rows.extend(rows)
+            changed_columns.update(column_of[f] for f in fields if f in column_of)
+        emit_rows_changed(self, changed_rows, changed_columns)
+
     def update_row_values(self, row_index: int, updates: dict[str, Any]) -> None:
         """Update specific fields in a row without resetting the model.
 
@@ -93,12 +159,15 @@ class DictTableModel(QAbstractTableModel):
             return
         row = self._rows[row_index]
         for key, value in updates.items():
+            if key in self._key_rows and row.get(key) != value:
+                del self._key_rows[key]
             row[key] = value
         # Emit dataChanged for the affected columns
-        for col_idx, (col_key, _) in enumerate(self._columns):
-            if col_key in updates:
-                index = self.index(row_index, col_idx)
-                self.dataChanged.emit(index, index)
+        emit_rows_changed(
+            self,
+            [row_index],
+            [i for i, (col_key, _) in enumerate(self._columns) if col_key in updates],
+        )
 
 
 class AdvancedTableView(QTableView):
@@ -120,7 +189,7 @@ class AdvancedTableView(QTableView):
         # Allow selecting individual cells for better copy support
         self.setSelectionBehavior(QTableView.SelectionBehavior.SelectItems)
         self.setSelectionMode(QTableView.SelectionMode.ExtendedSelection)
-        self._model: DictTableModel | None = None
+        self._model: DictTableModel | ColumnarTableModel | None = None
         self._full_rows: list[dict[str, Any]] = []
         self._predicate: Callable[[dict[str, Any]], bool] | None = None
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -159,21 +228,33 @@ class AdvancedTableView(QTableView):
             None
         )
 
-    def setup(self, columns: list[tuple[str, str]]) -> None:
-        self._model = DictTableModel(columns, [])
+    def setup(self, columns: list[tuple[str, str]], columnar: bool = False) -> None:
+        """Create the table model.
+
+        Args:
+            columns: (key, title) pairs
+            columnar: Use ``ColumnarTableModel`` (for very large row sets)
+        """
+        if columnar:
+            self._model = ColumnarTableModel(columns, [])
+        else:
+            self._model = DictTableModel(columns, [])
         self.setModel(self._model)
 
     def set_rows(self, rows: list[dict[str, Any]]) -> None:
         self._full_rows = rows
-        self._apply_filter()
+        self._apply_filter(rows_changed=True)
 
     def set_predicate(self, pred: Callable[[dict[str, Any]], bool] | None) -> None:
         self._predicate = pred
         self._apply_filter()
 
-    def _apply_filter(self) -> None:
+    def _apply_filter(self, rows_changed: bool = False) -> None:
         if not self._model:
             return
+        if isinstance(self._model, ColumnarTableModel):
+            self._apply_filter_mask(self._model, rows_changed)
+            return
         if self._predicate:
             filtered = [r for r in self._full_rows if self._predicate(r)]
             # Log warning if filter removes all rows but there were rows to filter
@@ -186,6 +267,64 @@ class AdvancedTableView(QTableView):
             filtered = self._full_rows
         self._model.set_rows(filtered)
 
+    def _apply_filter_mask(self, model: ColumnarTableModel, rows_changed: bool) -> None:
+        """Filter a columnar model with a boolean mask over the full rows.
+
+        Compiled filters build the mask from the model's column arrays;
+        other predicates are evaluated row by row. Either way the mask is
+        computed by the model, on a worker thread for large tables.
+        """
+        predicate = self._predicate
+        mask: Mask = None
+        if predicate:
+            total = len(self._full_rows)
+            if isinstance(predicate, CompiledFilter):
+                build = predicate.mask
+            else:
+
+                def build(columns: ColumnCache) -> np.ndarray:
+                    return build_mask(columns.source_rows, lambda r: bool(predicate(r)))
+
+            def mask(columns: ColumnCache) -> np.ndarray:
+                result = build(columns)
+                if total and not result.any():
+                    logger.warning(
+                        "Filter removed all %d rows - check filter settings", total
+                    )
+                return result
+
+        if rows_changed or model.latest_rows is not self._full_rows:
+            model.set_rows(self._full_rows, mask)
+        else:
+            model.set_mask(mask)
+
+    def set_computed_column(
+        self, key: str, compute: Callable[[dict[str, Any]], Any] | None
+    ) -> None:
+        """Compute a column from its row on demand (see ``DictTableModel``).
+
+        Raises:
+            TypeError: If the table uses the columnar model, whose cached
+                display values and sort keys cannot follow computed values
+        """
+        if isinstance(self._model, ColumnarTableModel):
+            raise TypeError("Computed columns need a DictTableModel table")
+        if self._model:
+            self._model.set_computed_column(key, compute)
+
+    def visible_rows(self) -> list[dict[str, Any]]:
+        """Rows currently inside the viewport (none while the table is hidden)."""
+        if not self._model or not self.isVisible():
+            return []
+        first = self.rowAt(0)
+        if first < 0:
+            return []
+        vp = self.viewport()
+        last = self.rowAt(vp.height() - 1) if vp is not None else -1
+        if last < 0:
+            last = self._model.rowCount() - 1
+        return [self._model.row_at(i) for i in range(first, last + 1)]
+
     def set_context_menu_builder(
         self, builder: Callable[[list[dict[str, Any]]], QMenu]
     ) -> None:
@@ -195,7 +334,9 @@ class AdvancedTableView(QTableView):
         """Update specific rows by key value without resetting the view.
 
         Looks up rows by a key field value and updates their fields. This
-        preserves selection, sort order, and filter state.
+        preserves selection, sort order, and filter state. Rows are found
+        through a key index kept by the model, and changes are signalled
+        once per run of consecutive rows, so a tick costs O(changed rows).
 
         Args:
             key: Column key to match on (e.g., "job_id")
@@ -209,11 +350,7 @@ class AdvancedTableView(QTableView):
         """
         if not self._model:
             return
-        # Find rows matching each key and update them
-        for row_idx, row in enumerate(self._model._rows):
-            row_key_val = row.get(key)
-            if row_key_val in updates:
-                self._model.update_row_values(row_idx, updates[row_key_val])
+        self._model.update_rows_by_key(key, updates)
 
     def select_rows_by_key(self, key: str, values: set[Any]) -> None:
         """Select rows by matching a key field value.
@@ -234,8 +371,8 @@ class AdvancedTableView(QTableView):
             return
         sel_model.clearSelection()
         # Find and select matching rows
-        for row_idx, row in enumerate(self._model._rows):
-            if row.get(key) in values:
+        for rows in self._model.rows_by_key(key, values).values():
+            for row_idx in rows:
                 index = self._model.index(row_idx, 0)
                 sel_model.select(index, QTableView.SelectionFlag.SelectCurrent)
 
@@ -0,0 +1,586 @@
+"""Columnar table model for large row sets.
+
+A drop-in variant of ``DictTableModel`` for tables with hundreds of thousands
+of rows. Rows stay the source of truth, but each column is extracted once
+into a typed array on first use (float64 for numeric columns, with NaN for
+missing values, and order codes for everything else). Sorting is an
+``argsort`` over that key, filtering is a boolean mask, and both only produce
+an index permutation into the source rows. Display strings are formatted
+lazily the first time a cell is painted and cached per cell.
+
+For large row sets the permutation is computed on a worker thread (when an
+asyncio loop is running, i.e. under qasync). The model keeps showing its
+current view meanwhile; a newer request cancels the pending one, and the
+result is swapped in with a single reset once it completes. A thread is used
+rather than a process so the rows never have to be pickled; the NumPy sort
+releases the GIL, and row-wise tests check for cancellation between chunks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from functools import partial
+from typing import Any
+
+import numpy as np
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+logger = logging.getLogger(__name__)
+
+# A mask, or a function computing one from the columns once the rows are set
+Mask = np.ndarray | Callable[["ColumnCache"], np.ndarray] | None
+
+# Rows tested between two cancellation checks in ``build_mask``
+CHUNK_ROWS = 16384
+
+_job = threading.local()
+
+
+class ViewCancelledError(Exception):
+    """Raised inside a view job that a newer request superseded."""
+
+
+def check_cancelled() -> None:
+    """Raise ``ViewCancelledError`` if the view job on this thread was superseded."""
+    event = getattr(_job, "cancelled", None)
+    if event is not None and event.is_set():
+        raise ViewCancelledError
+
+
+def build_mask(values: Sequence[Any], test: Callable[[Any], bool]) -> np.ndarray:
+    """Boolean mask of ``test`` over ``values``, in cancellable chunks."""
+    result = np.empty(len(values), dtype=bool)
+    for start in range(0, len(values), CHUNK_ROWS):
+        check_cancelled()
+        chunk = values[start : start + CHUNK_ROWS]
+        result[start : start + len(chunk)] = np.fromiter(
+            (test(value) for value in chunk), dtype=bool, count=len(chunk)
+        )
+    return result
+
+
+def format_cell(value: Any) -> Any:
+    """Display value for a cell, matching ``DictTableModel`` formatting."""
+    if isinstance(value, float):
+        return f"{value:,.2f}"
+    if isinstance(value, int) and not isinstance(value, bool):
+        return f"{value:,}"
+    return value
+
+
+def contiguous_ranges(positions: Iterable[int]) -> list[tuple[int, int]]:
+    """Sorted (first, last) runs of consecutive positions."""
+    ranges: list[tuple[int, int]] = []
+    for position in sorted(set(positions)):
+        if ranges and ranges[-1][1] == position - 1:
+            ranges[-1] = (ranges[-1][0], position)
+        else:
+            ranges.append((position, position))
+    return ranges
+
+
+def emit_rows_changed(
+    model: QAbstractTableModel, rows: Iterable[int], columns: Iterable[int]
+) -> None:
+    """Emit one ``dataChanged`` per run of consecutive changed rows.
+
+    Each signal spans the leftmost to the rightmost changed column, so a
+    batch of updates costs a handful of signals instead of one per cell.
+    """
+    columns = list(columns)
+    if not columns:
+        return
+    left, right = min(columns), max(columns)
+    for first, last in contiguous_ranges(rows):
+        model.dataChanged.emit(model.index(first, left), model.index(last, right))
+
+
+def _search_text(row: dict[str, Any]) -> str | None:
+    """Lower-cased values of a row joined by NUL, None if every value is None."""
+    texts = [str(value).lower() for value in row.values() if value is not None]
+    return "\0".join(texts) if texts else None
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def column_sort_key(values: Sequence[Any]) -> tuple[np.ndarray, bool]:
+    """Build a float64 sort key for one column.
+
+    Numeric columns use their values; other columns use the rank of each
+    value among the column's distinct values. Missing values are NaN.
+
+    Returns:
+        (key, numeric) where ``numeric`` says whether the key holds the
+        values themselves
+    """
+    if all(value is None or _is_number(value) for value in values):
+        key = np.array(
+            [np.nan if value is None else value for value in values],
+            dtype=np.float64,
+        )
+        return key, True
+    try:
+        distinct = {value for value in values if value is not None}
+        try:
+            ordered = sorted(distinct)
+        except TypeError:
+            ordered = sorted(distinct, key=str)
+        rank = {value: float(i) for i, value in enumerate(ordered)}
+        key = np.array(
+            [np.nan if value is None else rank[value] for value in values],
+            dtype=np.float64,
+        )
+    except TypeError:
+        # Unhashable cell values: order by their text
+        return column_sort_key(
+            [None if value is None else str(value) for value in values]
+        )
+    return key, False
+
+
+def sort_permutation(
+    key: np.ndarray, indices: np.ndarray, descending: bool
+) -> np.ndarray:
+    """Stable order of ``indices`` by ``key``.
+
+    Matches sorting rows with ``(value is None, value)`` keys: missing values
+    go last when ascending and first when descending, and ties keep their
+    current order.
+    """
+    values = key[indices]
+    missing = np.isnan(values)
+    if descending:
+        order = np.lexsort((-values, ~missing))
+    else:
+        order = np.lexsort((values, missing))
+    return indices[order]
+
+
+class ColumnCache:
+    """Column arrays extracted lazily from one list of rows.
+
+    A new cache is made whenever the rows are replaced, so a worker still
+    reading an old one never mixes columns of two row sets.
+    """
+
+    def __init__(self, rows: list[dict[str, Any]]):
+        self.source_rows = rows
+        self._keys: dict[str, tuple[np.ndarray, bool]] = {}
+        self._texts: dict[tuple[str, bool], list[str | None]] = {}
+        self._search: list[str | None] | None = None
+        self._key_rows: dict[str, dict[Any, list[int]]] = {}
+
+    def sort_key(self, key: str) -> tuple[np.ndarray, bool]:
+        """Float64 sort key of a column (see ``column_sort_key``), cached."""
+        cached = self._keys.get(key)
+        if cached is None:
+            cached = self._keys[key] = column_sort_key(
+                [row.get(key) for row in self.source_rows]
+            )
+        return cached
+
+    def numeric_values(self, key: str) -> np.ndarray | None:
+        """A column's values as float64 (NaN if missing), or None if not numeric."""
+        values, numeric = self.sort_key(key)
+        return values if numeric else None
+
+    def text_values(self, key: str, lower: bool = False) -> list[str | None]:
+        """A column's values as strings (None stays None), cached."""
+        cached = self._texts.get((key, lower))
+        if cached is None:
+            values = (row.get(key) for row in self.source_rows)
+            if lower:
+                cached = [None if v is None else str(v).lower() for v in values]
+            else:
+                cached = [None if v is None else str(v) for v in values]
+            self._texts[key, lower] = cached
+        return cached
+
+    def search_text(self) -> list[str | None]:
+        """Per row, every non-None value lower-cased and joined by NUL, cached.
+
+        Used for 'Any Column' searches, which look at all of a row's values
+        (not only the displayed columns).
+        """
+        if self._search is None:
+            self._search = [_search_text(row) for row in self.source_rows]
+        return self._search
+
+    def key_rows(self, key: str) -> dict[Any, list[int]]:
+        """Source indices of the rows holding each value of a column, cached.
+
+        Source indices do not move when the view is sorted or filtered, so
+        the index lives as long as the rows.
+        """
+        cached = self._key_rows.get(key)
+        if cached is None:
+            cached = {}
+            for source, row in enumerate(self.source_rows):
+                try:
+                    cached.setdefault(row.get(key), []).append(source)
+                except TypeError:
+                    continue  # unhashable values cannot be looked up
+            self._key_rows[key] = cached
+        return cached
+
+    def update(self, source: int, updates: dict[str, Any]) -> None:
+        """Set fields of one source row and refresh the cached values."""
+        row = self.source_rows[source]
+        for key, value in updates.items():
+            if key in self._key_rows and row.get(key) != value:
+                del self._key_rows[key]
+            row[key] = value
+            cached = self._keys.get(key)
+            if cached is not None:
+                values, numeric = cached
+                if numeric and (value is None or _is_number(value)):
+                    values[source] = np.nan if value is None else value
+                else:
+                    del self._keys[key]
+            for lower in (False, True):
+                texts = self._texts.get((key, lower))
+                if texts is not None:
+                    text = None if value is None else str(value)
+                    texts[source] = text.lower() if lower and text else text
+        if self._search is not None:
+            self._search[source] = _search_text(row)
+
+
+def compute_view(
+    columns: ColumnCache,
+    mask: Mask,
+    sort_key: str | None,
+    descending: bool,
+    indices: np.ndarray | None = None,
+) -> np.ndarray:
+    """Source row indices to show, filtered by ``mask`` and sorted.
+
+    Args:
+        columns: Column arrays of the rows to show
+        mask: Row mask (see ``Mask``); ignored when ``indices`` is given
+        sort_key: Column key to sort on, None to keep source order
+        descending: Sort direction
+        indices: Already filtered indices to re-sort
+    """
+    if indices is None:
+        if callable(mask):
+            mask = mask(columns)
+        if mask is None:
+            indices = np.arange(len(columns.source_rows), dtype=np.int64)
+        else:
+            indices = np.flatnonzero(mask).astype(np.int64)
+    check_cancelled()
+    if sort_key is None or not len(indices):
+        return indices
+    key, _ = columns.sort_key(sort_key)
+    check_cancelled()
+    return sort_permutation(key, indices, descending)
+
+
+def _run_job(cancelled: threading.Event, *args: Any) -> np.ndarray:
+    """``compute_view`` on a worker thread, cancellable through ``cancelled``."""
+    _job.cancelled = cancelled
+    try:
+        check_cancelled()
+        return compute_view(*args)
+    finally:
+        _job.cancelled = None
+
+
+class ColumnarTableModel(QAbstractTableModel):
+    """Table model that sorts and filters through index permutations."""
+
+    # Row count from which views are computed on a worker thread
+    BACKGROUND_ROWS = 50_000
+
+    def __init__(
+        self,
+        columns: list[tuple[str, str]],
+        rows: list[dict[str, Any]],
+        background_rows: int | None = None,
+    ):
+        super().__init__()
+        self._columns = columns  # list of (key, title)
+        self._rows = rows
+        self._cache = ColumnCache(rows)
+        # Source row index of each visible row
+        self._view = np.arange(len(rows), dtype=np.int64)
+        self._display: list[dict[int, Any]] = [{} for _ in columns]
+        # Visible position of each source row (-1 if filtered out), lazy
+        self._positions: np.ndarray | None = None
+        self._sort_column: int | None = None
+        self._sort_order = Qt.SortOrder.AscendingOrder
+        self._background_rows = (
+            self.BACKGROUND_ROWS if background_rows is None else background_rows
+        )
+        # Most recently requested rows and mask; shown once the job completes
+        self._target = self._cache
+        self._target_mask: Mask = None
+        self._pending: asyncio.Future | None = None
+        self._cancel: threading.Event | None = None
+
+    def rowCount(self, parent: QModelIndex | None = None) -> int:  # noqa: N802
+        return len(self._view)
+
+    def columnCount(self, parent: QModelIndex | None = None) -> int:  # noqa: N802
+        return len(self._columns)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return None
+        source = int(self._view[index.row()])
+        cache = self._display[index.column()]
+        try:
+            return cache[source]
+        except KeyError:
+            key = self._columns[index.column()][0]
+            value = cache[source] = format_cell(self._rows[source].get(key))
+            return value
+
+    def headerData(  # noqa: N802
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._columns[section][1]
+        return section + 1
+
+    def sort_key(self, key: str) -> tuple[np.ndarray, bool]:
+        """Float64 sort key of a shown column (see ``ColumnCache``)."""
+        return self._cache.sort_key(key)
+
+    def numeric_values(self, key: str) -> np.ndarray | None:
+        """A shown column's values as float64, or None if not numeric."""
+        return self._cache.numeric_values(key)
+
+    def text_values(self, key: str, lower: bool = False) -> list[str | None]:
+        """A shown column's values as strings (None stays None)."""
+        return self._cache.text_values(key, lower)
+
+    def search_text(self) -> list[str | None]:
+        """Per shown row, the 'Any Column' search text (see ``ColumnCache``)."""
+        return self._cache.search_text()
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        self._sort_column = column
+        self._sort_order = order
+        try:
+            self._request(reorder=True)
+        except Exception:
+            logger.debug("Columnar sort failed", exc_info=True)
+
+    def set_rows(self, rows: list[dict[str, Any]], mask: Mask = None) -> None:
+        """Replace the source rows, optionally keeping only rows where ``mask``.
+
+        ``mask`` may be a function of the rows' ``ColumnCache``, evaluated
+        once the new rows are in place (e.g. ``CompiledFilter.mask``).
+        """
+        self._target = ColumnCache(rows)
+        self._target_mask = mask
+        self._request()
+
+    def set_mask(self, mask: Mask) -> None:
+        """Show only source rows where ``mask`` is True (all rows when None)."""
+        self._target_mask = mask
+        self._request()
+
+    @property
+    def source_rows(self) -> list[dict[str, Any]]:
+        """All shown rows, including the ones filtered out."""
+        return self._rows
+
+    @property
+    def latest_rows(self) -> list[dict[str, Any]]:
+        """Rows of the latest ``set_rows``, shown once a pending job is done."""
+        return self._target.source_rows
+
+    @property
+    def is_idle(self) -> bool:
+        """Whether the shown view reflects the latest request."""
+        return self._pending is None
+
+    async def wait_until_idle(self) -> None:
+        """Wait until background view jobs have been swapped in."""
+        while self._pending is not None:
+            pending = self._pending
+            await asyncio.wait([pending])
+            if pending is self._pending:
+                # Done callback did not run (e.g. the loop is closing)
+                break
+
+    def _request(self, reorder: bool = False) -> None:
+        """Compute the view for the latest rows, mask and sort order.
+
+        Args:
+            reorder: Only the sort order changed, so the current filtered
+                indices can be re-sorted instead of re-evaluating the mask
+        """
+        columns = self._target
+        indices = None
+        if reorder and self._pending is None and columns is self._cache:
+            indices = self._view
+        sort_key = None
+        if self._sort_column is not None:
+            sort_key = self._columns[self._sort_column][0]
+        args = (
+            columns,
+            self._target_mask,
+            sort_key,
+            self._sort_order == Qt.SortOrder.DescendingOrder,
+            indices,
+        )
+        self._cancel_pending()
+
+        loop = None
+        if len(columns.source_rows) >= self._background_rows:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+        if loop is None:
+            self._swap(columns, compute_view(*args), reorder)
+            return
+
+        cancelled = threading.Event()
+        future = loop.run_in_executor(None, _run_job, cancelled, *args)
+        self._pending, self._cancel = future, cancelled
+        future.add_done_callback(partial(self._on_job_done, columns, reorder))
+
+    def _cancel_pending(self) -> None:
+        if self._pending is not None:
+            if self._cancel is not None:
+                self._cancel.set()
+            self._pending.cancel()
+        self._pending = self._cancel = None
+
+    def _on_job_done(
+        self, columns: ColumnCache, reorder: bool, future: asyncio.Future
+    ) -> None:
+        if future is not self._pending:
+            return  # superseded by a newer request
+        self._pending = self._cancel = None
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            if not isinstance(error, ViewCancelledError):
+                logger.debug("Columnar view job failed", exc_info=error)
+            return
+        self._swap(columns, future.result(), reorder)
+
+    def _swap(self, columns: ColumnCache, view: np.ndarray, reorder: bool) -> None:
+        """Show a computed view (and its rows, if they changed) in one step."""
+        if reorder and columns is self._cache and len(view) == len(self._view):
+            self.layoutAboutToBeChanged.emit()
+            self._view = view
+            self._positions = None
+            self.layoutChanged.emit()
+            return
+        self.beginResetModel()
+        if columns is not self._cache:
+            self._cache = columns
+            self._rows = columns.source_rows
+            self._display = [{} for _ in self._columns]
+        self._view = view
+        self._positions = None
+        self.endResetModel()
+
+    def row_at(self, i: int) -> dict[str, Any]:
+        return self._rows[int(self._view[i])]
+
+    def _source_positions(self) -> np.ndarray:
+        if self._positions is None:
+            positions = np.full(len(self._rows), -1, dtype=np.int64)
+            positions[self._view] = np.arange(len(self._view))
+            self._positions = positions
+        return self._positions
+
+    def rows_by_key(self, key: str, values: Iterable[Any]) -> dict[Any, list[int]]:
+        """Visible row positions of the rows whose ``key`` is one of ``values``.
+
+        Looks rows up through the cached key index, so the cost depends on
+        the number of matches rather than on the size of the table.
+        """
+        index = self._cache.key_rows(key)
+        positions = self._source_positions()
+        found: dict[Any, list[int]] = {}
+        for value in values:
+            rows = [
+                int(positions[s]) for s in index.get(value, ()) if positions[s] >= 0
+            ]
+            if rows:
+                found[value] = rows
+        return found
+
+    def update_rows_by_key(self, key: str, updates: dict[Any, dict[str, Any]]) -> None:
+        """Update rows matched by a key value (see ``AdvancedTableView``).
+
+        Rows hidden by the mask are updated as well, so they show the new
+        values once visible. Emits one ``dataChanged`` per run of
+        consecutive updated visible rows.
+        """
+        column_of = {col_key: i for i, (col_key, _) in enumerate(self._columns)}
+        index = self._cache.key_rows(key)
+        positions = self._source_positions()
+        changed_rows: list[int] = []
+        changed_columns: set[int] = set()
+        for value, fields in updates.items():
+            sources = list(index.get(value, ()))
+            if not sources:
+                continue
+            columns = [column_of[field] for field in fields if field in column_of]
+            for source in sources:
+                self._cache.update(source, fields)
+                for column in columns:
+                    self._display[column].pop(source, None)
+                if positions[source] >= 0:
+                    changed_rows.append(int(positions[source]))
+            changed_columns.update(columns)
+        emit_rows_changed(self, changed_rows, changed_columns)
+
+    def update_row_values(self, row_index: int, updates: dict[str, Any]) -> None:
+        """Update specific fields in a row without resetting the model.
+
+        Emits dataChanged signal for the affected cells so the view updates
+        without losing selection, sort order, or filter state.
+
+        Args:
+            row_index: Index of the row to update
+            updates: Dictionary of {key: new_value} pairs to update
+        """
+        if row_index < 0 or row_index >= len(self._view):
+            return
+        source = int(self._view[row_index])
+        self._cache.update(source, updates)
+        columns = []
+        for col_idx, (col_key, _) in enumerate(self._columns):
+            if col_key in updates:
+                self._display[col_idx].pop(source, None)
+                columns.append(col_idx)
+        emit_rows_changed(self, [row_index], columns)
+
+
+__all__ = [
+    "ColumnCache",
+    "ColumnarTableModel",
+    "ViewCancelledError",
+    "build_mask",
+    "check_cancelled",
+    "column_sort_key",
+    "compute_view",
+    "contiguous_ranges",
+    "emit_rows_changed",
+    "format_cell",
+    "sort_permutation",
+]
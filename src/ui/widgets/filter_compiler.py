@@ -0,0 +1,271 @@
+"""Compile FilterWidget specs into specialized predicates and column masks.
+
+``FilterWidget`` emits a nested spec of groups and rules. Interpreting that
+tree for every row re-lowers needles, re-parses numbers and builds result
+lists per group. Compiling does all of that once: each rule becomes a small
+closure with its needle or bound pre-computed, and groups short-circuit.
+
+A compiled filter is also a drop-in row predicate, and can additionally
+produce a boolean mask over the cached column arrays of a
+``ColumnarTableModel`` (its ``ColumnCache``) (float comparisons on numeric columns, substring tests over
+pre-lowered text), falling back to the row closure for anything else.
+
+Semantics match ``FilterWidget`` specs exactly: rules on missing (None)
+values never match, disabled rules and groups are skipped (a disabled group
+counts as matching), and empty groups match everything.
+"""
+
+from __future__ import annotations
+
+import operator
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from ui.widgets.columnar_table_model import build_mask
+
+if TYPE_CHECKING:
+    from ui.widgets.columnar_table_model import ColumnarTableModel, ColumnCache
+
+    # Both expose the same column accessors
+    Columns = ColumnCache | ColumnarTableModel
+
+Row = dict[str, Any]
+RowFn = Callable[[Row], bool]
+MaskFn = Callable[["Columns"], np.ndarray]
+
+_COMPARISONS: dict[str, Callable[[Any, Any], Any]] = {
+    "gt": operator.gt,
+    "lt": operator.lt,
+    "ge": operator.ge,
+    "le": operator.le,
+}
+
+
+def _never(row: Row) -> bool:
+    return False
+
+
+def _always(row: Row) -> bool:
+    return True
+
+
+def _row_mask(fn: RowFn) -> MaskFn:
+    """Mask builder that evaluates a row closure over every source row."""
+
+    def mask(columns: Columns) -> np.ndarray:
+        return build_mask(columns.source_rows, fn)
+
+    return mask
+
+
+def _constant_mask(value: bool) -> MaskFn:
+    def mask(columns: Columns) -> np.ndarray:
+        return np.full(len(columns.source_rows), value, dtype=bool)
+
+    return mask
+
+
+def _text_mask(key: str, test: Callable[[str], bool], lower: bool) -> MaskFn:
+    def mask(columns: Columns) -> np.ndarray:
+        texts = columns.text_values(key, lower=lower)
+        return build_mask(texts, lambda text: text is not None and test(text))
+
+    return mask
+
+
+def _compile_any(value: Any) -> tuple[RowFn, MaskFn]:
+    """Substring search across every value of a row ('Any Column')."""
+    needle = str(value or "").lower()
+
+    def row_fn(row: Row) -> bool:
+        for col_val in row.values():
+            if col_val is not None and needle in str(col_val).lower():
+                return True
+        return False
+
+    if "\0" in needle:
+        return row_fn, _row_mask(row_fn)
+
+    def mask(columns: Columns) -> np.ndarray:
+        texts = columns.search_text()
+        return build_mask(texts, lambda text: text is not None and needle in text)
+
+    return row_fn, mask
+
+
+def _compile_rule(rule: dict) -> tuple[RowFn, MaskFn]:
+    key = rule["key"]
+    op = rule["op"]
+    val = rule.get("value")
+
+    if key == "__any__":
+        return _compile_any(val)
+
+    if op == "contains":
+        needle = str(val or "").lower()
+
+        def contains(row: Row) -> bool:
+            rv = row.get(key)
+            return rv is not None and needle in str(rv).lower()
+
+        return contains, _text_mask(key, lambda text: needle in text, lower=True)
+
+    if op in ("equals", "neq"):
+        target = str(val)
+        if op == "equals":
+
+            def equals(row: Row) -> bool:
+                rv = row.get(key)
+                return rv is not None and str(rv) == target
+
+            return equals, _text_mask(key, target.__eq__, lower=False)
+
+        def differs(row: Row) -> bool:
+            rv = row.get(key)
+            return rv is not None and str(rv) != target
+
+        return differs, _text_mask(key, target.__ne__, lower=False)
+
+    if op in _COMPARISONS:
+        try:
+            bound = float(val)  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            return _never, _constant_mask(False)
+        compare = _COMPARISONS[op]
+
+        def in_range(row: Row) -> bool:
+            rv = row.get(key)
+            if rv is None:
+                return False
+            try:
+                return compare(float(rv), bound)
+            except (TypeError, ValueError):
+                return False
+
+        fallback = _row_mask(in_range)
+
+        def range_mask(columns: Columns) -> np.ndarray:
+            values = columns.numeric_values(key)
+            if values is None:
+                return fallback(columns)
+            # NaN (missing) compares False, like rules on None
+            return compare(values, bound)
+
+        return in_range, range_mask
+
+    if op in ("is_true", "is_false"):
+        wanted = op == "is_true"
+
+        def truthy(row: Row) -> bool:
+            rv = row.get(key)
+            return rv is not None and bool(rv) is wanted
+
+        return truthy, _row_mask(truthy)
+
+    if op == "in":
+        choices = {str(x) for x in (val or [])}
+
+        def member(row: Row) -> bool:
+            rv = row.get(key)
+            return rv is not None and str(rv) in choices
+
+        return member, _text_mask(key, choices.__contains__, lower=False)
+
+    return _never, _constant_mask(False)
+
+
+def _combine(
+    parts: Sequence[tuple[RowFn, MaskFn]], require_all: bool
+) -> tuple[RowFn, MaskFn]:
+    """AND/OR a list of compiled nodes (an empty list matches everything)."""
+    if not parts:
+        return _always, _constant_mask(True)
+    if len(parts) == 1:
+        return parts[0]
+
+    fns = tuple(fn for fn, _ in parts)
+    masks = tuple(mask for _, mask in parts)
+    if require_all:
+
+        def row_fn(row: Row) -> bool:
+            for fn in fns:
+                if not fn(row):
+                    return False
+            return True
+
+    else:
+
+        def row_fn(row: Row) -> bool:
+            for fn in fns:
+                if fn(row):
+                    return True
+            return False
+
+    def mask(columns: Columns) -> np.ndarray:
+        result = masks[0](columns)
+        for part in masks[1:]:
+            # Short-circuit once the outcome is decided for every row
+            if require_all and not result.any():
+                break
+            if not require_all and result.all():
+                break
+            if require_all:
+                result &= part(columns)
+            else:
+                result |= part(columns)
+        return result
+
+    return row_fn, mask
+
+
+def _compile_group(group: dict) -> tuple[RowFn, MaskFn]:
+    if not group.get("enabled", True):
+        return _always, _constant_mask(True)
+    parts = [
+        _compile_rule(rule)
+        for rule in group.get("rules", [])
+        if rule.get("enabled", True)
+    ]
+    parts.extend(_compile_group(sub) for sub in group.get("groups", []))
+    return _combine(parts, group.get("op") == "AND")
+
+
+class CompiledFilter:
+    """A filter spec compiled once into a row predicate and a mask builder."""
+
+    def __init__(self, spec: dict):
+        """Compile a spec.
+
+        Args:
+            spec: ``FilterWidget.get_spec()`` output
+        """
+        self.spec = spec
+        groups = spec.get("groups", [])
+        self._row_fn, self._mask_fn = _combine(
+            [_compile_group(group) for group in groups],
+            spec.get("op") == "AND",
+        )
+
+    def __call__(self, row: Row) -> bool:
+        return self._row_fn(row)
+
+    def mask(self, columns: Columns) -> np.ndarray:
+        """Evaluate the filter over all source rows of a columnar model.
+
+        Args:
+            columns: A ``ColumnarTableModel`` or its ``ColumnCache``
+
+        Returns:
+            Boolean array aligned with ``columns.source_rows``
+        """
+        return np.asarray(self._mask_fn(columns), dtype=bool).copy()
+
+
+def compile_filter(spec: dict) -> CompiledFilter:
+    """Compile a ``FilterWidget`` spec (see ``CompiledFilter``)."""
+    return CompiledFilter(spec)
+
+
+__all__ = ["CompiledFilter", "compile_filter"]
@@ -32,6 +32,7 @@ from PyQt6.QtWidgets import (
 )
 
 from ui.styles import AppStyles
+from ui.widgets.filter_compiler import compile_filter
 from utils.settings_manager import get_settings_manager
 
 logger = logging.getLogger(__name__)
@@ -286,80 +287,13 @@ class FilterWidget(QWidget):
 
     @staticmethod
     def build_predicate(spec: dict) -> Callable[[dict[str, Any]], bool]:
-        """Build a row predicate from a spec. Row is dict[column_key] -> value."""
-
-        def eval_rule(rule: dict, row: dict[str, Any]) -> bool:
-            key = rule["key"]
-            op = rule["op"]
-            val = rule.get("value")
-
-            # Handle 'any column' searches
-            if key == "__any__":
-                # Search across all column values
-                search_str = str(val or "").lower()
-                for col_val in row.values():
-                    if col_val is not None and search_str in str(col_val).lower():
-                        return True
-                return False
-
-            rv = row.get(key)
-            if rv is None:
-                return False
-            try:
-                if op == "contains":
-                    return str(val or "").lower() in str(rv).lower()
-                if op == "equals":
-                    return str(rv) == str(val)
-                if op == "neq":
-                    return str(rv) != str(val)
-                if op in {"gt", "lt", "ge", "le"}:
-                    if val is None:
-                        return False
-                    rvf = float(rv)
-                    vvf = float(val)
-                    if op == "gt":
-                        return rvf > vvf
-                    if op == "lt":
-                        return rvf < vvf
-                    if op == "ge":
-                        return rvf >= vvf
-                    if op == "le":
-                        return rvf <= vvf
-                if op == "is_true":
-                    return bool(rv) is True
-                if op == "is_false":
-                    return bool(rv) is False
-                if op == "in":
-                    return str(rv) in [str(x) for x in (val or [])]
-            except Exception:
-                return False
-            return False
-
-        def eval_group(group: dict, row: dict[str, Any]) -> bool:
-            # Skip disabled groups
-            if not group.get("enabled", True):
-                return True  # Disabled groups don't filter anything
-
-            rule_results = [
-                eval_rule(r, row)
-                for r in group.get("rules", [])
-                if r.get("enabled", True)  # Only evaluate enabled rules
-            ]
-            subgroup_specs = group.get("groups", [])
-            subgroup_results = [eval_group(g, row) for g in subgroup_specs]
-            combined = rule_results + subgroup_results
-            if not combined:
-                return True
-            return all(combined) if group.get("op") == "AND" else any(combined)
-
-        def predicate(row: dict[str, Any]) -> bool:
-            groups = spec.get("groups", [])
-            if not groups:
-                return True
-            group_results = [eval_group(g, row) for g in groups]
-            return all(group_results) if spec.get("op") == "AND" else any(group_results)
-
-        return predicate
+        """Build a row predicate from a spec. Row is dict[column_key] -> value.
+
+        The spec is compiled once (see ``filter_compiler``); the returned
+        ``CompiledFilter`` is callable per row and can also build a mask over
+        a columnar table model.
+        """
+        return compile_filter(spec)
 
 
 class FilterGroup(QFrame):
@@ -202,6 +202,16 @@ class ESIConfig(BaseSettings):
         description="Maximum backoff delay in seconds",
         ge=1,
     )
+    structure_refresh_per_minute: int = Field(
+        default=20,
+        description="Structure lookups per minute the background location refresher may spend (0 disables it)",
+        ge=0,
+    )
+    structure_refresh_max_age_hours: int = Field(
+        default=72,
+        description="Age in hours after which a resolved structure name is refreshed in the background",
+        ge=1,
+    )
 
     # ESI Scopes - Centralized scope management
     default_scopes: list[str] = Field(
@@ -223,6 +223,10 @@ class ServiceKeys:
     CONTRACT_SERVICE = "contract_service"
     INDUSTRY_SERVICE = "industry_service"
     NETWORTH_SERVICE = "networth_service"
+    PRICE_RESOLVER = "price_resolver"
+    MANUFACTURING_COST = "manufacturing_cost"
+    BLUEPRINT_VALUATOR = "blueprint_valuator"
+    REPROCESSING = "reprocessing"
 
 
 # Global singleton container
@@ -397,7 +401,11 @@ def configure_container(container: DIContainer | None = None) -> DIContainer:
     def character_service_factory(c: DIContainer) -> Any:
         from services.character_service import CharacterService
 
-        return CharacterService(esi_client=c.resolve(ServiceKeys.ESI_CLIENT))
+        return CharacterService(
+            esi_client=c.resolve(ServiceKeys.ESI_CLIENT),
+            repository=c.resolve(ServiceKeys.REPOSITORY),
+            location_service=c.resolve(ServiceKeys.LOCATION_SERVICE),
+        )
 
     container.register_factory(ServiceKeys.CHARACTER_SERVICE, character_service_factory)
 
@@ -458,6 +466,55 @@ def configure_container(container: DIContainer | None = None) -> DIContainer:
 
     container.register_factory(ServiceKeys.INDUSTRY_SERVICE, industry_service_factory)
 
+    # Register price resolver (shared effective price table)
+    def price_resolver_factory(c: DIContainer) -> Any:
+        from services.price_resolver import PriceResolver
+
+        return PriceResolver(
+            repository=c.resolve(ServiceKeys.REPOSITORY),
+            fuzzwork_provider=c.resolve_optional(ServiceKeys.FUZZWORK_PROVIDER),
+            settings_manager=c.resolve(ServiceKeys.SETTINGS_MANAGER),
+        )
+
+    container.register_factory(ServiceKeys.PRICE_RESOLVER, price_resolver_factory)
+
+    # Register manufacturing cost engine (bulk blueprint material costs)
+    def manufacturing_cost_factory(c: DIContainer) -> Any:
+        from services.manufacturing_cost import ManufacturingCostEngine
+
+        return ManufacturingCostEngine(
+            sde_provider=c.resolve(ServiceKeys.SDE_PROVIDER),
+            price_resolver=c.resolve(ServiceKeys.PRICE_RESOLVER),
+        )
+
+    container.register_factory(
+        ServiceKeys.MANUFACTURING_COST, manufacturing_cost_factory
+    )
+
+    # Register blueprint valuator (memoized blueprint/BPC values)
+    def blueprint_valuator_factory(c: DIContainer) -> Any:
+        from services.blueprint_valuation import BlueprintValuator
+
+        return BlueprintValuator(
+            cost_engine=c.resolve(ServiceKeys.MANUFACTURING_COST),
+            price_resolver=c.resolve(ServiceKeys.PRICE_RESOLVER),
+        )
+
+    container.register_factory(
+        ServiceKeys.BLUEPRINT_VALUATOR, blueprint_valuator_factory
+    )
+
+    # Register reprocessing engine (bulk reprocess values)
+    def reprocessing_factory(c: DIContainer) -> Any:
+        from services.reprocessing import ReprocessingEngine
+
+        return ReprocessingEngine(
+            sde_provider=c.resolve(ServiceKeys.SDE_PROVIDER),
+            price_resolver=c.resolve(ServiceKeys.PRICE_RESOLVER),
+        )
+
+    container.register_factory(ServiceKeys.REPROCESSING, reprocessing_factory)
+
     # Register networth service
     def networth_service_factory(c: DIContainer) -> Any:
         from services.networth_service import NetWorthService
@@ -469,6 +526,8 @@ def configure_container(container: DIContainer | None = None) -> DIContainer:
             settings_manager=c.resolve(ServiceKeys.SETTINGS_MANAGER),
             sde_provider=c.resolve(ServiceKeys.SDE_PROVIDER),
             location_service=c.resolve(ServiceKeys.LOCATION_SERVICE),
+            price_resolver=c.resolve(ServiceKeys.PRICE_RESOLVER),
+            blueprint_valuator=c.resolve(ServiceKeys.BLUEPRINT_VALUATOR),
         )
 
     container.register_factory(ServiceKeys.NETWORTH_SERVICE, networth_service_factory)
@@ -103,6 +103,13 @@ class MarketValuePreferences(BaseModel):
         default=0.3,
         description="Weight for buy price in weighted calculation (0.0-1.0)",
     )
+    blueprint_valuation: str = Field(
+        default="custom",
+        description=(
+            "Blueprint value without a custom price: 'material_cost', "
+            "'product_margin' or 'custom' (copies worth 0)"
+        ),
+    )
 
 
 class LoggingPreferences(BaseModel):
@@ -902,6 +909,21 @@ class SettingsManager:
         self._settings.market_value.weighted_buy_ratio = max(0.0, min(1.0, ratio))
         self._save()
 
+    def get_blueprint_valuation(self) -> str:
+        """Get the blueprint valuation strategy."""
+        return self._settings.market_value.blueprint_valuation
+
+    def set_blueprint_valuation(self, strategy: str) -> None:
+        """Set the blueprint valuation strategy.
+
+        Args:
+            strategy: One of 'material_cost', 'product_margin', 'custom'
+        """
+        valid_strategies = {"material_cost", "product_margin", "custom"}
+        if strategy.lower() in valid_strategies:
+            self._settings.market_value.blueprint_valuation = strategy.lower()
+            self._save()
+
     # -------------------------------------------------------------------------
     # Logging Preferences
     # -------------------------------------------------------------------------
@@ -1,8 +1,135 @@
 """Pytest configuration and shared fixtures."""
 
 import sys
+from collections.abc import Mapping
+from datetime import UTC, datetime
 from pathlib import Path
 
+import pytest
+
 # Add src to Python path so imports work
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
+
+from data.repositories import prices  # noqa: E402
+from models.app import (  # noqa: E402
+    FuzzworkMarketDataPoint,
+    FuzzworkMarketStats,
+    FuzzworkRegionMarketData,
+)
+from models.eve.asset import EveAsset  # noqa: E402
+
+
+def market_stats(price: float) -> FuzzworkMarketStats:
+    """Order book statistics where every figure equals ``price``."""
+    return FuzzworkMarketStats(
+        weighted_average=price,
+        max_price=price,
+        min_price=price,
+        stddev=0.0,
+        median=price,
+        volume=1,
+        num_orders=1,
+        five_percent=price,
+    )
+
+
+def market_point(
+    type_id: int, regions: Mapping[int, tuple[float | None, float | None]]
+) -> FuzzworkMarketDataPoint:
+    """Fuzzwork data point from ``region_id -> (buy, sell)`` prices."""
+    return FuzzworkMarketDataPoint(
+        type_id=type_id,
+        snapshot_time=datetime.now(UTC),
+        region_data={
+            region_id: FuzzworkRegionMarketData(
+                region_id=region_id,
+                buy_stats=market_stats(buy) if buy is not None else None,
+                sell_stats=market_stats(sell) if sell is not None else None,
+            )
+            for region_id, (buy, sell) in regions.items()
+        },
+    )
+
+
+def jita_sell_point(type_id: int, sell: float) -> FuzzworkMarketDataPoint:
+    """Fuzzwork data point with only a Jita sell side."""
+    return market_point(type_id, {prices.JITA_REGION_ID: (None, sell)})
+
+
+def make_asset(
+    item_id: int,
+    type_id: int,
+    quantity: int = 1,
+    *,
+    is_blueprint_copy: bool = False,
+    is_singleton: bool | None = None,
+) -> EveAsset:
+    """Hangar asset in Jita 4-4; singleton defaults to ``is_blueprint_copy``."""
+    return EveAsset(
+        item_id=item_id,
+        type_id=type_id,
+        quantity=quantity,
+        location_id=60003760,
+        location_type="station",
+        location_flag="Hangar",
+        is_singleton=is_blueprint_copy if is_singleton is None else is_singleton,
+        is_blueprint_copy=is_blueprint_copy,
+    )
+
+
+class StubSettings:
+    """Settings manager stand-in covering the market and account getters.
+
+    ``custom`` maps type IDs to ``{"buy": ..., "sell": ...}`` overrides and
+    may be mutated by tests; the constructor takes plain sell prices.
+    """
+
+    def __init__(
+        self,
+        custom_sell: Mapping[int, float] | None = None,
+        *,
+        hub: str = "jita",
+        price_type: str = "sell",
+        ratio: float = 0.3,
+        blueprint_valuation: str = "custom",
+        accounts: Mapping[int, int] | None = None,
+    ):
+        self.custom: dict[int, dict[str, float | None]] = {
+            type_id: {"buy": None, "sell": price}
+            for type_id, price in (custom_sell or {}).items()
+        }
+        self.hub = hub
+        self.price_type = price_type
+        self.ratio = ratio
+        self.blueprint_valuation = blueprint_valuation
+        self.accounts = dict(accounts or {})
+        self.reads = 0
+
+    def get_market_source_station(self):
+        self.reads += 1
+        return self.hub
+
+    def get_market_price_type(self):
+        return self.price_type
+
+    def get_market_weighted_buy_ratio(self):
+        return self.ratio
+
+    def get_blueprint_valuation(self):
+        return self.blueprint_valuation
+
+    def get_custom_price(self, type_id):
+        return self.custom.get(type_id)
+
+    def get_all_custom_prices(self):
+        return dict(self.custom)
+
+    def get_account_for_character(self, character_id):
+        return self.accounts.get(character_id)
+
+
+@pytest.fixture
+def settings() -> StubSettings:
+    """Default market settings with no custom prices."""
+    return StubSettings()
@@ -0,0 +1,96 @@
+"""Tests for root locations persisted on current_assets at sync time."""
+
+from __future__ import annotations
+
+import asyncio
+
+from data.repositories import assets as assets_repo
+from data.repositories.repository import Repository
+from models.eve.asset import EveAsset
+
+
+def _asset(item_id: int, location_id: int, location_type: str = "item") -> EveAsset:
+    return EveAsset(
+        item_id=item_id,
+        type_id=34,
+        quantity=1,
+        location_id=location_id,
+        location_type=location_type,
+        location_flag="Hangar",
+        is_singleton=True,
+        is_blueprint_copy=False,
+    )
+
+
+INVENTORY = [
+    # Item in a container in a ship docked at a station; listed child-first
+    _asset(4, 3),
+    _asset(3, 2),
+    _asset(2, 60003760, "station"),
+    # Container whose parent is a structure we do not own
+    _asset(5, 1_035_466_617_946),
+    # Container with an unknown parent
+    _asset(6, 999),
+]
+
+
+def test_compute_root_locations_walks_each_chain_once():
+    roots = assets_repo._compute_root_locations(INVENTORY)
+    assert roots[2] == (60003760, "station", 0)
+    assert roots[3] == (60003760, "station", 1)
+    assert roots[4] == (60003760, "station", 2)
+    assert roots[5] == (1_035_466_617_946, "other", 0)
+    assert roots[6] == (None, None, 1)
+
+
+def test_root_location_queries():
+    async def _run():
+        repo = Repository(db_path=":memory:")
+        await repo.initialize()
+        try:
+            await assets_repo.update_current_assets(repo, 1, INVENTORY)
+            await assets_repo.update_current_assets(repo, 2, [_asset(7, 60003760)])
+
+            at_station = await assets_repo.get_assets_at_roots(repo, 1, [60003760])
+            assert {a.item_id for a in at_station} == {2, 3, 4}
+
+            summary = {
+                entry["location_id"]: entry
+                for entry in await assets_repo.get_root_location_summary(repo)
+            }
+            assert summary[60003760]["asset_count"] == 4
+            assert summary[60003760]["character_count"] == 2
+            assert summary[1_035_466_617_946]["location_type"] == "other"
+            assert set(summary) == {60003760, 1_035_466_617_946}
+
+            roots = await assets_repo.get_root_locations(repo, 1)
+            assert roots[4] == (60003760, "station")
+            assert 6 not in roots
+        finally:
+            await repo.close()
+
+    asyncio.run(_run())
+
+
+def test_migration_adds_and_backfills_root_columns(tmp_path):
+    async def _run():
+        db_path = tmp_path / "old.db"
+        repo = Repository(db_path=db_path)
+        await repo.initialize()
+        await assets_repo.update_current_assets(repo, 1, INVENTORY)
+        # Simulate a database created before the root columns existed
+        await repo.execute("DROP INDEX idx_current_assets_root")
+        for column in ("root_location_id", "root_location_type", "container_depth"):
+            await repo.execute(f"ALTER TABLE current_assets DROP COLUMN {column}")
+        await repo.commit()
+        await repo.close()
+
+        repo = Repository(db_path=db_path)
+        await repo.initialize()
+        try:
+            at_station = await assets_repo.get_assets_at_roots(repo, 1, [60003760])
+            assert {a.item_id for a in at_station} == {2, 3, 4}
+        finally:
+            await repo.close()
+
+    asyncio.run(_run())
@@ -11,6 +11,7 @@ sys.path.insert(0, str(SRC))
 os.environ.setdefault("QT_QPA_PLATFORM", "minimal")
 
 from ui.tabs.assets_tab import AssetsTab
+from ui.widgets.advanced_table_widget import AdvancedTableView
 from ui.widgets.filter_widget import FilterWidget
 
 
@@ -206,3 +207,35 @@ def test_filter_spec_initialization():
     pred = tab.table.predicate
     assert pred({"type_name": "Anything"}) is True
     assert pred({"type_name": "Something Else"}) is True
+
+
+def test_resolved_structure_names_update_rows_in_place(qtbot):
+    """Background structure names must not reset the table under the user."""
+    view = AdvancedTableView()
+    qtbot.addWidget(view)
+    view.setup([("location_display", "Location"), ("type_name", "Type")], columnar=True)
+    rows = [
+        {"structure_id": 1, "location_display": "Structure 1", "type_name": "Rifter"},
+        {"structure_id": 2, "location_display": "Structure 2", "type_name": "Slasher"},
+        {"structure_id": 1, "location_display": "Structure 1", "type_name": "Atron"},
+    ]
+    view.set_rows(rows)
+    view.set_predicate(lambda row: row["type_name"] != "Atron")
+    model = view.model()
+    resets: list[bool] = []
+    model.modelReset.connect(lambda: resets.append(True))
+
+    tab = AssetsTab.__new__(AssetsTab)
+    tab.table = view
+    tab._on_locations_refreshed({1: "Jita Keepstar", 3: "Elsewhere"})
+
+    assert resets == []
+    assert model.data(model.index(0, 0)) == "Jita Keepstar"
+    # The row hidden by the filter picks up the name as well
+    view.set_predicate(None)
+    assert [model.row_at(i)["location_display"] for i in range(3)] == [
+        "Jita Keepstar",
+        "Structure 2",
+        "Jita Keepstar",
+    ]
+    assert rows[2]["structure_name"] == "Jita Keepstar"
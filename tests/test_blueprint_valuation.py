@@ -0,0 +1,268 @@
+"""Tests for blueprint valuation strategies and blueprint copies in net worth."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import cast
+
+import pytest
+
+from data.clients import ESIClient
+from data.parsers import SDEJsonlParser
+from data.repositories import assets as assets_repo
+from data.repositories import prices
+from data.repositories.repository import Repository
+from data.sde_provider import SDEProvider
+from services.blueprint_valuation import BlueprintKey, BlueprintValuator
+from services.manufacturing_cost import ManufacturingCostEngine
+from services.networth_service import NetWorthService
+from services.price_resolver import PriceResolver
+from tests.conftest import StubSettings, jita_sell_point, make_asset
+
+_BLUEPRINTS = [
+    {
+        "_key": 681,
+        "activities": {
+            "manufacturing": {
+                "materials": [{"quantity": 10, "typeID": 34}],
+                "products": [{"quantity": 1, "typeID": 165}],
+                "time": 600,
+            }
+        },
+        "blueprintTypeID": 681,
+        "maxProductionLimit": 300,
+    },
+    {
+        "_key": 682,
+        "activities": {
+            "manufacturing": {
+                "materials": [{"quantity": 100, "typeID": 36}],
+                "products": [{"quantity": 2, "typeID": 166}],
+                "time": 1200,
+            }
+        },
+        "blueprintTypeID": 682,
+        "maxProductionLimit": 600,
+    },
+]
+
+
+class _Prices:
+    """Price resolver stand-in with a mutable table and strategy."""
+
+    def __init__(self, table: dict[int, float], strategy: str):
+        self.table = table
+        self.revision = 1
+        self.preferences = SimpleNamespace(blueprint_valuation=strategy)
+        self.reads = 0
+
+    def price_table(self) -> dict[int, float]:
+        self.reads += 1
+        return dict(self.table)
+
+
+def _provider(tmp_path: Path, types: list[dict] | None = None) -> SDEProvider:
+    data_dir = tmp_path / "sde"
+    data_dir.mkdir()
+    (data_dir / "blueprints.jsonl").write_text(
+        "".join(json.dumps(bp) + "\n" for bp in _BLUEPRINTS)
+    )
+    if types is not None:
+        (data_dir / "types.jsonl").write_text(
+            "".join(json.dumps(t) + "\n" for t in types)
+        )
+    return SDEProvider(
+        SDEJsonlParser(data_dir),
+        background_build=False,
+        persist_path=tmp_path / "sde_store.db",
+    )
+
+
+def _valuator(tmp_path: Path, prices_: _Prices) -> BlueprintValuator:
+    engine = ManufacturingCostEngine(_provider(tmp_path), prices_)  # type: ignore[arg-type]
+    return BlueprintValuator(engine, prices_)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    ("strategy", "expected"),
+    [
+        ("material_cost", {681: 50.0, 682: 200.0, 999: 0.0}),
+        ("product_margin", {681: 70.0, 682: 0.0, 999: 0.0}),
+        ("custom", {681: 0.0, 682: 0.0, 999: 0.0}),
+        ("bogus", {681: 0.0, 682: 0.0, 999: 0.0}),
+    ],
+)
+def test_strategies(tmp_path, strategy, expected):
+    # 681: 10 x 5.0 materials -> 1 x 120.0 product
+    # 682: 100 x 2.0 materials -> 2 x 50.0 products (margin clamps at 0)
+    table = {34: 5.0, 36: 2.0, 165: 120.0, 166: 50.0}
+    valuator = _valuator(tmp_path, _Prices(table, strategy))
+
+    values = valuator.value_blueprints(BlueprintKey(t) for t in expected)
+    assert {key.type_id: value for key, value in values.items()} == expected
+
+
+def test_memo_is_reused_and_invalidated(tmp_path):
+    prices_ = _Prices({34: 5.0}, "material_cost")
+    valuator = _valuator(tmp_path, prices_)
+
+    runs = BlueprintKey(681, me=10, runs=10)
+    assert valuator.value_blueprints([BlueprintKey(681), runs]) == {
+        BlueprintKey(681): 50.0,
+        runs: 90 * 5.0,
+    }
+    valuator.value_blueprints([BlueprintKey(681)])
+    assert prices_.reads == 1
+
+    # New price revision recomputes against the new table
+    prices_.table[34] = 6.0
+    prices_.revision = 2
+    assert valuator.value_blueprints([BlueprintKey(681)]) == {BlueprintKey(681): 60.0}
+    assert prices_.reads == 2
+
+    # A strategy change drops memoized values
+    prices_.preferences.blueprint_valuation = "product_margin"
+    assert valuator.value_blueprints([BlueprintKey(681)]) == {BlueprintKey(681): 0.0}
+
+
+def test_networth_values_blueprint_copies_in_bulk(tmp_path):
+    sde = _provider(tmp_path)
+
+    async def _run():
+        repo = Repository(db_path=":memory:")
+        await repo.initialize()
+        try:
+            await prices.save_snapshot(repo, [jita_sell_point(34, 5.0)])
+            await assets_repo.update_current_assets(
+                repo,
+                1,
+                [
+                    make_asset(1, 34, 10),
+                    make_asset(2, 681, is_blueprint_copy=True),
+                    make_asset(3, 681, is_blueprint_copy=True),
+                    make_asset(4, 682, is_blueprint_copy=True),
+                ],
+            )
+            await assets_repo.update_current_assets(
+                repo, 2, [make_asset(10, 681, is_blueprint_copy=True)]
+            )
+            assert await assets_repo.get_blueprint_copy_counts(repo, [1, 2, 3]) == {
+                1: {681: 2, 682: 1},
+                2: {681: 1},
+            }
+
+            settings = StubSettings(
+                {682: 1000.0}, ratio=0.0, blueprint_valuation="material_cost"
+            )
+            resolver = PriceResolver(repository=repo, settings_manager=settings)
+            await resolver.ensure_ready()
+            service = NetWorthService(
+                esi_client=cast(ESIClient, object()),
+                repository=repo,
+                fuzzwork_provider=None,
+                settings_manager=settings,
+                sde_provider=sde,
+                price_resolver=resolver,
+            )
+
+            # Items 10 x 5.0; two 681 copies at 50.0; 682 copy at its custom price
+            many = await service.calculate_networth_many([1, 2])
+            assert many[1].total_asset_value == 50.0 + 2 * 50.0 + 1000.0
+            assert many[2].total_asset_value == 50.0
+        finally:
+            await repo.close()
+
+    asyncio.run(_run())
+
+
+def test_ledger_reprices_blueprint_originals_when_materials_move(tmp_path):
+    sde = _provider(tmp_path)
+
+    original = make_asset(1, 681, is_singleton=True)
+
+    async def _run():
+        repo = Repository(db_path=":memory:")
+        await repo.initialize()
+        try:
+            await assets_repo.update_current_assets(repo, 1, [original])
+            settings = StubSettings(
+                {34: 5.0}, ratio=0.0, blueprint_valuation="material_cost"
+            )
+            resolver = PriceResolver(repository=repo, settings_manager=settings)
+            await resolver.ensure_ready()
+            service = NetWorthService(
+                esi_client=cast(ESIClient, object()),
+                repository=repo,
+                fuzzwork_provider=None,
+                settings_manager=settings,
+                sde_provider=sde,
+                price_resolver=resolver,
+            )
+
+            # 10 x material 34 at 5.0
+            assert (await service.calculate_networth(1)).total_asset_value == 50.0
+            assert await assets_repo.get_ledger_prices(repo, 1) == {
+                681: (50.0, "blueprint-material_cost")
+            }
+
+            # Only the material's price moves; the blueprint follows it
+            settings.custom[34] = {"buy": None, "sell": 8.0}
+            resolver.on_custom_price_changed(34)
+            assert (await service.calculate_networth(1)).total_asset_value == 80.0
+            assert await assets_repo.get_ledger_prices(repo, 1) == {
+                681: (80.0, "blueprint-material_cost")
+            }
+        finally:
+            await repo.close()
+
+    asyncio.run(_run())
+
+
+@pytest.mark.parametrize(
+    ("strategy", "expected"),
+    [
+        ("material_cost", (50.0, "blueprint-material_cost")),
+        ("custom", (275000.0, "base")),
+    ],
+)
+def test_blueprint_originals_use_the_strategy_before_base_price(
+    tmp_path, strategy, expected
+):
+    sde = _provider(
+        tmp_path,
+        types=[
+            {
+                "_key": 681,
+                "name": {"en": "Rifter Blueprint"},
+                "basePrice": 275000.0,
+                "portionSize": 1,
+                "published": True,
+            }
+        ],
+    )
+    assert sde.get_type_by_id(681).base_price == 275000.0
+
+    settings = StubSettings({34: 5.0}, ratio=0.0, blueprint_valuation=strategy)
+
+    async def _run():
+        repo = Repository(db_path=":memory:")
+        await repo.initialize()
+        try:
+            resolver = PriceResolver(repository=repo, settings_manager=settings)
+            await resolver.ensure_ready()
+            service = NetWorthService(
+                esi_client=cast(ESIClient, object()),
+                repository=repo,
+                settings_manager=settings,
+                sde_provider=sde,
+                price_resolver=resolver,
+            )
+            # Strategy value wins; base price only when the strategy gives nothing
+            assert await service._price_types([681]) == {681: expected}
+        finally:
+            await repo.close()
+
+    asyncio.run(_run())
@@ -0,0 +1,201 @@
+"""Tests for the columnar table model behind large AdvancedTableViews."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+
+os.environ.setdefault("QT_QPA_PLATFORM", "minimal")
+
+import numpy as np
+import pytest
+from PyQt6.QtCore import Qt
+
+from ui.widgets import columnar_table_model
+from ui.widgets.advanced_table_widget import AdvancedTableView, DictTableModel
+from ui.widgets.columnar_table_model import ColumnarTableModel
+
+COLUMNS = [("name", "Name"), ("quantity", "Qty"), ("value", "Value")]
+
+
+def _rows() -> list[dict]:
+    return [
+        {"name": "Tritanium", "quantity": 1500, "value": 6.5},
+        {"name": "Pyerite", "quantity": None, "value": 12.25},
+        {"name": None, "quantity": 20, "value": None},
+        {"name": "Mexallon", "quantity": 1500, "value": 80.0},
+        {"name": "Isogen", "quantity": 7, "value": 1234567.891},
+    ]
+
+
+def _table(model) -> list[list]:
+    return [
+        [model.data(model.index(r, c)) for c in range(model.columnCount())]
+        for r in range(model.rowCount())
+    ]
+
+
+def test_sort_and_display_match_the_dict_model():
+    for column in range(len(COLUMNS)):
+        for order in (Qt.SortOrder.AscendingOrder, Qt.SortOrder.DescendingOrder):
+            reference = DictTableModel(COLUMNS, _rows())
+            columnar = ColumnarTableModel(COLUMNS, _rows())
+            reference.sort(column, order)
+            columnar.sort(column, order)
+            assert _table(columnar) == _table(reference)
+
+    model = ColumnarTableModel(COLUMNS, _rows())
+    assert model.data(model.index(4, 2)) == "1,234,567.89"
+    assert model.data(model.index(0, 1)) == "1,500"
+    assert model.numeric_values("name") is None
+    np.testing.assert_array_equal(
+        model.numeric_values("quantity"), [1500, np.nan, 20, 1500, 7]
+    )
+
+
+def test_view_filters_with_a_mask_and_keeps_the_sort(qtbot):
+    view = AdvancedTableView()
+    qtbot.addWidget(view)
+    view.setup(COLUMNS, columnar=True)
+    model = view.model()
+    assert isinstance(model, ColumnarTableModel)
+
+    rows = _rows()
+    view.set_rows(rows)
+    model.sort(2, Qt.SortOrder.DescendingOrder)
+    assert [model.row_at(i)["name"] for i in range(5)] == [
+        None,
+        "Isogen",
+        "Mexallon",
+        "Pyerite",
+        "Tritanium",
+    ]
+
+    view.set_predicate(lambda row: (row["quantity"] or 0) > 10)
+    assert model.source_rows is rows
+    assert [model.row_at(i)["name"] for i in range(model.rowCount())] == [
+        None,
+        "Mexallon",
+        "Tritanium",
+    ]
+
+    # In-place updates refresh the cached display string and sort key
+    view.update_rows_by_key("name", {"Tritanium": {"value": 99.0}})
+    assert model.data(model.index(1, 2)) == "80.00"
+    assert model.data(model.index(2, 2)) == "99.00"
+    model.sort(2, Qt.SortOrder.DescendingOrder)
+    assert model.row_at(1)["name"] == "Tritanium"
+
+    view.set_predicate(None)
+    assert model.rowCount() == 5
+
+
+def _names(model) -> list:
+    return [model.row_at(i)["name"] for i in range(model.rowCount())]
+
+
+def test_large_views_are_computed_in_the_background_and_swapped_in():
+    model = ColumnarTableModel(COLUMNS, [], background_rows=0)
+    resets: list[int] = []
+    model.modelReset.connect(lambda: resets.append(model.rowCount()))
+
+    async def scenario() -> None:
+        model.set_rows(_rows(), lambda columns: columns.numeric_values("value") > 10)
+        # Nothing changes until the job completes
+        assert not model.is_idle
+        assert model.rowCount() == 0
+        await model.wait_until_idle()
+        assert _names(model) == ["Pyerite", "Mexallon", "Isogen"]
+
+        model.sort(2, Qt.SortOrder.DescendingOrder)
+        assert _names(model) == ["Pyerite", "Mexallon", "Isogen"]
+        await model.wait_until_idle()
+        assert _names(model) == ["Isogen", "Mexallon", "Pyerite"]
+
+    asyncio.run(scenario())
+    # Rows, mask and view were swapped in with a single reset
+    assert resets == [3]
+
+
+def test_a_newer_request_cancels_the_running_job(monkeypatch):
+    monkeypatch.setattr(columnar_table_model, "CHUNK_ROWS", 1)
+    model = ColumnarTableModel(COLUMNS, _rows(), background_rows=0)
+    started, release = threading.Event(), threading.Event()
+    tested: list[str | None] = []
+
+    def slow(row: dict) -> bool:
+        tested.append(row["name"])
+        started.set()
+        release.wait(5)
+        return True
+
+    async def scenario() -> None:
+        model.set_mask(
+            lambda columns: columnar_table_model.build_mask(columns.source_rows, slow)
+        )
+        await asyncio.to_thread(started.wait, 5)
+        model.set_mask(lambda columns: columns.numeric_values("quantity") > 10)
+        release.set()
+        await model.wait_until_idle()
+
+    asyncio.run(scenario())
+    # The stale job stopped at its next chunk and never reached the view
+    assert tested == ["Tritanium"]
+    assert _names(model) == ["Tritanium", None, "Mexallon"]
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_updates_by_key_emit_one_signal_per_run_of_rows(qtbot, columnar):
+    view = AdvancedTableView()
+    qtbot.addWidget(view)
+    view.setup(COLUMNS, columnar=columnar)
+    model = view.model()
+    view.set_rows(_rows())
+    model.sort(0, Qt.SortOrder.AscendingOrder)
+    # Isogen, Mexallon, Pyerite, Tritanium, None
+    view.set_predicate(lambda row: row["name"] != "Pyerite")
+
+    signals: list[tuple[int, int, int, int]] = []
+    model.dataChanged.connect(
+        lambda tl, br: signals.append((tl.row(), tl.column(), br.row(), br.column()))
+    )
+    view.update_rows_by_key(
+        "name",
+        {
+            "Isogen": {"quantity": 1, "value": 2.0},
+            "Mexallon": {"quantity": 3},
+            "Tritanium": {"value": 4.0},
+            "Pyerite": {"value": 5.0},
+        },
+    )
+    assert signals == [(0, 1, 2, 2)]
+    assert [model.data(model.index(r, 2)) for r in range(4)] == [
+        "2.00",
+        "80.00",
+        "4.00",
+        None,
+    ]
+
+    # Changing the key itself keeps later lookups right
+    view.update_rows_by_key("name", {"Isogen": {"name": "Zydrine"}})
+    view.update_rows_by_key("name", {"Zydrine": {"quantity": 9}})
+    assert model.row_at(0)["quantity"] == 9
+    assert signals[-1] == (0, 1, 0, 1)
+
+    # So does changing a field indexed for other lookups
+    assert model.rows_by_key("quantity", [9]) == {9: [0]}
+    view.update_rows_by_key("name", {"Zydrine": {"quantity": 11}})
+    assert model.rows_by_key("quantity", [9, 11]) == {11: [0]}
+
+
+def test_key_index_survives_sort_and_filter():
+    model = ColumnarTableModel(COLUMNS, _rows())
+    assert model.rows_by_key("name", ["Mexallon"]) == {"Mexallon": [3]}
+    index = model._cache.key_rows("name")
+
+    model.sort(2, Qt.SortOrder.DescendingOrder)
+    model.set_mask(np.array([True, False, True, True, True]))
+    # None, Isogen, Mexallon, Tritanium
+    assert model.rows_by_key("name", ["Mexallon", "Pyerite"]) == {"Mexallon": [2]}
+    assert model._cache.key_rows("name") is index
@@ -0,0 +1,106 @@
+"""Tests for compiling FilterWidget specs into predicates and column masks."""
+
+from __future__ import annotations
+
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "minimal")
+
+import pytest
+
+from ui.widgets.advanced_table_widget import AdvancedTableView
+from ui.widgets.columnar_table_model import ColumnarTableModel
+from ui.widgets.filter_compiler import CompiledFilter, compile_filter
+from ui.widgets.filter_widget import FilterWidget
+
+ROWS = [
+    {"type_name": "Tritanium", "quantity": 1500, "price": 6.5, "bpc": False},
+    {"type_name": "Veldspar", "quantity": None, "price": 12.0, "bpc": True},
+    {"type_name": "Concentrated Veldspar", "quantity": 20, "price": None},
+    {"type_name": None, "quantity": 7, "price": 5.0, "location": "Jita IV"},
+    {"type_name": "Rifter", "quantity": "n/a", "price": 250000.0, "bpc": True},
+]
+
+
+def _rule(key: str, op: str, value, enabled: bool = True) -> dict:
+    return {"key": key, "op": op, "value": value, "enabled": enabled}
+
+
+def _spec(*rules: dict, op: str = "AND", groups: list | None = None) -> dict:
+    return {
+        "op": "AND",
+        "groups": [
+            {"op": op, "enabled": True, "rules": list(rules), "groups": groups or []}
+        ],
+    }
+
+
+def _matches(spec: dict) -> list[int]:
+    """Matching row positions, checking the row and mask paths agree."""
+    compiled = compile_filter(spec)
+    by_row = [i for i, row in enumerate(ROWS) if compiled(row)]
+    model = ColumnarTableModel([("type_name", "Name")], ROWS)
+    assert compiled.mask(model).nonzero()[0].tolist() == by_row
+    return by_row
+
+
+@pytest.mark.parametrize(
+    ("spec", "expected"),
+    [
+        (_spec(_rule("type_name", "contains", "VELD")), [1, 2]),
+        (_spec(_rule("type_name", "equals", "Veldspar")), [1]),
+        (_spec(_rule("type_name", "neq", "Veldspar")), [0, 2, 4]),
+        (_spec(_rule("quantity", "gt", 10)), [0, 2]),
+        (_spec(_rule("price", "le", 6.5)), [0, 3]),
+        (_spec(_rule("price", "ge", "abc")), []),
+        (_spec(_rule("bpc", "is_true", None)), [1, 4]),
+        (_spec(_rule("bpc", "is_false", None)), [0]),
+        (_spec(_rule("type_name", "in", ["Rifter", "Tritanium"])), [0, 4]),
+        (_spec(_rule("__any__", "contains", "jita")), [3]),
+        (_spec(_rule("__any__", "contains", "")), [0, 1, 2, 3, 4]),
+        (_spec(_rule("type_name", "bogus", "x")), []),
+    ],
+)
+def test_rules_match_filter_semantics(spec, expected):
+    assert _matches(spec) == expected
+
+
+def test_groups_combine_and_skip_disabled_parts():
+    veld = _rule("type_name", "contains", "veld")
+    cheap = _rule("price", "lt", 10)
+    assert _matches(_spec(veld, cheap, op="AND")) == []
+    assert _matches(_spec(veld, cheap, op="OR")) == [0, 1, 2, 3]
+    assert _matches(_spec(veld, _rule("price", "lt", 10, enabled=False))) == [1, 2]
+
+    nested = {"op": "OR", "enabled": True, "rules": [cheap, veld], "groups": []}
+    assert _matches(_spec(_rule("quantity", "ge", 7), groups=[nested])) == [0, 2, 3]
+
+    disabled = dict(nested, enabled=False)
+    assert _matches({"op": "AND", "groups": [disabled]}) == [0, 1, 2, 3, 4]
+    assert _matches({"op": "AND", "groups": []}) == [0, 1, 2, 3, 4]
+
+
+def test_build_predicate_returns_a_compiled_filter():
+    spec = _spec(_rule("type_name", "contains", "rit"))
+    predicate = FilterWidget.build_predicate(spec)
+    assert isinstance(predicate, CompiledFilter)
+    assert [predicate(row) for row in ROWS] == [True, False, False, False, False]
+
+
+def test_columnar_view_filters_through_the_compiled_mask(qtbot, monkeypatch):
+    view = AdvancedTableView()
+    qtbot.addWidget(view)
+    view.setup([("type_name", "Name"), ("price", "Price")], columnar=True)
+    view.set_rows(ROWS)
+
+    predicate = compile_filter(_spec(_rule("price", "lt", 100)))
+    monkeypatch.setattr(
+        CompiledFilter, "__call__", lambda self, row: pytest.fail("row path used")
+    )
+    view.set_predicate(predicate)
+    model = view.model()
+    assert [model.row_at(i)["price"] for i in range(model.rowCount())] == [
+        6.5,
+        12.0,
+        5.0,
+    ]
@@ -12,6 +12,7 @@ sys.path.insert(0, str(SRC))
 # Run Qt in minimal mode to avoid GUI plugin errors
 os.environ.setdefault("QT_QPA_PLATFORM", "minimal")
 
+from collections import deque
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, Mock
 
@@ -299,3 +300,82 @@ def test_cleanup_stops_timer(qtbot, industry_jobs_tab):
 async def test_countdown_timer_interval(qtbot, industry_jobs_tab):
     """Test that countdown timer has correct 1-second interval."""
     assert industry_jobs_tab._countdown_timer.interval() == 1000  # 1000ms = 1 second
+
+
+def _job(job_id: int, ends_in: timedelta, status: str = "active") -> EveIndustryJob:
+    now = datetime.now(UTC)
+    return EveIndustryJob(
+        job_id=job_id,
+        installer_id=100,
+        facility_id=1000,
+        activity_id=1,
+        blueprint_id=10000,
+        blueprint_type_id=20000,
+        blueprint_location_id=1000,
+        output_location_id=1000,
+        runs=1,
+        cost=100000.0,
+        status=status,
+        duration=3600,
+        start_date=now - timedelta(hours=1),
+        end_date=now + ends_in,
+    )
+
+
+@pytest.mark.asyncio
+async def test_countdown_only_updates_visible_rows(
+    qtbot, industry_jobs_tab, mock_services
+):
+    """Off-screen rows are left alone and computed when painted."""
+    jobs = [_job(i, timedelta(hours=2, minutes=i)) for i in range(200)]
+    mock_services["industry_service"].get_active_jobs = AsyncMock(return_value=jobs)
+    industry_jobs_tab._current_characters = [Mock(character_id=100)]
+    await industry_jobs_tab._do_refresh()
+
+    industry_jobs_tab.resize(800, 400)
+    industry_jobs_tab.show()
+    qtbot.waitExposed(industry_jobs_tab)
+
+    for row in industry_jobs_tab._rows_cache:
+        row["remaining_time"] = "stale"
+    industry_jobs_tab._update_countdowns()
+
+    visible = industry_jobs_tab._table.visible_rows()
+    assert 0 < len(visible) < 200
+    assert all(row["remaining_time"] != "stale" for row in visible)
+    last = industry_jobs_tab._rows_cache[-1]
+    assert last["remaining_time"] == "stale"
+
+    model = industry_jobs_tab._table.model()
+    painted = model.data(model.index(199, 9))
+    assert painted.startswith("05:1")
+
+    # Nothing visible ends within a minute: coarse tick
+    assert industry_jobs_tab._countdown_timer.interval() == 10_000
+
+
+@pytest.mark.asyncio
+async def test_countdown_interval_adapts(qtbot, industry_jobs_tab, mock_services):
+    """Tick every second near a visible completion, else until the next one."""
+    jobs = [_job(1, timedelta(seconds=30)), _job(2, timedelta(hours=3))]
+    mock_services["industry_service"].get_active_jobs = AsyncMock(return_value=jobs)
+    industry_jobs_tab._current_characters = [Mock(character_id=100)]
+    await industry_jobs_tab._do_refresh()
+
+    # Hidden tab: wake up for the off-screen completion in ~30s at the latest
+    industry_jobs_tab._update_countdowns()
+    assert industry_jobs_tab._countdown_timer.interval() == 10_000
+
+    industry_jobs_tab.show()
+    qtbot.waitExposed(industry_jobs_tab)
+    industry_jobs_tab._update_countdowns()
+    assert industry_jobs_tab._countdown_timer.interval() == 1000
+
+    # Completion is picked up even though no row is visible
+    industry_jobs_tab.hide()
+    jobs[0].end_date = datetime.now(UTC) - timedelta(seconds=1)
+    industry_jobs_tab._ending = deque(sorted(jobs, key=lambda job: job.end_date))
+    industry_jobs_tab._update_countdowns()
+    assert jobs[0].status == "ready"
+    assert industry_jobs_tab._rows_cache[0]["status"] == "Ready"
+    assert industry_jobs_tab._countdown_timer.isActive()
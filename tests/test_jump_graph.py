@@ -0,0 +1,129 @@
+"""Tests for the stargate jump graph and jump distance queries."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+from data.jump_graph import JumpGraph
+from data.parsers import SDEJsonlParser
+from data.sde_provider import SDEProvider
+from services.location_service import LocationService
+
+JITA, PERIMETER, NEW_CALDARI, URLEN, SOBASEKI, ISLAND = (
+    30000142,
+    30000144,
+    30000145,
+    30000139,
+    30001363,
+    30099999,
+)
+# Jita - Perimeter - Urlen, Jita - New Caldari - Sobaseki; Island has no gates
+CONNECTIONS = [(JITA, PERIMETER), (PERIMETER, URLEN), (JITA, NEW_CALDARI)]
+CONNECTIONS += [(NEW_CALDARI, SOBASEKI)]
+
+
+def _gates() -> tuple[dict[int, int], dict[int, int]]:
+    systems: dict[int, int] = {}
+    destinations: dict[int, int] = {}
+    for n, (a, b) in enumerate(CONNECTIONS):
+        gate_a, gate_b = 50000000 + 2 * n, 50000001 + 2 * n
+        systems[gate_a], destinations[gate_a] = a, b
+        systems[gate_b], destinations[gate_b] = b, a
+    return systems, destinations
+
+
+def test_hop_counts_by_breadth_first_search():
+    graph = JumpGraph.from_stargates(*_gates())
+
+    assert graph.system_ids.tolist() == sorted(
+        {JITA, PERIMETER, NEW_CALDARI, URLEN, SOBASEKI}
+    )
+    assert len(graph.neighbors) == 2 * len(CONNECTIONS)
+    assert graph.jumps(JITA, [JITA, URLEN, SOBASEKI, ISLAND]).tolist() == [
+        0,
+        2,
+        2,
+        -1,
+    ]
+    assert graph.jumps_between(URLEN, SOBASEKI) == 4
+    assert graph.jumps_between(JITA, ISLAND) is None
+    assert sorted(graph.within(JITA, 1).tolist()) == [JITA, PERIMETER, NEW_CALDARI]
+    assert (graph.distances_from(ISLAND) == -1).all()
+
+
+def test_distance_rows_are_memoized_in_an_lru():
+    graph = JumpGraph.from_stargates(*_gates(), cache_size=2)
+
+    jita = graph.distances_from(JITA)
+    assert graph.distances_from(JITA) is jita
+    assert not jita.flags.writeable
+    graph.distances_from(URLEN)
+    graph.distances_from(SOBASEKI)
+    # Jita was least recently used and got evicted
+    assert graph.distances_from(JITA) is not jita
+
+    graph.pin([PERIMETER])
+    perimeter = graph.distances_from(PERIMETER)
+    for origin in (JITA, URLEN, SOBASEKI, NEW_CALDARI):
+        graph.distances_from(origin)
+    assert graph.distances_from(PERIMETER) is perimeter
+
+    empty = JumpGraph.from_stargates({}, {})
+    assert empty.jumps(JITA, [JITA]).tolist() == [-1]
+
+
+def _provider(tmp_path: Path) -> SDEProvider:
+    data_dir = tmp_path / "sde"
+    data_dir.mkdir(exist_ok=True)
+    systems, destinations = _gates()
+    (data_dir / "mapStargates.jsonl").write_text(
+        "".join(
+            json.dumps(
+                {
+                    "_key": gate_id,
+                    "solarSystemID": system_id,
+                    "destination": {
+                        "solarSystemID": destinations[gate_id],
+                        "stargateID": gate_id ^ 1,
+                    },
+                    "typeID": 16,
+                }
+            )
+            + "\n"
+            for gate_id, system_id in systems.items()
+        )
+    )
+    return SDEProvider(
+        SDEJsonlParser(data_dir),
+        background_build=False,
+        persist_path=tmp_path / "sde_store.db",
+    )
+
+
+def test_provider_persists_stargates_and_location_service_filters(
+    tmp_path, monkeypatch
+):
+    provider = _provider(tmp_path)
+    assert provider.get_cache_stats()["stargates"] == 2 * len(CONNECTIONS)
+    assert provider.get_jump_graph() is provider.get_jump_graph()
+
+    reloaded = _provider(tmp_path)
+    graph = reloaded.get_jump_graph()
+    np.testing.assert_array_equal(graph.neighbors, provider.get_jump_graph().neighbors)
+
+    monkeypatch.setattr(
+        "services.location_service.get_config",
+        lambda: SimpleNamespace(app=SimpleNamespace(user_data_dir=tmp_path)),
+    )
+    service = LocationService(SimpleNamespace(), reloaded)  # type: ignore[arg-type]
+    assert service.jump_distances(JITA, [URLEN, None, ISLAND]) == [2, None, None]
+    assert service.systems_within_jumps(URLEN, 2) == {URLEN, PERIMETER, JITA}
+    # Trade hub rows are precomputed and survive LRU eviction
+    assert JITA in graph._pinned
+    assert service.locations_within_jumps([PERIMETER, SOBASEKI, 123], JITA, 1) == {
+        PERIMETER
+    }
@@ -0,0 +1,126 @@
+"""Tests for the budgeted background refresh of stale structure names."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from models.app import LocationInfo
+from services.location_refresher import LocationRefresher
+from services.location_service import LocationService
+
+FRESH, STALE, OLDEST, UNKNOWN = (1035466617946 + n for n in range(4))
+CHARACTER = 90000001
+
+
+class _Structure:
+    def __init__(self, structure_id: int):
+        self.structure_id = structure_id
+        self.name = f"Structure {structure_id} Name"
+        self.owner_id = 98000001
+        self.solar_system_id = 30000142
+
+
+class _Universe:
+    def __init__(self):
+        self.calls: list[int] = []
+
+    async def get_structure_info(self, structure_id, character_id, use_cache=True):
+        self.calls.append(structure_id)
+        return _Structure(structure_id), {}
+
+
+@pytest.fixture(autouse=True)
+def _config(tmp_path, monkeypatch):
+    config = SimpleNamespace(
+        app=SimpleNamespace(user_data_dir=tmp_path),
+        esi=SimpleNamespace(
+            structure_refresh_per_minute=20, structure_refresh_max_age_hours=72
+        ),
+    )
+    monkeypatch.setattr("services.location_service.get_config", lambda: config)
+    monkeypatch.setattr("services.location_refresher.get_config", lambda: config)
+
+
+def _service(groups: dict | None = None) -> LocationService:
+    client = SimpleNamespace(
+        universe=_Universe(),
+        rate_limiter=SimpleNamespace(
+            rate_limit_groups=groups or {}, should_backoff=lambda group_key: False
+        ),
+    )
+    service = LocationService(client, SimpleNamespace())  # type: ignore[arg-type]
+    now = datetime.now(UTC)
+    for structure_id, age in ((FRESH, 1), (STALE, 100), (OLDEST, 500)):
+        service._cache[structure_id] = LocationInfo(
+            location_id=structure_id,
+            name=f"Old {structure_id}",
+            category="structure",
+            last_checked=now - timedelta(hours=age),
+        )
+    service._requested_structures.add(UNKNOWN)
+    return service
+
+
+def test_refresh_queue_covers_unknown_and_stale_structures():
+    service = _service()
+    max_age = timedelta(hours=72)
+
+    assert service.get_refresh_queue(max_age) == [UNKNOWN, STALE, OLDEST]
+    service._failed_structures_backoff[STALE] = datetime.now(UTC) + timedelta(1)
+    assert service.get_refresh_queue(max_age) == [UNKNOWN, OLDEST]
+    assert not service.needs_refresh(FRESH, max_age)
+
+
+def test_refresher_spends_its_budget_and_reports_names():
+    service = _service()
+    resolved: list[dict[int, LocationInfo]] = []
+    refresher = LocationRefresher(
+        service,
+        service._client,  # type: ignore[arg-type]
+        budget_per_minute=1200,
+        on_resolved=resolved.append,
+    )
+
+    # Nothing to do without a character to authenticate with
+    assert asyncio.run(refresher.run_once()) == 0
+
+    refresher.set_characters([CHARACTER])
+    started = time.monotonic()
+    assert asyncio.run(refresher.run_once()) == 3
+    # 1200 lookups per minute leaves 50ms between requests
+    assert time.monotonic() - started >= 0.09
+    assert service._client.universe.calls == [UNKNOWN, STALE, OLDEST]
+    assert [list(batch) for batch in resolved] == [[UNKNOWN], [STALE], [OLDEST]]
+    assert resolved[1][STALE].name == f"Structure {STALE} Name"
+    assert service.get_refresh_queue(timedelta(hours=72)) == []
+
+
+def test_budget_is_capped_by_the_universe_rate_group():
+    service = _service({"universe:90000001": {"requests_per_second": 0.5}})
+    refresher = LocationRefresher(service, service._client)  # type: ignore[arg-type]
+    assert refresher.budget_per_minute == 20
+    assert refresher.effective_budget() == pytest.approx(7.5)
+
+
+def test_refresher_yields_to_interactive_resolutions():
+    service = _service()
+    refresher = LocationRefresher(
+        service,
+        service._client,  # type: ignore[arg-type]
+        budget_per_minute=60000,
+    )
+    refresher.set_characters([CHARACTER])
+
+    async def scenario() -> int:
+        with service._interactive():
+            task = asyncio.ensure_future(refresher.run_once())
+            await asyncio.sleep(0.05)
+            assert service._client.universe.calls == []
+        return await task
+
+    assert asyncio.run(scenario()) == 3
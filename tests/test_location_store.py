@@ -0,0 +1,136 @@
+"""Tests for the SQLite-backed location store behind LocationService."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from data.location_store import LocationStore
+from models.app import LocationInfo
+from services.location_service import LocationService
+
+STRUCTURE = 1035466617946
+
+
+class _Structure:
+    def __init__(self, structure_id: int):
+        self.structure_id = structure_id
+        self.name = f"Structure {structure_id} Name"
+        self.owner_id = 98000001
+        self.solar_system_id = 30000142
+
+
+class _Universe:
+    def __init__(self, denied: set[int]):
+        self.denied = denied
+
+    async def get_structure_info(self, structure_id, character_id, use_cache=True):
+        if structure_id in self.denied:
+            raise RuntimeError("403 Forbidden")
+        return _Structure(structure_id), {}
+
+
+def _service(tmp_path, denied: set[int] = frozenset()) -> LocationService:  # type: ignore[assignment]
+    client = SimpleNamespace(
+        universe=_Universe(set(denied)),
+        rate_limiter=SimpleNamespace(rate_limit_groups={}),
+    )
+    return LocationService(client, SimpleNamespace())  # type: ignore[arg-type]
+
+
+@pytest.fixture(autouse=True)
+def _config(tmp_path, monkeypatch):
+    config = SimpleNamespace(
+        app=SimpleNamespace(
+            user_data_dir=tmp_path,
+            structure_resolution_backoff=timedelta(minutes=5),
+        )
+    )
+    monkeypatch.setattr("services.location_service.get_config", lambda: config)
+
+
+def test_legacy_json_is_imported_once(tmp_path):
+    (tmp_path / "locations.json").write_text(
+        json.dumps(
+            {
+                "locations": [
+                    {
+                        "location_id": STRUCTURE,
+                        "name": "Old Name",
+                        "category": "structure",
+                        "last_checked": "2024-01-01T00:00:00+00:00",
+                        "custom_name": "Home",
+                        "metadata": {"custom_overrides": {"system_id": 30000144}},
+                    },
+                    {"location_id": 1, "category": "broken"},
+                ]
+            }
+        )
+    )
+
+    service = _service(tmp_path)
+    assert service.get_display_name(STRUCTURE) == "Home"
+    assert service.get_system_id(STRUCTURE) == 30000144
+
+    # Later edits go to the store; the legacy file is not read again
+    (tmp_path / "locations.json").write_text('{"locations": []}')
+    service.set_custom_location_data(STRUCTURE, name="Base")
+    assert _service(tmp_path).get_display_name(STRUCTURE) == "Base"
+
+
+def test_edits_and_resolutions_write_only_changed_rows(tmp_path, monkeypatch):
+    store = LocationStore(tmp_path / "locations.db")
+    store.upsert_locations(
+        LocationInfo(location_id=1000000000000 + n, name=f"S{n}", category="structure")
+        for n in range(50)
+    )
+    store.close()
+
+    written: list[list[int]] = []
+    upsert = LocationStore.upsert_locations
+
+    def spy(self, locations):
+        locations = list(locations)
+        written.append([loc.location_id for loc in locations])
+        return upsert(self, locations)
+
+    monkeypatch.setattr(LocationStore, "upsert_locations", spy)
+
+    service = _service(tmp_path, denied={STRUCTURE + 1})
+    service.set_custom_location_data(1000000000007, name="Renamed")
+    assert written == [[1000000000007]]
+
+    results = asyncio.run(
+        service.resolve_locations_bulk([STRUCTURE, STRUCTURE + 1], character_id=1)
+    )
+    assert results[STRUCTURE + 1].is_placeholder
+    # Only the structure that resolved is written; the placeholder is not
+    assert written[-1] == [STRUCTURE]
+
+    reloaded = _service(tmp_path)
+    assert reloaded.get_display_name(1000000000007) == "Renamed"
+    assert reloaded.get_display_name(STRUCTURE) == f"Structure {STRUCTURE} Name"
+    assert len(reloaded._cache) == 51
+
+
+def test_structure_backoff_survives_restarts(tmp_path):
+    service = _service(tmp_path, denied={STRUCTURE})
+    asyncio.run(service.resolve_locations_bulk([STRUCTURE], character_id=1))
+
+    retry_after = LocationStore(tmp_path / "locations.db").load_backoff()[STRUCTURE]
+    assert retry_after > datetime.now(UTC)
+
+    # The next run skips the structure until the backoff expires
+    restarted = _service(tmp_path)
+    assert (
+        asyncio.run(restarted.resolve_locations_bulk([STRUCTURE], character_id=1)) == {}
+    )
+
+    # Once it expires, a successful resolution clears the stored backoff
+    restarted._failed_structures_backoff[STRUCTURE] = retry_after - timedelta(hours=1)
+    asyncio.run(restarted.resolve_locations_bulk([STRUCTURE], character_id=1))
+    assert LocationStore(tmp_path / "locations.db").load_backoff() == {}
@@ -0,0 +1,167 @@
+"""Tests for blueprint activity arrays and the vectorized material cost engine."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from data.parsers import SDEJsonlParser
+from data.sde_provider import SDEProvider
+from services.manufacturing_cost import ManufacturingCostEngine
+
+_BLUEPRINTS = [
+    {
+        "_key": 681,
+        "activities": {
+            "copying": {"time": 480},
+            "manufacturing": {
+                "materials": [
+                    {"quantity": 86, "typeID": 34},
+                    {"quantity": 1, "typeID": 35},
+                ],
+                "products": [{"quantity": 1, "typeID": 165}],
+                "skills": [{"level": 1, "typeID": 3380}],
+                "time": 600,
+            },
+            "invention": {
+                "materials": [{"quantity": 2, "typeID": 20410}],
+                "products": [{"probability": 0.3, "quantity": 10, "typeID": 39581}],
+                "time": 6300,
+            },
+        },
+        "blueprintTypeID": 681,
+        "maxProductionLimit": 300,
+    },
+    {
+        "_key": 682,
+        "activities": {
+            "manufacturing": {
+                "materials": [{"quantity": 1000, "typeID": 36}],
+                "products": [{"quantity": 100, "typeID": 166}],
+                "time": 1200,
+            }
+        },
+        "blueprintTypeID": 682,
+        "maxProductionLimit": 600,
+    },
+    {"_key": 683, "activities": {"copying": {"time": 60}}, "blueprintTypeID": 683},
+]
+
+
+class _Prices:
+    """Price resolver stand-in exposing a revision and a price table."""
+
+    def __init__(self, table: dict[int, float]):
+        self.table = table
+        self.revision = 1
+        self.reads = 0
+
+    def price_table(self) -> dict[int, float]:
+        self.reads += 1
+        return dict(self.table)
+
+
+def _provider(tmp_path: Path) -> SDEProvider:
+    data_dir = tmp_path / "sde"
+    data_dir.mkdir()
+    (data_dir / "blueprints.jsonl").write_text(
+        "".join(json.dumps(bp) + "\n" for bp in _BLUEPRINTS)
+    )
+    return SDEProvider(
+        SDEJsonlParser(data_dir),
+        background_build=False,
+        persist_path=tmp_path / "sde_store.db",
+    )
+
+
+def test_blueprint_activities_are_parsed_and_packed(tmp_path):
+    provider = _provider(tmp_path)
+
+    blueprint = provider.get_blueprint(681)
+    assert blueprint is not None
+    assert blueprint.max_production_limit == 300
+    invention = blueprint.activities["invention"]
+    assert invention.products[0].probability == 0.3
+    assert blueprint.activities["manufacturing"].skills[0].level == 1
+
+    arrays = provider.get_blueprint_activity_arrays()
+    assert arrays.blueprint_type_ids.tolist() == [681, 682]
+    assert arrays.material_indptr.tolist() == [0, 2, 3]
+    assert arrays.material_type_ids.tolist() == [34, 35, 36]
+    assert arrays.material_rows.tolist() == [0, 0, 1]
+    assert arrays.times.tolist() == [600, 1200]
+    assert arrays.rows_of([682, 999, 681]).tolist() == [1, -1, 0]
+    assert provider.get_blueprint_activity_arrays() is arrays
+
+    inv = provider.get_blueprint_activity_arrays("invention")
+    assert inv.blueprint_type_ids.tolist() == [681]
+    assert inv.product_probabilities.tolist() == [0.3]
+
+    # Blueprints survive the store round trip
+    reloaded = SDEProvider(
+        SDEJsonlParser(tmp_path / "sde"),
+        background_build=False,
+        persist_path=tmp_path / "sde_store.db",
+    )
+    assert reloaded.get_blueprint(681) == blueprint
+    assert reloaded.get_blueprint_activity_arrays().material_quantities.tolist() == [
+        86,
+        1,
+        1000,
+    ]
+
+
+def test_parallel_blueprint_parsing_matches_sequential(tmp_path):
+    provider = _provider(tmp_path)
+    parser = SDEJsonlParser(tmp_path / "sde")
+    parallel = parser.load_parallel(["blueprints", "types"], max_workers=1)
+    assert parallel["blueprints"] == {
+        bp.blueprint_type_id: bp for bp in parser.load_blueprints()
+    }
+    assert provider.get_cache_stats()["blueprints"] == 3
+
+
+def test_material_costs_apply_me_runs_and_rounding(tmp_path):
+    prices = _Prices({34: 5.0, 35: 1000.0, 36: 2.0})
+    engine = ManufacturingCostEngine(_provider(tmp_path), prices)  # type: ignore[arg-type]
+
+    costs = engine.material_costs()
+    assert costs.blueprint_type_ids.tolist() == [681, 682]
+    assert costs.material_cost.tolist() == [86 * 5.0 + 1000.0, 1000 * 2.0]
+    assert costs.fully_priced.all()
+
+    # ME 10 over 10 runs: 86*10*0.9 = 774; single-unit inputs never drop below runs
+    costs = engine.material_costs([681], me=10, te=20, runs=10)
+    assert costs.material_cost.tolist() == [774 * 5.0 + 10 * 1000.0]
+    assert costs.production_time.tolist() == [600 * 0.8 * 10]
+    assert costs.cost_per_run.tolist() == [(774 * 5.0 + 10 * 1000.0) / 10]
+
+    # ME 4 on one run: ceil(86 * 0.96) = 83
+    costs = engine.material_costs([682, 999, 681], me=[10, 0, 4], runs=[1, 1, 1])
+    assert costs.blueprint_type_ids.tolist() == [682, 681]
+    assert costs.as_dict() == {682: 900 * 2.0, 681: 83 * 5.0 + 1000.0}
+
+    with pytest.raises(ValueError, match="per-blueprint"):
+        engine.material_costs([681, 682], me=[1, 2, 3])
+
+
+def test_unpriced_materials_and_price_revisions(tmp_path):
+    prices = _Prices({34: 5.0})
+    engine = ManufacturingCostEngine(_provider(tmp_path), prices)  # type: ignore[arg-type]
+
+    costs = engine.material_costs()
+    assert costs.fully_priced.tolist() == [False, False]
+    assert costs.material_cost.tolist() == [430.0, 0.0]
+
+    engine.material_costs()
+    assert prices.reads == 1
+
+    prices.table[36] = 3.0
+    prices.revision = 2
+    costs = engine.material_costs([682])
+    assert prices.reads == 2
+    assert costs.fully_priced.tolist() == [True]
+    np.testing.assert_allclose(costs.material_cost, [3000.0])
@@ -0,0 +1,129 @@
+"""Tests for the flattened market group tree and subtree type queries."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from data.market_group_tree import MarketGroupTree
+from data.parsers import SDEJsonlParser
+from data.sde_provider import SDEProvider
+
+# Ships > Frigates > {Standard, Faction}, Ships > Cruisers; Materials
+PARENTS = {4: None, 1361: 4, 64: 1361, 1364: 1361, 1367: 4, 1857: None}
+TYPES = {64: [587, 603], 1364: [17619], 1367: [620], 1857: [34, 35]}
+
+
+def _tree() -> MarketGroupTree:
+    return MarketGroupTree.from_parents(PARENTS, TYPES.items())
+
+
+def test_subtrees_are_contiguous_ranges():
+    tree = _tree()
+
+    assert tree.group_ids.tolist() == [4, 1361, 64, 1364, 1367, 1857]
+    assert tree.depths.tolist() == [0, 1, 2, 2, 1, 0]
+    assert tree.descendants(1361).tolist() == [1361, 64, 1364]
+    assert tree.descendants(4).tolist() == [4, 1361, 64, 1364, 1367]
+    assert tree.descendants(999).tolist() == []
+    assert tree.types_under(4).tolist() == [587, 603, 17619, 620]
+    assert tree.types_under(1361).tolist() == [587, 603, 17619]
+    assert tree.types_under(64).tolist() == [587, 603]
+    assert tree.ancestors(1364) == [4, 1361]
+    assert tree.is_under([64, 1367, 1857, 999], 1361).tolist() == [
+        True,
+        False,
+        False,
+        False,
+    ]
+
+
+def test_rollup_aggregates_values_per_tree_level():
+    tree = _tree()
+    type_ids = [587, 603, 17619, 620, 34, 99999]
+    values = [1.0, 2.0, 4.0, 8.0, 16.0, 32.0]
+
+    assert tree.rollup(type_ids, values) == {4: 15.0, 1857: 16.0}
+    assert tree.rollup(type_ids, values, depth=1) == {
+        1361: 7.0,
+        1367: 8.0,
+        1857: 16.0,
+    }
+    assert tree.rollup(type_ids, np.array(values), depth=5) == {
+        64: 3.0,
+        1364: 4.0,
+        1367: 8.0,
+        1857: 16.0,
+    }
+    with pytest.raises(ValueError, match="values"):
+        tree.rollup(type_ids, values[:2])
+
+    empty = MarketGroupTree.from_parents({})
+    assert empty.types_under(4).tolist() == []
+    assert empty.rollup([587], [1.0]) == {}
+
+
+def _jsonl(records: list[dict]) -> str:
+    return "".join(json.dumps(record) + "\n" for record in records)
+
+
+def _provider(tmp_path: Path) -> SDEProvider:
+    data_dir = tmp_path / "sde"
+    data_dir.mkdir(exist_ok=True)
+    (data_dir / "marketGroups.jsonl").write_text(
+        _jsonl(
+            [
+                {"_key": group_id, "hasTypes": True, "name": {"en": str(group_id)}}
+                | ({"parentGroupID": parent} if parent else {})
+                for group_id, parent in PARENTS.items()
+            ]
+        )
+    )
+    (data_dir / "types.jsonl").write_text(
+        _jsonl(
+            [
+                {
+                    "_key": type_id,
+                    "groupID": 10,
+                    "marketGroupID": group_id,
+                    "name": {"en": f"Type {type_id}"},
+                    "portionSize": 1,
+                    "published": True,
+                }
+                for group_id, type_ids in TYPES.items()
+                for type_id in type_ids
+            ]
+        )
+    )
+    return SDEProvider(
+        SDEJsonlParser(data_dir),
+        background_build=False,
+        persist_path=tmp_path / "sde_store.db",
+    )
+
+
+def test_provider_serves_types_under_market_group_from_the_store(tmp_path):
+    provider = _provider(tmp_path)
+
+    assert [t.type_id for t in provider.get_types_under_market_group(1361)] == [
+        587,
+        603,
+        17619,
+    ]
+    assert provider.get_cache_stats()["market_group_parents"] == 4
+    assert provider.get_market_group_tree() is provider.get_market_group_tree()
+
+    reloaded = _provider(tmp_path)
+    tree = reloaded.get_market_group_tree()
+    assert (
+        tree.group_ids.tolist() == provider.get_market_group_tree().group_ids.tolist()
+    )
+    assert [t.type_id for t in reloaded.get_types_under_market_group(4)] == [
+        587,
+        603,
+        17619,
+        620,
+    ]
@@ -0,0 +1,170 @@
+"""Tests for the set-based multi-character net worth engine."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import cast
+
+from data.clients import ESIClient
+from data.repositories import assets as assets_repo
+from data.repositories import prices
+from data.repositories.repository import Repository
+from services.networth_service import NetWorthService
+from tests.conftest import StubSettings, jita_sell_point, make_asset
+
+
+def _settings() -> StubSettings:
+    return StubSettings({35: 100.0}, accounts={1: 7})
+
+
+async def _seed(repo: Repository) -> None:
+    await prices.save_snapshot(
+        repo, [jita_sell_point(34, 5.0), jita_sell_point(36, 2.0)]
+    )
+    await assets_repo.update_current_assets(
+        repo,
+        1,
+        [
+            make_asset(1, 34, 10),
+            make_asset(2, 35, 1),
+            make_asset(3, 999, 1, is_blueprint_copy=True),
+        ],
+    )
+    await assets_repo.update_current_assets(
+        repo, 2, [make_asset(10, 34, 3), make_asset(11, 36, 4), make_asset(12, 77, 1)]
+    )
+    await repo.executemany(
+        "INSERT INTO wallet_journal (entry_id, character_id, date, ref_type, "
+        "first_party_id, amount, balance) VALUES (?, ?, ?, 'bounty', 1, 0, ?)",
+        [
+            (1, 1, "2024-01-01T00:00:00", 50.0),
+            (2, 1, "2024-01-02T00:00:00", 75.0),
+            (3, 2, "2024-01-01T00:00:00", 20.0),
+        ],
+    )
+    await repo.executemany(
+        "INSERT INTO market_orders (order_id, character_id, type_id, location_id, "
+        "volume_total, volume_remain, min_volume, price, is_buy_order, duration, "
+        "issued, range, state, region_id, is_corporation, escrow, last_updated) "
+        "VALUES (?, ?, 34, 1, 10, ?, 1, ?, ?, 90, '2024-01-01', 'station', ?, "
+        "10000002, 0, ?, '2024-01-01')",
+        [
+            (1, 1, 4, 10.0, 0, "active", None),
+            (2, 1, 2, 5.0, 1, "active", 10.0),
+            (3, 2, 9, 1.0, 0, "expired", None),
+        ],
+    )
+    await repo.executemany(
+        "INSERT INTO contracts (contract_id, character_id, issuer_id, "
+        "issuer_corporation_id, assignee_id, acceptor_id, start_location_id, "
+        "type, status, for_corporation, availability, date_issued, date_expired, "
+        "price, reward, collateral) VALUES (?, ?, 1, 1, 0, 0, 1, 'courier', ?, 0, "
+        "'public', '2024-01-01', '2024-02-01', ?, ?, ?)",
+        [
+            (1, 2, "outstanding", None, 30.0, 500.0),
+            (2, 2, "in_progress", 40.0, 99.0, None),
+            (3, 2, "finished", 1000.0, None, 1000.0),
+        ],
+    )
+
+
+def test_calculate_networth_many_matches_per_character():
+    async def _run():
+        repo = Repository(db_path=":memory:")
+        await repo.initialize()
+        try:
+            await _seed(repo)
+            service = NetWorthService(
+                esi_client=cast(ESIClient, object()),
+                repository=repo,
+                fuzzwork_provider=None,
+                settings_manager=_settings(),
+                sde_provider=None,
+            )
+
+            many = await service.calculate_networth_many([1, 2, 3, 1])
+            assert list(many) == [1, 2, 3]
+            assert many[1].total_asset_value == 10 * 5.0 + 100.0
+            assert many[2].total_asset_value == 3 * 5.0 + 4 * 2.0
+            assert many[2].contract_value == 70.0
+            assert many[3].total_net_worth == 0.0
+
+            assert (many[1].account_id, many[2].account_id) == (7, None)
+            assert (many[1].wallet_balance, many[2].wallet_balance) == (75.0, 20.0)
+            assert many[1].market_escrow == 10.0
+            assert many[1].market_sell_value == 40.0
+            assert many[2].contract_collateral == 500.0
+
+            assert await service.calculate_networth_many([]) == {}
+        finally:
+            await repo.close()
+
+    asyncio.run(_run())
+
+
+def test_calculate_networth_many_prices_shared_types_once():
+    async def _run():
+        repo = Repository(db_path=":memory:")
+        await repo.initialize()
+        try:
+            await _seed(repo)
+            service = NetWorthService(
+                esi_client=cast(ESIClient, object()),
+                repository=repo,
+                fuzzwork_provider=None,
+                settings_manager=_settings(),
+                sde_provider=None,
+            )
+            priced: list[set[int]] = []
+            original = service._price_types
+
+            async def _tracking(type_ids):
+                type_ids = set(type_ids)
+                priced.append(type_ids)
+                return await original(type_ids)
+
+            service._price_types = _tracking  # type: ignore[method-assign]
+
+            await service.calculate_networth_many([1, 2])
+            assert priced == [{34, 35, 36, 77}]
+
+            # Unchanged ledgers are summed without pricing anything again
+            many = await service.calculate_networth_many([1, 2])
+            assert len(priced) == 1
+            assert many[2].total_asset_value == 3 * 5.0 + 4 * 2.0
+        finally:
+            await repo.close()
+
+    asyncio.run(_run())
+
+
+def test_save_networth_snapshots_persists_each_character_in_one_group():
+    async def _run():
+        repo = Repository(db_path=":memory:")
+        await repo.initialize()
+        try:
+            await _seed(repo)
+            service = NetWorthService(
+                esi_client=cast(ESIClient, object()),
+                repository=repo,
+                fuzzwork_provider=None,
+                settings_manager=_settings(),
+                sde_provider=None,
+            )
+            group_id = await service.create_snapshot_group(
+                account_id=7, refresh_source="account", label="Refresh"
+            )
+
+            saved = await service.save_networth_snapshots([1, 2], group_id)
+            assert list(saved) == [1, 2]
+            for character_id in (1, 2):
+                latest = await service.get_latest_networth(character_id)
+                assert latest is not None
+                assert latest.snapshot_group_id == group_id
+            assert (await service.get_latest_networth(1)).total_asset_value == 150.0
+
+            assert await service.save_networth_snapshots([]) == {}
+        finally:
+            await repo.close()
+
+    asyncio.run(_run())
@@ -0,0 +1,80 @@
+"""Tests for the batched price-history fallback in net worth valuation."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import cast
+
+from data.clients import ESIClient
+from data.repositories import assets as assets_repo
+from data.repositories import prices
+from data.repositories.repository import Repository
+from services.networth_service import NetWorthService
+from tests.conftest import jita_sell_point, make_asset
+
+
+def test_get_latest_jita_prices_returns_latest_snapshot_per_type():
+    async def _run():
+        repo = Repository(db_path=":memory:")
+        await repo.initialize()
+        try:
+            await prices.save_snapshot(
+                repo, [jita_sell_point(34, 4.0), jita_sell_point(35, 9.0)]
+            )
+            await prices.save_snapshot(repo, [jita_sell_point(34, 5.0)])
+
+            latest = await prices.get_latest_jita_prices(repo, [34, 35, 36])
+            assert set(latest) == {34, 35}
+            assert latest[34].sell_weighted_average == 5.0
+            assert latest[35].sell_weighted_average == 9.0
+            assert await prices.get_latest_jita_prices(repo, []) == {}
+        finally:
+            await repo.close()
+
+    asyncio.run(_run())
+
+
+def test_unpriced_assets_resolved_with_one_history_query(monkeypatch):
+    async def _run():
+        repo = Repository(db_path=":memory:")
+        await repo.initialize()
+        try:
+            await prices.save_snapshot(
+                repo, [jita_sell_point(34, 5.0), jita_sell_point(35, 7.0)]
+            )
+            await assets_repo.update_current_assets(
+                repo,
+                1,
+                [
+                    make_asset(1, 34, 10),
+                    make_asset(2, 35, 2),
+                    make_asset(3, 34, 5),
+                    make_asset(4, 99, 1),
+                ],
+            )
+
+            calls: list[set[int]] = []
+            original = prices.get_latest_jita_prices
+
+            async def _counting(repo_arg, type_ids):
+                calls.append(set(type_ids))
+                return await original(repo_arg, type_ids)
+
+            monkeypatch.setattr(prices, "get_latest_jita_prices", _counting)
+
+            service = NetWorthService(
+                esi_client=cast(ESIClient, object()),
+                repository=repo,
+                fuzzwork_provider=None,
+                settings_manager=None,
+                sde_provider=None,
+            )
+            snapshot = await service.calculate_networth(1)
+
+            assert snapshot.total_asset_value == 15 * 5.0 + 2 * 7.0
+            assert calls == [{34, 35, 99}]
+            assert service._last_used_prices[34] == (5.0, "history")
+        finally:
+            await repo.close()
+
+    asyncio.run(_run())
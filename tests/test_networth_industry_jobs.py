@@ -0,0 +1,129 @@
+"""Tests for in-progress industry job value in net worth."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import cast
+
+from data.clients import ESIClient
+from data.parsers import SDEJsonlParser
+from data.repositories import industry_jobs
+from data.repositories.repository import Repository
+from data.sde_provider import SDEProvider
+from models.eve import EveIndustryJob
+from services.networth_service import NetWorthService
+from tests.conftest import StubSettings
+
+_BLUEPRINTS = [
+    {
+        "_key": 681,
+        "activities": {
+            "manufacturing": {
+                "materials": [{"quantity": 10, "typeID": 34}],
+                "products": [{"quantity": 100, "typeID": 165}],
+                "time": 600,
+            },
+            "invention": {
+                "materials": [{"quantity": 2, "typeID": 20410}],
+                "products": [{"probability": 0.3, "quantity": 10, "typeID": 39581}],
+                "time": 6300,
+            },
+        },
+        "blueprintTypeID": 681,
+    },
+]
+
+
+def _job(
+    job_id: int,
+    activity_id: int,
+    product_type_id: int | None,
+    runs: int,
+    status: str = "active",
+    probability: float | None = None,
+) -> EveIndustryJob:
+    start = datetime.now(UTC)
+    return EveIndustryJob(
+        job_id=job_id,
+        installer_id=1,
+        facility_id=60003760,
+        activity_id=activity_id,
+        blueprint_id=job_id,
+        blueprint_type_id=681,
+        blueprint_location_id=60003760,
+        output_location_id=60003760,
+        runs=runs,
+        cost=1.0,
+        probability=probability,
+        product_type_id=product_type_id,
+        status=status,
+        duration=600,
+        start_date=start,
+        end_date=start + timedelta(hours=1),
+    )
+
+
+def test_industry_job_value_is_computed_in_bulk(tmp_path: Path):
+    data_dir = tmp_path / "sde"
+    data_dir.mkdir()
+    (data_dir / "blueprints.jsonl").write_text(
+        "".join(json.dumps(bp) + "\n" for bp in _BLUEPRINTS)
+    )
+    sde = SDEProvider(
+        SDEJsonlParser(data_dir),
+        background_build=False,
+        persist_path=tmp_path / "sde_store.db",
+    )
+
+    async def _run():
+        repo = Repository(db_path=":memory:")
+        await repo.initialize()
+        try:
+            await industry_jobs.save_jobs(
+                repo,
+                1,
+                [
+                    # 5 runs x 100 units x 2.0
+                    _job(1, 1, 165, 5),
+                    # Finished but not delivered yet
+                    _job(2, 1, 165, 1, status="ready"),
+                    # Delivered output already sits in the hangar
+                    _job(3, 1, 165, 50, status="delivered"),
+                    # Research yields no items
+                    _job(4, 4, 681, 3),
+                ],
+            )
+            await industry_jobs.save_jobs(
+                repo,
+                2,
+                [
+                    # 4 attempts at the SDE base chance, one copy each
+                    _job(10, 8, 39581, 4),
+                    # Skill-adjusted probability from ESI wins
+                    _job(11, 8, 39581, 2, probability=0.5),
+                ],
+            )
+            assert await industry_jobs.get_in_progress_outputs(repo, [1, 2]) == {
+                (1, 681, 165),
+                (4, 681, 681),
+                (8, 681, 39581),
+            }
+
+            service = NetWorthService(
+                esi_client=cast(ESIClient, object()),
+                repository=repo,
+                fuzzwork_provider=None,
+                settings_manager=StubSettings({165: 2.0, 39581: 1000.0}),
+                sde_provider=sde,
+            )
+            many = await service.calculate_networth_many([1, 2, 3])
+            assert many[1].industry_job_value == 6 * 100 * 2.0
+            assert many[2].industry_job_value == (4 * 0.3 + 2 * 0.5) * 1000.0
+            assert many[3].industry_job_value == 0.0
+        finally:
+            await repo.close()
+
+    asyncio.run(_run())
@@ -0,0 +1,70 @@
+"""Tests for incremental net worth maintenance via the valuation ledger."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import cast
+
+from data.clients import ESIClient
+from data.repositories import assets as assets_repo
+from data.repositories.repository import Repository
+from services.networth_service import NetWorthService
+from tests.conftest import StubSettings, make_asset
+
+
+def test_ledger_reprices_only_churn_and_moved_prices():
+    async def _run():
+        repo = Repository(db_path=":memory:")
+        await repo.initialize()
+        try:
+            settings = StubSettings({34: 5.0, 35: 7.0, 36: 11.0})
+            await assets_repo.update_current_assets(
+                repo, 1, [make_asset(1, 34, 10), make_asset(2, 35, 2)]
+            )
+            service = NetWorthService(
+                esi_client=cast(ESIClient, object()),
+                repository=repo,
+                settings_manager=settings,
+            )
+
+            priced: list[set[int]] = []
+            original = service._price_types
+
+            async def _tracking(type_ids):
+                type_ids = set(type_ids)
+                priced.append(type_ids)
+                return await original(type_ids)
+
+            service._price_types = _tracking  # type: ignore[method-assign]
+
+            snapshot = await service.calculate_networth(1)
+            assert snapshot.total_asset_value == 10 * 5.0 + 2 * 7.0
+            assert priced == [{34, 35}]
+
+            # Churn: one stack grows, one is removed, a new type arrives
+            await assets_repo.update_current_assets(
+                repo, 1, [make_asset(1, 34, 12), make_asset(3, 36, 1)]
+            )
+            snapshot = await service.calculate_networth(1)
+            assert snapshot.total_asset_value == 12 * 5.0 + 11.0
+            assert priced[-1] == {36}
+
+            # A single price edit reprices only that type
+            settings.custom[34] = {"buy": None, "sell": 6.0}
+            service._prices.on_custom_price_changed(34)
+            snapshot = await service.calculate_networth(1)
+            assert snapshot.total_asset_value == 12 * 6.0 + 11.0
+            assert priced[-1] == {34}
+
+            # Preference change forces a full reprice
+            settings.price_type = "buy"
+            service._prices.invalidate()
+            snapshot = await service.calculate_networth(1)
+            assert priced[-1] == {34, 36}
+
+            raw = await assets_repo.get_current_assets(repo, 1)
+            assert snapshot.total_asset_value == await service._value_assets(raw)
+        finally:
+            await repo.close()
+
+    asyncio.run(_run())
@@ -0,0 +1,130 @@
+"""Tests for the shared PriceResolver price table."""
+
+from __future__ import annotations
+
+import pytest
+
+from data.repositories import prices
+from data.repositories.repository import Repository
+from services.price_resolver import PriceResolver
+from tests.conftest import market_point
+
+
+class _FakeFuzzwork:
+    def __init__(self, points):
+        self._points = {p.type_id: p for p in points}
+        self.bulk_calls = 0
+
+    is_loaded = True
+
+    def get_market_data(self, type_id):
+        return self._points.get(type_id)
+
+    def get_all_market_data(self):
+        self.bulk_calls += 1
+        return list(self._points.values())
+
+
+@pytest.fixture
+def fuzzwork():
+    return _FakeFuzzwork(
+        [
+            market_point(34, {10000002: (4.0, 5.0), 10000043: (6.0, 7.0)}),
+            market_point(35, {10000043: (8.0, 10.0)}),
+        ]
+    )
+
+
+def test_select_preferred_price_rules():
+    assert prices.select_preferred_price((4.0,), (5.0,), "sell") == 5.0
+    assert prices.select_preferred_price((4.0,), (5.0,), "buy") == 4.0
+    assert prices.select_preferred_price((None, 0, 3.0), (), "buy") == 3.0
+    assert prices.select_preferred_price((), (5.0,), "buy") == 5.0
+    assert prices.select_preferred_price((10.0,), (20.0,), "weighted", 0.5) == 15.0
+    assert prices.select_preferred_price((10.0,), (), "weighted") == 10.0
+    assert prices.select_preferred_price((10.0,), (), "sell") is None
+
+
+def test_table_compiled_once_and_respects_hub(fuzzwork, settings):
+    resolver = PriceResolver(fuzzwork_provider=fuzzwork, settings_manager=settings)
+
+    assert resolver.get_price(34) == 5.0
+    # Falls back to any region when the preferred hub has no data
+    assert resolver.get_price(35) == 10.0
+    assert resolver.get_price(99) is None
+    assert fuzzwork.bulk_calls == 1
+    assert settings.reads == 1
+
+    settings.hub = "amarr"
+    assert resolver.get_price(34) == 5.0  # not rebuilt until invalidated
+    resolver.invalidate()
+    assert resolver.get_price(34) == 7.0
+    assert fuzzwork.bulk_calls == 2
+
+
+def test_custom_price_patches_single_entry(fuzzwork, settings):
+    resolver = PriceResolver(fuzzwork_provider=fuzzwork, settings_manager=settings)
+    assert resolver.get_price_with_source(34) == (5.0, "market")
+
+    settings.custom[34] = {"buy": None, "sell": 0.0}
+    resolver.on_custom_price_changed(34)
+    assert resolver.get_price_with_source(34) == (0.0, "custom")
+    assert fuzzwork.bulk_calls == 1
+
+    del settings.custom[34]
+    resolver.on_custom_price_changed(34)
+    assert resolver.get_price_with_source(34) == (5.0, "market")
+
+
+@pytest.mark.asyncio
+async def test_history_layer_used_when_market_missing(fuzzwork):
+    repo = Repository(db_path=":memory:")
+    await repo.initialize()
+    try:
+        await prices.save_snapshot(repo, [market_point(500, {10000002: (1.0, 2.0)})])
+        resolver = PriceResolver(
+            repository=repo, fuzzwork_provider=fuzzwork, settings_manager=None
+        )
+        await resolver.ensure_ready()
+
+        assert resolver.get_price_with_source(500) == (2.0, "history")
+        assert resolver.get_price_with_source(34) == (5.0, "market")
+        assert resolver.price_table() == {500: 2.0, 34: 5.0, 35: 10.0}
+    finally:
+        await repo.close()
+
+
+def test_custom_change_while_stale_is_reported(fuzzwork, settings):
+    resolver = PriceResolver(fuzzwork_provider=fuzzwork, settings_manager=settings)
+    since = resolver.revision
+
+    resolver.invalidate()
+    settings.custom[34] = {"buy": None, "sell": 9.0}
+    resolver.on_custom_price_changed(34)
+
+    assert resolver.get_price_with_source(34) == (9.0, "custom")
+    assert 34 in resolver.changed_types(since)
+
+
+@pytest.mark.asyncio
+async def test_history_layer_reloads_after_new_snapshot(fuzzwork):
+    repo = Repository(db_path=":memory:")
+    await repo.initialize()
+    try:
+        resolver = PriceResolver(
+            repository=repo, fuzzwork_provider=fuzzwork, settings_manager=None
+        )
+        await resolver.ensure_ready()
+        assert resolver.get_price(500) is None
+
+        await prices.save_snapshot(repo, [market_point(500, {10000002: (1.0, 2.0)})])
+        resolver.on_price_snapshot_saved()
+        await resolver.ensure_ready()
+        assert resolver.get_price_with_source(500) == (2.0, "history")
+
+        await prices.save_snapshot(repo, [market_point(501, {10000002: (3.0, 4.0)})])
+        resolver.set_fuzzwork_provider(fuzzwork)
+        await resolver.ensure_ready()
+        assert resolver.get_price_with_source(501) == (4.0, "history")
+    finally:
+        await repo.close()
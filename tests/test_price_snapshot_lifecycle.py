@@ -93,7 +93,8 @@ async def test_price_snapshot_created_on_networth_save(
     await temp_repo.commit()
 
     # Save networth snapshot
-    snapshot_id = await service.save_networth_snapshot(character_id, snapshot_group_id)
+    saved = await service.save_networth_snapshots([character_id], snapshot_group_id)
+    snapshot_id = saved[character_id]
 
     # Verify networth snapshot was created
     assert snapshot_id > 0
@@ -343,7 +344,7 @@ async def test_price_snapshot_only_created_when_fuzzwork_updated(
     group2 = await service.create_snapshot_group(None, "manual", "Second")
 
     # This should use existing price snapshot (not create new one)
-    await service.save_networth_snapshot(character_id, group2)
+    await service.save_networth_snapshots([character_id], group2)
 
     # Verify only one price snapshot exists (from initial save)
     all_price_snapshots = await prices.get_snapshots(temp_repo, limit=10)
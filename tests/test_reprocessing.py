@@ -0,0 +1,112 @@
+"""Tests for the reprocessing matrix and the vectorized reprocessing engine."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from data.parsers import SDEJsonlParser
+from data.sde_provider import SDEProvider
+from services.reprocessing import ReprocessingEngine
+
+
+def _jsonl(records: list[dict]) -> str:
+    return "".join(json.dumps(record) + "\n" for record in records)
+
+
+def _type(type_id: int, portion_size: int) -> dict:
+    return {
+        "_key": type_id,
+        "groupID": 10,
+        "name": {"en": f"Type {type_id}"},
+        "portionSize": portion_size,
+        "published": True,
+    }
+
+
+class _Prices:
+    """Price resolver stand-in exposing a revision and a price table."""
+
+    def __init__(self, table: dict[int, float]):
+        self.table = table
+        self.revision = 1
+
+    def price_table(self) -> dict[int, float]:
+        return dict(self.table)
+
+
+def _provider(tmp_path: Path) -> SDEProvider:
+    data_dir = tmp_path / "sde"
+    data_dir.mkdir()
+    (data_dir / "types.jsonl").write_text(
+        _jsonl([_type(34, 1), _type(35, 1), _type(1230, 100), _type(587, 1)])
+    )
+    (data_dir / "typeMaterials.jsonl").write_text(
+        _jsonl(
+            [
+                # Veldspar ore: 100 units per batch
+                {"_key": 1230, "materials": [{"materialTypeID": 34, "quantity": 400}]},
+                # Rifter
+                {
+                    "_key": 587,
+                    "materials": [
+                        {"materialTypeID": 34, "quantity": 30000},
+                        {"materialTypeID": 35, "quantity": 5},
+                    ],
+                },
+                {"_key": 34, "materials": []},
+            ]
+        )
+    )
+    return SDEProvider(
+        SDEJsonlParser(data_dir),
+        background_build=False,
+        persist_path=tmp_path / "sde_store.db",
+    )
+
+
+def test_type_materials_are_packed_and_persisted(tmp_path):
+    provider = _provider(tmp_path)
+
+    matrix = provider.get_reprocessing_matrix()
+    assert matrix.type_ids.tolist() == [587, 1230]
+    assert matrix.portion_sizes.tolist() == [1, 100]
+    assert matrix.indptr.tolist() == [0, 2, 3]
+    assert matrix.material_type_ids.tolist() == [34, 35, 34]
+    assert matrix.entry_rows.tolist() == [0, 0, 1]
+    assert matrix.rows_of([1230, 34, 587]).tolist() == [1, -1, 0]
+    assert provider.get_reprocessing_matrix() is matrix
+    assert provider.get_cache_stats()["type_materials"] == 3
+
+    reloaded = SDEProvider(
+        SDEJsonlParser(tmp_path / "sde"),
+        background_build=False,
+        persist_path=tmp_path / "sde_store.db",
+    )
+    assert reloaded.get_type_materials(587) == provider.get_type_materials(587)
+    assert reloaded.get_reprocessing_matrix().quantities.tolist() == [30000, 5, 400]
+
+
+def test_reprocess_values_apply_portions_yield_and_rounding(tmp_path):
+    engine = ReprocessingEngine(
+        _provider(tmp_path),
+        _Prices({34: 2.0, 35: 1000.0}),  # type: ignore[arg-type]
+    )
+
+    # 250 ore = 2 whole batches; a Rifter at 50% rounds 2.5 units down to 2
+    values = engine.reprocess_values([1230, 587, 34, 999], [250, 1, 500, 1])
+    np.testing.assert_allclose(values, [400 * 2.0, 15000 * 2.0 + 2 * 1000.0, 0.0, 0.0])
+
+    values = engine.reprocess_values([1230, 1230], [99, 1000], yield_rate=[1.0, 0.9])
+    np.testing.assert_allclose(values, [0.0, 3600 * 2.0])
+
+    assert engine.material_yields([1230, 587], [250, 2], yield_rate=0.5) == {
+        34: 400 + 30000,
+        35: 5,
+    }
+
+    with pytest.raises(ValueError, match="quantities"):
+        engine.reprocess_values([1230, 587], [1])
@@ -0,0 +1,246 @@
+"""Tests for applying SDE change feeds as incremental patches."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import zipfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+
+from data.clients import sde_client
+from data.clients.sde_client import SDEBuildMetadata, SDEClient
+from data.parsers import SDEJsonlParser
+from data.sde_provider import SDEProvider
+
+
+def _jsonl(records: list[dict]) -> str:
+    return "".join(json.dumps(record) + "\n" for record in records)
+
+
+def _type(type_id: int, name: str, group_id: int = 10) -> dict:
+    return {
+        "_key": type_id,
+        "groupID": group_id,
+        "name": {"en": name},
+        "portionSize": 1,
+        "published": True,
+    }
+
+
+def _station(station_id: int, name: str) -> dict:
+    return {"_key": station_id, "name": {"en": name}, "solarSystemID": 30000001}
+
+
+def _write_sde(base: Path) -> None:
+    base.mkdir()
+    (base / "types.jsonl").write_text(
+        _jsonl([_type(100, "Tritanium"), _type(101, "Pyerite"), _type(102, "Rifter")])
+    )
+    (base / "groups.jsonl").write_text(
+        _jsonl(
+            [
+                {
+                    "_key": group_id,
+                    "anchorable": False,
+                    "anchored": False,
+                    "categoryID": group_id - 9,
+                    "fittableNonSingleton": False,
+                    "name": {"en": f"Group {group_id}"},
+                    "published": True,
+                    "useBasePrice": False,
+                }
+                for group_id in (10, 11)
+            ]
+        )
+    )
+    (base / "npcStations.jsonl").write_text(
+        _jsonl([_station(60000001, "Station A"), _station(60000002, "Station B")])
+    )
+
+
+class _CountingParser(SDEJsonlParser):
+    """Parser recording which files are read."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reads: list[str] = []
+
+    def restricted_to(self, keys):
+        view = super().restricted_to(keys)
+        view.__class__ = _CountingParser
+        view.reads = self.reads  # type: ignore[attr-defined]
+        return view
+
+    def _load_jsonl(self, filename):
+        self.reads.append(filename)
+        return super()._load_jsonl(filename)
+
+
+def test_restricted_view_loads_only_listed_records(tmp_path):
+    _write_sde(tmp_path / "sde")
+    parser = SDEJsonlParser(tmp_path / "sde")
+    view = parser.restricted_to({"types.jsonl": {101, 999}})
+
+    assert [t.type_id for t in view.load_types()] == [101]
+    # Files without a filter load in full
+    assert view.load_npc_station_ids() == {60000001, 60000002}
+    assert len(list(parser.load_types())) == 3
+
+
+def test_provider_patches_only_changed_records(tmp_path):
+    data_dir = tmp_path / "sde"
+    _write_sde(data_dir)
+    persist_path = tmp_path / "sde_store.db"
+    SDEProvider(
+        SDEJsonlParser(data_dir), background_build=False, persist_path=persist_path
+    )
+    parser = _CountingParser(data_dir)
+    provider = SDEProvider(parser, background_build=False, persist_path=persist_path)
+    assert parser.reads == []
+
+    # New build: 100 renamed, 101 removed, 103 added; one station renamed
+    (data_dir / "types.jsonl").write_text(
+        _jsonl(
+            [
+                _type(100, "Tritanium II"),
+                _type(102, "Rifter"),
+                _type(103, "Slasher", group_id=11),
+            ]
+        )
+    )
+    (data_dir / "npcStations.jsonl").write_text(
+        _jsonl([_station(60000001, "Station A"), _station(60000002, "Renamed")])
+    )
+    assert provider.apply_sde_changes(
+        {"types.jsonl": {100, 101, 103}, "npcStations.jsonl": {60000002}}
+    )
+
+    assert provider.get_type_by_id(100).name == "Tritanium II"  # type: ignore[union-attr]
+    assert provider.get_type_by_id(101) is None
+    assert provider.get_type_by_id(102).name == "Rifter"  # type: ignore[union-attr]
+    assert sorted(t.type_id for t in provider.get_types_by_category(2)) == [103]
+    assert provider.get_npc_station_name(60000002) == "Renamed"
+    assert provider.get_npc_station_name(60000001) == "Station A"
+    assert provider.is_npc_station(60000001)
+    assert set(parser.reads) == {"types.jsonl", "npcStations.jsonl"}
+
+    # The patched store is current: reopening parses nothing
+    parser = _CountingParser(data_dir)
+    provider = SDEProvider(parser, background_build=False, persist_path=persist_path)
+    assert parser.reads == []
+    assert provider.get_type_by_id(103).name == "Slasher"  # type: ignore[union-attr]
+
+
+def test_store_patched_off_thread_is_adopted_by_the_owner(tmp_path):
+    data_dir = tmp_path / "sde"
+    _write_sde(data_dir)
+    persist_path = tmp_path / "sde_store.db"
+    SDEProvider(
+        SDEJsonlParser(data_dir), background_build=False, persist_path=persist_path
+    )
+    provider = SDEProvider(
+        SDEJsonlParser(data_dir), background_build=False, persist_path=persist_path
+    )
+    assert provider.get_type_by_id(102).name == "Rifter"  # type: ignore[union-attr]
+
+    (data_dir / "types.jsonl").write_text(
+        _jsonl([_type(100, "Tritanium"), _type(101, "Pyerite"), _type(102, "Wolf")])
+    )
+    patch = asyncio.run(
+        asyncio.to_thread(provider.patch_sde_store, {"types.jsonl": {102}})
+    )
+    assert patch is not None
+
+    # The open store keeps serving reads until the owner swaps it out
+    assert provider.get_type_by_id(102).name == "Rifter"  # type: ignore[union-attr]
+    assert provider.get_type_by_id(100).name == "Tritanium"  # type: ignore[union-attr]
+
+    provider.adopt_patched_store(patch)
+    assert provider.get_type_by_id(102).name == "Wolf"  # type: ignore[union-attr]
+    assert provider.get_npc_station_name(60000001) == "Station A"
+
+
+def _client(tmp_path: Path) -> SDEClient:
+    config = SimpleNamespace(
+        sde=SimpleNamespace(
+            sde_dir_path=tmp_path / "sde",
+            rift_download_url_template="https://example.invalid/sde-{build_id}.zip",
+            ccp_changes_url_template="https://example.invalid/changes/{build_id}.jsonl",
+        ),
+        app=SimpleNamespace(user_data_dir=tmp_path),
+    )
+    return SDEClient(config)  # type: ignore[arg-type]
+
+
+def _feed(last_build: int, **tables: dict) -> str:
+    return _jsonl(
+        [{"_key": "_meta", "lastBuildNumber": last_build}]
+        + [{"_key": table, **entries} for table, entries in tables.items()]
+    )
+
+
+def _mock_http(monkeypatch, routes: dict[str, bytes | str]) -> list[str]:
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        body = routes[request.url.path]
+        return httpx.Response(200, content=body)
+
+    real_client = httpx.AsyncClient
+    transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(
+        sde_client.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=transport, **kwargs),
+    )
+    return requested
+
+
+def test_collect_changes_merges_keys_across_builds(tmp_path, monkeypatch):
+    requested = _mock_http(
+        monkeypatch,
+        {
+            "/changes/3.jsonl": _feed(
+                2, types={"changed": [100], "added": [103]}, dogmaEffects={"added": [1]}
+            ),
+            "/changes/2.jsonl": _feed(
+                1, types={"removed": [101]}, npcStations={"changed": [60000002]}
+            ),
+        },
+    )
+
+    changes = asyncio.run(_client(tmp_path).collect_changes("1", "3"))
+
+    assert changes == {"types": {100, 101, 103}, "npcStations": {60000002}}
+    assert requested == ["/changes/3.jsonl", "/changes/2.jsonl"]
+
+
+def test_update_extracts_only_changed_tables(tmp_path, monkeypatch):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("sde/types.jsonl", _jsonl([_type(100, "New")]))
+        zf.writestr("sde/groups.jsonl", "new groups\n")
+    _mock_http(
+        monkeypatch,
+        {
+            "/changes/2.jsonl": _feed(1, types={"changed": [100]}),
+            "/sde-2.zip": buffer.getvalue(),
+        },
+    )
+    client = _client(tmp_path)
+    (client.sde_dir / "types.jsonl").write_text("old types\n")
+    (client.sde_dir / "groups.jsonl").write_text("old groups\n")
+    client.save_metadata(SDEBuildMetadata(build_id="1"))
+
+    success, changes = asyncio.run(client.update_sde("2"))
+
+    assert success
+    assert changes == {"types.jsonl": {100}}
+    assert (client.sde_dir / "types.jsonl").read_text() == _jsonl([_type(100, "New")])
+    assert (client.sde_dir / "groups.jsonl").read_text() == "old groups\n"
+    assert client.load_metadata().build_id == "2"  # type: ignore[union-attr]
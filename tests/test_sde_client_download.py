@@ -0,0 +1,76 @@
+"""Tests for spooled SDE archive download and selective extraction."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import zipfile
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from data.clients import sde_client
+from data.clients.sde_client import SDEClient
+from utils.exceptions import SDEDownloadError
+
+
+def _archive() -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("sde/types.jsonl", '{"_key": 34}\n' * 1000)
+        zf.writestr("sde/mapSolarSystems.jsonl", '{"_key": 30000142}\n')
+        zf.writestr("sde/npcStations.jsonl", '{"_key": 60003760}\n')
+        zf.writestr("sde/dogmaEffects.jsonl", '{"_key": 1}\n')
+        zf.writestr("sde/_sde.jsonl", '{"_key": "sde"}\n')
+        zf.writestr("sde/readme.txt", "ignored")
+    return buffer.getvalue()
+
+
+def _client(tmp_path) -> SDEClient:
+    config = SimpleNamespace(
+        sde=SimpleNamespace(
+            sde_dir_path=tmp_path / "sde",
+            rift_download_url_template="https://example.invalid/sde-{build_id}.zip",
+        ),
+        app=SimpleNamespace(user_data_dir=tmp_path),
+    )
+    return SDEClient(config)  # type: ignore[arg-type]
+
+
+def test_download_extracts_only_needed_members(tmp_path, monkeypatch):
+    payload = _archive()
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(
+            200, content=payload, headers={"Content-Length": str(len(payload))}
+        )
+    )
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        sde_client.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=transport, **kwargs),
+    )
+
+    client = _client(tmp_path)
+    asyncio.run(client._download_rift_sde("3000000"))
+
+    assert sorted(p.name for p in client.sde_dir.iterdir()) == [
+        "mapSolarSystems.jsonl",
+        "npcStations.jsonl",
+        "types.jsonl",
+    ]
+    assert (client.sde_dir / "types.jsonl").read_text() == '{"_key": 34}\n' * 1000
+    # The spooled archive is removed afterwards
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["sde"]
+
+
+def test_archive_without_needed_members_fails(tmp_path):
+    archive_path = tmp_path / "empty.zip"
+    with zipfile.ZipFile(archive_path, "w") as zf:
+        zf.writestr("dogmaEffects.jsonl", "{}\n")
+
+    client = _client(tmp_path)
+    with pytest.raises(SDEDownloadError):
+        asyncio.run(client._extract_sde_members(archive_path))
+    assert list(client.sde_dir.iterdir()) == []
@@ -0,0 +1,125 @@
+"""Tests for process-pool SDE JSONL ingestion."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from data.parsers import SDEJsonlParser, sde_jsonl
+from data.sde_provider import SDEProvider
+
+
+def _write_jsonl(path: Path, records: list[dict]) -> None:
+    path.write_text(
+        "".join(json.dumps(record) + "\n" for record in records), encoding="utf-8"
+    )
+
+
+def _write_sde(base: Path) -> None:
+    base.mkdir()
+    _write_jsonl(
+        base / "types.jsonl",
+        [
+            {
+                "_key": type_id,
+                "groupID": 10 + type_id % 2,
+                "name": {"en": f"Type {type_id}", "de": "Typ"},
+                "portionSize": 1,
+                "published": type_id % 3 != 0,
+                "marketGroupID": 50 if type_id % 5 == 0 else None,
+            }
+            for type_id in range(100, 160)
+        ],
+    )
+    _write_jsonl(
+        base / "groups.jsonl",
+        [
+            {
+                "_key": group_id,
+                "anchorable": False,
+                "anchored": False,
+                "categoryID": group_id - 9,
+                "fittableNonSingleton": False,
+                "name": {"en": f"Group {group_id}"},
+                "published": True,
+                "useBasePrice": False,
+            }
+            for group_id in (10, 11)
+        ],
+    )
+    _write_jsonl(
+        base / "categories.jsonl",
+        [{"_key": 1, "name": {"en": "Cat"}, "published": True}],
+    )
+    _write_jsonl(
+        base / "marketGroups.jsonl",
+        [{"_key": 50, "name": {"en": "Minerals"}, "hasTypes": True}],
+    )
+    _write_jsonl(
+        base / "npcStations.jsonl",
+        [{"_key": 60000001, "name": {"en": "Station"}, "solarSystemID": 30000001}],
+    )
+    _write_jsonl(
+        base / "mapSolarSystems.jsonl",
+        [{"_key": 30000001, "name": {"en": "Jita"}, "constellationID": 20000001}],
+    )
+    _write_jsonl(base / "blueprints.jsonl", [{"_key": 1, "blueprintTypeID": 200}])
+
+
+def test_load_parallel_matches_sequential_loaders(tmp_path, monkeypatch):
+    _write_sde(tmp_path / "sde")
+    parser = SDEJsonlParser(tmp_path / "sde")
+    # Force several byte-range chunks for the small test file
+    monkeypatch.setattr(sde_jsonl, "_CHUNK_BYTES", 1024)
+
+    loaders = [
+        "types",
+        "groups",
+        "npc_station_ids",
+        "npc_station_names",
+        "solar_system_constellation_ids",
+        "blueprint_type_ids",
+    ]
+    results = parser.load_parallel(loaders, max_workers=3)
+
+    assert list(results["types"]) == list(range(100, 160))
+    assert results["types"] == {t.type_id: t for t in parser.load_types()}
+    assert results["groups"] == {g.group_id: g for g in parser.load_groups()}
+    assert results["npc_station_ids"] == {60000001}
+    assert results["npc_station_names"] == {60000001: "Station"}
+    assert results["solar_system_constellation_ids"] == {30000001: 20000001}
+    assert results["blueprint_type_ids"] == {200}
+
+
+def test_chunk_boundaries_neither_split_nor_repeat_lines(tmp_path):
+    path = tmp_path / "lines.jsonl"
+    path.write_bytes(b'{"a": 1}\n\n{"a": 22}\n{"a": 333}\n')
+    size = path.stat().st_size
+
+    for step in range(1, size + 1):
+        lines = [
+            line
+            for start in range(0, size, step)
+            for line in sde_jsonl._iter_chunk_lines(path, start, start + step)
+        ]
+        assert lines == [b'{"a": 1}', b'{"a": 22}', b'{"a": 333}'], step
+
+
+def test_provider_build_merges_parallel_results(tmp_path):
+    _write_sde(tmp_path / "sde")
+    provider = SDEProvider(
+        SDEJsonlParser(tmp_path / "sde"),
+        background_build=False,
+        persist_path=tmp_path / "sde_store.db",
+    )
+
+    assert len(provider.get_all_types()) == 60
+    assert {t.type_id for t in provider.get_types_by_category(2)} == set(
+        range(101, 160, 2)
+    )
+    assert [t.type_id for t in provider.get_types_by_market_group(50)] == list(
+        range(100, 160, 5)
+    )
+    assert provider.get_npc_station_system_id(60000001) == 30000001
+    assert provider.get_solar_system_name(30000001) == "Jita"
+    assert provider.is_blueprint(200)
@@ -0,0 +1,199 @@
+"""Tests for per-file incremental SDE cache rebuilds."""
+
+from __future__ import annotations
+
+import os
+from collections import Counter
+from pathlib import Path
+
+from data.sde_provider import SDE_SOURCE_CACHES, SDEProvider
+from models.eve import (
+    EveBlueprint,
+    EveCategory,
+    EveGroup,
+    EveMarketGroup,
+    EveType,
+    EveTypeMaterials,
+)
+
+
+class _Parser:
+    """Parser stub whose output is driven by attributes, counting calls."""
+
+    def __init__(self, base: Path):
+        self.file_path = base
+        self.calls: Counter[str] = Counter()
+        self.station_name = "Station"
+        self.group_category = {10: 1}
+
+    def load_types(self):
+        self.calls["types"] += 1
+        yield EveType(
+            id=100, name="Tritanium", group_id=10, portion_size=1, published=True
+        )
+
+    def load_type_names(self):
+        self.calls["types"] += 1
+        return {100: "Tritanium"}
+
+    def load_categories(self):
+        self.calls["categories"] += 1
+        yield EveCategory(id=1, name="Material", published=True)
+        yield EveCategory(id=2, name="Ship", published=True)
+
+    def load_groups(self):
+        self.calls["groups"] += 1
+        for group_id, category_id in self.group_category.items():
+            yield EveGroup(
+                id=group_id,
+                anchorable=False,
+                anchored=False,
+                category_id=category_id,
+                fittable_non_singleton=False,
+                name=f"Group {group_id}",
+                published=True,
+                use_base_price=False,
+            )
+
+    def load_market_groups(self):
+        self.calls["market_groups"] += 1
+        yield EveMarketGroup(id=50, name="Minerals", has_types=True)
+
+    def load_market_group_parent_ids(self):
+        self.calls["market_groups"] += 1
+        return {}
+
+    def load_blueprints(self):
+        self.calls["blueprints"] += 1
+        yield EveBlueprint(
+            id=200,
+            max_production_limit=10,
+            activities={
+                "manufacturing": {
+                    "time": 600,
+                    "materials": [{"type_id": 100, "quantity": 5}],
+                    "products": [{"type_id": 102, "quantity": 1}],
+                }
+            },
+        )
+
+    def load_type_materials(self):
+        self.calls["type_materials"] += 1
+        yield EveTypeMaterials(
+            id=102, materials=[{"material_type_id": 100, "quantity": 25}]
+        )
+
+    def load_blueprint_type_ids(self):
+        self.calls["blueprints"] += 1
+        return {200}
+
+    def load_npc_station_ids(self):
+        self.calls["stations"] += 1
+        return {60000001}
+
+    def load_npc_station_names(self):
+        self.calls["stations"] += 1
+        return {60000001: self.station_name}
+
+    def load_npc_station_system_ids(self):
+        self.calls["stations"] += 1
+        return {60000001: 30000001}
+
+    def load_region_names(self):
+        self.calls["map"] += 1
+        return {10000001: "Region"}
+
+    def load_constellation_names(self):
+        self.calls["map"] += 1
+        return {20000001: "Constellation"}
+
+    def load_solar_system_names(self):
+        self.calls["map"] += 1
+        return {30000001: "System"}
+
+    def load_solar_system_constellation_ids(self):
+        self.calls["map"] += 1
+        return {30000001: 20000001}
+
+    def load_stargate_system_ids(self):
+        self.calls["map"] += 1
+        return {}
+
+    def load_stargate_destination_ids(self):
+        self.calls["map"] += 1
+        return {}
+
+    def load_constellation_region_ids(self):
+        self.calls["map"] += 1
+        return {20000001: 10000001}
+
+
+def _setup(tmp_path: Path) -> tuple[Path, Path]:
+    data_dir = tmp_path / "sde"
+    data_dir.mkdir()
+    for name in SDE_SOURCE_CACHES:
+        (data_dir / name).write_text('{"_key": 1}\n', encoding="utf-8")
+    persist_path = tmp_path / "sde_store.db"
+    SDEProvider(
+        _Parser(data_dir),  # type: ignore[arg-type]
+        background_build=False,
+        persist_path=persist_path,
+    )
+    return data_dir, persist_path
+
+
+def _reload(data_dir: Path, persist_path: Path, **attrs) -> tuple[SDEProvider, _Parser]:
+    parser = _Parser(data_dir)
+    for name, value in attrs.items():
+        setattr(parser, name, value)
+    provider = SDEProvider(parser, background_build=False, persist_path=persist_path)  # type: ignore[arg-type]
+    return provider, parser
+
+
+def test_metadata_records_content_hash_per_file(tmp_path):
+    data_dir, persist_path = _setup(tmp_path)
+    provider, parser = _reload(data_dir, persist_path)
+
+    signatures = provider.get_sde_metadata()["file_signatures"]  # type: ignore[index]
+    assert set(signatures) == set(SDE_SOURCE_CACHES)
+    assert all(len(sig["sha256"]) == 64 for sig in signatures.values())
+    assert not parser.calls
+
+    # A touched file with identical content does not trigger a rebuild
+    path = data_dir / "types.jsonl"
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 60))
+    _, parser = _reload(data_dir, persist_path)
+    assert not parser.calls
+
+
+def test_station_file_change_rebuilds_only_station_caches(tmp_path):
+    data_dir, persist_path = _setup(tmp_path)
+    (data_dir / "npcStations.jsonl").write_text('{"_key": 2}\n', encoding="utf-8")
+
+    provider, parser = _reload(data_dir, persist_path, station_name="Renamed")
+    assert parser.calls == {"stations": 3}
+    assert provider.get_npc_station_name(60000001) == "Renamed"
+    assert provider.get_type_by_id(100).name == "Tritanium"  # type: ignore[union-attr]
+    assert provider.get_region_name(10000001) == "Region"
+
+    # The rewritten store serves the update without parsing anything
+    provider, parser = _reload(data_dir, persist_path)
+    assert not parser.calls
+    assert provider.get_npc_station_name(60000001) == "Renamed"
+    assert provider.get_solar_system_constellation_id(30000001) == 20000001
+
+
+def test_group_change_reindexes_type_categories_without_parsing_types(tmp_path):
+    data_dir, persist_path = _setup(tmp_path)
+    (data_dir / "groups.jsonl").write_text('{"_key": 3}\n', encoding="utf-8")
+
+    provider, parser = _reload(data_dir, persist_path, group_category={10: 2})
+    assert parser.calls == {"groups": 1}
+    assert [t.type_id for t in provider.get_types_by_category(2)] == [100]
+    assert provider.get_types_by_category(1) == []
+    assert provider.get_cache_stats()["types"] == 1
+
+    provider, parser = _reload(data_dir, persist_path)
+    assert not parser.calls
+    assert [t.type_id for t in provider.get_types_by_category(2)] == [100]
@@ -9,16 +9,24 @@ class _CountingParser:
         self.file_path = base
         self.calls = {
             "types": 0,
+            "type_names": 0,
             "categories": 0,
             "groups": 0,
             "market_groups": 0,
+            "market_group_parents": 0,
             "blueprints": 0,
+            "blueprint_activities": 0,
+            "type_materials": 0,
             "stations": 0,
             "station_names": 0,
             "station_systems": 0,
             "region_names": 0,
             "constellation_names": 0,
             "solar_system_names": 0,
+            "system_constellations": 0,
+            "constellation_regions": 0,
+            "stargate_systems": 0,
+            "stargate_destinations": 0,
         }
 
     def load_types(self):
@@ -31,6 +39,10 @@ class _CountingParser:
             published=True,
         )
 
+    def load_type_names(self):
+        self.calls["type_names"] += 1
+        return {100: "Type"}
+
     def load_categories(self):
         self.calls["categories"] += 1
         yield EveCategory(id=1, name="Cat", published=True, icon_id=None)
@@ -52,7 +64,7 @@ class _CountingParser:
     def load_market_groups(self):
         self.calls["market_groups"] += 1
         yield EveMarketGroup(
-            marketgroup_id=5,
+            id=5,
             name="MG",
             description="",
             has_types=True,
@@ -60,10 +72,22 @@ class _CountingParser:
             icon_id=None,
         )
 
+    def load_market_group_parent_ids(self):
+        self.calls["market_group_parents"] += 1
+        return {}
+
     def load_blueprint_type_ids(self):
         self.calls["blueprints"] += 1
         return {200}
 
+    def load_blueprints(self):
+        self.calls["blueprint_activities"] += 1
+        yield from ()
+
+    def load_type_materials(self):
+        self.calls["type_materials"] += 1
+        yield from ()
+
     def load_npc_station_ids(self):
         self.calls["stations"] += 1
         return {60000001}
@@ -88,6 +112,22 @@ class _CountingParser:
         self.calls["solar_system_names"] += 1
         return {30000001: "System"}
 
+    def load_solar_system_constellation_ids(self):
+        self.calls["system_constellations"] += 1
+        return {30000001: 20000001}
+
+    def load_constellation_region_ids(self):
+        self.calls["constellation_regions"] += 1
+        return {20000001: 10000001}
+
+    def load_stargate_system_ids(self):
+        self.calls["stargate_systems"] += 1
+        return {}
+
+    def load_stargate_destination_ids(self):
+        self.calls["stargate_destinations"] += 1
+        return {}
+
 
 def _touch_stub_files(base: Path):
     base.mkdir(parents=True, exist_ok=True)
@@ -119,6 +159,8 @@ def test_sde_persist_and_reload(tmp_path):
 
     # Ensure caches are present
     assert provider.get_all_types()[0].type_id == 100
+    assert len(provider.get_type_name_index()) == 1
+    assert provider.get_type_name_index().search("typ") == [100]
     assert persist_path.exists()
     first_calls = parser.calls.copy()
 
@@ -131,10 +173,13 @@ def test_sde_persist_and_reload(tmp_path):
     types = provider2.get_all_types()
     assert len(types) == 1
     assert types[0].type_id == 100
+    # The name index is rebuilt from the persisted type names
+    assert provider2.get_type_name_index().search("typ") == [100]
     assert all(v == 0 for v in parser2.calls.values())
 
     # Original parser was called during initial build
     assert first_calls["types"] == 1
+    assert first_calls["type_names"] == 1
     assert first_calls["categories"] == 1
     assert first_calls["groups"] == 1
     assert first_calls["market_groups"] == 1
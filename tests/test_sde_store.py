@@ -0,0 +1,203 @@
+"""Tests for the compact SDE store backing persisted SDEProvider caches."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from data.sde_provider import SDEProvider
+from data.sde_store import SDEStore
+from models.eve import (
+    EveBlueprint,
+    EveCategory,
+    EveGroup,
+    EveMarketGroup,
+    EveType,
+    EveTypeMaterials,
+)
+
+
+class _Parser:
+    def __init__(self, base: Path):
+        self.file_path = base
+        self.calls = 0
+
+    def load_types(self):
+        self.calls += 1
+        yield EveType(
+            id=100, name="Tritanium", group_id=10, portion_size=1, published=True
+        )
+        yield EveType(
+            id=101,
+            name="Hidden",
+            group_id=10,
+            market_group_id=50,
+            portion_size=1,
+            published=False,
+        )
+        yield EveType(
+            id=102, name="Rifter", group_id=11, portion_size=1, published=True
+        )
+
+    def load_categories(self):
+        self.calls += 1
+        yield EveCategory(id=1, name="Material", published=True)
+        yield EveCategory(id=2, name="Ship", published=True)
+
+    def load_groups(self):
+        self.calls += 1
+        for group_id, category_id in ((10, 1), (11, 2)):
+            yield EveGroup(
+                id=group_id,
+                anchorable=False,
+                anchored=False,
+                category_id=category_id,
+                fittable_non_singleton=False,
+                name=f"Group {group_id}",
+                published=True,
+                use_base_price=False,
+            )
+
+    def load_market_groups(self):
+        self.calls += 1
+        yield EveMarketGroup(id=50, name="Minerals", has_types=True)
+
+    def load_market_group_parent_ids(self):
+        self.calls += 1
+        return {}
+
+    def load_blueprints(self):
+        self.calls += 1
+        yield EveBlueprint(
+            id=200,
+            max_production_limit=10,
+            activities={
+                "manufacturing": {
+                    "time": 600,
+                    "materials": [{"type_id": 100, "quantity": 5}],
+                    "products": [{"type_id": 102, "quantity": 1}],
+                }
+            },
+        )
+
+    def load_type_materials(self):
+        self.calls += 1
+        yield EveTypeMaterials(
+            id=102, materials=[{"material_type_id": 100, "quantity": 25}]
+        )
+
+    def load_type_names(self):
+        self.calls += 1
+        return {100: "Tritanium", 101: "Hidden", 102: "Rifter"}
+
+    def load_blueprint_type_ids(self):
+        self.calls += 1
+        return {200}
+
+    def load_npc_station_ids(self):
+        self.calls += 1
+        return {60000001}
+
+    def load_npc_station_names(self):
+        self.calls += 1
+        return {60000001: "Station"}
+
+    def load_npc_station_system_ids(self):
+        self.calls += 1
+        return {60000001: 30000001}
+
+    def load_region_names(self):
+        self.calls += 1
+        return {10000001: "Region"}
+
+    def load_constellation_names(self):
+        self.calls += 1
+        return {20000001: "Constellation"}
+
+    def load_solar_system_names(self):
+        self.calls += 1
+        return {30000001: "System"}
+
+    def load_solar_system_constellation_ids(self):
+        self.calls += 1
+        return {30000001: 20000001}
+
+    def load_stargate_system_ids(self):
+        self.calls += 1
+        return {}
+
+    def load_stargate_destination_ids(self):
+        self.calls += 1
+        return {}
+
+    def load_constellation_region_ids(self):
+        self.calls += 1
+        return {20000001: 10000001}
+
+
+def _build(tmp_path: Path) -> tuple[SDEProvider, Path]:
+    data_dir = tmp_path / "sde"
+    data_dir.mkdir()
+    persist_path = tmp_path / "sde_store.db"
+    provider = SDEProvider(
+        _Parser(data_dir),  # type: ignore[arg-type]
+        background_build=False,
+        persist_path=persist_path,
+    )
+    return provider, persist_path
+
+
+def test_store_reload_matches_built_provider_and_decodes_lazily(tmp_path):
+    built, persist_path = _build(tmp_path)
+    assert persist_path.exists()
+
+    parser = _Parser(tmp_path / "sde")
+    loaded = SDEProvider(parser, background_build=False, persist_path=persist_path)  # type: ignore[arg-type]
+    assert parser.calls == 0
+    assert isinstance(loaded._store, SDEStore)
+
+    # Nothing is decoded until accessed
+    assert loaded._types_cache is not None
+    assert len(loaded._types_cache) == 3
+    assert loaded._types_cache._decoded == {}  # type: ignore[attr-defined]
+
+    assert loaded.get_type_by_id(100) == built.get_type_by_id(100)
+    assert loaded._types_cache._decoded.keys() == {100}  # type: ignore[attr-defined]
+    assert loaded.get_type_by_id(999) is None
+
+    def ids(models, attr):
+        return sorted(getattr(m, attr) for m in models)
+
+    assert ids(loaded.get_types_by_group(10), "type_id") == [100, 101]
+    assert ids(loaded.get_types_by_category(2), "type_id") == [102]
+    assert ids(loaded.get_types_by_market_group(50), "type_id") == [101]
+    assert ids(loaded.get_published_types(), "type_id") == [100, 102]
+    assert ids(loaded.get_groups_by_category(1), "group_id") == [10]
+    assert loaded.get_types_by_group(12345) == []
+    assert loaded.get_market_group_by_id(50) == built.get_market_group_by_id(50)
+    assert loaded.get_category_by_id(2) == built.get_category_by_id(2)
+    assert ids(loaded.get_all_types(), "type_id") == [100, 101, 102]
+
+    assert loaded.is_npc_station(60000001)
+    assert loaded.is_blueprint(200)
+    assert loaded.get_npc_station_name(60000001) == "Station"
+    assert loaded.get_npc_station_system_id(60000001) == 30000001
+    assert loaded.get_solar_system_constellation_id(30000001) == 20000001
+    assert loaded.get_constellation_region_id(20000001) == 10000001
+    assert loaded.get_region_name(10000001) == "Region"
+    assert loaded.get_all_solar_systems() == {30000001: "System"}
+    assert loaded.get_cache_stats() == built.get_cache_stats()
+    assert loaded.get_sde_metadata() == built.get_sde_metadata()
+
+
+def test_invalid_store_file_triggers_rebuild(tmp_path):
+    data_dir = tmp_path / "sde"
+    data_dir.mkdir()
+    persist_path = tmp_path / "sde_store.db"
+    persist_path.write_bytes(b"not a database")
+
+    parser = _Parser(data_dir)
+    provider = SDEProvider(parser, background_build=False, persist_path=persist_path)  # type: ignore[arg-type]
+    assert parser.calls > 0
+    assert provider.get_type_by_id(102).name == "Rifter"  # type: ignore[union-attr]
+    # Rebuilt store replaced the invalid file
+    SDEStore(persist_path).close()
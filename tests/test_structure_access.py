@@ -0,0 +1,147 @@
+"""Tests for routing structure lookups through the persisted access map."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from data.location_store import LocationStore
+from services.character_service import CharacterService
+from services.location_service import LocationService
+
+HOME, MARKET, LOCKED = 1035466617946, 1035466617947, 1035466617948
+ALICE, BOB, CAROL = 90000001, 90000002, 90000003
+
+
+class _Structure:
+    def __init__(self, structure_id: int):
+        self.structure_id = structure_id
+        self.name = f"Structure {structure_id} Name"
+        self.owner_id = 98000001
+        self.solar_system_id = 30000142
+
+
+class _Universe:
+    """Fake universe endpoint where only listed characters can dock."""
+
+    def __init__(self, docking: dict[int, set[int]]):
+        self.docking = docking
+        self.calls: list[tuple[int, int]] = []
+
+    async def get_structure_info(self, structure_id, character_id, use_cache=True):
+        self.calls.append((structure_id, character_id))
+        if character_id not in self.docking.get(structure_id, set()):
+            raise RuntimeError("403 Forbidden")
+        return _Structure(structure_id), {}
+
+
+def _service(docking: dict[int, set[int]]) -> LocationService:
+    client = SimpleNamespace(
+        universe=_Universe(docking),
+        rate_limiter=SimpleNamespace(rate_limit_groups={}),
+    )
+    return LocationService(client, SimpleNamespace())  # type: ignore[arg-type]
+
+
+@pytest.fixture(autouse=True)
+def _config(tmp_path, monkeypatch):
+    config = SimpleNamespace(
+        app=SimpleNamespace(
+            user_data_dir=tmp_path,
+            structure_resolution_backoff=timedelta(minutes=5),
+            structure_access_denied_ttl=timedelta(hours=2),
+        )
+    )
+    monkeypatch.setattr("services.location_service.get_config", lambda: config)
+
+
+DOCKING = {HOME: {BOB}, MARKET: {ALICE, CAROL}}
+
+
+def test_denied_structures_fall_through_to_the_next_character():
+    service = _service(DOCKING)
+    results = asyncio.run(
+        service.resolve_structures_multi_character(
+            {HOME, MARKET, LOCKED}, [ALICE, BOB, CAROL]
+        )
+    )
+
+    assert not results[HOME].is_placeholder
+    assert not results[MARKET].is_placeholder
+    assert results[LOCKED].is_placeholder
+    assert service.get_structure_access(HOME) == {ALICE: False, BOB: True}
+    assert service.get_structure_access(MARKET) == {ALICE: True}
+    assert service.get_structure_access(LOCKED) == {
+        ALICE: False,
+        BOB: False,
+        CAROL: False,
+    }
+    # Locked out for everyone: retried once the first denial expires
+    retry_after = service._failed_structures_backoff[LOCKED]
+    assert retry_after > datetime.now(UTC) + timedelta(hours=1)
+
+
+def test_known_access_routes_straight_to_the_right_character(tmp_path):
+    first = _service(DOCKING)
+    asyncio.run(
+        first.resolve_structures_multi_character(
+            {HOME, MARKET, LOCKED}, [ALICE, BOB, CAROL]
+        )
+    )
+    stored = LocationStore(tmp_path / "locations.db").load_access()
+    assert stored[HOME][BOB][0] is True
+
+    # After a restart, stale names are refreshed without any denied attempt
+    restarted = _service(DOCKING)
+    restarted._failed_structures_backoff.clear()
+    results = asyncio.run(
+        restarted.resolve_structures_multi_character(
+            {HOME, MARKET, LOCKED}, [ALICE, BOB, CAROL]
+        )
+    )
+    assert set(results) == {HOME, MARKET}
+    assert sorted(restarted._client.universe.calls) == [(HOME, BOB), (MARKET, ALICE)]
+
+
+def test_expired_denials_are_checked_again():
+    service = _service({HOME: {ALICE}})
+    service._structure_access[HOME] = {
+        ALICE: (False, datetime.now(UTC) - timedelta(hours=3)),
+        BOB: (False, datetime.now(UTC)),
+    }
+
+    results = asyncio.run(
+        service.resolve_structures_multi_character({HOME}, [BOB, ALICE])
+    )
+
+    assert not results[HOME].is_placeholder
+    assert service._client.universe.calls == [(HOME, ALICE)]
+    assert service.get_structure_access(HOME) == {ALICE: True, BOB: False}
+
+
+def test_forgetting_a_character_drops_its_access_checks(tmp_path):
+    service = _service(DOCKING)
+    asyncio.run(
+        service.resolve_structures_multi_character({HOME, MARKET}, [ALICE, BOB])
+    )
+
+    service.forget_character_access(ALICE)
+
+    assert service.get_structure_access(HOME) == {BOB: True}
+    assert service.get_structure_access(MARKET) == {}
+    stored = LocationStore(tmp_path / "locations.db").load_access()
+    assert all(ALICE not in checks for checks in stored.values())
+    assert stored[HOME][BOB][0] is True
+
+
+def test_removing_a_character_drops_its_access_checks():
+    service = _service(DOCKING)
+    asyncio.run(service.resolve_structures_multi_character({HOME}, [ALICE, BOB]))
+    client = SimpleNamespace(auth=SimpleNamespace(remove_token=lambda cid: True))
+    characters = CharacterService(client, location_service=service)  # type: ignore[arg-type]
+
+    assert asyncio.run(characters.remove_character(ALICE))
+    assert service.get_structure_access(HOME) == {BOB: True}
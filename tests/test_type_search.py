@@ -0,0 +1,87 @@
+"""Tests for the type name search index and SDEProvider.search_types."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from data.parsers import SDEJsonlParser
+from data.sde_provider import SDEProvider
+from data.type_name_index import TypeNameIndex
+
+NAMES = {
+    34: "Tritanium",
+    35: "Pyerite",
+    587: "Rifter",
+    11400: "Jaguar",
+    17470: "Compressed Tritanium",
+    28694: "Tritanium Bar",
+    99: "Tritanium Test Item",
+    1230: "Veldspar",
+}
+PUBLISHED = set(NAMES) - {99}
+
+
+def test_exact_and_prefix_matches_rank_first():
+    index = TypeNameIndex(NAMES, PUBLISHED)
+
+    assert len(index) == len(NAMES)
+    assert index.search("tritanium") == [34, 28694, 17470]
+    assert index.search("  TRIT ") == [34, 28694, 17470]
+    assert index.search("trit", limit=2) == [34, 28694]
+    assert index.search("trit", published_only=False) == [34, 28694, 99, 17470]
+
+
+def test_word_and_fuzzy_matches():
+    index = TypeNameIndex(NAMES, PUBLISHED)
+
+    assert index.search("bar") == [28694]
+    # Typos still find the name through shared trigrams
+    assert index.search("tritanum")[0] == 34
+    assert index.search("rifer") == [587]
+    assert index.search("zzzz") == []
+    assert index.search("") == []
+    assert index.search("rifter", limit=0) == []
+
+
+def _provider(tmp_path: Path) -> SDEProvider:
+    data_dir = tmp_path / "sde"
+    data_dir.mkdir(exist_ok=True)
+    (data_dir / "types.jsonl").write_text(
+        "".join(
+            json.dumps(
+                {
+                    "_key": type_id,
+                    "groupID": 10,
+                    "name": {"en": name, "de": name.upper()},
+                    "portionSize": 1,
+                    "published": type_id in PUBLISHED,
+                }
+            )
+            + "\n"
+            for type_id, name in NAMES.items()
+        )
+    )
+    return SDEProvider(
+        SDEJsonlParser(data_dir),
+        background_build=False,
+        persist_path=tmp_path / "sde_store.db",
+    )
+
+
+def test_search_types_uses_persisted_names(tmp_path):
+    provider = _provider(tmp_path)
+
+    assert [t.type_id for t in provider.search_types("rif")] == [587]
+    assert provider.get_cache_stats()["type_names"] == len(NAMES)
+    index = provider.get_type_name_index()
+    assert provider.get_type_name_index() is index
+
+    # A reopened store answers from the persisted names
+    reloaded = _provider(tmp_path)
+    results = reloaded.search_types("tritanium test", published_only=False)
+    assert [t.type_id for t in results][:2] == [99, 34]
+    assert 99 not in [t.type_id for t in reloaded.search_types("tritanium test")]
+
+    reloaded.clear_cache()
+    assert reloaded.get_cache_stats()["type_names"] == 0